@@ -0,0 +1,183 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Pool of warm agent sessions shared by the apps that talk to an agent network in-process.
+"""
+
+import atexit
+import os
+import threading
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from neuro_san.client.agent_session_factory import AgentSessionFactory
+from neuro_san.client.streaming_input_processor import StreamingInputProcessor
+
+# How many unused sessions are kept per (agent network, connection, host, port)
+DEFAULT_MAX_IDLE_PER_KEY = 4
+
+SessionKey = Tuple[str, str, str, int]
+
+
+class AgentSessionPool:
+    """
+    Keeps agent sessions, and the StreamingInputProcessor of each, once a conversation is done with them,
+    so that the next conversation with the same agent network does not load the network and build
+    the client again. A session is handed to one conversation at a time.
+
+    Conversation state lives in the chat_context of the callers' state dictionaries, not in the session,
+    which is why a session can serve one conversation after another.
+    """
+
+    def __init__(self, max_idle_per_key: int = DEFAULT_MAX_IDLE_PER_KEY):
+        """
+        :param max_idle_per_key: Unused sessions kept per key; sessions released beyond that are closed
+        """
+        self.max_idle_per_key = max_idle_per_key
+        self.factory = AgentSessionFactory()
+        # id(session) -> (key, session) of every session of the pool, in use or idle
+        self._sessions: Dict[int, Tuple[SessionKey, Any]] = {}
+        self._processors: Dict[int, StreamingInputProcessor] = {}
+        self._idle: Dict[SessionKey, List[Any]] = {}
+        self._closed = False
+        self._lock = threading.Lock()
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def acquire(
+        self,
+        agent_name: str,
+        connection: str = "direct",
+        host: str = "localhost",
+        port: int = 30011,
+        local_externals_direct: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        :param agent_name: The agent network to talk to
+        :param connection: The connection type, for instance "direct" or "http"
+        :param host: The host of the server, for remote connections
+        :param port: The port of the server, for remote connections
+        :param local_externals_direct: Whether external agents are called directly, for new sessions
+        :param metadata: Metadata sent with requests, for new sessions
+        :return: An agent session for the exclusive use of the caller until it is released
+        """
+        key: SessionKey = (agent_name, connection, host, port)
+        with self._lock:
+            idle: List[Any] = self._idle.get(key)
+            if idle:
+                return idle.pop()
+
+        # Creating a session can take a while, so other callers are not held up meanwhile
+        session = self.factory.create_session(connection, agent_name, host, port, local_externals_direct, metadata)
+        with self._lock:
+            self._sessions[id(session)] = (key, session)
+        return session
+
+    def get_processor(self, session) -> StreamingInputProcessor:
+        """
+        :param session: A session acquired from this pool, or any other session
+        :return: The StreamingInputProcessor kept with the session, created on first use
+        """
+        with self._lock:
+            processor: StreamingInputProcessor = self._processors.get(id(session))
+        if processor is not None:
+            return processor
+
+        processor = StreamingInputProcessor(
+            "DEFAULT",
+            "/tmp/agent_thinking.txt",  # Or wherever you want
+            session,
+            None,  # Not using a thinking_dir for simplicity
+        )
+        with self._lock:
+            # Sessions that do not belong to the pool get a new processor every time
+            if id(session) in self._sessions:
+                self._processors[id(session)] = processor
+        return processor
+
+    def release(self, session):
+        """
+        Hand a session back once its conversation is over. It is kept for the next conversation,
+        or closed if enough sessions are already waiting.
+
+        :param session: A session acquired from this pool
+        """
+        with self._lock:
+            entry: Tuple[SessionKey, Any] = self._sessions.get(id(session))
+            if entry is not None:
+                idle: List[Any] = self._idle.setdefault(entry[0], [])
+                if any(waiting is session for waiting in idle):
+                    return
+                if len(idle) < self.max_idle_per_key and not self._closed:
+                    idle.append(session)
+                    return
+                self._forget(session)
+        session.close()
+
+    def discard(self, session):
+        """
+        Close a session instead of keeping it, for instance after it failed.
+
+        :param session: A session acquired from this pool
+        """
+        with self._lock:
+            self._forget(session)
+            for idle in self._idle.values():
+                idle[:] = [waiting for waiting in idle if waiting is not session]
+        session.close()
+
+    def close_all(self):
+        """
+        Close the idle sessions. Sessions still in use are closed when they are released.
+        """
+        with self._lock:
+            self._closed = True
+            sessions: List[Any] = [session for idle in self._idle.values() for session in idle]
+            self._idle.clear()
+            for session in sessions:
+                self._forget(session)
+        for session in sessions:
+            session.close()
+
+    def _forget(self, session):
+        """
+        Drop the pool's references to a session. Called with the lock held.
+
+        :param session: A session of this pool
+        """
+        self._sessions.pop(id(session), None)
+        self._processors.pop(id(session), None)
+
+
+_POOL: Optional[AgentSessionPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_session_pool() -> AgentSessionPool:
+    """
+    :return: The process-wide session pool, configured by the environment
+    """
+    global _POOL  # pylint: disable=global-statement
+
+    with _POOL_LOCK:
+        if _POOL is None:
+            max_idle = int(os.getenv("AGENT_SESSION_POOL_MAX_IDLE", str(DEFAULT_MAX_IDLE_PER_KEY)))
+            _POOL = AgentSessionPool(max_idle)
+            atexit.register(_POOL.close_all)
+        return _POOL
@@ -16,10 +16,12 @@
 
 import os
 
-from neuro_san.client.agent_session_factory import AgentSessionFactory
-from neuro_san.client.streaming_input_processor import StreamingInputProcessor
+from apps.agent_session_pool import get_session_pool
+from apps.response_blocks import parse_blocks
+from apps.response_blocks import stream_blocks
 
 AGENT_NETWORK_NAME = "conscious_agent"
+RESPONSE_BLOCK_KINDS = ("thought", "say")
 
 
 def set_up_conscious_assistant():
@@ -31,9 +33,8 @@ def set_up_conscious_assistant():
     local_externals_direct = False
     metadata = {"user_id": os.environ.get("USER")}
 
-    # Create session factory and agent session
-    factory = AgentSessionFactory()
-    session = factory.create_session(connection, agent_name, host, port, local_externals_direct, metadata)
+    # Get a warm agent session from the shared pool, created only if none is waiting
+    session = get_session_pool().acquire(agent_name, connection, host, port, local_externals_direct, metadata)
     # Initialize any conversation state here
     conscious_thread = {
         "last_chat_response": None,
@@ -47,36 +48,37 @@ def set_up_conscious_assistant():
     return session, conscious_thread
 
 
-def conscious_thinker(conscious_session, conscious_thread, thoughts):
+def conscious_thinker(conscious_session, conscious_thread, thoughts, on_block=None):
     """
     Processes a single turn of user input within the conscious agent's session.
 
     This function simulates a conversational turn by:
-    1. Initializing a StreamingInputProcessor to handle the input.
+    1. Getting the StreamingInputProcessor kept with the session to handle the input.
     2. Updating the agent's internal thread state with the user's input (`thoughts`).
     3. Passing the updated thread to the processor for handling.
     4. Extracting and returning the agent's response for this turn.
 
+    When `on_block` is given, the 'thought' and 'say' blocks of the response are also handed to it
+    one by one as the answer messages of the agent arrive. An answer arrives as one message,
+    so its blocks are handed over together, near the end of the turn.
+
     Parameters:
         conscious_session: An active session object for the conscious agent.
         conscious_thread (dict): The agent's current conversation thread state.
         thoughts (str): The user's input or query to be processed.
+        on_block (callable, optional): Function called with the kind and content of each block.
 
     Returns:
         tuple:
             - last_chat_response (str or None): The agent's response to the input.
             - conscious_thread (dict): The updated thread state after processing.
     """
-    # Use the processor (like in agent_cli.py)
-    input_processor = StreamingInputProcessor(
-        "DEFAULT",
-        "/tmp/agent_thinking.txt",  # Or wherever you want
-        conscious_session,
-        None,  # Not using a thinking_dir for simplicity
-    )
+    # Use the processor kept with the session (like in agent_cli.py)
+    input_processor = get_session_pool().get_processor(conscious_session)
     # Update the conversation state with this turn's input
     conscious_thread["user_input"] = thoughts
-    conscious_thread = input_processor.process_once(conscious_thread)
+    with stream_blocks(input_processor, RESPONSE_BLOCK_KINDS, on_block):
+        conscious_thread = input_processor.process_once(conscious_thread)
     # Get the agent response for this turn
     last_chat_response = conscious_thread.get("last_chat_response")
     return last_chat_response, conscious_thread
@@ -88,6 +90,17 @@ def tear_down_conscious_assistant(conscious_session):
     :param conscious_session: The pointer to the session.
     """
     print("tearing down conscious assistant...")
-    conscious_session.close()
+    # Keep the session warm for the next conversation instead of closing it
+    get_session_pool().release(conscious_session)
     # client.assistants.delete(conscious_assistant_id)
     print("conscious assistant torn down.")
+
+
+def parse_response_blocks(response: str):
+    """
+    Parses a response into its 'thought' and 'say' blocks.
+
+    :param response: The raw response string to parse.
+    :return: A list of (block_type, content) tuples.
+    """
+    return parse_blocks(response, RESPONSE_BLOCK_KINDS)
@@ -17,7 +17,6 @@
 import atexit
 import os
 import queue
-import re
 import time
 from datetime import datetime
 
@@ -28,11 +27,14 @@ from flask import render_template
 from flask_socketio import SocketIO
 
 from apps.conscious_assistant.conscious_assistant import conscious_thinker
+from apps.conscious_assistant.conscious_assistant import parse_response_blocks
 from apps.conscious_assistant.conscious_assistant import set_up_conscious_assistant
 from apps.conscious_assistant.conscious_assistant import tear_down_conscious_assistant
 
 os.environ["AGENT_MANIFEST_FILE"] = "registries/manifest.hocon"
 os.environ["AGENT_TOOL_PATH"] = "coded_tools"
+# Send the blocks of the agent's answer as they are parsed; see BlockStreamingProcessor for why this is off by default
+STREAM_RESPONSES = os.getenv("CONSCIOUS_STREAM_RESPONSES", "false").lower() in ("1", "true", "yes")
 app = Flask(__name__)
 app.config["SECRET_KEY"] = "secret!"
 socketio = SocketIO(app)
@@ -43,6 +45,56 @@ user_input_queue = queue.Queue()
 conscious_session, conscious_thread = set_up_conscious_assistant()
 
 
+def emit_block(kind, content):
+    """
+    Send one block of a response to the page.
+
+    :param kind: 'thought' or 'say'
+    :param content: The content of the block
+    """
+    if not content:
+        return
+    if kind == "thought":
+        timestamp = datetime.now().strftime("[%I:%M:%S%p]").lower()
+        socketio.emit("update_thoughts", {"data": f"{timestamp} thought: {content}"}, namespace="/chat")
+    else:  # kind == "say"
+        socketio.emit("update_speech", {"data": content}, namespace="/chat")
+
+
+def emit_response(response):
+    """
+    Send all blocks of a complete response to the page.
+
+    :param response: The response of the conscious agent
+    """
+    thoughts_to_emit = []
+    speeches_to_emit = []
+
+    for kind, content in parse_response_blocks(response):
+        if not content:
+            continue
+
+        if kind == "thought":
+            timestamp = datetime.now().strftime("[%I:%M:%S%p]").lower()
+            thoughts_to_emit.append(f"{timestamp} thought: {content}")
+        else:  # kind == "say"
+            speeches_to_emit.append(content)
+
+    if thoughts_to_emit:
+        socketio.emit(
+            "update_thoughts",
+            {"data": "\n".join(thoughts_to_emit)},
+            namespace="/chat",
+        )
+
+    if speeches_to_emit:
+        socketio.emit(
+            "update_speech",
+            {"data": "\n".join(speeches_to_emit)},
+            namespace="/chat",
+        )
+
+
 def conscious_thinking_process():
     """Main permanent agent-calling loop."""
     with app.app_context():  # Manually push the application context
@@ -51,47 +103,16 @@ def conscious_thinking_process():
         while True:
             socketio.sleep(1)
 
-            thoughts, conscious_thread = conscious_thinker(conscious_session, conscious_thread, thoughts)
-            print(thoughts)
-
-            # Separating thoughts and speeches
-            # Assume 'thoughts' is the string returned by conscious_thinker
-
-            thoughts_to_emit = []
-            speeches_to_emit = []
-
-            # --- 1.  Slice the input into blocks ----------------------------------------
-            #     Each block begins with  "thought:"  or  "say:"  and continues until
-            #     the next block or the end of the string.
-            pattern = re.compile(
-                r"(?m)^(thought|say):[ \t]*(.*?)(?=^\s*(?:thought|say):|\Z)", re.S  # look-ahead  # dot = newline
-            )
-
-            for kind, raw in pattern.findall(thoughts):
-                content = raw.lstrip()  # drop the leading spaces/newline after the prefix
-                if not content:
-                    continue
-
-                if kind == "thought":
-                    timestamp = datetime.now().strftime("[%I:%M:%S%p]").lower()
-                    thoughts_to_emit.append(f"{timestamp} thought: {content}")
-                else:  # kind == "say"
-                    speeches_to_emit.append(content)
-
-            # --- 2.  Emit the blocks -----------------------------------------------------
-            if thoughts_to_emit:
-                socketio.emit(
-                    "update_thoughts",
-                    {"data": "\n".join(thoughts_to_emit)},
-                    namespace="/chat",
-                )
-
-            if speeches_to_emit:
-                socketio.emit(
-                    "update_speech",
-                    {"data": "\n".join(speeches_to_emit)},
-                    namespace="/chat",
+            if STREAM_RESPONSES:
+                # Blocks are emitted as the answer messages of the agent arrive
+                thoughts, conscious_thread = conscious_thinker(
+                    conscious_session, conscious_thread, thoughts, emit_block
                 )
+                print(thoughts)
+            else:
+                thoughts, conscious_thread = conscious_thinker(conscious_session, conscious_thread, thoughts)
+                print(thoughts)
+                emit_response(thoughts)
 
             timestamp = datetime.now().strftime("[%I:%M:%S%p]").lower()
             thoughts = f"\n{timestamp} user: " + "[Silence]"
@@ -0,0 +1,118 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import queue
+import threading
+import time
+from typing import Any
+from typing import Optional
+
+# Kinds of items a client session's inbox holds
+USER_INPUT = "user_input"
+GUI_CONTEXT = "gui_context"
+NEW_CHAT = "new_chat"
+RELEASE = "release"
+CLOSE = "close"
+
+
+class ClientSession:
+    """
+    Conversation of one Socket.IO connection with the CRUSE agent.
+
+    Events from the browser are put into the inbox, and a worker dedicated to this connection
+    blocks on it, so a turn starts as soon as an event arrives and one connection's turn
+    never delays another's.
+    """
+
+    def __init__(self, sid: str, selected_agent: str):
+        """
+        :param sid: Socket.IO session id of the connection
+        :param selected_agent: The agent network CRUSE is attached to
+        """
+        self.sid = sid
+        self.selected_agent = selected_agent
+        self.inbox: queue.Queue = queue.Queue()
+        # Agent session and conversation state, created by the worker on the first turn
+        self.agent_session: Any = None
+        self.agent_state: Optional[dict[str, Any]] = None
+        self.last_active = time.monotonic()
+        self.busy = False
+
+    def put(self, kind: str, data: Any = None):
+        """Queue an event for the worker of this session."""
+        self.last_active = time.monotonic()
+        self.inbox.put((kind, data))
+
+    def take_turn(self) -> list[tuple[str, Any]]:
+        """
+        Block until there is at least one event, then return it with any others already queued,
+        so that input arriving during a turn is handled together in the next one.
+        """
+        events = [self.inbox.get()]
+        while True:
+            try:
+                events.append(self.inbox.get_nowait())
+            except queue.Empty:
+                return events
+
+
+class ClientSessions:
+    """Thread-safe registry of the sessions of the connected clients, keyed by Socket.IO sid."""
+
+    def __init__(self, idle_seconds: float):
+        """
+        :param idle_seconds: Seconds without activity after which a session's agent resources are released.
+                            0 to never release them.
+        """
+        self.idle_seconds = idle_seconds
+        self._sessions: dict[str, ClientSession] = {}
+        self._lock = threading.Lock()
+
+    def add(self, session: ClientSession):
+        """Register the session of a new connection."""
+        with self._lock:
+            self._sessions[session.sid] = session
+
+    def get(self, sid: str) -> Optional[ClientSession]:
+        """Return the session of a connection, if any."""
+        with self._lock:
+            return self._sessions.get(sid)
+
+    def remove(self, sid: str) -> Optional[ClientSession]:
+        """Forget the session of a connection and return it."""
+        with self._lock:
+            return self._sessions.pop(sid, None)
+
+    def all(self) -> list[ClientSession]:
+        """Return all current sessions."""
+        with self._lock:
+            return list(self._sessions.values())
+
+    def idle(self) -> list[ClientSession]:
+        """Return the sessions that hold an agent session but have not been used for idle_seconds."""
+        if not self.idle_seconds:
+            return []
+        cutoff = time.monotonic() - self.idle_seconds
+        with self._lock:
+            return [
+                session
+                for session in self._sessions.values()
+                if session.agent_session is not None and not session.busy and session.last_active < cutoff
+            ]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
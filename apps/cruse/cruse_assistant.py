@@ -16,11 +16,14 @@
 
 import os
 
-from neuro_san.client.agent_session_factory import AgentSessionFactory
-from neuro_san.client.streaming_input_processor import StreamingInputProcessor
 from pyhocon import ConfigFactory
 
+from apps.agent_session_pool import get_session_pool
+from apps.response_blocks import parse_blocks
+from apps.response_blocks import stream_blocks
+
 AGENT_NETWORK_NAME = "cruse_agent"
+RESPONSE_BLOCK_KINDS = ("say", "gui")
 
 
 def set_up_cruse_assistant(selected_agent):
@@ -33,9 +36,8 @@ def set_up_cruse_assistant(selected_agent):
     metadata = {"user_id": os.environ.get("USER")}
     selected_agent = "registries/" + selected_agent
 
-    # Create session factory and agent session
-    factory = AgentSessionFactory()
-    session = factory.create_session(connection, agent_name, host, port, local_externals_direct, metadata)
+    # Get a warm agent session from the shared pool, created only if none is waiting
+    session = get_session_pool().acquire(agent_name, connection, host, port, local_externals_direct, metadata)
     sly_data = {"selected_agent": selected_agent, "agent_session": session}
 
     # Initialize any conversation state here
@@ -51,36 +53,37 @@ def set_up_cruse_assistant(selected_agent):
     return session, cruse_state_info
 
 
-def cruse(cruse_session, cruse_state_info, user_input):
+def cruse(cruse_session, cruse_state_info, user_input, on_block=None):
     """
     Processes a single turn of user input within the cruse_agent agent's session.
 
     This function simulates a conversational turn by:
-    1. Initializing a StreamingInputProcessor to handle the input.
+    1. Getting the StreamingInputProcessor kept with the session to handle the input.
     2. Updating the agent's internal state with the user's input (`thoughts`).
     3. Passing the updated state to the processor for handling.
     4. Extracting and returning the agent's response for this turn.
 
+    When `on_block` is given, the 'say' and 'gui' blocks of the response are also handed to it
+    one by one as the answer messages of the agent arrive. An answer arrives as one message,
+    so its blocks are handed over together, near the end of the turn.
+
     Parameters:
         cruse_session: An active session object for the cruse_agent agent.
         cruse_state_info (dict): The agent's current conversation state.
         user_input (str): The user's input or query to be processed.
+        on_block (callable, optional): Function called with the kind and content of each block.
 
     Returns:
         tuple:
             - last_chat_response (str or None): The agent's response to the input.
             - cruse_state_info (dict): The updated state after processing.
     """
-    # Use the processor (like in agent_cli.py)
-    input_processor = StreamingInputProcessor(
-        "DEFAULT",
-        "/tmp/agent_thinking.txt",  # Or wherever you want
-        cruse_session,
-        None,  # Not using a thinking_dir for simplicity
-    )
+    # Use the processor kept with the session (like in agent_cli.py)
+    input_processor = get_session_pool().get_processor(cruse_session)
     # Update the conversation state with this turn's input
     cruse_state_info["user_input"] = user_input
-    cruse_state_info = input_processor.process_once(cruse_state_info)
+    with stream_blocks(input_processor, RESPONSE_BLOCK_KINDS, on_block):
+        cruse_state_info = input_processor.process_once(cruse_state_info)
     # Get the agent response for this turn
     last_chat_response = cruse_state_info.get("last_chat_response")
     return last_chat_response, cruse_state_info
@@ -92,7 +95,8 @@ def tear_down_cruse_assistant(cruse_session):
     :param cruse_session: The pointer to the session.
     """
     print("tearing down cruse_agent assistant...")
-    cruse_session.close()
+    # Keep the session warm for the next conversation instead of closing it
+    get_session_pool().release(cruse_session)
     # client.assistants.delete(cruse_assistant_id)
     print("cruse_agent assistant torn down.")
 
@@ -130,29 +134,4 @@ def parse_response_blocks(response: str):
         List[Tuple[str, str]]: A list of (block_type, content) tuples, where block_type is
                                either 'say' or 'gui', and content is the corresponding block text.
     """
-    blocks = []
-    current_type = None
-    current_lines = []
-
-    for line in response.splitlines():
-        line = line.rstrip()
-
-        # Detect new block start
-        if line.lower().startswith("say:"):
-            if current_type:
-                blocks.append((current_type, "\n".join(current_lines).strip()))
-            current_type = "say"
-            current_lines = [line[4:].lstrip()]  # content on same line
-        elif line.lower().startswith("gui:"):
-            if current_type:
-                blocks.append((current_type, "\n".join(current_lines).strip()))
-            current_type = "gui"
-            current_lines = [line[4:].lstrip()]
-        else:
-            current_lines.append(line)
-
-    # Append the last block
-    if current_type and current_lines:
-        blocks.append((current_type, "\n".join(current_lines).strip()))
-
-    return blocks
+    return parse_blocks(response, RESPONSE_BLOCK_KINDS)
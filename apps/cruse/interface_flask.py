@@ -16,15 +16,24 @@
 
 import atexit
 import os
-import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # pylint: disable=import-error
 import schedule
 from flask import Flask
 from flask import jsonify
 from flask import render_template
+from flask import request
 from flask_socketio import SocketIO
 
+from apps.cruse.client_sessions import CLOSE
+from apps.cruse.client_sessions import GUI_CONTEXT
+from apps.cruse.client_sessions import NEW_CHAT
+from apps.cruse.client_sessions import RELEASE
+from apps.cruse.client_sessions import USER_INPUT
+from apps.cruse.client_sessions import ClientSession
+from apps.cruse.client_sessions import ClientSessions
 from apps.cruse.cruse_assistant import cruse
 from apps.cruse.cruse_assistant import get_available_systems
 from apps.cruse.cruse_assistant import parse_response_blocks
@@ -34,77 +43,196 @@ from apps.cruse.cruse_assistant import tear_down_cruse_assistant
 os.environ["AGENT_MANIFEST_FILE"] = "registries/manifest.hocon"
 os.environ["AGENT_TOOL_PATH"] = "coded_tools"
 
+# Seconds a connected but inactive client keeps its agent session
+SESSION_IDLE_SECONDS = float(os.getenv("CRUSE_SESSION_IDLE_SECONDS", "1800"))
+# Agent turns that may run at the same time, across all clients
+MAX_CONCURRENT_TURNS = int(os.getenv("CRUSE_MAX_CONCURRENT_TURNS", "8"))
+# Send the blocks of the agent's answer as they are parsed; see BlockStreamingProcessor for why this is off by default
+STREAM_RESPONSES = os.getenv("CRUSE_STREAM_RESPONSES", "false").lower() in ("1", "true", "yes")
+
 app = Flask(__name__)
 app.config["SECRET_KEY"] = "secret!"
-socketio = SocketIO(app, ping_timeout=360, ping_interval=25)
-thread_started = False  # pylint: disable=invalid-name
-
-user_input_queue = queue.Queue()
-gui_context_queue = queue.Queue()
-
-cruse_session, cruse_agent_state = set_up_cruse_assistant(get_available_systems()[0])
-
-
-def cruse_thinking_process():
-    """Main permanent agent-calling loop."""
-    with app.app_context():
-        global cruse_agent_state  # pylint: disable=global-statement
-        user_input = ""
+# The loop of each client waits on a queue.Queue and on the turn executor, which would block the whole hub
+# of eventlet or gevent, as they are not monkey-patched here. Flask-SocketIO picks eventlet whenever it is
+# installed, so threading is pinned: each background task is then a real thread.
+socketio = SocketIO(app, async_mode="threading", ping_timeout=360, ping_interval=25)
+reaper_started = False  # pylint: disable=invalid-name
+
+client_sessions = ClientSessions(SESSION_IDLE_SECONDS)
+# Agent turns run here, so that at most MAX_CONCURRENT_TURNS of them run at the same time
+turn_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TURNS, thread_name_prefix="cruse-turn")
+
+
+def get_default_system():
+    """Return the agent network a new chat is attached to when none is selected."""
+    available_systems = get_available_systems()
+    return available_systems[0] if available_systems else None
+
+
+def release_agent_session(client: ClientSession):
+    """Tear down the agent session of a client, if it has one. The next turn sets up a new one."""
+    if client.agent_session is not None:
+        tear_down_cruse_assistant(client.agent_session)
+    client.agent_session = None
+    client.agent_state = None
+
+
+class BlockEmitter:
+    """Sends the response of one turn to one client, block by block as each of them completes when streaming."""
+
+    def __init__(self, sid: str):
+        """
+        :param sid: Socket.IO session id of the client
+        """
+        self.sid = sid
+        self.gui_blocks = []
+        self.block_count = 0
+
+    def __call__(self, kind: str, content: str):
+        """
+        :param kind: 'say' or 'gui'
+        :param content: The content of the block
+        """
+        self.block_count += 1
+        if not content:
+            return
+        if kind == "gui":
+            # The page replaces its GUI on every update, so send all gui blocks of the turn so far
+            self.gui_blocks.append(content)
+            socketio.emit("update_gui", {"data": "\n".join(self.gui_blocks)}, namespace="/chat", to=self.sid)
+        elif kind == "say":
+            socketio.emit("update_speech", {"data": content}, namespace="/chat", to=self.sid)
+
+    def finish(self, response: str):
+        """
+        :param response: The whole response of the turn, sent now unless its blocks were already streamed
+        """
+        if not self.block_count:
+            # Not streamed, or there were no blocks to stream and the whole response is spoken
+            emit_response(self.sid, response or "")
+
+    def fail(self, error: Exception):
+        """
+        :param error: Why the turn failed, told to the client so it does not wait for an answer forever
+        """
+        socketio.emit(
+            "update_speech", {"data": f"Sorry, the agent could not answer: {error}"}, namespace="/chat", to=self.sid
+        )
+
+
+def run_turn(client: ClientSession, turn_input: str, on_block: BlockEmitter = None):
+    """Run one agent turn for a client, setting up its agent session first if needed."""
+    if client.agent_session is None:
+        client.agent_session, client.agent_state = set_up_cruse_assistant(client.selected_agent)
+    response, client.agent_state = cruse(client.agent_session, client.agent_state, turn_input, on_block)
+    return response
 
-        while True:
-            socketio.sleep(1)
-            try:
-                gui_context = gui_context_queue.get_nowait()
-            except queue.Empty:
-                gui_context = ""
 
-            if user_input or gui_context:
+def emit_response(sid: str, response: str):
+    """Send the gui and say blocks of an agent response to one client."""
+    blocks = parse_response_blocks(response)
 
-                print(f"USER INPUT:{user_input}\n\nGUI CONTEXT:{gui_context}\n")
-                response, cruse_agent_state = cruse(cruse_session, cruse_agent_state, user_input + str(gui_context))
-                print(response)
+    gui_to_emit = []
+    speeches_to_emit = []
 
-                blocks = parse_response_blocks(response)
+    for kind, content in blocks:
+        if not content:
+            continue
+        if kind == "gui":
+            gui_to_emit.append(content)
+        elif kind == "say":
+            speeches_to_emit.append(content)
 
-                gui_to_emit = []
-                speeches_to_emit = []
+    # fallback if nothing was matched
+    if not blocks and response.strip():
+        speeches_to_emit.append(response.strip())
 
-                for kind, content in blocks:
-                    if not content:
-                        continue
-                    if kind == "gui":
-                        gui_to_emit.append(content)
-                    elif kind == "say":
-                        speeches_to_emit.append(content)
+    if gui_to_emit:
+        socketio.emit("update_gui", {"data": "\n".join(gui_to_emit)}, namespace="/chat", to=sid)
 
-                # fallback if nothing was matched
-                if not blocks and response.strip():
-                    speeches_to_emit.append(response.strip())
+    if speeches_to_emit:
+        socketio.emit("update_speech", {"data": "\n".join(speeches_to_emit)}, namespace="/chat", to=sid)
 
-                if gui_to_emit:
-                    socketio.emit("update_gui", {"data": "\n".join(gui_to_emit)}, namespace="/chat")
 
-                if speeches_to_emit:
-                    socketio.emit("update_speech", {"data": "\n".join(speeches_to_emit)}, namespace="/chat")
+def cruse_thinking_process(client: ClientSession):
+    """
+    Agent-calling loop of one client. It sleeps until the client sends something,
+    and input that arrives while a turn runs is handled together in the next turn.
+    """
+    with app.app_context():
+        while True:
+            user_inputs = []
+            gui_contexts = []
+            for kind, data in client.take_turn():
+                if kind == CLOSE or (kind == USER_INPUT and data == "exit"):
+                    release_agent_session(client)
+                    return
+                if kind == RELEASE:
+                    if time.monotonic() - client.last_active >= SESSION_IDLE_SECONDS:
+                        print(f"Releasing idle session of client {client.sid}")
+                        release_agent_session(client)
+                elif kind == NEW_CHAT:
+                    print(f"Resetting session for new chat... Selected agent is: {data}")
+                    release_agent_session(client)
+                    client.selected_agent = data
+                    # Input queued before the reset belongs to the old chat
+                    user_inputs = []
+                    gui_contexts = []
+                    print("****New chat started****")
+                elif kind == USER_INPUT:
+                    user_inputs.append(data)
+                elif kind == GUI_CONTEXT:
+                    gui_contexts.append(data)
+
+            if not user_inputs and not gui_contexts:
+                continue
 
+            user_input = "\n".join(user_inputs)
+            gui_context = "".join(str(context) for context in gui_contexts)
+            print(f"USER INPUT:{user_input}\n\nGUI CONTEXT:{gui_context}\n")
+            block_emitter = BlockEmitter(client.sid)
+            on_block = block_emitter if STREAM_RESPONSES else None
+            client.busy = True
             try:
-                user_input = user_input_queue.get_nowait()
-                if user_input == "exit":
-                    break
-            except queue.Empty:
-                user_input = ""
-                socketio.sleep(1)
+                response = turn_executor.submit(run_turn, client, user_input + gui_context, on_block).result()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                print(f"Agent turn failed for client {client.sid}: {error}")
+                block_emitter.fail(error)
                 continue
+            finally:
+                client.busy = False
+                client.last_active = time.monotonic()
+            print(response)
+            block_emitter.finish(response)
+
+
+def release_idle_sessions():
+    """Periodically release the agent sessions of clients that stay connected but inactive."""
+    while True:
+        socketio.sleep(min(60.0, SESSION_IDLE_SECONDS or 60.0))
+        for client in client_sessions.idle():
+            client.inbox.put((RELEASE, None))
 
 
 @socketio.on("connect", namespace="/chat")
 def on_connect():
-    """Start background task on connect."""
-    global thread_started  # pylint: disable=global-statement
-    if not thread_started:
-        thread_started = True
-        # let socketio manage the green-thread
-        socketio.start_background_task(cruse_thinking_process)
+    """Create the session of a new client and start its agent-calling loop."""
+    global reaper_started  # pylint: disable=global-statement
+    client = ClientSession(request.sid, get_default_system())
+    client_sessions.add(client)
+    # let socketio manage the thread
+    socketio.start_background_task(cruse_thinking_process, client)
+    if not reaper_started:
+        reaper_started = True
+        socketio.start_background_task(release_idle_sessions)
+
+
+@socketio.on("disconnect", namespace="/chat")
+def on_disconnect(*_):
+    """Close the session of a client that went away."""
+    client = client_sessions.remove(request.sid)
+    if client is not None:
+        client.put(CLOSE)
 
 
 @app.route("/")
@@ -121,8 +249,10 @@ def handle_user_input(json, *_):
     :param json: A json object
     """
     user_input = json["data"]
-    user_input_queue.put(user_input)
-    socketio.emit("update_user_input", {"data": user_input}, namespace="/chat")
+    client = client_sessions.get(request.sid)
+    if client is not None:
+        client.put(USER_INPUT, user_input)
+    socketio.emit("update_user_input", {"data": user_input}, namespace="/chat", to=request.sid)
 
 
 @socketio.on("gui_context", namespace="/chat")
@@ -133,14 +263,19 @@ def handle_gui_context(json, *_):
     :param json: A json object
     """
     gui_context = json["gui_context"]
-    gui_context_queue.put(gui_context)
-    socketio.emit("gui_context_input", {"gui_context": gui_context}, namespace="/chat")
+    client = client_sessions.get(request.sid)
+    if client is not None:
+        client.put(GUI_CONTEXT, gui_context)
+    socketio.emit("gui_context_input", {"gui_context": gui_context}, namespace="/chat", to=request.sid)
 
 
 def cleanup():
     """Tear things down on exit."""
     print("Bye!")
-    tear_down_cruse_assistant(cruse_session)
+    for client in client_sessions.all():
+        client_sessions.remove(client.sid)
+        release_agent_session(client)
+    turn_executor.shutdown(wait=False)
     socketio.stop()
 
 
@@ -190,7 +325,7 @@ def handle_new_chat(data, *args):
     """
     Initializes a new chat session with a selected conversational agent.
 
-    This function resets the current Cruse assistant session and sets up a new one
+    This function asks the agent-calling loop of the client to reset its Cruse assistant session
     based on the provided `data`, which can be either a dictionary (with a "system" key)
     or a direct string specifying the agent name. If no valid agent is specified, it
     defaults to the first available system retrieved by `get_available_systems()`.
@@ -206,19 +341,18 @@ def handle_new_chat(data, *args):
 
     Side Effects:
     ------------
-    - Tears down the existing Cruse assistant session.
-    - Sets up a new session and updates the global `cruse_session` and `cruse_agent_state`.
+    - Tears down the client's existing Cruse assistant session, in the client's loop,
+      after any turn in progress. The new session is set up on the next turn.
+    - Drops input the client queued for the old chat.
     - Prints diagnostic messages to the console.
 
     Notes:
     -----
     - If no valid agent is found and no available systems are returned, the function exits early.
-    - Relies on global variables: `cruse_session`, `cruse_agent_state`.
+    - Only the session of the client that sent the event is reset.
 
     """
     del args
-    # pylint: disable=global-statement
-    global cruse_session, cruse_agent_state
 
     if isinstance(data, dict):
         selected_agent = data.get("system")
@@ -229,19 +363,15 @@ def handle_new_chat(data, *args):
 
     # Fallback to default system if none was provided
     if not selected_agent:
-        available_systems = get_available_systems()
-        selected_agent = available_systems[0] if available_systems else None
+        selected_agent = get_default_system()
 
     if not selected_agent:
         print("No available systems to initialize!")
         return
 
-    print(f"Resetting session for new chat... Selected agent is: {selected_agent}")
-
-    tear_down_cruse_assistant(cruse_session)
-    cruse_session, cruse_agent_state = set_up_cruse_assistant(selected_agent)
-
-    print("****New chat started****")
+    client = client_sessions.get(request.sid)
+    if client is not None:
+        client.put(NEW_CHAT, selected_agent)
 
 
 # Register the cleanup function
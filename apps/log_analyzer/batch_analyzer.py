@@ -0,0 +1,335 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Batch mode of the log analyzer. Analyzes the entries of a directory of thinking logs with several
+agent sessions at once, and can be stopped and started again without redoing finished entries.
+
+    python -m apps.log_analyzer.batch_analyzer --directory /private/tmp/agent_thinking --output analysis.jsonl
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import TextIO
+from typing import Tuple
+
+from apps.log_analyzer.log_analyzer import AGENT_THINKING_LOGS_DIRECTORY
+from apps.log_analyzer.log_analyzer import iter_log_file
+from apps.log_analyzer.log_analyzer import log_analyzer_agent
+from apps.log_analyzer.log_analyzer import new_analysis_thread
+from apps.log_analyzer.log_analyzer import set_up_log_analyzer
+from apps.log_analyzer.log_analyzer import tear_down_analysis_assistant
+
+DEFAULT_WORKERS = 4
+
+# (path, size, modification time) of a log file, so that a file that changed is analyzed again
+FileSignature = Tuple[str, int, int]
+
+
+def entry_hash(system_prompt: str, log_entry: str) -> str:
+    """
+    :param system_prompt: The system prompt of the log file
+    :param log_entry: A conversation entry of the log file
+    :return: Hash identifying the analysis request, the same for identical entries of any file
+    """
+    return hashlib.sha256(f"{system_prompt}\0{log_entry}".encode("utf-8")).hexdigest()
+
+
+def file_signature(file_path: str) -> FileSignature:
+    """
+    :param file_path: Path of a log file
+    :return: The signature of the file as it is now
+    """
+    stat = os.stat(file_path)
+    return os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns
+
+
+@dataclass
+class BatchProgress:
+    """
+    What a batch run has done so far, and what earlier runs did.
+    """
+
+    # Counts of files and entries, by outcome
+    stats: Counter = field(default_factory=Counter)
+    # Hashes of the entries analyzed by earlier runs
+    analyzed: Set[str] = field(default_factory=set)
+    finished_files: Set[FileSignature] = field(default_factory=set)
+    # Analyses of the distinct entries of this run, by hash
+    analyses: Dict[str, Future] = field(default_factory=dict)
+
+
+class BatchLogAnalyzer:
+    """
+    Sends the entries of all log files of a directory to the analysis agent, a bounded number at a time.
+
+    Each entry is analyzed in a conversation of its own, so entries can go to any of the sessions, and
+    identical entries, in one file or several, are analyzed once but get a result each. Every result is appended
+    to a JSONL file as soon as it is in, and files whose entries are all analyzed are recorded in a checkpoint file
+    next to it.
+    A run that was interrupted picks up where it stopped: finished files are not read again and analyzed
+    entries are not sent again. Entries whose analysis failed are retried by the next run.
+    """
+
+    def __init__(self, output_path: str, workers: int = DEFAULT_WORKERS, analyze: Callable[[str], str] = None):
+        """
+        :param output_path: Path of the JSONL file results are appended to
+        :param workers: Number of entries analyzed at the same time, each with its own agent session
+        :param analyze: Function that returns the analysis of an agent input.
+                    By default, the log analysis agent network is called.
+        """
+        self.output_path = output_path
+        self.workers = workers
+        self.analyze = analyze or self.analyze_with_agent
+        self.progress = BatchProgress()
+        self._local = threading.local()
+        self._sessions: List = []
+        self._lock = threading.Lock()
+
+    @property
+    def checkpoint_path(self) -> str:
+        """
+        :return: Path of the file recording the files whose entries are all analyzed
+        """
+        return self.output_path + ".checkpoint"
+
+    def load_checkpoint(self):
+        """
+        Read what earlier runs already did from the output and checkpoint files.
+        """
+        if os.path.exists(self.output_path):
+            with open(self.output_path, "r", encoding="utf-8") as output_file:
+                for line in output_file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # The last line may be cut short if the previous run was killed while writing it
+                        continue
+                    if "error" not in record:
+                        self.progress.analyzed.add(record["hash"])
+
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, "r", encoding="utf-8") as checkpoint_file:
+                for line in checkpoint_file:
+                    try:
+                        self.progress.finished_files.add(tuple(json.loads(line)))
+                    except json.JSONDecodeError:
+                        continue
+
+    def run(self, directory_path: str) -> Counter:
+        """
+        Analyze every entry of every file of a directory that earlier runs did not.
+
+        :param directory_path: Path to directory containing log files
+        :return: Counts of files and entries, by outcome
+        """
+        self.load_checkpoint()
+        # Files whose entries are submitted, with the futures of their entries
+        pending_files: List[Tuple[FileSignature, List[Future]]] = []
+        # Each worker holds one entry and has at most one more waiting, so files are read as they are needed
+        slots = threading.BoundedSemaphore(2 * self.workers)
+
+        with open(self.output_path, "a", encoding="utf-8") as output_file, open(
+            self.checkpoint_path, "a", encoding="utf-8"
+        ) as checkpoint_file:
+            try:
+                with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="log-analyzer") as executor:
+                    for file_path in sorted(entry.path for entry in os.scandir(directory_path) if entry.is_file()):
+                        signature = file_signature(file_path)
+                        if signature in self.progress.finished_files:
+                            self._count("files_skipped")
+                            continue
+
+                        print(f"Processing file: {file_path}")
+                        futures = self._submit_file(executor, slots, output_file, file_path)
+                        if futures is not None:
+                            pending_files.append((signature, futures))
+                        pending_files = self._checkpoint_files(pending_files, checkpoint_file)
+            finally:
+                self._checkpoint_files(pending_files, checkpoint_file)
+                for session in self._sessions:
+                    tear_down_analysis_assistant(session)
+                self._sessions.clear()
+
+        return self.progress.stats
+
+    def analyze_with_agent(self, agent_input: str) -> str:
+        """
+        Analyze an entry in a new conversation, on the agent session of the calling worker.
+
+        :param agent_input: The system prompt and log entry to analyze
+        :return: The analysis
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session, _ = set_up_log_analyzer()
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        analysis, _ = log_analyzer_agent(session, new_analysis_thread(), agent_input)
+        return analysis
+
+    def _submit_file(
+        self, executor: ThreadPoolExecutor, slots: threading.BoundedSemaphore, output_file: TextIO, file_path: str
+    ) -> List[Future]:
+        """
+        :return: The futures of the results of the entries of the file still to be analyzed,
+                or None if the file cannot be read
+        """
+        futures: List[Future] = []
+        try:
+            # Entries are read as the workers are ready for them
+            for index, (system_prompt, log_entry) in enumerate(iter_log_file(file_path)):
+                if not log_entry.strip():  # Skip empty entries
+                    continue
+                future = self._submit_entry(executor, slots, output_file, file_path, index, system_prompt, log_entry)
+                if future is not None:
+                    futures.append(future)
+        except (FileNotFoundError, UnicodeDecodeError, IOError) as e:
+            print(f"Error processing file {file_path}: {str(e)}")
+            self._count("files_failed")
+            return None
+        return futures
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _submit_entry(
+        self,
+        executor: ThreadPoolExecutor,
+        slots: threading.BoundedSemaphore,
+        output_file: TextIO,
+        file_path: str,
+        index: int,
+        system_prompt: str,
+        log_entry: str,
+    ) -> Future:
+        """
+        :return: Future done once the result of the entry is written, failed if its analysis failed,
+                or None if an earlier run analyzed it
+        """
+        digest = entry_hash(system_prompt, log_entry)
+        with self._lock:
+            analysis = self.progress.analyses.get(digest)
+            if analysis is None and digest in self.progress.analyzed:
+                self.progress.stats["entries_skipped"] += 1
+                return None
+            if analysis is not None:
+                # Identical entries share one analysis, but each gets a result of its own
+                self.progress.stats["entries_duplicate"] += 1
+
+        if analysis is None:
+            slots.acquire()
+            analysis = executor.submit(self.analyze, system_prompt + " " + log_entry)
+            with self._lock:
+                self.progress.analyses[digest] = analysis
+            analysis.add_done_callback(self._count_analysis)
+            analysis.add_done_callback(lambda _: slots.release())
+
+        recorded: Future = Future()
+
+        def record(done: Future):
+            error = self._write_result(output_file, file_path, index, digest, done)
+            if error is None:
+                recorded.set_result(None)
+            else:
+                recorded.set_exception(error)
+
+        analysis.add_done_callback(record)
+        return recorded
+
+    def _count(self, name: str):
+        """
+        :param name: The statistic to increase by one
+        """
+        with self._lock:
+            self.progress.stats[name] += 1
+
+    def _count_analysis(self, analysis: Future):
+        """
+        :param analysis: The finished analysis of a distinct entry
+        """
+        self._count("entries_analyzed" if analysis.exception() is None else "entries_failed")
+
+    def _write_result(
+        self, output_file: TextIO, file_path: str, index: int, digest: str, analysis: Future
+    ) -> BaseException:
+        """
+        Append the outcome of an entry to the output file.
+
+        :return: The error of the analysis, or None if it succeeded
+        """
+        record = {"hash": digest, "file": file_path, "entry_index": index}
+        error = analysis.exception()
+        if error is None:
+            record["analysis"] = analysis.result()
+            print(record["analysis"])
+        else:
+            record["error"] = str(error)
+            print(f"Error analyzing entry {index} of {file_path}: {error}")
+
+        with self._lock:
+            output_file.write(json.dumps(record) + "\n")
+            output_file.flush()
+        return error
+
+    def _checkpoint_files(
+        self, pending_files: List[Tuple[FileSignature, List[Future]]], checkpoint_file: TextIO
+    ) -> List[Tuple[FileSignature, List[Future]]]:
+        """
+        Record the files whose entries are all analyzed.
+
+        :return: The files still pending
+        """
+        still_pending: List[Tuple[FileSignature, List[Future]]] = []
+        for signature, futures in pending_files:
+            if not all(future.done() for future in futures):
+                still_pending.append((signature, futures))
+                continue
+            if any(future.exception() is not None for future in futures):
+                # Left out of the checkpoint, so the next run retries the failed entries
+                continue
+            with self._lock:
+                checkpoint_file.write(json.dumps(list(signature)) + "\n")
+                checkpoint_file.flush()
+                self.progress.finished_files.add(signature)
+                self.progress.stats["files_analyzed"] += 1
+        return still_pending
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Analyze a directory of agent thinking logs in batch")
+    arg_parser.add_argument("--directory", default=AGENT_THINKING_LOGS_DIRECTORY, help="Directory of log files")
+    arg_parser.add_argument("--output", default="log_analysis.jsonl", help="JSONL file the results are appended to")
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("LOG_ANALYZER_WORKERS", str(DEFAULT_WORKERS))),
+        help="Number of entries analyzed at the same time",
+    )
+    args = arg_parser.parse_args()
+
+    run_stats = BatchLogAnalyzer(args.output, args.workers).run(args.directory)
+    print(f"Done: {dict(run_stats)}")
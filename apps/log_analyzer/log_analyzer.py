@@ -14,16 +14,19 @@
 #
 # END COPYRIGHT
 
+import io
 import json
 import os
-import re
 
-from neuro_san.client.agent_session_factory import AgentSessionFactory
-from neuro_san.client.streaming_input_processor import StreamingInputProcessor
+from apps.agent_session_pool import get_session_pool
 
 AGENT_THINKING_LOGS_DIRECTORY = "/private/tmp/agent_thinking"
 
 AGENT_NETWORK_NAME = "log_analysis_agents"
+# Labels of the sections of an agent thinking log
+SECTION_LABELS = ("HUMAN", "AI", "AGENT", "SYSTEM")
+# Fields of the token accounting an [AGENT] section may hold
+METADATA_FIELDS = ("completion_tokens", "prompt_tokens", "total_tokens")
 os.environ["AGENT_MANIFEST_FILE"] = "registries/manifest.hocon"
 os.environ["AGENT_TOOL_PATH"] = "coded_tools"
 
@@ -37,11 +40,15 @@ def set_up_log_analyzer():
     local_externals_direct = False
     metadata = {"user_id": os.environ.get("USER")}
 
-    # Create session factory and agent session
-    factory = AgentSessionFactory()
-    session = factory.create_session(connection, agent_name, host, port, local_externals_direct, metadata)
+    # Get a warm agent session from the shared pool, created only if none is waiting
+    session = get_session_pool().acquire(agent_name, connection, host, port, local_externals_direct, metadata)
+    return session, new_analysis_thread()
+
+
+def new_analysis_thread():
+    """Return the state of a new conversation with the analysis agent."""
     # Initialize any conversation state here
-    analysis_thread = {
+    return {
         "last_chat_response": None,
         "prompt": "Analyze the agent log\n",
         "timeout": 5000.0,
@@ -50,7 +57,6 @@ def set_up_log_analyzer():
         "sly_data": None,
         "chat_filter": {"chat_filter_type": "MAXIMAL"},
     }
-    return session, analysis_thread
 
 
 def log_analyzer_agent(analysis_session, analysis_thread, log_entry):
@@ -58,7 +64,7 @@ def log_analyzer_agent(analysis_session, analysis_thread, log_entry):
     Processes a single turn of user input within the analysis agent's session.
 
     This function simulates a conversational turn by:
-    1. Initializing a StreamingInputProcessor to handle the input.
+    1. Getting the StreamingInputProcessor kept with the session to handle the input.
     2. Updating the agent's internal thread state with the user's input (`log_entry`).
     3. Passing the updated thread to the processor for handling.
     4. Extracting and returning the agent's response for this turn.
@@ -73,13 +79,8 @@ def log_analyzer_agent(analysis_session, analysis_thread, log_entry):
             - last_chat_response (str or None): The agent's response to the input.
             - analysis_thread (dict): The updated thread state after processing.
     """
-    # Use the processor (like in agent_cli.py)
-    input_processor = StreamingInputProcessor(
-        "DEFAULT",
-        "/tmp/agent_thinking.txt",  # Or wherever you want
-        analysis_session,
-        None,  # Not using a thinking_dir for simplicity
-    )
+    # Use the processor kept with the session (like in agent_cli.py)
+    input_processor = get_session_pool().get_processor(analysis_session)
     # Update the conversation state with this turn's input
     analysis_thread["user_input"] = log_entry
     analysis_thread = input_processor.process_once(analysis_thread)
@@ -94,7 +95,8 @@ def tear_down_analysis_assistant(analysis_session):
     :param analysis_session: The pointer to the session.
     """
     print("tearing down analysis assistant...")
-    analysis_session.close()
+    # Keep the session warm for the next conversation instead of closing it
+    get_session_pool().release(analysis_session)
     # client.assistants.delete(analysis_assistant_id)
     print("analysis assistant torn down.")
 
@@ -118,17 +120,8 @@ def parse_log_files(directory_path, log_analyzer, analysis_session, analysis_thr
         print(f"Processing file: {log_file}")
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Extract system prompt
-            system_prompt = extract_system_prompt(content)
-
-            # Extract conversation entries
-            conversation_entries = extract_conversation_entries(content)
-
-            # Process each conversation entry
-            for log_entry in conversation_entries:
+            # Process each conversation entry as it is read
+            for system_prompt, log_entry in iter_log_file(file_path):
                 if log_entry.strip():  # Skip empty entries
                     analysis, analysis_thread = log_analyzer(
                         analysis_session, analysis_thread, system_prompt + " " + log_entry
@@ -144,6 +137,151 @@ def parse_log_files(directory_path, log_analyzer, analysis_session, analysis_thr
             raise  # Or use logging framework to log full traceback
 
 
+def iter_log_file(file_path):
+    """
+    Read a log file line by line and yield its conversation entries as they are found,
+    so that files of any size are processed without being loaded in full.
+
+    Args:
+        file_path (str): Path to the log file
+
+    Yields:
+        tuple:
+            - system_prompt (str): System prompt text, as far as the file has been read
+            - log_entry (str): Conversation entry string
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        yield from iter_log_entries(f)
+
+
+def iter_log_sections(lines):
+    """
+    Split log lines into labeled sections. A section starts on a line beginning with [HUMAN], [AI],
+    [AGENT] or [SYSTEM] and runs until the next such line. Only the current section is kept in memory.
+
+    Args:
+        lines (iterable): Lines of the log, for instance an open file
+
+    Yields:
+        tuple:
+            - label (str): Section label, for instance "[HUMAN]"
+            - header (str): Rest of the line the section starts on
+            - body (str): Text of the lines after that, up to the next section
+    """
+    label = None
+    header = ""
+    section_lines = []
+
+    for line in lines:
+        if line.startswith("["):
+            end = line.find("]")
+            if end > 0 and line[1:end] in SECTION_LABELS:
+                if label is not None:
+                    yield label, header, "".join(section_lines)
+                label = line[: end + 1]
+                header = line[end + 1 :]
+                section_lines = []
+                continue
+        if label is not None:
+            section_lines.append(line)
+
+    if label is not None:
+        yield label, header, "".join(section_lines)
+
+
+class SystemPromptReader:
+    """
+    Picks the system prompt out of the sections of a log: the text after the first line that is just "[SYSTEM]:",
+    up to the next [HUMAN], [AI] or [AGENT] section.
+    """
+
+    def __init__(self):
+        self.system_prompt = None
+        self._parts = None
+
+    def add_section(self, label, header, body):
+        """
+        Args:
+            label (str): Section label
+            header (str): Rest of the line the section starts on
+            body (str): Text of the lines after that
+
+        Returns:
+            bool: True once the system prompt is complete
+        """
+        if self.system_prompt is not None:
+            return True
+        if self._parts is None:
+            if label == "[SYSTEM]" and header.endswith("\n") and header.strip() == ":":
+                self._parts = [body]
+        elif label == "[SYSTEM]":
+            self._parts.append(label + header + body)
+        else:
+            self.finish()
+        return self.system_prompt is not None
+
+    def finish(self):
+        """
+        Mark the end of the log.
+
+        Returns:
+            str: The system prompt, or None if there is none
+        """
+        if self.system_prompt is None and self._parts is not None:
+            self.system_prompt = "".join(self._parts).strip()
+        return self.system_prompt
+
+
+def iter_log_entries(lines):
+    """
+    Extract conversation entries from [HUMAN] to [AI] plus the following [AGENT] metadata, in a single pass.
+
+    Args:
+        lines (iterable): Lines of the log, for instance an open file
+
+    Yields:
+        tuple:
+            - system_prompt (str): The system prompt, or "" while it has not been read in full
+            - log_entry (str): Conversation entry string
+    """
+    system_prompt_reader = SystemPromptReader()
+    system_prompt = ""
+    # Parts of the entry being collected, from its [HUMAN] section on
+    entry_parts = None
+    ai_found = False
+
+    for label, header, body in iter_log_sections(lines):
+        if system_prompt_reader.add_section(label, header, body):
+            system_prompt = system_prompt_reader.system_prompt
+        content = (header + body).strip()
+        if not content:
+            continue
+
+        if entry_parts is not None and ai_found:
+            # Look for the following AGENT section with metadata (JSON)
+            is_metadata = label == "[AGENT]" and is_json_metadata(content)
+            if is_metadata:
+                entry_parts.append(f"[AGENT]:\n{content}")
+            yield system_prompt, "\n".join(entry_parts)
+            entry_parts = None
+            if is_metadata:
+                continue
+
+        if entry_parts is None:
+            if label == "[HUMAN]":
+                entry_parts = [f"[HUMAN]:\n{content}"]
+                ai_found = False
+            continue
+
+        # Collect everything until we find [AI]
+        entry_parts.append(f"{label}:\n{content}")
+        ai_found = label == "[AI]"
+
+    # Combine all parts into a single log entry, if there are at least HUMAN and AI
+    if entry_parts is not None and len(entry_parts) >= 2:
+        yield system_prompt_reader.finish() or "", "\n".join(entry_parts)
+
+
 def extract_system_prompt(content):
     """
     Extract the [SYSTEM] section from the log content.
@@ -154,11 +292,11 @@ def extract_system_prompt(content):
     Returns:
         str: System prompt text
     """
-    system_match = re.search(r"\[SYSTEM]:\s*\n(.*?)(?=\[HUMAN]|\[AI]|\[AGENT]|$)", content, re.DOTALL)
-
-    if system_match:
-        return system_match.group(1).strip()
-    return ""
+    system_prompt_reader = SystemPromptReader()
+    for label, header, body in iter_log_sections(io.StringIO(content)):
+        if system_prompt_reader.add_section(label, header, body):
+            break
+    return system_prompt_reader.finish() or ""
 
 
 def extract_conversation_entries(content):
@@ -171,61 +309,7 @@ def extract_conversation_entries(content):
     Returns:
         list: List of conversation entry strings
     """
-    entries = []
-
-    # Split content into sections
-    sections = re.split(r"(\[(?:HUMAN|AI|AGENT|SYSTEM)])", content)
-
-    # Remove empty sections and combine with their labels
-    labeled_sections = []
-    for i in range(0, len(sections), 2):
-        if i + 1 < len(sections):
-            label = sections[i + 1] if i + 1 < len(sections) else ""
-            content_part = sections[i + 2] if i + 2 < len(sections) else ""
-            if label and content_part.strip():
-                labeled_sections.append((label, content_part.strip()))
-
-    # Find conversation patterns: [HUMAN] -> ... -> [AI] -> [AGENT] (with metadata)
-    i = 0
-    while i < len(labeled_sections):
-        if labeled_sections[i][0] == "[HUMAN]":
-            entry_parts = []
-            current_pos = i
-
-            # Add the HUMAN section
-            entry_parts.append(f"[HUMAN]:\n{labeled_sections[current_pos][1]}")
-            current_pos += 1
-
-            # Collect everything until we find [AI]
-            while current_pos < len(labeled_sections) and labeled_sections[current_pos][0] != "[AI]":
-                label, content_part = labeled_sections[current_pos]
-                entry_parts.append(f"{label}:\n{content_part}")
-                current_pos += 1
-
-            # Add the AI section if found
-            if current_pos < len(labeled_sections) and labeled_sections[current_pos][0] == "[AI]":
-                entry_parts.append(f"[AI]:\n{labeled_sections[current_pos][1]}")
-                current_pos += 1
-
-                # Look for the following AGENT section with metadata (JSON)
-                if (
-                    current_pos < len(labeled_sections)
-                    and labeled_sections[current_pos][0] == "[AGENT]"
-                    and is_json_metadata(labeled_sections[current_pos][1])
-                ):
-                    entry_parts.append(f"[AGENT]:\n{labeled_sections[current_pos][1]}")
-                    current_pos += 1
-
-            # Combine all parts into a single log entry
-            if len(entry_parts) >= 2:  # At least HUMAN and AI
-                log_entry = "\n".join(entry_parts)
-                entries.append(log_entry)
-
-            i = current_pos
-        else:
-            i += 1
-
-    return entries
+    return [log_entry for _, log_entry in iter_log_entries(io.StringIO(content))]
 
 
 def is_json_metadata(content):
@@ -238,11 +322,14 @@ def is_json_metadata(content):
     Returns:
         bool: True if content appears to be metadata JSON
     """
+    content = content.strip()
+    # Only parse what can be JSON holding one of the fields
+    if not content.startswith(("{", "[", '"')) or not any(field in content for field in METADATA_FIELDS):
+        return False
     try:
-        data = json.loads(content.strip())
+        data = json.loads(content)
         # Check if it has the expected metadata fields
-        expected_fields = ["completion_tokens", "prompt_tokens", "total_tokens"]
-        return any(field in data for field in expected_fields)
+        return any(field in data for field in METADATA_FIELDS)
     except (json.JSONDecodeError, TypeError):
         return False
 
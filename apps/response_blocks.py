@@ -0,0 +1,198 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Parsing of agent responses made of labeled blocks, such as "say:", "gui:" or "thought:",
+as the answer messages of the agent come in.
+"""
+
+from contextlib import contextmanager
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+from neuro_san.client.streaming_input_processor import StreamingInputProcessor
+from neuro_san.internals.filters.answer_message_filter import AnswerMessageFilter
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.message_processing.message_processor import MessageProcessor
+
+
+class ResponseBlockParser:
+    """
+    Splits a response into blocks, each starting on a line that begins with "<kind>:" (case-insensitive)
+    and running until the next such line or the end of the response. Text can be fed in pieces;
+    a block is returned as soon as the line starting the next block is complete.
+    Text before the first block is dropped.
+    """
+
+    def __init__(self, kinds: Tuple[str, ...]):
+        """
+        :param kinds: The block labels to recognize, for instance ("say", "gui")
+        """
+        self.kinds = kinds
+        self._partial_line = ""
+        self._kind = None
+        self._lines: List[str] = []
+
+    def feed(self, text: str) -> List[Tuple[str, str]]:
+        """
+        :param text: The next piece of the response
+        :return: List of (kind, content) of the blocks completed by this piece
+        """
+        completed: List[Tuple[str, str]] = []
+        lines = (self._partial_line + text).split("\n")
+        # The last line may still be growing
+        self._partial_line = lines.pop()
+        for line in lines:
+            self._add_line(line, completed)
+        return completed
+
+    def close(self) -> List[Tuple[str, str]]:
+        """
+        Mark the end of the response and start over for the next one.
+
+        :return: List of (kind, content) of the blocks that were still open
+        """
+        completed: List[Tuple[str, str]] = []
+        if self._partial_line:
+            self._add_line(self._partial_line, completed)
+        if self._kind is not None:
+            completed.append((self._kind, "\n".join(self._lines).strip()))
+        self._partial_line = ""
+        self._kind = None
+        self._lines = []
+        return completed
+
+    def _add_line(self, line: str, completed: List[Tuple[str, str]]):
+        """
+        :param line: A complete line of the response
+        :param completed: List the block ended by this line, if any, is appended to
+        """
+        line = line.rstrip()
+        lowered = line.lower()
+        for kind in self.kinds:
+            if lowered.startswith(kind + ":"):
+                if self._kind is not None:
+                    completed.append((self._kind, "\n".join(self._lines).strip()))
+                self._kind = kind
+                # content on same line
+                self._lines = [line[len(kind) + 1 :].lstrip()]
+                return
+        self._lines.append(line)
+
+
+def parse_blocks(response: str, kinds: Tuple[str, ...]) -> List[Tuple[str, str]]:
+    """
+    :param response: A complete response
+    :param kinds: The block labels to recognize
+    :return: List of (kind, content) of all blocks of the response
+    """
+    parser = ResponseBlockParser(kinds)
+    return parser.feed(response) + parser.close()
+
+
+class BlockStreamingProcessor(MessageProcessor):
+    """
+    MessageProcessor that parses the answer messages of the front man while the agent streams its messages,
+    and hands every block to a callback as soon as it is complete.
+
+    With the MAXIMAL chat filter, the answer of the front man arrives twice: first as an AI message,
+    then again as the final AGENT_FRAMEWORK message of the turn. Only the latter is parsed, so each block
+    is handed over once. As that message arrives at the end of the turn, this does not make the first block
+    reach the client sooner than parsing the response after the turn. That is why streaming is off by default
+    in the apps (CRUSE_STREAM_RESPONSES, CONSCIOUS_STREAM_RESPONSES). The parser itself accepts partial text
+    for the day answers are streamed in pieces.
+    """
+
+    def __init__(self, kinds: Tuple[str, ...], on_block: Callable[[str, str], None]):
+        """
+        :param kinds: The block labels to recognize
+        :param on_block: Function called with the kind and content of each completed block
+        """
+        self.kinds = kinds
+        self.on_block = on_block
+        self.filter = AnswerMessageFilter()
+        self.parser = ResponseBlockParser(kinds)
+        self.block_count = 0
+
+    def reset(self):
+        """
+        Resets any previously accumulated state
+        """
+        self.parser = ResponseBlockParser(self.kinds)
+        self.block_count = 0
+
+    def process_message(self, chat_message_dict: Dict[str, Any], message_type: ChatMessageType):
+        """
+        Feed the text of the final answer message to the parser.
+        Each message is a whole answer, so the next one starts on a line of its own.
+
+        :param chat_message_dict: The ChatMessage dictionary to process.
+        :param message_type: The ChatMessageType of the chat_message_dictionary to process.
+        """
+        # The AI message of the front man only repeats ahead of time what its final answer says
+        if message_type != ChatMessageType.AGENT_FRAMEWORK:
+            return
+        if not self.filter.allow_message(chat_message_dict, message_type):
+            return
+        text: str = chat_message_dict.get("text")
+        if not text:
+            return
+        self._emit(self.parser.feed(text + "\n"))
+
+    def flush(self):
+        """
+        Hand over the last block, once the agent has finished answering.
+        """
+        self._emit(self.parser.close())
+
+    def _emit(self, blocks: List[Tuple[str, str]]):
+        """
+        :param blocks: List of (kind, content) of completed blocks
+        """
+        for kind, content in blocks:
+            self.block_count += 1
+            self.on_block(kind, content)
+
+
+@contextmanager
+def stream_blocks(
+    input_processor: StreamingInputProcessor, kinds: Tuple[str, ...], on_block: Callable[[str, str], None]
+) -> Iterator[None]:
+    """
+    Hand the blocks of the answers the input processor handles within the with-block to a callback,
+    each as soon as it is complete.
+
+    :param input_processor: The processor of the turn
+    :param kinds: The block labels to recognize
+    :param on_block: Function called with the kind and content of each completed block.
+                    If None, nothing is streamed.
+    """
+    if on_block is None:
+        yield
+        return
+
+    block_processor = BlockStreamingProcessor(kinds, on_block)
+    message_processor = input_processor.get_message_processor()
+    message_processor.add_processor(block_processor)
+    try:
+        yield
+        block_processor.flush()
+    finally:
+        # The input processor is kept for later turns, which may not stream
+        message_processor.message_processors.remove(block_processor)
@@ -14,19 +14,47 @@
 #
 # END COPYRIGHT
 
+import threading
+from json import loads
 from typing import Any
+from typing import Iterator
 
-from requests import get
-from requests import post
+from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 
+# Seconds to wait for the server to accept a connection, and at most between two streamed messages
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 300
+
+
+class NetworkBusyError(Exception):
+    """Raised when an agent network already has as many requests in flight as allowed."""
+
 
 class APIClient:
     """Handle API communication with neuro-san server."""
 
-    def __init__(self, port: str):
+    def __init__(self, port: str, max_per_network: int = 4, queue_timeout: float = 60.0, pool_size: int = 16):
+        """
+        :param port: Port of the neuro-san server
+        :param max_per_network: Maximum number of chat requests in flight per agent network
+        :param queue_timeout: Seconds a chat request waits for its network to have a free slot
+        :param pool_size: Number of keep-alive connections kept open to the server
+        """
         self.port = port
         self.base_url = f"http://localhost:{port}/api/v1"
+        self.max_per_network = max_per_network
+        self.queue_timeout = queue_timeout
+
+        # One session reuses connections across messages instead of opening a new one per request
+        self.session = Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
 
     def call(self, endpoint: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
         """
@@ -40,13 +68,56 @@ class APIClient:
         url = f"{self.base_url}/{endpoint}"
 
         if endpoint == "list":
-            response = get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
         else:
-            response = post(url, json=payload, timeout=300)
+            response = self.session.post(url, json=payload, timeout=READ_TIMEOUT)
 
         response.raise_for_status()
         return response.json()
 
+    def list_networks(self, etag: str | None = None) -> tuple[list[dict[str, Any]] | None, str | None]:
+        """
+        Get the agent networks served by the server.
+
+        :param etag: ETag of the catalog the caller already has, if any
+
+        :return: A tuple of (list of agent dicts, or None if the catalog is unchanged since etag; new ETag)
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self.session.get(f"{self.base_url}/list", headers=headers, timeout=30)
+        if response.status_code == 304:
+            return None, etag
+        response.raise_for_status()
+        return response.json().get("agents", []), response.headers.get("ETag")
+
+    def stream_chat(self, network_name: str, payload: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """
+        Chat with an agent network, yielding its messages as the server streams them.
+
+        :param network_name: Name of the agent network
+        :param payload: Chat request payload
+
+        :return: Iterator of the streamed chat responses in JSON format
+        :raises NetworkBusyError: If the network has no free slot within the queue timeout
+        """
+        slot = self._get_slot(network_name)
+        if not slot.acquire(timeout=self.queue_timeout):
+            raise NetworkBusyError(f"{network_name} is busy with {self.max_per_network} other requests")
+
+        try:
+            with self.session.post(
+                f"{self.base_url}/{network_name}/streaming_chat",
+                json=payload,
+                stream=True,
+                timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines(decode_unicode=True):
+                    if line and line.strip():
+                        yield loads(line)
+        finally:
+            slot.release()
+
     def test_connection(self, network_name: str) -> bool:
         """
         Test if network exists.
@@ -60,3 +131,12 @@ class APIClient:
             return True
         except HTTPError:
             return False
+
+    def _get_slot(self, network_name: str) -> threading.BoundedSemaphore:
+        """Get the semaphore that limits concurrent requests to a network."""
+        with self._slots_lock:
+            slot = self._slots.get(network_name)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_per_network)
+                self._slots[network_name] = slot
+            return slot
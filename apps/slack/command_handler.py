@@ -23,13 +23,15 @@ from slack_bolt import Ack
 from slack_bolt import App
 
 from apps.slack.api_client import APIClient
+from apps.slack.network_catalog import NetworkCatalog
 
 
 class CommandHandler:
     """Handle Slack slash commands."""
 
-    def __init__(self, api_client: APIClient):
+    def __init__(self, api_client: APIClient, catalog: NetworkCatalog | None = None):
         self.api_client = api_client
+        self.catalog = catalog
 
     def list_networks(self, ack: Ack, respond: Any, logger: Any) -> None:
         """
@@ -43,8 +45,10 @@ class CommandHandler:
 
         try:
             logger.info("Fetching networks")
-            data = self.api_client.call("list")
-            agents = data.get("agents", [])
+            if self.catalog is not None:
+                agents = self.catalog.get_networks()
+            else:
+                agents = self.api_client.call("list").get("agents", [])
 
             if not agents:
                 respond("No networks available.")
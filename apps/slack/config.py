@@ -23,3 +23,20 @@ load_dotenv()
 SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN")
 SLACK_APP_TOKEN = os.environ.get("SLACK_APP_TOKEN")
 NEURO_SAN_SERVER_HTTP_PORT = os.environ.get("NEURO_SAN_SERVER_HTTP_PORT", "8080")
+
+# Conversation store budgets. 0 disables a limit; without a path threads are kept in memory only.
+SLACK_CONVERSATION_MAX_THREADS = int(os.environ.get("SLACK_CONVERSATION_MAX_THREADS", "1000"))
+SLACK_CONVERSATION_MAX_BYTES = int(os.environ.get("SLACK_CONVERSATION_MAX_BYTES", str(256 * 1024 * 1024)))
+SLACK_CONVERSATION_TTL_SECONDS = float(os.environ.get("SLACK_CONVERSATION_TTL_SECONDS", str(7 * 24 * 60 * 60)))
+SLACK_CONVERSATION_STORE_PATH = os.environ.get("SLACK_CONVERSATION_STORE_PATH")
+
+# Request handling: worker threads, accepted-but-unanswered messages, and in-flight requests per agent network
+SLACK_MAX_CONCURRENT_REQUESTS = int(os.environ.get("SLACK_MAX_CONCURRENT_REQUESTS", "16"))
+SLACK_MAX_QUEUED_REQUESTS = int(os.environ.get("SLACK_MAX_QUEUED_REQUESTS", "64"))
+SLACK_MAX_REQUESTS_PER_NETWORK = int(os.environ.get("SLACK_MAX_REQUESTS_PER_NETWORK", "4"))
+SLACK_QUEUE_TIMEOUT_SECONDS = float(os.environ.get("SLACK_QUEUE_TIMEOUT_SECONDS", "60"))
+SLACK_UPDATE_INTERVAL_SECONDS = float(os.environ.get("SLACK_UPDATE_INTERVAL_SECONDS", "1.5"))
+
+# Network catalog: seconds between refreshes, and the manifest file whose changes trigger an earlier refresh
+SLACK_CATALOG_TTL_SECONDS = float(os.environ.get("SLACK_CATALOG_TTL_SECONDS", "300"))
+AGENT_MANIFEST_FILE = os.environ.get("AGENT_MANIFEST_FILE", os.path.join("registries", "manifest.hocon"))
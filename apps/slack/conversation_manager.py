@@ -16,46 +16,78 @@
 
 from typing import Any
 
+from apps.slack.conversation_store import ConversationStore
 from apps.slack.dataclass.thread_context import ThreadContext
+from apps.slack.dataclass.thread_record import ThreadRecord
 
 
 class ConversationManager:
     """Manage conversation contexts and thread data."""
 
-    def __init__(self):
-        self.contexts: dict[str, Any] = {}
-        self.networks: dict[str, str] = {}
-        self.sly_data: dict[str, dict[str, Any]] = {}
+    def __init__(self, store: ConversationStore | None = None):
+        self.store = store if store is not None else ConversationStore()
+
+    @staticmethod
+    def _split_conversation_key(conversation_key: str) -> tuple[str, str]:
+        """Split a "<channel>:<thread>:<network>" conversation key into its thread key and network name."""
+        parts = conversation_key.split(":", 2)
+        if len(parts) < 3:
+            return conversation_key, ""
+        return f"{parts[0]}:{parts[1]}", parts[2]
 
     def get_network(self, thread_key: str) -> str | None:
         """Get network for a thread."""
-        return self.networks.get(thread_key)
+        record = self.store.get(thread_key)
+        return record.network if record else None
 
     def set_network(self, thread_key: str, network_name: str) -> None:
         """Set network for a thread."""
-        self.networks[thread_key] = network_name
+
+        def change(record: ThreadRecord) -> None:
+            record.network = network_name
+
+        self.store.update(thread_key, change)
 
     def get_sly_data(self, thread_key: str) -> dict[str, Any] | None:
         """Get sly_data for a thread."""
-        return self.sly_data.get(thread_key)
+        record = self.store.get(thread_key)
+        return record.sly_data if record else None
 
     def set_sly_data(self, thread_key: str, data: dict[str, Any]) -> None:
         """Set sly_data for a thread."""
-        self.sly_data[thread_key] = data
+
+        def change(record: ThreadRecord) -> None:
+            record.sly_data = data
+
+        self.store.update(thread_key, change)
 
     def get_context(self, conversation_key: str) -> dict[str, Any]:
         """Get conversation context."""
-        return self.contexts.get(conversation_key, {})
+        thread_key, network_name = self._split_conversation_key(conversation_key)
+        record = self.store.get(thread_key)
+        return record.contexts.get(network_name, {}) if record else {}
 
     def set_context(self, conversation_key: str, context: dict[str, Any]) -> None:
         """Set conversation context."""
-        self.contexts[conversation_key] = context
+        thread_key, network_name = self._split_conversation_key(conversation_key)
+
+        def change(record: ThreadRecord) -> None:
+            record.contexts[network_name] = context
+
+        self.store.update(thread_key, change)
 
     def clear_old_contexts(self, thread_ctx: ThreadContext, network_name: str, logger: Any) -> None:
         """Clear contexts from different networks in the same thread."""
-        prefix = f"{thread_ctx.channel_id}:{thread_ctx.conversation_thread}"
-        keys_to_delete = [k for k in self.contexts if k.startswith(prefix) and not k.endswith(f":{network_name}")]
+        thread_key = f"{thread_ctx.channel_id}:{thread_ctx.conversation_thread}"
+        record = self.store.get(thread_key)
+        stale = [name for name in record.contexts if name != network_name] if record else []
+        if not stale:
+            return
+
+        def change(record: ThreadRecord) -> None:
+            for name in stale:
+                record.contexts.pop(name, None)
 
-        for key in keys_to_delete:
-            del self.contexts[key]
-            logger.info(f"Cleared context for different network: {key}")
+        self.store.update(thread_key, change)
+        for name in stale:
+            logger.info(f"Cleared context for different network: {thread_key}:{name}")
@@ -0,0 +1,198 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from json import loads
+from typing import Callable
+
+from apps.slack.dataclass.store_limits import StoreLimits
+from apps.slack.dataclass.thread_record import ThreadRecord
+
+# How often idle threads are purged from the database
+PURGE_INTERVAL_SECONDS = 60.0
+
+# Fraction of the TTL after which a read writes the access time of a thread back to the database.
+# A thread that is only read may then expire from the database up to this much of the TTL early.
+TOUCH_FRACTION_OF_TTL = 0.1
+
+logger = logging.getLogger(__name__)
+
+
+class ConversationStore:
+    """
+    Bounded store of thread records.
+
+    Records are kept in memory in least-recently-used order and evicted once there are
+    more than max_threads of them, once their total size exceeds max_bytes, or once they
+    have been idle for ttl_seconds. If a path is given, every change is also written to a
+    SQLite database, so evicted threads are reloaded on their next message and
+    conversations survive restarts without the bot holding all history in memory.
+    """
+
+    def __init__(self, max_threads: int = 1000, max_bytes: int = 0, ttl_seconds: float = 0, path: str | None = None):
+        """
+        :param max_threads: Maximum number of threads kept in memory. 0 for no limit.
+        :param max_bytes: Maximum total size of the records kept in memory. 0 for no limit.
+        :param ttl_seconds: Seconds after which an idle thread is forgotten. 0 to keep threads forever.
+        :param path: Optional path to a SQLite database to persist threads in
+        """
+        self.limits = StoreLimits(max_threads, max_bytes, ttl_seconds)
+        self.total_bytes = 0
+        self._records: OrderedDict[str, ThreadRecord] = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+
+        self._connection: sqlite3.Connection | None = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS threads ("
+                " thread_key TEXT PRIMARY KEY,"
+                " record TEXT NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON threads(last_access)")
+            self._connection.commit()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, thread_key: str) -> ThreadRecord | None:
+        """Get the record of a thread, loading it from the database if it was evicted."""
+        with self._lock:
+            self._purge_expired()
+            record = self._records.get(thread_key)
+            if record is not None:
+                self._records.move_to_end(thread_key)
+            else:
+                record = self._load(thread_key)
+                if record is None:
+                    return None
+                self._remember(thread_key, record)
+
+            record.last_access = time.time()
+            if self._should_touch(record):
+                # Reading a thread keeps it alive, also for the TTL of the database after a restart
+                self._connection.execute(
+                    "UPDATE threads SET last_access = ? WHERE thread_key = ?", (record.last_access, thread_key)
+                )
+                self._connection.commit()
+                record.stored_access = record.last_access
+            return record
+
+    def update(self, thread_key: str, change: Callable[[ThreadRecord], None]) -> None:
+        """Apply a change to the record of a thread, creating the record if needed, and persist it."""
+        with self._lock:
+            self._purge_expired()
+            record = self._records.pop(thread_key, None)
+            if record is not None:
+                self.total_bytes -= record.size
+            else:
+                record = self._load(thread_key) or ThreadRecord()
+
+            change(record)
+            record.last_access = time.time()
+            text = record.to_json()
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO threads (thread_key, record, last_access) VALUES (?, ?, ?)",
+                    (thread_key, text, record.last_access),
+                )
+                self._connection.commit()
+                record.stored_access = record.last_access
+            self._remember(thread_key, record)
+
+    def _should_touch(self, record: ThreadRecord) -> bool:
+        """
+        :return: True if a read should write the access time of the record to the database.
+            Without a TTL the stored time is never used, so it is never refreshed.
+        """
+        if self._connection is None or not self.limits.ttl_seconds:
+            return False
+        return record.last_access - record.stored_access >= self.limits.ttl_seconds * TOUCH_FRACTION_OF_TTL
+
+    def _load(self, thread_key: str) -> ThreadRecord | None:
+        """Read a record from the database. Assumes the lock is held."""
+        if self._connection is None:
+            return None
+        row = self._connection.execute(
+            "SELECT record, last_access FROM threads WHERE thread_key = ?", (thread_key,)
+        ).fetchone()
+        if row is None:
+            return None
+        # The column, not the serialized record, has the time of the last read
+        if self.limits.ttl_seconds and row[1] < time.time() - self.limits.ttl_seconds:
+            return None
+        record = ThreadRecord(**loads(row[0]))
+        record.last_access = row[1]
+        record.stored_access = row[1]
+        record.size = len(row[0])
+        return record
+
+    def _remember(self, thread_key: str, record: ThreadRecord) -> None:
+        """Keep a record in memory, evicting the least recently used ones past the budgets."""
+        self._records[thread_key] = record
+        self.total_bytes += record.size
+        # The record just touched is always kept, even if it alone exceeds the size budget
+        while len(self._records) > 1 and (
+            (self.limits.max_threads and len(self._records) > self.limits.max_threads)
+            or (self.limits.max_bytes and self.total_bytes > self.limits.max_bytes)
+        ):
+            evicted_key, evicted = self._records.popitem(last=False)
+            self.total_bytes -= evicted.size
+            logger.debug("Evicted thread %s from memory", evicted_key)
+
+    def _purge_expired(self) -> None:
+        """Forget threads idle for longer than the TTL. Assumes the lock is held."""
+        if not self.limits.ttl_seconds:
+            return
+        now = time.time()
+        cutoff = now - self.limits.ttl_seconds
+
+        # Records are in access order, so the expired ones are at the front
+        while self._records:
+            thread_key, record = next(iter(self._records.items()))
+            if record.last_access >= cutoff:
+                break
+            del self._records[thread_key]
+            self.total_bytes -= record.size
+
+        if self._connection is not None and now - self._last_purge >= PURGE_INTERVAL_SECONDS:
+            self._last_purge = now
+            deleted = self._connection.execute("DELETE FROM threads WHERE last_access < ?", (cutoff,)).rowcount
+            self._connection.commit()
+            if deleted:
+                logger.info("Purged %s idle threads from the conversation store", deleted)
+
+
+def create_conversation_store(
+    max_threads: int, max_bytes: int, ttl_seconds: float, path: str | None
+) -> ConversationStore:
+    """Create a conversation store, keeping it in memory only if the database cannot be opened."""
+    try:
+        return ConversationStore(max_threads, max_bytes, ttl_seconds, os.path.expanduser(path) if path else None)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Could not open conversation store at %s, keeping it in memory only: %s", path, e)
+        return ConversationStore(max_threads, max_bytes, ttl_seconds)
@@ -30,3 +30,5 @@ class MessageContext:
     thread_ctx: ThreadContext
     say: Say
     logger: Any
+    # Slack WebClient, used to update partial answers in place. Without it only the final answer is posted.
+    client: Any = None
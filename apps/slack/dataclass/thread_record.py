@@ -0,0 +1,44 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from json import dumps
+from typing import Any
+
+
+@dataclass
+class ThreadRecord:
+    """Store everything the bot remembers about one Slack thread."""
+
+    network: str | None = None
+    sly_data: dict[str, Any] | None = None
+    # Chat context per network name, so a thread's contexts are found without scanning other threads
+    contexts: dict[str, dict[str, Any]] = field(default_factory=dict)
+    last_access: float = 0.0
+    size: int = 0
+    # Last access time written to the database, which reads only refresh once it gets old
+    stored_access: float = 0.0
+
+    def to_json(self) -> str:
+        """Serialize the record and refresh its size estimate."""
+        data = asdict(self)
+        data.pop("size")
+        data.pop("stored_access")
+        text = dumps(data)
+        self.size = len(text)
+        return text
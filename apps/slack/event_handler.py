@@ -34,12 +34,13 @@ class EventHandler:
         self.conversation_manager = conversation_manager
         self.network_handler = network_handler
 
-    def handle_message(self, body: dict[str, Any], logger: Any, say: Say) -> None:
+    def handle_message(self, body: dict[str, Any], logger: Any, say: Say, client: Any = None) -> None:
         """
         Handle regular messages - works in DMs without @mention.
         :param body: The event body from Slack containing event details
         :param logger: Logger instance for logging information
         :param say: Slack say function to send messages
+        :param client: Slack WebClient used to update partial answers
         """
         try:
             event = body.get("event", {})
@@ -60,7 +61,7 @@ class EventHandler:
             thread_ctx = ThreadContext(
                 channel_id=event.get("channel"), thread_ts=event.get("thread_ts"), message_ts=event.get("ts")
             )
-            msg_ctx = MessageContext(thread_ctx, say, logger)
+            msg_ctx = MessageContext(thread_ctx, say, logger, client)
 
             # Strip @mention if present
             message_text = CommandParser.strip_bot_mention(text) if "<@" in text else text
@@ -85,12 +86,13 @@ class EventHandler:
         except Exception as e:
             logger.error(f"Error in handle_message: {e}", exc_info=True)
 
-    def handle_app_mention(self, event: dict[str, Any], say: Say, logger: Any) -> None:
+    def handle_app_mention(self, event: dict[str, Any], say: Say, logger: Any, client: Any = None) -> None:
         """
         Handle @mentions with network name.
         :param event: The event data from Slack containing mention details
         :param say: Slack say function to send messages
         :param logger: Logger instance for logging information
+        :param client: Slack WebClient used to update partial answers
         """
         try:
             logger.info("Received app_mention")
@@ -98,7 +100,7 @@ class EventHandler:
             thread_ctx = ThreadContext(
                 channel_id=event.get("channel"), thread_ts=event.get("thread_ts"), message_ts=event.get("ts")
             )
-            msg_ctx = MessageContext(thread_ctx, say, logger)
+            msg_ctx = MessageContext(thread_ctx, say, logger, client)
 
             raw_text = event.get("text", "").strip()
             if not raw_text:
@@ -22,11 +22,25 @@ from slack_bolt.adapter.socket_mode import SocketModeHandler
 
 from apps.slack.api_client import APIClient
 from apps.slack.command_handler import CommandHandler
+from apps.slack.config import AGENT_MANIFEST_FILE
 from apps.slack.config import NEURO_SAN_SERVER_HTTP_PORT
 from apps.slack.config import SLACK_APP_TOKEN
 from apps.slack.config import SLACK_BOT_TOKEN
+from apps.slack.config import SLACK_CATALOG_TTL_SECONDS
+from apps.slack.config import SLACK_CONVERSATION_MAX_BYTES
+from apps.slack.config import SLACK_CONVERSATION_MAX_THREADS
+from apps.slack.config import SLACK_CONVERSATION_STORE_PATH
+from apps.slack.config import SLACK_CONVERSATION_TTL_SECONDS
+from apps.slack.config import SLACK_MAX_CONCURRENT_REQUESTS
+from apps.slack.config import SLACK_MAX_QUEUED_REQUESTS
+from apps.slack.config import SLACK_MAX_REQUESTS_PER_NETWORK
+from apps.slack.config import SLACK_QUEUE_TIMEOUT_SECONDS
+from apps.slack.config import SLACK_UPDATE_INTERVAL_SECONDS
 from apps.slack.conversation_manager import ConversationManager
+from apps.slack.conversation_store import create_conversation_store
+from apps.slack.dataclass.handler_settings import HandlerSettings
 from apps.slack.event_handler import EventHandler
+from apps.slack.network_catalog import NetworkCatalog
 from apps.slack.network_handler import NetworkHandler
 
 # Configure logging
@@ -36,13 +50,30 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(level
 app = App(token=SLACK_BOT_TOKEN)
 
 # Initialize dependencies
-conversation_manager = ConversationManager()
-api_client = APIClient(NEURO_SAN_SERVER_HTTP_PORT)
-network_handler = NetworkHandler(conversation_manager, api_client)
+conversation_store = create_conversation_store(
+    SLACK_CONVERSATION_MAX_THREADS,
+    SLACK_CONVERSATION_MAX_BYTES,
+    SLACK_CONVERSATION_TTL_SECONDS,
+    SLACK_CONVERSATION_STORE_PATH,
+)
+conversation_manager = ConversationManager(conversation_store)
+api_client = APIClient(
+    NEURO_SAN_SERVER_HTTP_PORT,
+    max_per_network=SLACK_MAX_REQUESTS_PER_NETWORK,
+    queue_timeout=SLACK_QUEUE_TIMEOUT_SECONDS,
+    pool_size=SLACK_MAX_CONCURRENT_REQUESTS,
+)
+network_catalog = NetworkCatalog(api_client, SLACK_CATALOG_TTL_SECONDS, AGENT_MANIFEST_FILE)
+network_handler = NetworkHandler(
+    conversation_manager,
+    api_client,
+    HandlerSettings(SLACK_MAX_CONCURRENT_REQUESTS, SLACK_MAX_QUEUED_REQUESTS, SLACK_UPDATE_INTERVAL_SECONDS),
+    catalog=network_catalog,
+)
 
 # Initialize and register handlers
 event_handlers = EventHandler(conversation_manager, network_handler)
-command_handlers = CommandHandler(api_client)
+command_handlers = CommandHandler(api_client, network_catalog)
 
 event_handlers.register(app)
 command_handlers.register(app)
@@ -54,6 +85,7 @@ def main():
         raise ValueError("NEURO_SAN_SERVER_HTTP_PORT required")
 
     print(f"Starting Slack bot on port {NEURO_SAN_SERVER_HTTP_PORT}")
+    network_catalog.start()
     SocketModeHandler(app, SLACK_APP_TOKEN).start()
 
 
@@ -0,0 +1,99 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Tuple
+
+Message = Tuple[Callable[..., Any], Tuple[Any, ...]]
+
+
+class MessageQueue:
+    """
+    Bounded queue of messages waiting for an answer. Messages are answered on threads of its own,
+    so Bolt's worker threads are freed right away, and messages of one Slack thread are answered
+    in order, each building on the context of the previous one.
+
+    Only the oldest message of a Slack thread is handed to the pool; the next one is handed over once
+    it is answered. So a Slack thread never holds more than one worker, and a burst in one thread
+    does not hold up the others.
+    """
+
+    def __init__(self, max_workers: int = 16, max_queued: int = 64):
+        """
+        :param max_workers: Maximum number of messages processed at once
+        :param max_queued: Maximum number of messages accepted but not yet answered; more are turned away
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="slack-chat")
+        self._slots = threading.BoundedSemaphore(max_queued)
+        self._lock = threading.Lock()
+        # Slack thread key -> messages waiting behind the one being answered, for threads with one in the pool
+        self._waiting: Dict[str, Deque[Message]] = {}
+
+    def submit(self, thread_key: str, function: Callable[..., Any], *args: Any) -> bool:
+        """
+        Queue a function answering a message of a Slack thread.
+
+        :param thread_key: Key of the Slack thread the message belongs to
+        :param function: Function answering the message; it is expected to handle its own errors
+        :param args: Arguments of the function
+        :return: True if the message was queued, False if too many messages are already waiting
+        """
+        if not self._slots.acquire(blocking=False):  # pylint: disable=consider-using-with
+            return False
+        with self._lock:
+            waiting: Deque[Message] = self._waiting.get(thread_key)
+            if waiting is not None:
+                waiting.append((function, args))
+                return True
+            self._waiting[thread_key] = deque()
+        self.executor.submit(self._run, thread_key, function, args)
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting messages.
+
+        :param wait: Whether to return only once the queued messages are answered
+        """
+        self.executor.shutdown(wait=wait)
+
+    def _run(self, thread_key: str, function: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        """Answer a message, then hand the next message of its Slack thread to the pool."""
+        try:
+            function(*args)
+        finally:
+            self._slots.release()
+            self._submit_next(thread_key)
+
+    def _submit_next(self, thread_key: str) -> None:
+        """Hand the oldest waiting message of a Slack thread to the pool, if there is one."""
+        with self._lock:
+            waiting: Deque[Message] = self._waiting[thread_key]
+            if not waiting:
+                del self._waiting[thread_key]
+                return
+            function, args = waiting.popleft()
+        try:
+            self.executor.submit(self._run, thread_key, function, args)
+        except RuntimeError:
+            # The pool is shutting down and takes no new work, so this worker answers the message itself
+            self._run(thread_key, function, args)
@@ -0,0 +1,140 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import logging
+import os
+import threading
+import time
+from dataclasses import replace
+from typing import Any
+
+from requests.exceptions import RequestException
+
+from apps.slack.api_client import APIClient
+from apps.slack.dataclass.catalog_snapshot import CatalogSnapshot
+
+# Seconds between checks of the manifest file for changes
+MANIFEST_POLL_SECONDS = 5.0
+
+# A catalog refreshed less than this long ago is trusted to know every network;
+# past it, an unknown network name is checked against the server and triggers a refresh
+MIN_REFRESH_INTERVAL_SECONDS = 5.0
+
+logger = logging.getLogger(__name__)
+
+
+class NetworkCatalog:
+    """
+    Local copy of the agent networks served by the neuro-san server.
+
+    Listing networks and checking that a known network exists are answered from memory.
+    A background thread refreshes the copy every ttl_seconds, and sooner when the agent
+    manifest file changes or a network the copy does not know is asked for; refreshes
+    are conditional requests, so an unchanged catalog costs the server no more than a
+    304 reply.
+    """
+
+    def __init__(self, client: APIClient, ttl_seconds: float = 300.0, manifest_path: str | None = None):
+        """
+        :param client: Client for the neuro-san server
+        :param ttl_seconds: Seconds after which the catalog is refreshed
+        :param manifest_path: Optional path to the agent manifest file; a change to it triggers a refresh
+        """
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.manifest_path = manifest_path
+        self._snapshot = CatalogSnapshot()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Load the catalog and keep refreshing it in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="network-catalog", daemon=True)
+            self._thread.start()
+
+    def invalidate(self) -> None:
+        """Have the background thread refresh the catalog as soon as possible."""
+        self._wake.set()
+
+    def get_networks(self) -> list[dict[str, Any]]:
+        """
+        Get the agent networks.
+
+        :return: List of agent dicts as returned by the server's list endpoint
+        :raises RequestException: If the catalog was never loaded and the server cannot be reached
+        """
+        if self._snapshot.agents is None:
+            self.refresh()
+        return list(self._snapshot.agents or [])
+
+    def has_network(self, network_name: str) -> bool:
+        """
+        Check that an agent network exists. Known networks are answered from memory.
+
+        :param network_name: Name of the agent network
+        :return: True if the catalog or, for a name it does not know, the server has the network
+        :raises RequestException: If the name is unknown, the catalog is not fresh and the server cannot be reached
+        """
+        snapshot = self._snapshot
+        if network_name in snapshot.names:
+            return True
+        if snapshot.agents is not None and time.monotonic() - snapshot.refreshed_at < MIN_REFRESH_INTERVAL_SECONDS:
+            return False
+        # The catalog is not loaded yet, or the network may have been added since the last refresh.
+        # Ask the server about this one name and leave the full refresh to the background thread.
+        self.invalidate()
+        return self.client.test_connection(network_name)
+
+    def refresh(self) -> None:
+        """Fetch the catalog from the server unless it is unchanged."""
+        with self._lock:
+            agents, etag = self.client.list_networks(self._snapshot.etag)
+            if agents is None:
+                self._snapshot = replace(self._snapshot, refreshed_at=time.monotonic())
+                return
+            names = frozenset(agent.get("agent_name", "") for agent in agents)
+            self._snapshot = CatalogSnapshot(agents, names, etag, time.monotonic())
+            logger.info("Network catalog refreshed: %s networks", len(agents))
+
+    def _run(self) -> None:
+        """Refresh the catalog when it expires, the manifest changes or a refresh is asked for."""
+        manifest_mtime = self._get_manifest_mtime()
+        due = True
+        while True:
+            mtime = self._get_manifest_mtime()
+            if mtime != manifest_mtime:
+                manifest_mtime = mtime
+                due = True
+
+            if due or time.monotonic() - self._snapshot.refreshed_at >= self.ttl_seconds:
+                try:
+                    self.refresh()
+                except RequestException as e:
+                    logger.warning("Could not refresh network catalog: %s", e)
+
+            due = self._wake.wait(MANIFEST_POLL_SECONDS if self.manifest_path else self.ttl_seconds)
+            self._wake.clear()
+
+    def _get_manifest_mtime(self) -> float | None:
+        """Get the modification time of the manifest file, if there is one."""
+        if not self.manifest_path:
+            return None
+        try:
+            return os.stat(self.manifest_path).st_mtime
+        except OSError:
+            return None
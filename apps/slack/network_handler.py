@@ -14,23 +14,46 @@
 #
 # END COPYRIGHT
 
+import time
 from json import dumps
 from typing import Any
 
 from requests.exceptions import RequestException
 
 from apps.slack.api_client import APIClient
+from apps.slack.api_client import NetworkBusyError
 from apps.slack.conversation_manager import ConversationManager
+from apps.slack.dataclass.handler_settings import HandlerSettings
 from apps.slack.dataclass.message_context import MessageContext
 from apps.slack.dataclass.network_command import NetworkCommand
+from apps.slack.message_queue import MessageQueue
+from apps.slack.network_catalog import NetworkCatalog
+
+# Partial answers longer than this are cut short; the final answer is always sent whole
+MAX_PROGRESS_CHARS = 3000
 
 
 class NetworkHandler:
     """Handle network message processing."""
 
-    def __init__(self, manager: ConversationManager, client: APIClient):
+    def __init__(
+        self,
+        manager: ConversationManager,
+        client: APIClient,
+        settings: HandlerSettings | None = None,
+        catalog: NetworkCatalog | None = None,
+    ):
+        """
+        :param manager: Conversation manager holding the state of every thread
+        :param client: Client for the neuro-san server
+        :param settings: Concurrency and progress settings; defaults are used if None
+        :param catalog: Optional local catalog of agent networks, so checking a network name needs no request
+        """
         self.manager = manager
         self.client = client
+        self.catalog = catalog
+        self.settings = settings or HandlerSettings()
+        self.queue = MessageQueue(self.settings.max_workers, self.settings.max_queued)
 
     def setup_new_network(self, msg_ctx: MessageContext, command: NetworkCommand) -> None:
         """Set up a new network connection."""
@@ -53,6 +76,25 @@ class NetworkHandler:
             self._acknowledge_connection(msg_ctx, command.network_name, command.sly_data)
 
     def process_message(self, msg_ctx: MessageContext, network_name: str, user_message: str) -> None:
+        """Queue a message for a network, or turn it away if too many messages are already waiting."""
+        if self.queue.submit(msg_ctx.thread_ctx.thread_key, self._run_queued, msg_ctx, network_name, user_message):
+            return
+
+        msg_ctx.logger.warning(f"Rejected message for '{network_name}': {self.settings.max_queued} messages queued")
+        msg_ctx.say(
+            text="I'm busy with other requests right now. Please try again in a moment.",
+            thread_ts=msg_ctx.thread_ctx.conversation_thread,
+        )
+
+    def _run_queued(self, msg_ctx: MessageContext, network_name: str, user_message: str) -> None:
+        """Process a queued message, logging any error since nobody waits for its outcome."""
+        try:
+            self._process_message(msg_ctx, network_name, user_message)
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            msg_ctx.logger.error(f"Error processing message for '{network_name}': {e}", exc_info=True)
+
+    def _process_message(self, msg_ctx: MessageContext, network_name: str, user_message: str) -> None:
         """Process a message for a network."""
         conversation_key = f"{msg_ctx.thread_ctx.channel_id}:{msg_ctx.thread_ctx.conversation_thread}:{network_name}"
 
@@ -68,24 +110,89 @@ class NetworkHandler:
 
         try:
             msg_ctx.logger.info(f"Calling network '{network_name}'")
-            data = self.client.call(f"{network_name}/streaming_chat", payload)
+            data, progress_ts = self._consume_stream(msg_ctx, network_name, payload)
 
             # Extract and send response
             response_text = self._extract_response_text(data, msg_ctx.logger)
             self._store_context(data, conversation_key, msg_ctx.logger)
-            self._send_response(response_text, data, msg_ctx)
+            self._send_response(response_text, data, msg_ctx, progress_ts)
 
-        except RequestException as e:
+        except NetworkBusyError as e:
+            msg_ctx.logger.warning(f"Network busy: {e}")
+            msg_ctx.say(
+                text=f"*{network_name}* is busy with other requests. Please try again in a moment.",
+                thread_ts=msg_ctx.thread_ctx.conversation_thread,
+            )
+        except (RequestException, ValueError) as e:
             msg_ctx.logger.error(f"API error for '{network_name}': {e}", exc_info=True)
             msg_ctx.say(text=f"Error calling API: {e}", thread_ts=msg_ctx.thread_ctx.conversation_thread)
 
+    def _consume_stream(
+        self, msg_ctx: MessageContext, network_name: str, payload: dict[str, Any]
+    ) -> tuple[dict[str, Any], str | None]:
+        """
+        Read a streaming chat response as it arrives, showing partial answers in Slack.
+
+        :return: A tuple of (the final response carrying the chat context, ts of the progress message if any)
+        """
+        final: dict[str, Any] = {}
+        returned_sly: dict[str, Any] = {}
+        progress_ts = None
+        last_update = 0.0
+
+        try:
+            for message in self.client.stream_chat(network_name, payload):
+                response = message.get("response", {})
+                if response.get("sly_data"):
+                    returned_sly = response["sly_data"]
+                if response.get("chat_context"):
+                    final = message
+                    continue
+
+                text = response.get("text")
+                interval = self.settings.update_interval
+                if text and msg_ctx.client is not None and time.monotonic() - last_update >= interval:
+                    progress_ts = self._post_progress(msg_ctx, text, progress_ts)
+                    last_update = time.monotonic()
+        except Exception:
+            # The error is reported in a message of its own, so the partial answer would be left hanging
+            self._delete_progress(msg_ctx, progress_ts)
+            raise
+
+        if returned_sly:
+            final.setdefault("response", {})["sly_data"] = returned_sly
+        return final, progress_ts
+
+    def _post_progress(self, msg_ctx: MessageContext, text: str, progress_ts: str | None) -> str | None:
+        """Post a partial answer, or update the one already posted."""
+        progress_text = f"_Working on it..._\n{text[:MAX_PROGRESS_CHARS]}"
+        try:
+            if progress_ts is None:
+                response = msg_ctx.say(text=progress_text, thread_ts=msg_ctx.thread_ctx.conversation_thread)
+                return response.get("ts")
+            msg_ctx.client.chat_update(channel=msg_ctx.thread_ctx.channel_id, ts=progress_ts, text=progress_text)
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            msg_ctx.logger.warning(f"Failed to post partial answer: {e}")
+        return progress_ts
+
+    def _delete_progress(self, msg_ctx: MessageContext, progress_ts: str | None) -> None:
+        """Remove the partial answer, if one was posted."""
+        if progress_ts is None:
+            return
+        try:
+            msg_ctx.client.chat_delete(channel=msg_ctx.thread_ctx.channel_id, ts=progress_ts)
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            msg_ctx.logger.warning(f"Failed to delete partial answer: {e}")
+
     def _acknowledge_connection(
         self, msg_ctx: MessageContext, network_name: str, sly_data: dict[str, Any] | None
     ) -> None:
         """Acknowledge new network connection."""
         sly_msg = f" with sly_data: `{dumps(sly_data)}`" if sly_data else ""
 
-        if self.client.test_connection(network_name):
+        if self._network_exists(network_name):
             msg_ctx.say(
                 text=f"Connected to *{network_name}*{sly_msg}. Please provide your input.",
                 thread_ts=msg_ctx.thread_ctx.conversation_thread,
@@ -98,6 +205,12 @@ class NetworkHandler:
             )
             msg_ctx.logger.warning(f"Invalid network: {network_name}")
 
+    def _network_exists(self, network_name: str) -> bool:
+        """Check a network name against the catalog, or against the server if there is no catalog."""
+        if self.catalog is not None:
+            return self.catalog.has_network(network_name)
+        return self.client.test_connection(network_name)
+
     def _build_payload(
         self, message: str, context: dict[str, Any], sly_data: dict[str, Any] | None, logger: Any
     ) -> dict[str, Any]:
@@ -139,8 +252,10 @@ class NetworkHandler:
             self.manager.set_context(conversation_key, context)
             logger.info(f"Stored context for {conversation_key}")
 
-    def _send_response(self, text: str, data: dict[str, Any], msg_ctx: MessageContext) -> None:
-        """Send response with optional sly_data."""
+    def _send_response(
+        self, text: str, data: dict[str, Any], msg_ctx: MessageContext, progress_ts: str | None = None
+    ) -> None:
+        """Send response with optional sly_data, replacing the partial answer if one was posted."""
         returned_sly = data.get("response", {}).get("sly_data", {})
         sly_text = ""
 
@@ -148,5 +263,16 @@ class NetworkHandler:
             sly_text = f"\nReturned sly_data:\n```\n{dumps(returned_sly, indent=2)}\n```"
             msg_ctx.logger.info(f"Received sly_data: {returned_sly}")
 
+        if progress_ts is not None:
+            try:
+                msg_ctx.client.chat_update(channel=msg_ctx.thread_ctx.channel_id, ts=progress_ts, text=text + sly_text)
+                msg_ctx.logger.info("Response sent successfully")
+                return
+            # pylint: disable=broad-exception-caught
+            except Exception as e:
+                # Post the answer anew rather than leave "Working on it..." as the last word in the thread
+                msg_ctx.logger.warning(f"Failed to replace partial answer: {e}")
+                self._delete_progress(msg_ctx, progress_ts)
+
         msg_ctx.say(text=text + sly_text, thread_ts=msg_ctx.thread_ctx.conversation_thread)
         msg_ctx.logger.info("Response sent successfully")
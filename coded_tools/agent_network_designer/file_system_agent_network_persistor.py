@@ -14,14 +14,15 @@
 #
 # END COPYRIGHT
 
-# Import for asynchronous file operations
+import asyncio
 import os
 
-import aiofiles
-
 from coded_tools.agent_network_designer.agent_network_assembler import AgentNetworkAssembler
 from coded_tools.agent_network_designer.agent_network_persistor import AgentNetworkPersistor
 from coded_tools.agent_network_designer.hocon_agent_network_assembler import HoconAgentNetworkAssembler
+from coded_tools.agent_network_designer.manifest_writer import ManifestWriter
+from coded_tools.agent_network_designer.manifest_writer import get_manifest_writer
+from coded_tools.agent_network_designer.manifest_writer import write_atomically
 
 
 class FileSystemAgentNetworkPersistor(AgentNetworkPersistor):
@@ -63,59 +64,13 @@ class FileSystemAgentNetworkPersistor(AgentNetworkPersistor):
         # This agent network name already includes any subdirectory specified.
         the_agent_network_name: str = file_reference
 
-        # Write the agent network file
+        # Write the agent network file in one rename, so the server never loads half of it
         file_path: str = os.path.join(self.OUTPUT_PATH, the_agent_network_name + ".hocon")
-        # Create parent directory automatically if necessary
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        async with aiofiles.open(file_path, "w") as file:
-            await file.write(the_agent_network_hocon_str)
+        await asyncio.to_thread(write_atomically, file_path, the_agent_network_hocon_str)
 
-        # Update the manifest.hocon file
+        # Update the manifest.hocon file. Sessions persisting at the same time share one locked write.
         manifest_path: str = os.path.join(self.OUTPUT_PATH, self.GENERATED, "manifest.hocon")
-
-        # Create the generated directory if it doesn't exist
-        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
-
-        # Create the manifest file if it doesn't exist
-        if not os.path.exists(manifest_path):
-            async with aiofiles.open(manifest_path, "w") as file:
-                # Initialize with empty JSON format
-                await file.write("{\n}")
-
-        # Read the current manifest content
-        async with aiofiles.open(manifest_path, "r") as file:
-            manifest_content: str = await file.read()
-
-        # Check if the entry already exists to avoid duplicates
-        if (
-            f'"{the_agent_network_name}.hocon"' in manifest_content
-            or f"{the_agent_network_name}.hocon" in manifest_content
-        ):
-            return
-
-        # Detect format: JSON (has braces) or HOCON (no braces)
-        is_json_format = "{" in manifest_content and "}" in manifest_content
-        updated_content: str = ""
-        if is_json_format:
-            # JSON format handling
-            manifest_entry: str = f'    "{the_agent_network_name}.hocon": true,'
-            insert_position: int = manifest_content.rfind("}")
-
-            if insert_position != -1:
-                updated_content: str = (
-                    manifest_content[:insert_position]
-                    + "\n"
-                    + manifest_entry
-                    + "\n"
-                    + manifest_content[insert_position:]
-                )
-        else:
-            # HOCON format handling
-            manifest_entry = f'"{the_agent_network_name}.hocon" = true\n'
-            updated_content = manifest_content.rstrip() + "\n" + manifest_entry
-
-        # Write the updated content back to the manifest file
-        async with aiofiles.open(manifest_path, "w") as file:
-            await file.write(updated_content)
+        manifest_writer: ManifestWriter = get_manifest_writer(manifest_path)
+        await asyncio.to_thread(manifest_writer.add_entries, [f"{the_agent_network_name}.hocon"])
 
         return file_path
@@ -0,0 +1,248 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import logging
+import os
+import re
+import stat
+import tempfile
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, where only threads of the same process are kept apart
+    fcntl = None
+
+# Entries of the manifest, as written by this class or by hand: "name.hocon": true or name.hocon = true
+MANIFEST_ENTRY_PATTERN = re.compile(r'^\s*"?([^"\s:=#{}]+\.hocon)"?\s*[:=]', re.MULTILINE)
+
+logger = logging.getLogger(__name__)
+
+
+def _get_file_mode(path: str) -> int:
+    """
+    :param path: Path of a file about to be replaced
+    :return: Permission bits of the file, or those open() would give a new file under the current umask
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        # The umask can only be read by setting it, so set it straight back
+        umask: int = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_atomically(path: str, content: str):
+    """
+    Write a file so that readers see either the old or the new content, never a partial one.
+    The file keeps its permissions, or gets those of a file created with open() if it is new.
+
+    :param path: Path of the file to write
+    :param content: The new content of the file
+    """
+    directory: str = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        # mkstemp() creates the file readable by its owner only, which the rename would carry over
+        os.chmod(temp_path, _get_file_mode(path))
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+            temp_file.write(content)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class ManifestWriter:
+    """
+    Adds entries to a manifest file that several sessions and processes may update at the same time.
+
+    The entries of the manifest are kept in an index, re-read only when the file changes on disk, so that
+    checking for an existing entry does not search the file content. Updates hold a lock file across processes
+    and replace the manifest in one rename, so that the server's manifest watcher never reads a partial file.
+    Entries added by concurrent callers are committed together: whoever gets the lock writes all pending entries,
+    and every caller whose entries were in that write gets its outcome, including the error if it failed.
+    """
+
+    def __init__(self, manifest_path: str):
+        """
+        Constructor.
+
+        :param manifest_path: Path to the manifest file
+        """
+        self.manifest_path: str = manifest_path
+        self._entries: set[str] = set()
+        self._content: str = None
+        self._signature: tuple[int, int] = None
+        # Entry not yet committed -> outcome of the write that commits it, shared by the callers adding it
+        self._pending: dict[str, Future] = {}
+        self._pending_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+    @property
+    def lock_path(self) -> str:
+        """
+        :return: Path of the lock file that keeps processes from updating the manifest at the same time
+        """
+        return self.manifest_path + ".lock"
+
+    def _stat_signature(self) -> tuple[int, int]:
+        """
+        :return: Modification time and size of the manifest, or None if it does not exist
+        """
+        try:
+            file_stat: os.stat_result = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """
+        Hold the lock file of the manifest, so that other processes wait for this update.
+        """
+        os.makedirs(os.path.dirname(self.lock_path) or ".", exist_ok=True)
+        with open(self.lock_path, "a", encoding="utf-8") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _refresh(self):
+        """
+        Re-read the manifest and its index if the file changed since it was last read.
+        """
+        signature: tuple[int, int] = self._stat_signature()
+        if signature is not None and signature == self._signature:
+            return
+
+        if signature is None:
+            # Initialize with empty JSON format
+            self._content = "{\n}"
+        else:
+            with open(self.manifest_path, "r", encoding="utf-8") as manifest_file:
+                self._content = manifest_file.read()
+        self._entries = set(MANIFEST_ENTRY_PATTERN.findall(self._content))
+        self._signature = signature
+
+    def contains(self, entry: str) -> bool:
+        """
+        :param entry: Manifest key, for instance "generated/my_network.hocon"
+        :return: True if the manifest has the entry
+        """
+        with self._lock:
+            self._refresh()
+            return entry in self._entries
+
+    def add_entries(self, entries: list[str]):
+        """
+        Add entries to the manifest, skipping those it already has.
+
+        :param entries: Manifest keys, for instance "generated/my_network.hocon"
+        :raises OSError: If the manifest could not be written, also when another caller wrote these entries.
+            Other errors, such as an undecodable manifest, are raised the same way.
+        """
+        futures: list[Future] = []
+        with self._pending_lock:
+            for entry in entries:
+                futures.append(self._pending.setdefault(entry, Future()))
+
+        with self._lock:
+            with self._pending_lock:
+                batch: dict[str, Future] = dict(self._pending)
+                self._pending.clear()
+            # An empty batch means another caller already committed these entries along with its own
+            if batch:
+                try:
+                    self._commit(list(batch))
+                except BaseException as exception:
+                    # Every caller with entries in this batch waits on its future, so each must get the error
+                    for future in batch.values():
+                        future.set_exception(exception)
+                    raise
+                for future in batch.values():
+                    future.set_result(None)
+
+        for future in futures:
+            future.result()
+
+    def _commit(self, batch: list[str]):
+        """
+        Write the entries of a batch that the manifest does not have yet. Called with the lock held.
+
+        :param batch: Manifest keys to add
+        """
+        with self._file_lock():
+            self._refresh()
+            new_entries: list[str] = [entry for entry in batch if entry not in self._entries]
+            if not new_entries:
+                return
+
+            updated_content: str = self._add_to_content(self._content, new_entries)
+            write_atomically(self.manifest_path, updated_content)
+            self._content = updated_content
+            self._entries.update(new_entries)
+            self._signature = self._stat_signature()
+        logger.info("Added %s to manifest %s", new_entries, self.manifest_path)
+
+    @staticmethod
+    def _add_to_content(manifest_content: str, entries: list[str]) -> str:
+        """
+        :param manifest_content: The current content of the manifest
+        :param entries: Manifest keys to add
+        :return: The manifest content with the entries added, in the format the manifest already uses
+        """
+        # Detect format: JSON (has braces) or HOCON (no braces)
+        insert_position: int = manifest_content.rfind("}")
+        if "{" in manifest_content and insert_position != -1:
+            # JSON format handling
+            manifest_entries: str = "".join(f'    "{entry}": true,\n' for entry in entries)
+            return manifest_content[:insert_position] + "\n" + manifest_entries + manifest_content[insert_position:]
+
+        # HOCON format handling
+        manifest_entries = "".join(f'"{entry}" = true\n' for entry in entries)
+        return manifest_content.rstrip() + "\n" + manifest_entries
+
+
+_WRITERS: dict[str, ManifestWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def get_manifest_writer(manifest_path: str) -> ManifestWriter:
+    """
+    :param manifest_path: Path to the manifest file
+    :return: The process-wide writer of that manifest
+    """
+    path: str = os.path.abspath(manifest_path)
+    with _WRITERS_LOCK:
+        writer: ManifestWriter = _WRITERS.get(path)
+        if writer is None:
+            writer = ManifestWriter(path)
+            _WRITERS[path] = writer
+        return writer
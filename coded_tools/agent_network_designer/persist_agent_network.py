@@ -14,26 +14,21 @@
 #
 # END COPYRIGHT
 
+import asyncio
 import logging
 from copy import deepcopy
 from os import environ
 from typing import Any
 
 from neuro_san.interfaces.coded_tool import CodedTool
-from neuro_san.internals.validation.network.keyword_network_validator import KeywordNetworkValidator
-from neuro_san.internals.validation.network.structure_network_validator import StructureNetworkValidator
-from neuro_san.internals.validation.network.toolbox_network_validator import ToolboxNetworkValidator
-from neuro_san.internals.validation.network.unreachable_nodes_network_validator import UnreachableNodesNetworkValidator
-from neuro_san.internals.validation.network.url_network_validator import UrlNetworkValidator
 
 from coded_tools.agent_network_designer.agent_network_assembler import AgentNetworkAssembler
 from coded_tools.agent_network_designer.agent_network_persistor import AgentNetworkPersistor
 from coded_tools.agent_network_designer.agent_network_persistor_factory import AgentNetworkPersistorFactory
 from coded_tools.agent_network_editor.constants import AGENT_NETWORK_DEFINITION
 from coded_tools.agent_network_editor.constants import AGENT_NETWORK_NAME
-from coded_tools.agent_network_editor.get_mcp_tool import GetMcpTool
-from coded_tools.agent_network_editor.get_subnetwork import GetSubnetwork
-from coded_tools.agent_network_editor.get_toolbox import GetToolbox
+from coded_tools.agent_network_editor.incremental_validator import ValidationResult
+from coded_tools.agent_network_editor.incremental_validator import validate_network_definition
 
 # To use reservations, turn this environment variable to true and also
 # export AGENT_TEMPORARY_NETWORK_UPDATE_PERIOD_SECONDS=5
@@ -93,19 +88,12 @@ class PersistAgentNetwork(CodedTool):
             return "Error: No network in sly data!"
 
         # Validate the agent network and return error message if there are any issues.
-        # Gather all external agents (subnetworks) into a list.
-        subnetworks: dict[str, Any] | str = GetSubnetwork().invoke(None, None)
-        if isinstance(subnetworks, dict):
-            subnetworks: list[str] = list(subnetworks.keys())
-        else:
-            subnetworks = []
-
-        error_list: list[str] = (
-            StructureNetworkValidator().validate(network_def)
-            + KeywordNetworkValidator().validate(network_def)
-            + ToolboxNetworkValidator(GetToolbox().invoke(None, None)).validate(network_def)
-            + UrlNetworkValidator(subnetworks, GetMcpTool().mcp_servers).validate(network_def)
+        # The network in sly data has usually been validated while it was edited,
+        # so only what changed since then is checked again.
+        result: ValidationResult = await asyncio.to_thread(
+            validate_network_definition, sly_data.get(AGENT_NETWORK_DEFINITION), sly_data
         )
+        error_list: list[str] = result.errors
         if error_list:
             error_msg = f"Error: {error_list}"
             logger.error(error_msg)
@@ -131,7 +119,7 @@ class PersistAgentNetwork(CodedTool):
             args, WRITE_TO_FILE, DEMO_MODE
         )
         assembler: AgentNetworkAssembler = persistor.get_assembler()
-        top_agent_name: str = UnreachableNodesNetworkValidator().find_all_top_agents(network_def).pop()
+        top_agent_name: str = result.top_agents.pop()
         persisted_content: str = assembler.assemble_agent_network(
             network_def, top_agent_name, the_agent_network_name, sample_queries
         )
@@ -14,12 +14,15 @@
 #
 # END COPYRIGHT
 
+import asyncio
 import logging
 from typing import Any
 
 from neuro_san.interfaces.coded_tool import CodedTool
 
 from coded_tools.agent_network_editor.constants import AGENT_NETWORK_DEFINITION
+from coded_tools.agent_network_editor.incremental_validator import ValidationResult
+from coded_tools.agent_network_editor.incremental_validator import validate_network_definition
 from coded_tools.agent_network_editor.progress_handler import ProgressHandler
 
 
@@ -85,6 +88,10 @@ class AddAgent(CodedTool):
         logger.info("The resulting agent network definition: \n %s", str(network_def))
         sly_data[AGENT_NETWORK_DEFINITION] = network_def
 
+        # Keep the validation of the network current, which only re-checks the agents this edit touched
+        result: ValidationResult = await asyncio.to_thread(validate_network_definition, network_def, sly_data)
+        logger.info("New errors: %s Cleared errors: %s", result.new_errors, result.cleared_errors)
+
         await ProgressHandler.report_progress(args, network_def)
 
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
@@ -0,0 +1,252 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Down-chain indexes of an agent network definition, kept current across edits"""
+
+from collections import Counter
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+from neuro_san.internals.validation.network.abstract_network_validator import AbstractNetworkValidator
+
+
+@dataclass
+class GraphChange:
+    """
+    What one call to AgentGraph.apply() changed.
+    """
+
+    removed: set[str] = field(default_factory=set)
+    added: set[str] = field(default_factory=set)
+    changed: set[str] = field(default_factory=set)
+    # (agent, down-chain) edges between agents that went away or came in
+    removed_edges: list[tuple[str, str]] = field(default_factory=list)
+    added_edges: list[tuple[str, str]] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """
+        :return: True if no agent came, went or changed
+        """
+        return not (self.removed or self.added or self.changed)
+
+
+class AgentGraph:
+    """
+    The down-chains of every agent of a network, the reverse index of which agents list a name,
+    and the candidate top agents, updated from the agents that changed since the previous call.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        # Agent name -> (down-chains without dictionary entries, has down-chains, instructions state)
+        self.signatures: dict[str, tuple] = {}
+        # Agent names in the order of the definition, in which their errors are reported
+        self.order: list[str] = []
+        # Down-chains that name agents, rather than URLs or paths, and the reverse index
+        self.children: dict[str, list[str]] = {}
+        self.parents: dict[str, set[str]] = {}
+        # Number of agents listing a down-chain, and agents that have down-chains, to find top agents
+        self._referenced: Counter = Counter()
+        self._with_down_chains: set[str] = set()
+        self._top_candidates: set[str] = set()
+
+    @staticmethod
+    def signature(spec: dict[str, Any]) -> tuple:
+        """
+        :param spec: The spec of one agent
+        :return: Tuple that changes whenever a change to the spec can change validation
+        """
+        tools: list[Any] = spec.get("tools") or []
+        safe_tools: tuple = tuple(AbstractNetworkValidator.remove_dictionary_tools(tools))
+        instructions: Any = spec.get("instructions")
+        if instructions is None:
+            instructions_state: str = None
+        else:
+            instructions_state = "empty" if instructions == "" else "set"
+        return safe_tools, bool(tools), instructions_state
+
+    def apply(self, signatures: dict[str, tuple]) -> GraphChange:
+        """
+        Bring the indexes up to date with the signatures of the agents of the network.
+
+        :param signatures: Agent name -> signature() of its spec, for every agent of the network
+        :return: What changed since the previous call
+        """
+        self.order = list(signatures)
+        change = GraphChange(
+            removed=self.signatures.keys() - signatures.keys(),
+            added=signatures.keys() - self.signatures.keys(),
+            changed={
+                name
+                for name in signatures.keys() & self.signatures.keys()
+                if signatures[name] != self.signatures[name]
+            },
+        )
+        if change.is_empty():
+            return change
+
+        counted: set[str] = self._unindex(change)
+        counted |= self._index(change, signatures)
+        for name in counted | change.added | change.changed | change.removed:
+            if name in signatures and name in self._with_down_chains and self._referenced.get(name, 0) == 0:
+                self._top_candidates.add(name)
+            else:
+                self._top_candidates.discard(name)
+        return change
+
+    def _unindex(self, change: GraphChange) -> set[str]:
+        """
+        Take the old down-chains of changed and removed agents out of the indexes.
+
+        :return: The down-chains whose number of references changed
+        """
+        old_nodes: set[str] = set(self.signatures)
+        counted: set[str] = set()
+        for name in change.removed | change.changed:
+            old_tools, old_has_down_chains, _ = self.signatures[name]
+            for child in self.children.pop(name, []):
+                self.parents[child].discard(name)
+                if not self.parents[child]:
+                    del self.parents[child]
+                if child in old_nodes:
+                    change.removed_edges.append((name, child))
+            for tool in set(old_tools):
+                self._referenced[tool] -= 1
+                if self._referenced[tool] <= 0:
+                    del self._referenced[tool]
+                counted.add(tool)
+            if old_has_down_chains:
+                self._with_down_chains.discard(name)
+        for name in change.removed:
+            del self.signatures[name]
+            change.removed_edges.extend((parent, name) for parent in self.parents.get(name, ()) if parent in old_nodes)
+        return counted
+
+    def _index(self, change: GraphChange, signatures: dict[str, tuple]) -> set[str]:
+        """
+        Put the new down-chains of changed and added agents into the indexes.
+
+        :return: The down-chains whose number of references changed
+        """
+        counted: set[str] = set()
+        for name in change.added | change.changed:
+            new_tools, has_down_chains, _ = signatures[name]
+            self.signatures[name] = signatures[name]
+            children: list[str] = [tool for tool in new_tools if not AbstractNetworkValidator.is_url_or_path(tool)]
+            self.children[name] = children
+            for child in children:
+                self.parents.setdefault(child, set()).add(name)
+                if child in signatures:
+                    change.added_edges.append((name, child))
+            for tool in set(new_tools):
+                self._referenced[tool] += 1
+                counted.add(tool)
+            if has_down_chains:
+                self._with_down_chains.add(name)
+        for name in change.added:
+            change.added_edges.extend(
+                (parent, name) for parent in self.parents.get(name, ()) if parent not in change.added | change.changed
+            )
+        return counted
+
+    def find_top_agents(self) -> set[str]:
+        """
+        :return: Agents that have down-chains but are not down-chains of others
+        """
+        if not self._top_candidates and len(self.signatures) == 1:
+            return set(self.signatures)
+        return self._top_candidates
+
+    def walk(self, starts: list[str], within: set[str] = None, reverse: bool = False) -> set[str]:
+        """
+        :param starts: Agents to start from
+        :param within: Optional set of agents the walk may not leave
+        :param reverse: True to walk from down-chains to the agents that list them
+        :return: The agents reachable from the starts, including the starts themselves
+        """
+        seen: set[str] = set(starts)
+        queue: deque = deque(starts)
+        while queue:
+            agent: str = queue.popleft()
+            neighbors = self.parents.get(agent, ()) if reverse else self.children.get(agent, ())
+            for neighbor in neighbors:
+                if neighbor in seen or neighbor not in self.signatures:
+                    continue
+                if within is not None and neighbor not in within:
+                    continue
+                seen.add(neighbor)
+                queue.append(neighbor)
+        return seen
+
+    def strongly_connected(self, nodes: set[str]) -> list[list[str]]:
+        """
+        Tarjan's algorithm without recursion, so that deep networks cannot hit the recursion limit.
+
+        :param nodes: Agents whose induced subgraph to examine
+        :return: List of the strongly connected components of that subgraph
+        """
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        components: list[list[str]] = []
+
+        def visit(node: str) -> tuple[str, Any]:
+            index[node] = low[node] = len(index)
+            stack.append(node)
+            on_stack.add(node)
+            return node, iter([child for child in self.children.get(node, ()) if child in nodes])
+
+        for root in nodes:
+            if root in index:
+                continue
+            work: list[tuple[str, Any]] = [visit(root)]
+            while work:
+                node, children = work[-1]
+                descended: bool = False
+                for child in children:
+                    if child not in index:
+                        work.append(visit(child))
+                        descended = True
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], index[child])
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    low[work[-1][0]] = min(low[work[-1][0]], low[node])
+                if low[node] == index[node]:
+                    components.append(self._pop_component(stack, on_stack, node))
+        return components
+
+    @staticmethod
+    def _pop_component(stack: list[str], on_stack: set[str], node: str) -> list[str]:
+        """
+        :return: The agents of the stack down to node, which form one strongly connected component
+        """
+        component: list[str] = []
+        while True:
+            member: str = stack.pop()
+            on_stack.discard(member)
+            component.append(member)
+            if member == node:
+                return component
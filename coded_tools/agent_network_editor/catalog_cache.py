@@ -0,0 +1,262 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Process-wide caches of the toolbox, subnetwork and MCP catalogs used to design and validate agent networks"""
+
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any
+from typing import Callable
+
+from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.run_context.langchain.mcp.mcp_servers_info_restorer import McpServersInfoRestorer
+from neuro_san.internals.run_context.langchain.toolbox.toolbox_info_restorer import ToolboxInfoRestorer
+
+DEFAULT_TOOLBOX_INFO_FILE = os.path.join("toolbox", "toolbox_info.hocon")
+DEFAULT_MANIFEST_FILE = os.path.join("registries", "manifest.hocon")
+DEFAULT_MCP_INFO_FILE = os.path.join("mcp", "mcp_info.hocon")
+
+# How long MCP tool listings are reused before the servers are asked again
+MCP_TOOLS_CACHE_TTL_ENV = "MCP_TOOLS_CACHE_TTL_SECONDS"
+DEFAULT_MCP_TOOLS_CACHE_TTL_SECONDS = 300.0
+
+logger = logging.getLogger(__name__)
+
+
+def _stat_signature(paths: list[str]) -> tuple[tuple[str, int, int], ...]:
+    """
+    :param paths: Paths of the files a cached value was loaded from
+    :return: Tuple of (path, modification time, size) that changes whenever one of the files does
+    """
+    signature: list[tuple[str, int, int]] = []
+    for path in paths:
+        try:
+            stat: os.stat_result = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((path, -1, -1))
+    return tuple(signature)
+
+
+class FileCache:
+    """
+    Holds a value loaded from files until one of those files changes.
+
+    Checking for changes costs one stat() per file, which is far cheaper than
+    parsing the HOCON files again. A loader that raises is not cached, so the
+    next call tries again.
+    """
+
+    def __init__(self, loader: Callable[[], Any], paths: Callable[[], list[str]]):
+        """
+        :param loader: Function that loads the value
+        :param paths: Function that returns the paths of the files the value depends on.
+                Called on every lookup, so that changes to environment variables are picked up.
+        """
+        self.loader: Callable[[], Any] = loader
+        self.paths: Callable[[], list[str]] = paths
+        self._value: Any = None
+        self._signature: tuple = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        """
+        :return: The cached value, reloaded first if any of its files changed
+        """
+        signature: tuple = _stat_signature(self.paths())
+        with self._lock:
+            if self._signature != signature:
+                self._value = self.loader()
+                self._signature = signature
+            return self._value
+
+    def invalidate(self):
+        """
+        Drop the cached value so the next lookup reloads it.
+        """
+        with self._lock:
+            self._signature = None
+            self._value = None
+
+
+def get_toolbox_info_file() -> str:
+    """
+    :return: Path of the toolbox info file
+    """
+    return os.getenv("AGENT_TOOLBOX_INFO_FILE", DEFAULT_TOOLBOX_INFO_FILE)
+
+
+def get_manifest_files() -> list[str]:
+    """
+    :return: Paths of the manifest files, which may be given as a comma- or space-separated list
+    """
+    manifest_file: str = os.getenv("AGENT_MANIFEST_FILE", DEFAULT_MANIFEST_FILE)
+    return [path for path in re.split(r"[,\s]+", manifest_file) if path]
+
+
+# Manifest file -> (modification time of the manifest, HOCON files below its directory)
+_HOCON_FILES: dict[str, tuple[int, list[str]]] = {}
+_HOCON_FILES_LOCK = threading.Lock()
+
+
+def _hocon_files(manifest_file: str) -> list[str]:
+    """
+    :param manifest_file: Path of a manifest file
+    :return: The HOCON files below the directory of the manifest. A network file added there only
+            matters once the manifest lists it, so the directory is walked again only when the manifest changes.
+    """
+    try:
+        mtime: int = os.stat(manifest_file).st_mtime_ns
+    except OSError:
+        mtime = -1
+    with _HOCON_FILES_LOCK:
+        entry: tuple[int, list[str]] = _HOCON_FILES.get(manifest_file)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+
+    files: list[str] = []
+    for directory, _, names in os.walk(os.path.dirname(manifest_file) or "."):
+        files.extend(os.path.join(directory, name) for name in sorted(names) if name.endswith(".hocon"))
+    with _HOCON_FILES_LOCK:
+        _HOCON_FILES[manifest_file] = (mtime, files)
+    return files
+
+
+def _manifest_paths() -> list[str]:
+    """
+    :return: The manifest files and every HOCON file below their directories,
+            since an agent network can change without its manifest changing
+    """
+    paths: list[str] = []
+    for manifest_file in get_manifest_files():
+        paths.append(manifest_file)
+        paths.extend(_hocon_files(manifest_file))
+    return paths
+
+
+def _load_toolbox() -> dict[str, str]:
+    """
+    :return: Dictionary of tool name -> tool description
+    """
+    toolbox_info_file: str = get_toolbox_info_file()
+    logger.info("Loading toolbox info file: %s", toolbox_info_file)
+    tools: dict[str, Any] = ToolboxInfoRestorer().restore(toolbox_info_file)
+    return {tool_name: tool_info.get("description", "") for tool_name, tool_info in tools.items()}
+
+
+def _load_subnetworks() -> dict[str, str]:
+    """
+    :return: Dictionary of "/" + agent network name -> description of its front man
+    """
+    logger.info("Loading agent networks from manifest: %s", str(get_manifest_files()))
+    # What is returned is mapping from storage type -> (name -> AgentNetwork mapping)
+    networks_by_storage: dict[str, dict[str, AgentNetwork]] = RegistryManifestRestorer().restore()
+
+    subnetworks: dict[str, str] = {}
+    for storage_type in ["public", "protected"]:
+        for name, network in networks_by_storage.get(storage_type, {}).items():
+            front_man: str = network.find_front_man()
+            subnetworks["/" + name] = network.get_agent_tool_spec(front_man).get("function", {}).get("description")
+    return subnetworks
+
+
+def _load_mcp_servers() -> list[str]:
+    """
+    :return: List of MCP server URLs
+    """
+    return list(McpServersInfoRestorer().restore().keys())
+
+
+_TOOLBOX_CACHE = FileCache(_load_toolbox, lambda: [get_toolbox_info_file()])
+_SUBNETWORK_CACHE = FileCache(_load_subnetworks, _manifest_paths)
+_MCP_SERVERS_CACHE = FileCache(_load_mcp_servers, lambda: [os.getenv("MCP_SERVERS_INFO_FILE", DEFAULT_MCP_INFO_FILE)])
+
+
+def get_toolbox_descriptions() -> dict[str, str]:
+    """
+    :return: A copy of the dictionary of tool name -> tool description
+    :raises FileNotFoundError: If the toolbox info file cannot be found
+    """
+    return dict(_TOOLBOX_CACHE.get())
+
+
+def get_subnetwork_descriptions() -> dict[str, str]:
+    """
+    :return: A copy of the dictionary of "/" + agent network name -> description
+    :raises FileNotFoundError: If the manifest file cannot be found
+    """
+    # The manifest restorer reads the manifest location from the environment
+    os.environ["AGENT_MANIFEST_FILE"] = os.getenv("AGENT_MANIFEST_FILE", DEFAULT_MANIFEST_FILE)
+    return dict(_SUBNETWORK_CACHE.get())
+
+
+def get_mcp_servers() -> list[str]:
+    """
+    :return: A copy of the list of MCP server URLs
+    """
+    if not os.getenv("MCP_SERVERS_INFO_FILE"):
+        os.environ["MCP_SERVERS_INFO_FILE"] = DEFAULT_MCP_INFO_FILE
+    return list(_MCP_SERVERS_CACHE.get())
+
+
+class TtlCache:
+    """
+    Dictionary whose entries expire a fixed number of seconds after they were stored.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        """
+        :param ttl_seconds: Seconds an entry stays valid
+        """
+        self.ttl_seconds: float = ttl_seconds
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """
+        :param key: Key of the entry
+        :return: The stored value, or None if there is none or it expired
+        """
+        with self._lock:
+            entry: tuple[float, Any] = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key: str, value: Any):
+        """
+        :param key: Key of the entry
+        :param value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def clear(self):
+        """
+        Drop every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+MCP_TOOLS_CACHE = TtlCache(float(os.getenv(MCP_TOOLS_CACHE_TTL_ENV, str(DEFAULT_MCP_TOOLS_CACHE_TTL_SECONDS))))
@@ -17,3 +17,4 @@
 # Common dictionary key constants
 AGENT_NETWORK_DEFINITION: str = "agent_network_definition"
 AGENT_NETWORK_NAME: str = "agent_network_name"
+VALIDATION_SESSION: str = "agent_network_validation_session"
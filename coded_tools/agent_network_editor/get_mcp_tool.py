@@ -14,17 +14,22 @@
 #
 # END COPYRIGHT
 
+import asyncio
 import logging
 import os
+import time
 from typing import Any
 
 from langchain_core.tools import BaseTool
 from neuro_san.interfaces.coded_tool import CodedTool
 from neuro_san.internals.run_context.langchain.mcp.langchain_mcp_adapter import LangChainMcpAdapter
-from neuro_san.internals.run_context.langchain.mcp.mcp_servers_info_restorer import McpServersInfoRestorer
 
-# Use deepwiki MCP server as default since it is free and does not require authorization.
-DEFAULT_MCP_INFO_FILE = os.path.join("mcp", "mcp_info.hocon")
+from coded_tools.agent_network_editor.catalog_cache import MCP_TOOLS_CACHE
+from coded_tools.agent_network_editor.catalog_cache import get_mcp_servers
+
+# Seconds to wait for one MCP server to list its tools before reporting it as failed
+MCP_DISCOVERY_TIMEOUT_ENV = "MCP_TOOL_DISCOVERY_TIMEOUT_SECONDS"
+DEFAULT_MCP_DISCOVERY_TIMEOUT_SECONDS = 15.0
 
 
 class GetMcpTool(CodedTool):
@@ -33,12 +38,13 @@ class GetMcpTool(CodedTool):
     """
 
     def __init__(self):
-        if not os.getenv("MCP_SERVERS_INFO_FILE"):
-            os.environ["MCP_SERVERS_INFO_FILE"] = DEFAULT_MCP_INFO_FILE
-        restorer = McpServersInfoRestorer()
-        self.mcp_servers: list[str] = list(restorer.restore().keys())
+        # Reread only when the MCP servers info file changes
+        self.mcp_servers: list[str] = get_mcp_servers()
+        self.timeout_seconds: float = float(
+            os.getenv(MCP_DISCOVERY_TIMEOUT_ENV, str(DEFAULT_MCP_DISCOVERY_TIMEOUT_SECONDS))
+        )
 
-    async def async_invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> dict[str, list[BaseTool]] | str:
+    async def async_invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> dict[str, dict[str, Any]]:
         """
         :param args: An argument dictionary whose keys are the parameters
                 to the coded tool and whose values are the values passed for them
@@ -61,31 +67,51 @@ class GetMcpTool(CodedTool):
                     None
 
         :return:
-            In case of successful execution:
-                the server name and tool definition from the server as a dictionary.
-            otherwise:
-                a text string of an error message in the format:
-                "Error: <error message>"
+            A dictionary with each MCP server URL as a key. Each value is a dictionary with
+                "tools": a dictionary of tool name -> tool description, if the server listed its tools
+                "error": an error message in the format "Error: <error message>", if it did not
+                "seconds": how long the server took to answer
+                "cached": True if the tools were listed recently and reused
         """
         logger = logging.getLogger(self.__class__.__name__)
 
-        # Get tool list from MCP servers
+        # Ask all servers at once, so total latency is that of the slowest server rather than the sum,
+        # and a server that does not answer in time only loses its own entry.
         logger.info(">>>>>>>>>>>>>>>>>>>Getting Tool Definition from MCP Servers>>>>>>>>>>>>>>>>>>>")
-        tool_dict: dict[str, list[BaseTool]] = {}
-        for mcp_server in self.mcp_servers:
-            try:
-                logger.info("MCP Server: %s", mcp_server)
-                tools: list[BaseTool] = await LangChainMcpAdapter().get_mcp_tools(mcp_server)
-                logger.info("Successfully loaded the following tools: %s", str(tools))
-
-                # Gather each tool's description into one string.
-                tool_dict[mcp_server] = ""
-                for tool in tools:
-                    tool_dict[mcp_server] += tool.description + "\n"
-
-            except ExceptionGroup as exception:
-                error_msg = f"Error: Failed to load tools from {mcp_server}. {str(exception)}"
-                logger.warning(error_msg)
-
-        # Returns a dict with url as a key and combined descriptions of tools as a value.
-        return str(tool_dict)
+        results: list[dict[str, Any]] = await asyncio.gather(
+            *[self.get_server_tools(mcp_server, logger) for mcp_server in self.mcp_servers]
+        )
+        return dict(zip(self.mcp_servers, results))
+
+    async def get_server_tools(self, mcp_server: str, logger: logging.Logger) -> dict[str, Any]:
+        """
+        :param mcp_server: URL of the MCP server
+        :param logger: Logger to report progress to
+        :return: The entry of the server in the result of async_invoke()
+        """
+        cached: dict[str, str] = MCP_TOOLS_CACHE.get(mcp_server)
+        if cached is not None:
+            logger.info("Using cached tools of MCP Server: %s", mcp_server)
+            return {"tools": dict(cached), "seconds": 0.0, "cached": True}
+
+        started: float = time.monotonic()
+        try:
+            logger.info("MCP Server: %s", mcp_server)
+            tools: list[BaseTool] = await asyncio.wait_for(
+                LangChainMcpAdapter().get_mcp_tools(mcp_server), timeout=self.timeout_seconds
+            )
+            logger.info("Successfully loaded the following tools: %s", str(tools))
+        except TimeoutError:
+            error_msg = f"Error: {mcp_server} did not list its tools within {self.timeout_seconds} seconds."
+            logger.warning(error_msg)
+            return {"error": error_msg, "seconds": round(time.monotonic() - started, 3), "cached": False}
+        # Any failure of one server, such as an MCP or HTTP status error, must only lose that server's entry
+        # pylint: disable=broad-exception-caught
+        except Exception as exception:
+            error_msg = f"Error: Failed to load tools from {mcp_server}. {str(exception)}"
+            logger.warning(error_msg)
+            return {"error": error_msg, "seconds": round(time.monotonic() - started, 3), "cached": False}
+
+        descriptions: dict[str, str] = {tool.name: tool.description for tool in tools}
+        MCP_TOOLS_CACHE.put(mcp_server, descriptions)
+        return {"tools": dict(descriptions), "seconds": round(time.monotonic() - started, 3), "cached": False}
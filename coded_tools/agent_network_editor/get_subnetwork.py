@@ -16,14 +16,12 @@
 
 import asyncio
 import logging
-import os
 from typing import Any
 
 from neuro_san.interfaces.coded_tool import CodedTool
-from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
-from neuro_san.internals.graph.registry.agent_network import AgentNetwork
 
-DEFAULT_MANIFEST_FILE = os.path.join("registries", "manifest.hocon")
+from coded_tools.agent_network_editor.catalog_cache import get_manifest_files
+from coded_tools.agent_network_editor.catalog_cache import get_subnetwork_descriptions
 
 
 class GetSubnetwork(CodedTool):
@@ -31,7 +29,6 @@ class GetSubnetwork(CodedTool):
     CodedTool implementation which provides a way to get subnetwork names and descriptions from the manifest file
     """
 
-    # pylint: disable=too-many-locals
     def invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> dict[str, Any] | str:
         """
         :param args: An argument dictionary whose keys are the parameters
@@ -62,35 +59,18 @@ class GetSubnetwork(CodedTool):
                 "Error: <error message>"
         """
         logger = logging.getLogger(self.__class__.__name__)
-        os.environ["AGENT_MANIFEST_FILE"] = os.getenv("AGENT_MANIFEST_FILE", DEFAULT_MANIFEST_FILE)
-        manifest_file: str | list[str] = os.environ["AGENT_MANIFEST_FILE"]
-
-        empty: dict[str, AgentNetwork] = {}
-        networks: dict[str, AgentNetwork] = {}
+        manifest_files: list[str] = get_manifest_files()
         try:
             logger.info(">>>>>>>>>>>>>>>>>>>Getting Subnetwork Descriptions from Manifest>>>>>>>>>>>>>>>>>>>")
-            logger.info("Manifest file: %s", str(manifest_file))
-
-            # What is returned is mapping from storage type -> (name -> AgentNetwork mapping)
-            networks_by_storage: dict[str, dict[str, AgentNetwork]] = RegistryManifestRestorer().restore()
-            logger.info("Successfully loaded agent networks info from %s", str(manifest_file))
-
-            # Put all name -> AgentNetwork mappings into a single dictionary,
-            # as is expected by the rest of this tool.
-            for storage_type in ["public", "protected"]:
-                one_storage_dict: dict[str, AgentNetwork] = networks_by_storage.get(storage_type, empty)
-                networks.update(one_storage_dict)
+            logger.info("Manifest file: %s", str(manifest_files))
+            # Parsed only when the manifest or one of the registry files changes
+            subnetworks_dict: dict[str, str] = get_subnetwork_descriptions()
+            logger.info("Successfully loaded agent networks info from %s", str(manifest_files))
         except FileNotFoundError as not_found_err:
-            error_msg = f"Error: Failed to load agent networkds info from {manifest_file}. {str(not_found_err)}"
+            error_msg = f"Error: Failed to load agent networkds info from {manifest_files}. {str(not_found_err)}"
             logger.warning(error_msg)
             return error_msg
 
-        subnetworks_dict: dict[str, str] = {}
-        for name, network in networks.items():
-            front_man: str = network.find_front_man()
-            desc: str = network.get_agent_tool_spec(front_man).get("function", {}).get("description")
-            subnetworks_dict["/" + name] = desc
-
         return subnetworks_dict
 
     async def async_invoke(self, args: dict[str, Any], sly_data: dict[str, Any]) -> dict[str, Any] | str:
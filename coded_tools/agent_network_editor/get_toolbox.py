@@ -16,13 +16,12 @@
 
 import asyncio
 import logging
-import os
 from typing import Any
 
 from neuro_san.interfaces.coded_tool import CodedTool
-from neuro_san.internals.run_context.langchain.toolbox.toolbox_info_restorer import ToolboxInfoRestorer
 
-DEFAULT_TOOLBOX_INFO_FILE = os.path.join("toolbox", "toolbox_info.hocon")
+from coded_tools.agent_network_editor.catalog_cache import get_toolbox_descriptions
+from coded_tools.agent_network_editor.catalog_cache import get_toolbox_info_file
 
 
 class GetToolbox(CodedTool):
@@ -60,17 +59,13 @@ class GetToolbox(CodedTool):
                 "Error: <error message>"
         """
         logger = logging.getLogger(self.__class__.__name__)
-        toolbox_info_file: str = os.getenv("AGENT_TOOLBOX_INFO_FILE", DEFAULT_TOOLBOX_INFO_FILE)
+        toolbox_info_file: str = get_toolbox_info_file()
         try:
             logger.info(">>>>>>>>>>>>>>>>>>>Getting Tool Definition from Toolbox>>>>>>>>>>>>>>>>>>>")
             logger.info("Toolbox info file: %s", toolbox_info_file)
-            tools: dict[str, Any] = ToolboxInfoRestorer().restore(toolbox_info_file)
+            # Tool names and descriptions, reloaded only when the toolbox info file changes
+            tools: dict[str, Any] = get_toolbox_descriptions()
             logger.info("Successfully loaded the following toolbox: %s", str(tools))
-
-            # Clean up the dict so that it only contains "description" key.
-            for tool_name, tool_info in tools.items():
-                tools[tool_name] = tool_info.get("description", "")
-
             return tools
         except FileNotFoundError as not_found_err:
             error_msg = f"Error: Failed to load toolbox info from {toolbox_info_file}. {str(not_found_err)}"
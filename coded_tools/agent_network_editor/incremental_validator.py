@@ -0,0 +1,325 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Validation of agent network definitions that only re-checks the agents an edit touched"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from neuro_san.internals.validation.network.cycles_network_validator import CyclesNetworkValidator
+from neuro_san.internals.validation.network.keyword_network_validator import KeywordNetworkValidator
+from neuro_san.internals.validation.network.missing_nodes_network_validator import MissingNodesNetworkValidator
+from neuro_san.internals.validation.network.toolbox_network_validator import ToolboxNetworkValidator
+from neuro_san.internals.validation.network.unreachable_nodes_network_validator import UnreachableNodesNetworkValidator
+from neuro_san.internals.validation.network.url_network_validator import UrlNetworkValidator
+
+from coded_tools.agent_network_editor.agent_graph import AgentGraph
+from coded_tools.agent_network_editor.agent_graph import GraphChange
+from coded_tools.agent_network_editor.catalog_cache import get_mcp_servers
+from coded_tools.agent_network_editor.constants import VALIDATION_SESSION
+from coded_tools.agent_network_editor.get_subnetwork import GetSubnetwork
+from coded_tools.agent_network_editor.get_toolbox import GetToolbox
+
+# Number of editing sessions whose validation state is kept at the same time
+MAX_TRACKED_NETWORKS = 64
+
+# Categories of errors that only depend on a single agent, in the order they are reported
+MISSING = "missing"
+KEYWORD = "keyword"
+TOOLBOX = "toolbox"
+URL = "url"
+
+# Down-chain that gives an agent of a skeleton network down-chains without naming another agent
+SKELETON_DOWN_CHAIN = "/"
+
+
+@dataclass
+class ValidationResult:
+    """
+    What one call to IncrementalNetworkValidator.sync() found, all read under the lock of the validator.
+    """
+
+    errors: list[str]
+    # The errors without those of KeywordNetworkValidator
+    structure_errors: list[str]
+    top_agents: set[str]
+    # Errors the edits since the previous sync() caused, and those they fixed
+    new_errors: list[str]
+    cleared_errors: list[str]
+
+
+# sync() is the one entry point; what it found comes back as a ValidationResult
+# pylint: disable=too-few-public-methods
+class IncrementalNetworkValidator:
+    """
+    Validates an agent network definition the way StructureNetworkValidator, KeywordNetworkValidator,
+    ToolboxNetworkValidator and UrlNetworkValidator do, but keeps its indexes between calls so that
+    each call only re-checks what changed since the previous one. The errors themselves come from
+    the neuro-san validators, run on the agents that need checking or on a skeleton of the network.
+
+    The validator keeps an AgentGraph of the network, the errors of every agent, the agents reachable
+    from the top agent and the strongly connected components that form cycles. An edit re-checks the
+    agents it changed and those that reference them, extends reachability from new edges (walking the
+    whole graph only when an edge or agent goes away), and recomputes cycles only within the part of
+    the graph where an added edge closes a loop or a removed one was part of one.
+
+    Cycles are looked for by CyclesNetworkValidator within the strongly connected components only,
+    so its depth-first search may name a few more or fewer agents than on the whole network when
+    several cycles share agents.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self._lock = threading.Lock()
+        self._graph = AgentGraph()
+        # Top agent the reachable agents were walked from, and those agents
+        self._reach: tuple[str, set[str]] = (None, set())
+        # Agent name -> members of its cycle, for agents that are part of one
+        self._cycle_components: dict[str, frozenset[str]] = {}
+        # Agent name -> category -> errors, for agents that have errors
+        self._agent_errors: dict[str, dict[str, list[str]]] = {}
+        # Toolbox tools, or an error message if the toolbox is unavailable, and valid URLs
+        self._catalogs: tuple[dict[str, Any] | str, list[str]] = (None, [])
+        self._errors: list[str] = []
+
+    @staticmethod
+    def _catalogs_key(catalogs: tuple[dict[str, Any] | str, list[str]]) -> tuple:
+        """
+        :param catalogs: Tuple of toolbox tools and valid URLs
+        :return: Tuple that changes whenever a change to the catalogs can change validation
+        """
+        tools, urls = catalogs
+        return frozenset(tools) if isinstance(tools, dict) else None, tuple(urls)
+
+    def sync(
+        self,
+        network_def: dict[str, Any],
+        tools: dict[str, Any] | str = None,
+        external_agents: list[str] = None,
+        mcp_servers: list[str] = None,
+    ) -> ValidationResult:
+        """
+        Bring the validation up to date with the agent network definition.
+
+        :param network_def: The agent name -> agent spec dictionary
+        :param tools: Dictionary of toolbox tools, or an error message if the toolbox is unavailable
+        :param external_agents: Valid subnetwork references
+        :param mcp_servers: MCP server URLs
+        :return: The errors and top agents of the network, and the errors the edits since the last call
+                caused or fixed
+        """
+        with self._lock:
+            previous: list[str] = self._errors
+            self._update(network_def, (tools, list(external_agents or []) + list(mcp_servers or [])))
+            self._errors = self._assemble_errors()
+
+            previous_set: set[str] = set(previous)
+            current_set: set[str] = set(self._errors)
+            return ValidationResult(
+                errors=list(self._errors),
+                structure_errors=self._assemble_errors(keywords=False),
+                top_agents=set(self._graph.find_top_agents()),
+                new_errors=[error for error in self._errors if error not in previous_set],
+                cleared_errors=[error for error in previous if error not in current_set],
+            )
+
+    def _update(self, network_def: dict[str, Any], catalogs: tuple[dict[str, Any] | str, list[str]]):
+        """
+        Apply the differences between the network definition and the state of the last call.
+        """
+        catalogs_changed: bool = self._catalogs_key(catalogs) != self._catalogs_key(self._catalogs)
+        self._catalogs = catalogs
+
+        change: GraphChange = self._graph.apply(
+            {name: AgentGraph.signature(spec or {}) for name, spec in network_def.items()}
+        )
+        if change.is_empty() and not catalogs_changed:
+            return
+
+        for name in change.removed:
+            self._agent_errors.pop(name, None)
+        # Agents whose own errors may differ: the edited ones, and those that reference agents that came or went
+        if catalogs_changed:
+            to_check: set[str] = set(self._graph.signatures)
+        else:
+            to_check = change.added | change.changed
+            for name in change.added | change.removed:
+                to_check.update(parent for parent in self._graph.parents.get(name, ()) if parent in network_def)
+        for name in to_check:
+            self._check_agent(name, network_def.get(name) or {})
+
+        self._update_reachability(bool(change.removed_edges or change.removed), change.added_edges)
+        self._update_cycles(change)
+
+    def _check_agent(self, name: str, spec: dict[str, Any]):
+        """
+        Recompute the errors that only depend on one agent.
+        """
+        tools, urls = self._catalogs
+        agent: dict[str, Any] = {name: spec}
+        # The down-chains of the agent that exist, so that only the others are reported as missing
+        neighborhood: dict[str, Any] = {
+            child: {} for child in self._graph.children.get(name, []) if child in self._graph.signatures
+        }
+        neighborhood[name] = spec
+
+        errors: dict[str, list[str]] = {
+            MISSING: MissingNodesNetworkValidator().validate_name_to_spec_dict(neighborhood),
+            KEYWORD: KeywordNetworkValidator().validate_name_to_spec_dict(agent),
+            TOOLBOX: ToolboxNetworkValidator(tools).validate_name_to_spec_dict(agent),
+            URL: UrlNetworkValidator(urls).validate_name_to_spec_dict(agent),
+        }
+        errors = {category: found for category, found in errors.items() if found}
+        if errors:
+            self._agent_errors[name] = errors
+        else:
+            self._agent_errors.pop(name, None)
+
+    def _update_reachability(self, lost_edges: bool, added_edges: list[tuple[str, str]]):
+        """
+        Keep the set of agents reachable from the single top agent current.
+        """
+        top_agents: set[str] = self._graph.find_top_agents()
+        root: str = next(iter(top_agents)) if len(top_agents) == 1 else None
+        if root is None:
+            self._reach = (None, set())
+        elif root != self._reach[0] or lost_edges:
+            self._reach = (root, self._graph.walk([root]))
+        else:
+            # Only new edges: what they lead to from reachable agents becomes reachable too
+            reachable: set[str] = self._reach[1]
+            for parent, child in added_edges:
+                if parent in reachable and child not in reachable:
+                    reachable |= self._graph.walk([child])
+
+    def _update_cycles(self, change: GraphChange):
+        """
+        Recompute the cycles in the part of the graph the edges could have changed.
+        """
+        region: set[str] = set()
+        for parent, _ in change.removed_edges:
+            region |= self._cycle_components.get(parent, frozenset())
+        for name in change.removed:
+            region |= self._cycle_components.get(name, frozenset())
+        for parent, child in change.added_edges:
+            forward: set[str] = self._graph.walk([child])
+            if parent in forward:
+                # The new edge closes a loop through every agent that is both below it and above it
+                region |= self._graph.walk([parent], within=forward, reverse=True)
+
+        for name in region | change.removed:
+            self._cycle_components.pop(name, None)
+        region &= self._graph.signatures.keys()
+        for component in self._graph.strongly_connected(region):
+            if len(component) > 1 or component[0] in self._graph.children.get(component[0], ()):
+                members: frozenset[str] = frozenset(component)
+                for name in component:
+                    self._cycle_components[name] = members
+
+    def _structure_errors(self) -> list[str]:
+        """
+        :return: The errors of UnreachableNodesNetworkValidator
+        """
+        # A skeleton network with the same top agents, plus the unreachable agents when there is one top agent
+        top_agents: set[str] = self._graph.find_top_agents()
+        skeleton: dict[str, Any] = {top: {"tools": [SKELETON_DOWN_CHAIN]} for top in top_agents}
+        if len(top_agents) == 1:
+            skeleton.update({name: {} for name in self._graph.signatures.keys() - self._reach[1]})
+        return UnreachableNodesNetworkValidator().validate_name_to_spec_dict(skeleton)
+
+    def _assemble_errors(self, keywords: bool = True) -> list[str]:
+        """
+        :param keywords: True to include the errors of KeywordNetworkValidator
+        :return: The errors of the network, in the order the full validators report them
+        """
+        if not self._graph.signatures:
+            return CyclesNetworkValidator().validate({})
+
+        # Only the agents of cycles, with their down-chains among those agents
+        cyclic: dict[str, Any] = {
+            name: {"tools": [child for child in self._graph.children[name] if child in self._cycle_components]}
+            for name in self._graph.order
+            if name in self._cycle_components
+        }
+        errors: list[str] = CyclesNetworkValidator().validate_name_to_spec_dict(cyclic)
+
+        with_errors: list[dict[str, list[str]]] = [
+            self._agent_errors[name] for name in self._graph.order if name in self._agent_errors
+        ]
+        for agent_errors in with_errors:
+            errors.extend(agent_errors.get(MISSING, []))
+        errors.extend(self._structure_errors())
+        for category in (KEYWORD, TOOLBOX, URL) if keywords else (TOOLBOX, URL):
+            for agent_errors in with_errors:
+                errors.extend(agent_errors.get(category, []))
+        return errors
+
+
+_VALIDATORS: OrderedDict[str, IncrementalNetworkValidator] = OrderedDict()
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def get_network_validator(session_key: str) -> IncrementalNetworkValidator:
+    """
+    :param session_key: Key of an editing session, as kept in sly data across edits
+    :return: The validator of that session, created on first use. Sly data is rebuilt on every turn,
+            so the validator is found by key, and each sync() reconciles it with whatever definition it gets.
+    """
+    with _VALIDATORS_LOCK:
+        validator: IncrementalNetworkValidator = _VALIDATORS.get(session_key)
+        if validator is None:
+            validator = IncrementalNetworkValidator()
+            _VALIDATORS[session_key] = validator
+            while len(_VALIDATORS) > MAX_TRACKED_NETWORKS:
+                _VALIDATORS.popitem(last=False)
+        _VALIDATORS.move_to_end(session_key)
+        return validator
+
+
+def get_session_validator(sly_data: dict[str, Any]) -> IncrementalNetworkValidator:
+    """
+    :param sly_data: Sly data of an editing session. A session key is added to it on first use.
+    :return: The validator of the session. Sessions editing networks of the same name get validators of their own.
+    """
+    session_key: str = sly_data.get(VALIDATION_SESSION)
+    if not session_key:
+        session_key = uuid.uuid4().hex
+        sly_data[VALIDATION_SESSION] = session_key
+    return get_network_validator(session_key)
+
+
+def validate_network_definition(network_def: dict[str, Any], sly_data: dict[str, Any] = None) -> ValidationResult:
+    """
+    Validate an agent network definition against the current toolbox, subnetworks and MCP servers.
+
+    :param network_def: An agent network definition, as kept in sly data across edits
+    :param sly_data: Sly data of the editing session. Without it, the network is validated from scratch.
+    :return: The errors and top agents of the network, and the errors changed since the last validation
+            in the same session
+    """
+    tools: dict[str, Any] | str = GetToolbox().invoke(None, None)
+    subnetworks: dict[str, Any] | str = GetSubnetwork().invoke(None, None)
+    external_agents: list[str] = list(subnetworks.keys()) if isinstance(subnetworks, dict) else []
+
+    validator: IncrementalNetworkValidator = (
+        get_session_validator(sly_data) if sly_data is not None else IncrementalNetworkValidator()
+    )
+    return validator.sync(network_def, tools, external_agents, get_mcp_servers())
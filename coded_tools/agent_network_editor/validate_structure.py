@@ -19,14 +19,10 @@ import logging
 from typing import Any
 
 from neuro_san.interfaces.coded_tool import CodedTool
-from neuro_san.internals.validation.network.structure_network_validator import StructureNetworkValidator
-from neuro_san.internals.validation.network.toolbox_network_validator import ToolboxNetworkValidator
-from neuro_san.internals.validation.network.url_network_validator import UrlNetworkValidator
 
 from coded_tools.agent_network_editor.constants import AGENT_NETWORK_DEFINITION
-from coded_tools.agent_network_editor.get_mcp_tool import GetMcpTool
-from coded_tools.agent_network_editor.get_subnetwork import GetSubnetwork
-from coded_tools.agent_network_editor.get_toolbox import GetToolbox
+from coded_tools.agent_network_editor.incremental_validator import ValidationResult
+from coded_tools.agent_network_editor.incremental_validator import validate_network_definition
 
 
 class ValidateStructure(CodedTool):
@@ -73,21 +69,13 @@ class ValidateStructure(CodedTool):
         logger.info(">>>>>>>>>>>>>>>>>>>Validate Agent Network Structure>>>>>>>>>>>>>>>>>>")
         # Validate the agent network and return error message if there are any issues.
 
-        # Get a dict of tools or error message if no toolbox found.
-        tools: dict[str, Any] | str = GetToolbox().invoke(None, None)
-        # Gather all URLs from MCP servers and subnetworks.
-        subnetworks: dict[str, Any] | str = GetSubnetwork().invoke(None, None)
-        if isinstance(subnetworks, dict):
-            subnetworks: list[str] = list(subnetworks.keys())
-        else:
-            subnetworks = []
-        mcp_servers: list[str] = GetMcpTool().mcp_servers
-
-        error_list: list[str] = (
-            StructureNetworkValidator().validate(network_def)
-            + ToolboxNetworkValidator(tools).validate(network_def)
-            + UrlNetworkValidator(subnetworks, mcp_servers).validate(network_def)
-        )
+        # The validator of this editing session only re-checks what changed since it last ran,
+        # against the current toolbox, subnetworks and MCP servers.
+        result: ValidationResult = validate_network_definition(network_def, sly_data)
+        if result.new_errors or result.cleared_errors:
+            logger.info("New errors: %s Cleared errors: %s", result.new_errors, result.cleared_errors)
+
+        error_list: list[str] = result.structure_errors
         if error_list:
             error_msg = f"Error: {error_list}"
             logger.error(error_msg)
@@ -14,9 +14,8 @@
 #
 # END COPYRIGHT
 
-import json
+import asyncio
 import logging
-import os
 from datetime import datetime
 from typing import Any
 from typing import Dict
@@ -25,7 +24,7 @@ from neuro_san.interfaces.coded_tool import CodedTool
 
 from coded_tools.experimental.kwik_agents.list_topics import LONG_TERM_MEMORY_FILE
 from coded_tools.experimental.kwik_agents.list_topics import MEMORY_DATA_STRUCTURE
-from coded_tools.experimental.kwik_agents.list_topics import MEMORY_FILE_PATH
+from coded_tools.experimental.kwik_agents.list_topics import open_memory_store
 
 
 class CommitToMemory(CodedTool):
@@ -58,6 +57,7 @@ class CommitToMemory(CodedTool):
 
                 Keys expected for this implementation are:
                     "TopicMemory" a dictionary containing topics as keys and strings of facts as values.
+                    Only used when LONG_TERM_MEMORY_FILE is False; otherwise facts go to the memory store.
 
         :return:
             In case of successful execution:
@@ -66,12 +66,6 @@ class CommitToMemory(CodedTool):
                 a text string an error message in the format:
                 "Error: <error message>"
         """
-        self.topic_memory = sly_data.get(MEMORY_DATA_STRUCTURE, None)
-        if not self.topic_memory:
-            if LONG_TERM_MEMORY_FILE:
-                self.read_memory_from_file()
-            else:
-                self.topic_memory = {}
         the_new_fact: str = args.get("new_fact", "")
         if the_new_fact == "":
             return "Error: No new_fact provided."
@@ -83,43 +77,43 @@ class CommitToMemory(CodedTool):
         logger.info(">>>>>>>>>>>>>>>>>>>CommitToMemory>>>>>>>>>>>>>>>>>>")
         logger.info("New Fact: %s", str(the_new_fact))
         logger.info("Topic: %s", str(the_topic))
-        the_memory_str = self.add_memory(the_topic, the_new_fact)
+        if LONG_TERM_MEMORY_FILE:
+            the_memory_str = self.commit_to_store(the_topic, the_new_fact)
+        else:
+            self.topic_memory = sly_data.get(MEMORY_DATA_STRUCTURE, None) or {}
+            the_memory_str = self.add_memory(the_topic, the_new_fact)
+            sly_data[MEMORY_DATA_STRUCTURE] = self.topic_memory
         logger.info("Memory on this topic: \n %s", str(the_memory_str))
-        sly_data[MEMORY_DATA_STRUCTURE] = self.topic_memory
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
         return the_memory_str
 
     async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> str:
         """
-        Delegates to the synchronous invoke method for now.
+        Runs the synchronous invoke method in a worker thread, so store access does not block the event loop.
         """
-        return self.invoke(args, sly_data)
+        return await asyncio.to_thread(self.invoke, args, sly_data)
 
-    def write_memory_to_file(self):
-        """
-        Writes the topic memory dictionary to a JSON file.
+    @staticmethod
+    def commit_to_store(topic: str, new_fact: str) -> str:
         """
-        file_path = MEMORY_FILE_PATH + MEMORY_DATA_STRUCTURE + ".json"
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as file:
-            file.write(json.dumps(self.topic_memory, indent=2))
+        Appends a new fact to the persistent memory store.
+        Only the new fact is written, however large the memory has grown.
 
-    def read_memory_from_file(self):
-        """
-        Reads the topic memory dictionary from a JSON file if it exists.
-        Otherwise initializes an empty dictionary.
+        Parameters:
+        - topic (str): A topic to store the memory under.
+        - new_fact (str): The new fact to remember.
+
+        Returns:
+        - str: A confirmation naming the stored fact, or noting that it was already known.
         """
-        file_path = MEMORY_FILE_PATH + MEMORY_DATA_STRUCTURE + ".json"
-        if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
-                self.topic_memory = json.loads(content) if content else {}
-        else:
-            self.topic_memory = {}
+        time_stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if not open_memory_store().add_fact(topic, new_fact, time_stamp):
+            return f"Already remembered under '{topic}': {new_fact}"
+        return f"Remembered under '{topic}': [{time_stamp}] {new_fact}"
 
     def add_memory(self, topic: str, new_fact: str) -> str:
         """
-        Adds a new fact to memory and saves the memory dictionary to a JSON file.
+        Adds a new fact to the in-memory topic dictionary.
 
         Parameters:
         - topic (str): A topic to store the memory under.
@@ -136,7 +130,4 @@ class CommitToMemory(CodedTool):
         else:
             self.topic_memory[topic] = self.topic_memory[topic] + "\n" + time_stamp + new_fact
 
-        if LONG_TERM_MEMORY_FILE:
-            self.write_memory_to_file()
-
         return self.topic_memory[topic]
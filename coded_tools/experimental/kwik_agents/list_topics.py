@@ -14,19 +14,29 @@
 #
 # END COPYRIGHT
 
-import json
+import asyncio
 import logging
-import os
 from typing import Any
 from typing import Dict
 
 from neuro_san.interfaces.coded_tool import CodedTool
 
+from coded_tools.experimental.kwik_agents.memory_store import MemoryStore
+from coded_tools.experimental.kwik_agents.memory_store import get_memory_store
+
 LONG_TERM_MEMORY_FILE = True  # Store and read memory from file
 MEMORY_FILE_PATH = "./"
 MEMORY_DATA_STRUCTURE = "TopicMemory"
 
 
+def open_memory_store() -> MemoryStore:
+    """
+    :return: The persistent memory store, importing the legacy JSON memory file the first time it is opened
+    """
+    base_path: str = MEMORY_FILE_PATH + MEMORY_DATA_STRUCTURE
+    return get_memory_store(base_path + ".db", base_path + ".json")
+
+
 class ListTopics(CodedTool):
     """
     A CodedTool that retrieves and returns the list of topics in the memory.
@@ -40,42 +50,33 @@ class ListTopics(CodedTool):
         :param args: None
 
         :param sly_data: "TopicMemory" a dictionary containing topics as keys and strings of facts as values.
+                Only used when LONG_TERM_MEMORY_FILE is False; otherwise topics come from the memory store.
 
         :return: The list of topics in the memory
         """
+        logger = logging.getLogger(self.__class__.__name__)
+        if LONG_TERM_MEMORY_FILE:
+            logger.info(">>>>>>>>>>>>>>>>>>>ListTopics>>>>>>>>>>>>>>>>>>")
+            topics_str = str(open_memory_store().topics())
+            logger.info("The resulting list of topics: \n %s", str(topics_str))
+            logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
+            return topics_str
+
         self.topic_memory = sly_data.get(MEMORY_DATA_STRUCTURE, None)
         if not self.topic_memory:
-            if LONG_TERM_MEMORY_FILE:
-                self.read_memory_from_file()
-            else:
-                return "NO TOPICS YET!"
+            return "NO TOPICS YET!"
 
-        logger = logging.getLogger(self.__class__.__name__)
         logger.info(">>>>>>>>>>>>>>>>>>>ListTopics>>>>>>>>>>>>>>>>>>")
         topics_str = self.get_memory_topics()
         logger.info("The resulting list of topics: \n %s", str(topics_str))
-        sly_data[MEMORY_DATA_STRUCTURE] = self.topic_memory
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
         return topics_str
 
     async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> str:
         """
-        Delegates to the synchronous invoke method for now.
-        """
-        return self.invoke(args, sly_data)
-
-    def read_memory_from_file(self):
-        """
-        Reads the topic memory dictionary from a JSON file if it exists.
-        Otherwise initializes an empty dictionary.
+        Runs the synchronous invoke method in a worker thread, so store access does not block the event loop.
         """
-        file_path = MEMORY_FILE_PATH + MEMORY_DATA_STRUCTURE + ".json"
-        if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
-                self.topic_memory = json.loads(content) if content else {}
-        else:
-            self.topic_memory = {}
+        return await asyncio.to_thread(self.invoke, args, sly_data)
 
     def get_memory_topics(self) -> str:
         """
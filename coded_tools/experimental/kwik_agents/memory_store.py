@@ -0,0 +1,294 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any
+
+from coded_tools.tools.bm25_index import Bm25Index
+from coded_tools.tools.bm25_index import tokenize
+
+# Environment variables that control the process-wide store
+MEMORY_STORE_PATH_ENV = "KWIK_MEMORY_STORE_PATH"
+MEMORY_COMPACT_INTERVAL_ENV = "KWIK_MEMORY_COMPACT_INTERVAL"
+
+DEFAULT_COMPACT_INTERVAL = 500
+DEFAULT_SEARCH_LIMIT = 10
+
+# Facts in the legacy JSON file are joined by newlines, each one starting with its timestamp
+LEGACY_FACT_PATTERN = re.compile(r"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] ?(.*)$")
+
+
+class MemoryStore:
+    """
+    Append-only store of the facts that kwik agents commit to memory.
+
+    Every fact is one row of a SQLite database, indexed by topic, so committing a
+    fact is a single insert rather than a rewrite of the whole memory, and listing
+    topics or recalling one topic only reads what it needs. Writes are transactions,
+    so several processes can share the same file. Facts are also indexed for keyword
+    search (full-text search when SQLite has FTS5, BM25 over the candidate facts
+    otherwise), so recall can return the facts relevant to a query instead of
+    whole topics.
+    """
+
+    def __init__(self, path: str, compact_interval: int = DEFAULT_COMPACT_INTERVAL):
+        """
+        Constructor.
+
+        :param path: Path to the SQLite database file
+        :param compact_interval: Number of committed facts after which the indexes are compacted. 0 to never compact.
+        """
+        self.path: str = path
+        self.compact_interval: int = compact_interval
+        self._writes: int = 0
+        self._lock = threading.Lock()
+
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS facts ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " topic TEXT NOT NULL,"
+            " fact TEXT NOT NULL,"
+            " timestamp TEXT NOT NULL,"
+            " digest TEXT NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_topic ON facts(topic)")
+        self._connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_topic_digest ON facts(topic, digest)")
+        self.full_text: bool = self._create_full_text_index()
+        self._connection.commit()
+
+    def _create_full_text_index(self) -> bool:
+        """
+        Create the full-text index over the facts and the trigger that keeps it current.
+
+        :return: True if SQLite supports FTS5, False if searches have to fall back to BM25 in Python
+        """
+        existed: bool = (
+            self._connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'facts_fts'").fetchone() is not None
+        )
+        try:
+            self._connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS facts_fts USING fts5(fact, content='facts', content_rowid='id')"
+            )
+        except sqlite3.OperationalError as error:
+            logging.info("SQLite FTS5 is not available, searching memory without it: %s", error)
+            return False
+
+        self._connection.execute(
+            "CREATE TRIGGER IF NOT EXISTS facts_fts_insert AFTER INSERT ON facts BEGIN"
+            " INSERT INTO facts_fts(rowid, fact) VALUES (new.id, new.fact); END"
+        )
+        if not existed:
+            # Facts stored before the index existed, or while FTS5 was not available, are not in it yet
+            self._connection.execute("INSERT INTO facts_fts(facts_fts) VALUES ('rebuild')")
+        return True
+
+    @staticmethod
+    def make_digest(fact: str) -> str:
+        """
+        :param fact: Text of a fact
+        :return: Hex digest that is the same for facts differing only in case and whitespace
+        """
+        return hashlib.sha256(" ".join(fact.lower().split()).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def format_facts(rows: list[tuple[str, str]]) -> str:
+        """
+        :param rows: List of (timestamp, fact) tuples
+        :return: The facts one per line, in the format they have always been shown to agents
+        """
+        return "\n".join(f"[{timestamp}] {fact}" for timestamp, fact in rows)
+
+    def add_fact(self, topic: str, fact: str, timestamp: str = None) -> bool:
+        """
+        Append a fact to a topic.
+
+        :param topic: Topic to store the fact under
+        :param fact: The fact to remember
+        :param timestamp: Time the fact was learned, as "YYYY-mm-dd HH:MM:SS". Defaults to now.
+        :return: True if the fact was added, False if the topic already had it
+        """
+        timestamp = timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock, self._connection:
+            cursor: sqlite3.Cursor = self._connection.execute(
+                "INSERT OR IGNORE INTO facts (topic, fact, timestamp, digest) VALUES (?, ?, ?, ?)",
+                (topic, fact, timestamp, self.make_digest(fact)),
+            )
+            added: bool = cursor.rowcount > 0
+            if added:
+                self._writes += 1
+            compact: bool = added and bool(self.compact_interval) and self._writes % self.compact_interval == 0
+
+        if compact:
+            self.compact()
+        return added
+
+    def topics(self) -> list[str]:
+        """
+        :return: Sorted list of the topics that have facts
+        """
+        with self._lock:
+            rows: list[tuple[str]] = self._connection.execute(
+                "SELECT DISTINCT topic FROM facts ORDER BY topic"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def facts(self, topic: str) -> list[tuple[str, str]]:
+        """
+        :param topic: Topic to read
+        :return: List of (timestamp, fact) tuples of the topic, oldest first
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT timestamp, fact FROM facts WHERE topic = ? ORDER BY id", (topic,)
+            ).fetchall()
+
+    def search(self, query: str, topic: str = None, limit: int = DEFAULT_SEARCH_LIMIT) -> list[tuple[str, str, str]]:
+        """
+        :param query: Keywords to look for
+        :param topic: Optional topic to restrict the search to
+        :param limit: Maximum number of facts to return
+        :return: List of up to limit (topic, timestamp, fact) tuples, most relevant first
+        """
+        terms: list[str] = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+
+        if not self.full_text:
+            return self._search_bm25(query, topic, limit)
+
+        # Quote every term so that punctuation in the query cannot break the FTS syntax
+        match: str = " OR ".join(f'"{term}"' for term in terms)
+        sql: str = (
+            "SELECT facts.topic, facts.timestamp, facts.fact FROM facts_fts"
+            " JOIN facts ON facts.id = facts_fts.rowid WHERE facts_fts MATCH ?"
+        )
+        parameters: list[Any] = [match]
+        if topic is not None:
+            sql += " AND facts.topic = ?"
+            parameters.append(topic)
+        sql += " ORDER BY bm25(facts_fts) LIMIT ?"
+        parameters.append(limit)
+
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def _search_bm25(self, query: str, topic: str, limit: int) -> list[tuple[str, str, str]]:
+        """
+        Keyword search without FTS5: score the candidate facts with an in-memory BM25 index.
+        """
+        with self._lock:
+            if topic is None:
+                rows = self._connection.execute("SELECT id, topic, timestamp, fact FROM facts").fetchall()
+            else:
+                rows = self._connection.execute(
+                    "SELECT id, topic, timestamp, fact FROM facts WHERE topic = ?", (topic,)
+                ).fetchall()
+
+        by_id: dict[str, tuple[str, str, str]] = {str(row[0]): row[1:] for row in rows}
+        index = Bm25Index()
+        index.add({row_id: row[2] for row_id, row in by_id.items()})
+        return [by_id[row_id] for row_id, _ in index.search(query, limit)]
+
+    def compact(self):
+        """
+        Merge the segments of the full-text index and fold the write-ahead log back into the database,
+        so that a long-lived memory keeps searching and opening quickly.
+        """
+        with self._lock:
+            if self.full_text:
+                self._connection.execute("INSERT INTO facts_fts(facts_fts) VALUES ('optimize')")
+                self._connection.commit()
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def is_empty(self) -> bool:
+        """
+        :return: True if no fact has been stored yet
+        """
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM facts LIMIT 1").fetchone() is None
+
+    def import_topic_memory(self, topic_memory: dict[str, str]) -> int:
+        """
+        Import memory in the legacy format of one newline-joined string of timestamped facts per topic.
+
+        :param topic_memory: Dictionary of topic -> facts string
+        :return: Number of facts added
+        """
+        added: int = 0
+        for topic, memory in topic_memory.items():
+            entries: list[list[str]] = []
+            for line in (memory or "").split("\n"):
+                found = LEGACY_FACT_PATTERN.match(line)
+                if found:
+                    entries.append([found.group(1), found.group(2)])
+                elif entries:
+                    # A fact that itself contained newlines
+                    entries[-1][1] += "\n" + line
+                elif line.strip():
+                    entries.append([None, line])
+            for timestamp, fact in entries:
+                added += self.add_fact(topic, fact, timestamp)
+        return added
+
+    def import_legacy_file(self, json_path: str) -> int:
+        """
+        Import a legacy TopicMemory.json file into an empty store.
+
+        :param json_path: Path to the JSON file
+        :return: Number of facts added
+        """
+        if not os.path.exists(json_path) or not self.is_empty():
+            return 0
+
+        with open(json_path, "r", encoding="utf-8") as file:
+            content: str = file.read()
+        added: int = self.import_topic_memory(json.loads(content) if content else {})
+        logging.info("Imported %d facts from %s into %s", added, json_path, self.path)
+        return added
+
+
+_STORES: dict[str, MemoryStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_memory_store(default_path: str, legacy_json_path: str = None) -> MemoryStore:
+    """
+    :param default_path: Database path to use unless the environment sets one
+    :param legacy_json_path: Optional legacy JSON memory file to import when the store is first created
+    :return: The process-wide memory store for the configured path
+    """
+    path: str = os.path.expanduser(os.getenv(MEMORY_STORE_PATH_ENV) or default_path)
+    with _STORES_LOCK:
+        store: MemoryStore = _STORES.get(path)
+        if store is None:
+            compact_interval: int = int(os.getenv(MEMORY_COMPACT_INTERVAL_ENV, str(DEFAULT_COMPACT_INTERVAL)))
+            store = MemoryStore(path, compact_interval)
+            if legacy_json_path:
+                store.import_legacy_file(legacy_json_path)
+            _STORES[path] = store
+        return store
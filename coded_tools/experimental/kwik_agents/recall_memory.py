@@ -14,13 +14,18 @@
 #
 # END COPYRIGHT
 
+import asyncio
 import logging
 from typing import Any
 from typing import Dict
 
 from neuro_san.interfaces.coded_tool import CodedTool
 
+from coded_tools.experimental.kwik_agents.list_topics import LONG_TERM_MEMORY_FILE
 from coded_tools.experimental.kwik_agents.list_topics import MEMORY_DATA_STRUCTURE
+from coded_tools.experimental.kwik_agents.list_topics import open_memory_store
+from coded_tools.experimental.kwik_agents.memory_store import DEFAULT_SEARCH_LIMIT
+from coded_tools.experimental.kwik_agents.memory_store import MemoryStore
 
 
 class RecallMemory(CodedTool):
@@ -39,6 +44,8 @@ class RecallMemory(CodedTool):
 
                 The argument dictionary expects the following keys:
                     "topic" A topic for which to retrieve relevant facts.
+                    "query" Optional keywords. When given, only the facts matching them are returned,
+                        most relevant first, including matches stored under other topics.
 
         :param sly_data: A dictionary whose keys are defined by the agent hierarchy,
                 but whose values are meant to be kept out of the chat stream.
@@ -52,6 +59,7 @@ class RecallMemory(CodedTool):
 
                 Keys expected for this implementation are:
                     "TopicMemory" a dictionary containing topics as keys and strings of facts as values.
+                    Only used when LONG_TERM_MEMORY_FILE is False; otherwise facts come from the memory store.
 
         :return:
             In case of successful execution:
@@ -60,31 +68,67 @@ class RecallMemory(CodedTool):
                 a text string an error message in the format:
                 "Error: <error message>"
         """
-        self.topic_memory = sly_data.get(MEMORY_DATA_STRUCTURE, None)
-        if not self.topic_memory:
-            return "NO TOPICS YET!"
+        store: MemoryStore = None
+        if LONG_TERM_MEMORY_FILE:
+            store = open_memory_store()
+            if store.is_empty():
+                return "NO TOPICS YET!"
+        else:
+            self.topic_memory = sly_data.get(MEMORY_DATA_STRUCTURE, None)
+            if not self.topic_memory:
+                return "NO TOPICS YET!"
         the_topic: str = args.get("topic", "")
         if the_topic == "":
             return "Error: No topic provided."
+        the_query: str = args.get("query", "")
 
         logger = logging.getLogger(self.__class__.__name__)
         logger.info(">>>>>>>>>>>>>>>>>>>RecallMemory>>>>>>>>>>>>>>>>>>")
         logger.info("Topic: %s", str(the_topic))
-        the_memory_str = self.recall_memory(the_topic)
+        logger.info("Query: %s", str(the_query))
+        if store is not None:
+            the_memory_str = self.recall_from_store(store, the_topic, the_query)
+        else:
+            the_memory_str = self.recall_memory(the_topic)
         logger.info("Memories on this topic: \n %s", str(the_memory_str))
-        sly_data[MEMORY_DATA_STRUCTURE] = self.topic_memory
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
         return the_memory_str
 
     async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> str:
         """
-        Delegates to the synchronous invoke method for now.
+        Runs the synchronous invoke method in a worker thread, so store access does not block the event loop.
         """
-        return self.invoke(args, sly_data)
+        return await asyncio.to_thread(self.invoke, args, sly_data)
+
+    @staticmethod
+    def recall_from_store(store: MemoryStore, topic: str, query: str = None) -> str:
+        """
+        Recall facts from the persistent memory store.
+
+        Parameters:
+        - store (MemoryStore): The store to read.
+        - topic (str): A topic to retrieve memories for.
+        - query (str): Optional keywords to select the most relevant facts instead of the whole topic.
+
+        Returns:
+        - str: The memories, one per line, or "NO RELATED MEMORIES!" if nothing matches.
+        """
+        if not query:
+            return MemoryStore.format_facts(store.facts(topic)) or "NO RELATED MEMORIES!"
+
+        lines: list[str] = [
+            f"[{timestamp}] {fact}" for _, timestamp, fact in store.search(query, topic, DEFAULT_SEARCH_LIMIT)
+        ]
+        if len(lines) < DEFAULT_SEARCH_LIMIT:
+            # Top up with matching facts that were filed under other topics
+            for other_topic, timestamp, fact in store.search(query, None, DEFAULT_SEARCH_LIMIT):
+                if other_topic != topic and len(lines) < DEFAULT_SEARCH_LIMIT:
+                    lines.append(f"[{timestamp}] ({other_topic}) {fact}")
+        return "\n".join(lines) or "NO RELATED MEMORIES!"
 
     def recall_memory(self, topic: str) -> str:
         """
-        Recall all facts related to this topic from memory.
+        Recall all facts related to this topic from the in-memory topic dictionary.
 
         Parameters:
         - topic (str): A topic to retrieve memories for.
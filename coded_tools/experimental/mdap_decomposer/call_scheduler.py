@@ -0,0 +1,167 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextvars import ContextVar
+from typing import Any
+
+from coded_tools.tools.agent_caller import AgentCaller
+
+# Priority of the agent calls made by the node being solved; lower runs first
+CALL_PRIORITY: ContextVar[int] = ContextVar("mdap_call_priority", default=0)
+
+# Timing statistics of the node being solved, filled in by ScheduledAgentCaller
+NODE_STATS: ContextVar[dict[str, Any]] = ContextVar("mdap_node_stats", default=None)
+
+
+def new_node_stats() -> dict[str, Any]:
+    """
+    :return: Empty timing statistics for one trace node
+    """
+    return {"agent_calls": 0, "agent_call_seconds": 0.0, "queued_seconds": 0.0}
+
+
+class CallScheduler:
+    """
+    Bounds the number of agent calls a solver has in flight.
+
+    A decomposition fans out at every level, and every node fans out again into
+    candidate and vote calls, so without a bound a deep problem fires hundreds of
+    simultaneous requests and trips provider rate limits. Calls beyond the budget
+    wait in a priority queue: lower priorities (shallower nodes, whose results the
+    rest of the tree is waiting on) are let through first, in arrival order otherwise.
+    """
+
+    def __init__(self, max_in_flight: int = None):
+        """
+        Constructor.
+
+        :param max_in_flight: Maximum number of agent calls running at once. None for no limit.
+        :raises ValueError: If max_in_flight is below 1, which would make every call wait forever
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1 or None, got: {max_in_flight}")
+
+        self.max_in_flight: int = max_in_flight
+        self.in_flight: int = 0
+        self.peak_in_flight: int = 0
+        self.calls: int = 0
+        self.queued_seconds: float = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+
+    async def acquire(self, priority: int = 0):
+        """
+        Wait for a free slot.
+
+        :param priority: Priority of the call; lower goes first
+        """
+        if self.max_in_flight is None or (self.in_flight < self.max_in_flight and not self._waiters):
+            self._start()
+            return
+
+        waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before the cancellation arrived
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        """
+        Free a slot, handing it to the waiting call with the lowest priority if there is one.
+        """
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                # The slot passes straight on, so the in-flight count stays the same
+                self.calls += 1
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def _start(self):
+        """
+        Take a slot without waiting.
+        """
+        self.in_flight += 1
+        self.calls += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        :return: Dictionary of scheduling statistics for the trace
+        """
+        return {
+            "max_in_flight": self.max_in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "agent_calls": self.calls,
+            "queued_seconds": round(self.queued_seconds, 3),
+        }
+
+
+class ScheduledAgentCaller(AgentCaller):
+    """
+    AgentCaller that runs the calls of another AgentCaller through a CallScheduler
+    and records their timing in the statistics of the node being solved.
+    """
+
+    def __init__(self, caller: AgentCaller, scheduler: CallScheduler):
+        """
+        Constructor.
+
+        :param caller: The AgentCaller that actually calls the agent
+        :param scheduler: The CallScheduler shared by all callers of a solver
+        """
+        self.caller: AgentCaller = caller
+        self.scheduler: CallScheduler = scheduler
+
+    def get_name(self) -> str:
+        """
+        Get the name of the agent
+
+        :return: The name of the agent
+        """
+        return self.caller.get_name()
+
+    async def call_agent(self, tool_args: dict[str, Any], sly_data: dict[str, Any] = None) -> str:
+        """
+        Call an agent with text once the scheduler has a slot for it
+
+        :param tool_args: A dictionary of arguments to pass to the agent
+        :param sly_data: A dictionary of private data to pass to the agent
+        :return: The text of the response
+        """
+        queued: float = time.monotonic()
+        await self.scheduler.acquire(CALL_PRIORITY.get())
+        started: float = time.monotonic()
+        self.scheduler.queued_seconds += started - queued
+
+        try:
+            return await self.caller.call_agent(tool_args, sly_data)
+        finally:
+            self.scheduler.release()
+            stats: dict[str, Any] = NODE_STATS.get()
+            if stats is not None:
+                stats["agent_calls"] += 1
+                stats["agent_call_seconds"] += time.monotonic() - started
+                stats["queued_seconds"] += started - queued
@@ -21,9 +21,14 @@ from neuro_san.interfaces.coded_tool import CodedTool
 from neuro_san.internals.graph.activations.branch_activation import BranchActivation
 
 from coded_tools.experimental.mdap_decomposer.neuro_san_solver import NeuroSanSolver
+from coded_tools.experimental.mdap_decomposer.solution_cache import get_solution_cache
+from coded_tools.experimental.mdap_decomposer.solver_config import SolverConfig
 from coded_tools.experimental.mdap_decomposer.solver_parsing import SolverParsing
 from coded_tools.tools.coded_tool_agent_caller import CodedToolAgentCaller
 
+# Agent calls in flight at once across a whole decomposition
+DEFAULT_MAX_CONCURRENT_CALLS = 16
+
 
 class DecompositionSolver(BranchActivation, CodedTool):
     """
@@ -109,10 +114,14 @@ class DecompositionSolver(BranchActivation, CodedTool):
 
         # Create the solver and use some of the arguments to configure it
         solver = NeuroSanSolver(
-            winning_vote_count=args.get("winning_vote_count", 2),
-            candidate_count=args.get("candidate_count"),
-            number_of_votes=args.get("number_of_votes"),
-            solution_candidate_count=args.get("solution_candidate_count"),
+            SolverConfig(
+                winning_vote_count=args.get("winning_vote_count", 2),
+                candidate_count=args.get("candidate_count"),
+                number_of_votes=args.get("number_of_votes"),
+                solution_candidate_count=args.get("solution_candidate_count"),
+                adaptive_voting=args.get("adaptive_voting", False),
+                max_concurrent_calls=args.get("max_concurrent_calls", DEFAULT_MAX_CONCURRENT_CALLS),
+            )
         )
 
         tools: Dict[str, str] = {}
@@ -133,6 +142,13 @@ class DecompositionSolver(BranchActivation, CodedTool):
             solution_discriminator_caller,
         )
 
+        # Reuse the voted solutions of sub-problems solved before, in this request or earlier ones.
+        # The scope names whatever else the answers depend on, such as the models of the agents.
+        if args.get("use_solution_cache", False):
+            solver.set_solution_cache(
+                get_solution_cache(), cache_scope={"tools": tools, "scope": args.get("solution_cache_scope")}
+            )
+
         problem: str = args.get("problem")
         max_depth: int = args.get("max_depth", 5)
         if max_depth is None:
@@ -140,6 +156,7 @@ class DecompositionSolver(BranchActivation, CodedTool):
 
         # Call the solver to solve the problem by decomposition
         trace_node: dict[str, Any] = await solver.solve(problem, depth=0, max_depth=max_depth)
+        trace_node["scheduling"] = solver.scheduler.stats()
 
         # Publish the trace node to the bulletin board for return.
         # This can be a large dictionary describing the process of decomposition into a solution tree.
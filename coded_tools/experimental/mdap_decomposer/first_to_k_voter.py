@@ -15,8 +15,11 @@
 # END COPYRIGHT
 
 import logging
-from asyncio import Future
+from asyncio import FIRST_COMPLETED
+from asyncio import Task
+from asyncio import ensure_future
 from asyncio import gather
+from asyncio import wait
 from typing import Any
 
 from coded_tools.experimental.mdap_decomposer.voter import Voter
@@ -28,6 +31,14 @@ class FirstToKVoter(Voter):
     """
     Generic Voter implementation that returns the first solution that receives
     a certain number of votes (K).
+
+    Votes are tallied as they arrive. As soon as one candidate has K votes,
+    the discriminator calls that are still outstanding are cancelled, so that
+    neither their latency nor their tokens are paid for.
+
+    In adaptive mode only K votes are requested up front, and more are requested
+    only while no candidate can reach K with the votes already in flight,
+    up to number_of_votes. Unanimous rounds then cost exactly K calls.
     """
 
     # pylint: disable=too-many-arguments, too-many-positional-arguments
@@ -39,6 +50,7 @@ class FirstToKVoter(Voter):
         discriminator_caller: AgentCaller,
         number_of_votes: int = 3,
         winning_vote_count: int = 2,
+        adaptive: bool = False,
     ):
         """
         Constructor.
@@ -50,6 +62,7 @@ class FirstToKVoter(Voter):
         self.discriminator_caller: AgentCaller = discriminator_caller
         self.number_of_votes: int = number_of_votes
         self.winning_vote_count: int = winning_vote_count
+        self.adaptive: bool = adaptive
 
     async def vote(self, problem: str, candidates: list[str]) -> tuple[list[int], int]:
         """
@@ -66,34 +79,37 @@ class FirstToKVoter(Voter):
 
         tool_args: dict[str, Any] = {"problem": problem, self.candidates_key: candidates}
 
-        # Prepare a list of coroutines to parallelize
-        coroutines: list[Future] = []
-        for _ in range(self.number_of_votes):
-            # All entries for parallelization do the same thing.
-            # Note: Perhaps not the most token/cost efficient, but definitely good for time.
-            coroutines.append(self.discriminator_caller.call_agent(tool_args))
-
-        # Call the agents in parallel
-        results: list[str] = await gather(*coroutines)
-
-        # Process the votes
         votes: list[int] = [0] * len(candidates)
         winner_idx: int = None
-        for vote_txt in results:
-            logging.info("%s raw vote: %s", self.source, vote_txt)
-            try:
-                idx: int = int(vote_txt) - 1
-                if idx >= len(candidates):
-                    logging.error("Invalid vote index: %d", idx)
-                if 0 <= idx < len(candidates):
-                    votes[idx] += 1
-                    logging.info("%s tally: %s", self.source, str(votes))
-                    if votes[idx] >= self.winning_vote_count:
-                        winner_idx = idx
-                        logging.info("%s early winner: %d", self.source, winner_idx + 1)
+        pending: set[Task] = set()
+        launched: int = 0
+
+        try:
+            while winner_idx is None:
+                # Keep enough calls in flight for the current leader to reach K, or all of them if not adaptive.
+                # All calls do the same thing; running them in parallel is good for time.
+                wanted: int = self.number_of_votes - launched
+                if self.adaptive:
+                    wanted = min(wanted, self.winning_vote_count - max(votes, default=0) - len(pending))
+                for _ in range(max(0, wanted)):
+                    pending.add(ensure_future(self.discriminator_caller.call_agent(tool_args)))
+                    launched += 1
+
+                if not pending:
+                    break
+
+                done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                for task in done:
+                    winner_idx = self._tally(task.result(), candidates, votes)
+                    if winner_idx is not None:
                         break
-            except ValueError:
-                logging.error("%s malformed vote ignored: %s", self.source, vote_txt)
+        finally:
+            # Stop paying for votes that can no longer change the outcome
+            for task in pending:
+                task.cancel()
+            if pending:
+                logging.info("%s cancelled %d outstanding votes", self.source, len(pending))
+                await gather(*pending, return_exceptions=True)
 
         if winner_idx is None:
             winner_idx = max(range(len(votes)), key=lambda v: votes[v])
@@ -101,3 +117,31 @@ class FirstToKVoter(Voter):
         logging.info("%s final winner: %d -> %s", self.source, winner_idx + 1, candidates[winner_idx])
 
         return votes, winner_idx
+
+    def _tally(self, vote_txt: str, candidates: list[str], votes: list[int]) -> int:
+        """
+        Count a single vote.
+
+        :param vote_txt: Raw response of the discriminator
+        :param candidates: The candidate solutions
+        :param votes: Number of votes per candidate, updated in place
+        :return: The index of the candidate that just reached the winning vote count, or None
+        """
+        logging.info("%s raw vote: %s", self.source, vote_txt)
+        try:
+            idx: int = int(vote_txt) - 1
+        except ValueError:
+            logging.error("%s malformed vote ignored: %s", self.source, vote_txt)
+            return None
+
+        if idx >= len(candidates):
+            logging.error("Invalid vote index: %d", idx)
+        if not 0 <= idx < len(candidates):
+            return None
+
+        votes[idx] += 1
+        logging.info("%s tally: %s", self.source, str(votes))
+        if votes[idx] >= self.winning_vote_count:
+            logging.info("%s early winner: %d", self.source, idx + 1)
+            return idx
+        return None
@@ -15,11 +15,19 @@
 # END COPYRIGHT
 
 import logging
+import time
 from asyncio import Future
 from asyncio import gather
 from typing import Any
 
+from coded_tools.experimental.mdap_decomposer.call_scheduler import CALL_PRIORITY
+from coded_tools.experimental.mdap_decomposer.call_scheduler import NODE_STATS
+from coded_tools.experimental.mdap_decomposer.call_scheduler import CallScheduler
+from coded_tools.experimental.mdap_decomposer.call_scheduler import ScheduledAgentCaller
+from coded_tools.experimental.mdap_decomposer.call_scheduler import new_node_stats
 from coded_tools.experimental.mdap_decomposer.first_to_k_voter import FirstToKVoter
+from coded_tools.experimental.mdap_decomposer.solution_cache import SolutionCache
+from coded_tools.experimental.mdap_decomposer.solver_config import SolverConfig
 from coded_tools.experimental.mdap_decomposer.solver_parsing import SolverParsing
 from coded_tools.experimental.mdap_decomposer.voter import Voter
 from coded_tools.tools.agent_caller import AgentCaller
@@ -31,34 +39,14 @@ class NeuroSanSolver:
     Generic solver implementation that uses Neuro SAN.
     """
 
-    def __init__(
-        self,
-        winning_vote_count: int = 2,
-        candidate_count: int = None,
-        number_of_votes: int = None,
-        solution_candidate_count: int = None,
-    ):
+    def __init__(self, config: SolverConfig = None):
         """
         Constructor.
-        """
-
-        if winning_vote_count is None:
-            winning_vote_count = 2
-        self.winning_vote_count: int = winning_vote_count
-
-        default_count: int = (2 * winning_vote_count) - 1
 
-        self.candidate_count: int = candidate_count
-        if self.candidate_count is None:
-            self.candidate_count = default_count
-
-        self.number_of_votes: int = number_of_votes
-        if self.number_of_votes is None:
-            self.number_of_votes = default_count
-
-        self.solution_candidate_count: int = solution_candidate_count
-        if self.solution_candidate_count is None:
-            self.solution_candidate_count = default_count
+        :param config: Vote counts, adaptive voting and concurrency of the solver. Defaults to SolverConfig().
+        """
+        self.config: SolverConfig = config or SolverConfig()
+        self.scheduler = CallScheduler(self.config.max_concurrent_calls)
 
         self.parsing = SolverParsing()
 
@@ -67,6 +55,9 @@ class NeuroSanSolver:
         self.problem_solver_caller: AgentCaller = None
         self.solution_discriminator_caller: AgentCaller = None
 
+        self.solution_cache: SolutionCache = None
+        self.cache_scope: dict[str, Any] = {}
+
     def set_callers(
         self,
         composition_discriminator_caller: AgentCaller,
@@ -75,20 +66,113 @@ class NeuroSanSolver:
         solution_discriminator_caller: AgentCaller,
     ):
         """
-        Set AgentCallers.
+        Set AgentCallers. All of their calls go through the solver's scheduler.
         """
 
         if composition_discriminator_caller is not None:
-            self.composition_discriminator_caller = composition_discriminator_caller
+            self.composition_discriminator_caller = ScheduledAgentCaller(
+                composition_discriminator_caller, self.scheduler
+            )
         if decomposer_caller is not None:
-            self.decomposer_caller = decomposer_caller
+            self.decomposer_caller = ScheduledAgentCaller(decomposer_caller, self.scheduler)
         if problem_solver_caller is not None:
-            self.problem_solver_caller = problem_solver_caller
+            self.problem_solver_caller = ScheduledAgentCaller(problem_solver_caller, self.scheduler)
         if solution_discriminator_caller is not None:
-            self.solution_discriminator_caller = solution_discriminator_caller
+            self.solution_discriminator_caller = ScheduledAgentCaller(solution_discriminator_caller, self.scheduler)
+
+    def set_solution_cache(self, solution_cache: SolutionCache, cache_scope: dict[str, Any] = None):
+        """
+        Set the cache of solved sub-problems.
+
+        :param solution_cache: The SolutionCache to use, or None to always solve
+        :param cache_scope: Anything besides the solver settings that changes how problems are solved,
+            like the names of the agents called, so that differently configured solvers do not share entries
+        """
+        self.solution_cache = solution_cache
+        self.cache_scope = cache_scope or {}
 
-    # pylint: disable=too-many-locals
     async def solve(self, problem: str, depth: int, max_depth: int, path: str = "0") -> dict[str, Any]:
+        """
+        Recursive solver that builds a complete trace tree of the decomposition process.
+        Every node records the time it took and the agent calls made for it (excluding its children).
+
+        :return: The root trace node of the decomposition process
+        """
+        started: float = time.monotonic()
+        stats: dict[str, Any] = new_node_stats()
+
+        # Agent calls of shallower nodes are scheduled first: the rest of the tree is waiting on them.
+        # Children are solved in their own tasks, which get their own copies of these context variables.
+        priority_token = CALL_PRIORITY.set(depth)
+        stats_token = NODE_STATS.set(stats)
+        try:
+            node: dict[str, Any] = await self._solve_memoized(problem, depth, max_depth, path)
+        finally:
+            NODE_STATS.reset(stats_token)
+            CALL_PRIORITY.reset(priority_token)
+
+        node["timing"] = {
+            "elapsed_seconds": round(time.monotonic() - started, 3),
+            "agent_calls": stats["agent_calls"],
+            "agent_call_seconds": round(stats["agent_call_seconds"], 3),
+            "queued_seconds": round(stats["queued_seconds"], 3),
+        }
+        return node
+
+    async def _solve_memoized(self, problem: str, depth: int, max_depth: int, path: str) -> dict[str, Any]:
+        """
+        Sub-problems that were already solved with the same settings are taken from the
+        solution cache, if one is set, instead of being solved again.
+
+        :return: The trace node of the problem
+        """
+        if self.solution_cache is None:
+            return await self._solve(problem, depth, max_depth, path)
+
+        config: dict[str, Any] = {
+            "winning_vote_count": self.config.winning_vote_count,
+            "candidate_count": self.config.candidate_count,
+            "number_of_votes": self.config.number_of_votes,
+            "solution_candidate_count": self.config.solution_candidate_count,
+            "scope": self.cache_scope,
+        }
+        key: str = SolutionCache.make_key(problem, max_depth - depth, config)
+        node, reused = await self.solution_cache.get_or_solve(
+            key,
+            lambda: self._solve(problem, depth, max_depth, path),
+            lambda solved: solved.get("extracted_final") is not None,
+        )
+        if not reused:
+            return node
+
+        logging.info("[solve] depth=%d path=%s -> reusing cached solution", depth, path)
+        node = self._rebase(node, depth, path)
+        node["cached"] = True
+        return node
+
+    def _rebase(self, node: dict[str, Any], depth: int, path: str) -> dict[str, Any]:
+        """
+        Move a trace subtree that was solved elsewhere in a decomposition to a new position.
+
+        :param node: Root of the trace subtree, modified in place
+        :param depth: Depth of the new position
+        :param path: Path of the new position
+        :return: The node
+        """
+        old_depth: int = node.get("depth", depth)
+        old_path: str = node.get("path", path)
+
+        def move(subtree: dict[str, Any]):
+            subtree["depth"] = depth + subtree.get("depth", old_depth) - old_depth
+            subtree["path"] = path + subtree.get("path", old_path)[len(old_path) :]
+            for child in subtree.get("children") or []:
+                move(child)
+
+        move(node)
+        return node
+
+    # pylint: disable=too-many-locals
+    async def _solve(self, problem: str, depth: int, max_depth: int, path: str) -> dict[str, Any]:
         """
         Internal recursive solver that returns (response, trace_node).
         Builds a complete trace tree of the decomposition process.
@@ -213,7 +297,7 @@ class NeuroSanSolver:
 
         # Parallelize finding different solutions for the problem
         coroutines: list[Future] = []
-        for k in range(self.solution_candidate_count):
+        for k in range(self.config.solution_candidate_count):
             coroutines.append(self.problem_solver_caller.call_agent(tool_args))
         results: list[str] = await gather(*coroutines)
 
@@ -227,8 +311,9 @@ class NeuroSanSolver:
             "composition",
             "solutions",
             self.composition_discriminator_caller,
-            self.number_of_votes,
-            self.winning_vote_count,
+            self.config.number_of_votes,
+            self.config.winning_vote_count,
+            adaptive=self.config.adaptive_voting,
         )
         votes, winner_idx = await voter.vote(problem, finals)
 
@@ -246,7 +331,7 @@ class NeuroSanSolver:
 
         # Parallelize finding different decompositions for the problem
         coroutines: list[Future] = []
-        for _ in range(self.candidate_count):
+        for _ in range(self.config.candidate_count):
             coroutines.append(self.decomposer_caller.call_agent(tool_args))
         results: list[str] = await gather(*coroutines)
 
@@ -266,8 +351,9 @@ class NeuroSanSolver:
             "solution",
             "decompositions",
             self.solution_discriminator_caller,
-            self.number_of_votes,
-            self.winning_vote_count,
+            self.config.number_of_votes,
+            self.config.winning_vote_count,
+            adaptive=self.config.adaptive_voting,
         )
         votes, winner_idx = await voter.vote(problem, candidates)
 
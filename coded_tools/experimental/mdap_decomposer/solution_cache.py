@@ -0,0 +1,271 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+
+# Environment variables that control the process-wide cache
+SOLUTION_CACHE_ENABLED_ENV = "MDAP_SOLUTION_CACHE_ENABLED"
+SOLUTION_CACHE_PATH_ENV = "MDAP_SOLUTION_CACHE_PATH"
+SOLUTION_CACHE_MAX_ENTRIES_ENV = "MDAP_SOLUTION_CACHE_MAX_ENTRIES"
+SOLUTION_CACHE_TTL_ENV = "MDAP_SOLUTION_CACHE_TTL_SECONDS"
+
+DEFAULT_MAX_ENTRIES = 10_000
+# Solutions older than this are solved again, so that changed prompts or models eventually take effect
+DEFAULT_TTL_SECONDS = 24 * 3600.0
+
+
+class SolutionCache:
+    """
+    Memoizes solved sub-problems of the NeuroSanSolver.
+
+    Every node of a decomposition costs dozens of LLM calls for candidates and votes.
+    When the same sub-problem text comes up again, in another branch or in another
+    request, its voted winner and trace subtree are reused instead.
+
+    Entries are kept in memory (least recently used ones are dropped past max_entries)
+    and, if a path is given, in a SQLite database so that they survive restarts.
+    Entries older than ttl_seconds are not reused. Concurrent requests for the same key share a single solve.
+    """
+
+    def __init__(
+        self, path: str = None, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS
+    ):
+        """
+        Constructor.
+
+        :param path: Optional path to a SQLite database file for persisting solutions across processes
+        :param max_entries: Maximum number of solutions kept in memory and on disk
+        :param ttl_seconds: Age after which a solution is solved again
+        """
+        self.max_entries: int = max_entries
+        self.ttl_seconds: float = ttl_seconds
+        self._counts: Counter = Counter()
+        # key -> (trace node, time it was solved)
+        self._memory: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+        self._connection: sqlite3.Connection = None
+        if path:
+            directory: str = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS solutions ("
+                " key TEXT PRIMARY KEY,"
+                " node TEXT NOT NULL,"
+                " solved_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON solutions(last_access)")
+            self._connection.commit()
+
+    @staticmethod
+    def normalize(problem: str) -> str:
+        """
+        :param problem: Problem text
+        :return: The text with runs of whitespace collapsed, so that formatting differences still hit
+        """
+        return " ".join(problem.split())
+
+    @staticmethod
+    def make_key(problem: str, remaining_depth: int, config: dict[str, Any]) -> str:
+        """
+        :param problem: Problem text
+        :param remaining_depth: How many more levels of decomposition are allowed below this problem
+        :param config: Solver settings that change how a problem is solved, such as vote counts and agent names
+        :return: Hex digest identifying the solution of the problem under that configuration
+        """
+        content: dict[str, Any] = {
+            "problem": SolutionCache.normalize(problem),
+            "remaining_depth": remaining_depth,
+            "config": config,
+        }
+        return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any]:
+        """
+        :param key: Key from make_key()
+        :return: A copy of the cached trace node, or None if there is none
+        """
+        with self._lock:
+            node: dict[str, Any] = self._get_fresh(key)
+            if node is None:
+                self._counts["misses"] += 1
+                return None
+
+            self._counts["hits"] += 1
+            return copy.deepcopy(node)
+
+    def _get_fresh(self, key: str) -> dict[str, Any]:
+        """
+        Look a key up in memory, then on disk. Assumes the lock is held.
+
+        :param key: Key from make_key()
+        :return: The cached trace node, or None if there is none younger than the TTL
+        """
+        now: float = time.time()
+        entry: tuple[dict[str, Any], float] = self._memory.get(key)
+        if entry is None and self._connection is not None:
+            row = self._connection.execute("SELECT node, solved_at FROM solutions WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                entry = (json.loads(row[0]), row[1])
+                self._connection.execute("UPDATE solutions SET last_access = ? WHERE key = ?", (now, key))
+                self._connection.commit()
+
+        if entry is None:
+            return None
+
+        node, solved_at = entry
+        if now - solved_at > self.ttl_seconds:
+            self._memory.pop(key, None)
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM solutions WHERE key = ?", (key,))
+                self._connection.commit()
+            return None
+
+        self._remember(key, node, solved_at)
+        return node
+
+    def put(self, key: str, node: dict[str, Any]):
+        """
+        :param key: Key from make_key()
+        :param node: Trace node of the solved problem. It is copied, so the caller may keep modifying it.
+        """
+        node = copy.deepcopy(node)
+        now: float = time.time()
+        with self._lock:
+            self._remember(key, node, now)
+            if self._connection is None:
+                return
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO solutions (key, node, solved_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(node, default=str), now, now),
+            )
+            self._connection.execute(
+                "DELETE FROM solutions WHERE key NOT IN"
+                " (SELECT key FROM solutions ORDER BY last_access DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            self._connection.commit()
+
+    def _remember(self, key: str, node: dict[str, Any], solved_at: float):
+        """
+        Keep a node in memory, dropping the least recently used ones past max_entries.
+        Assumes the lock is held.
+        """
+        self._memory[key] = (node, solved_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def get_or_solve(
+        self, key: str, solve: Callable[[], Awaitable[dict[str, Any]]], cacheable: Callable[[dict[str, Any]], bool]
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        :param key: Key from make_key()
+        :param solve: Coroutine function that solves the problem if it is not cached
+        :param cacheable: Whether a solved node is good enough to be reused
+        :return: A tuple of (trace node, True if the node came from the cache or from a concurrent solve)
+        """
+        node: dict[str, Any] = await asyncio.to_thread(self.get, key)
+        if node is not None:
+            return node, True
+
+        with self._lock:
+            # Another solve may have finished since the lookup above
+            node = self._get_fresh(key)
+            if node is not None:
+                return copy.deepcopy(node), True
+
+            pending: Future = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = Future()
+
+        if pending is not None:
+            node = await asyncio.wrap_future(pending)
+            if node is not None:
+                return copy.deepcopy(node), True
+            # The concurrent solve failed or was not cacheable, so solve independently
+            return await solve(), False
+
+        future: Future = self._pending[key]
+        try:
+            node = await solve()
+        except BaseException:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_result(None)
+            raise
+
+        good: bool = cacheable(node)
+        if good:
+            await asyncio.to_thread(self.put, key, node)
+        with self._lock:
+            self._pending.pop(key, None)
+        future.set_result(copy.deepcopy(node) if good else None)
+        return node, False
+
+    def stats(self) -> dict[str, float]:
+        """
+        :return: Dictionary with hit and miss counts and the hit rate
+        """
+        hits: int = self._counts["hits"]
+        total: int = hits + self._counts["misses"]
+        return {"hits": hits, "misses": self._counts["misses"], "hit_rate": (hits / total) if total else 0.0}
+
+
+_CACHE: SolutionCache = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_solution_cache() -> SolutionCache:
+    """
+    :return: The process-wide solution cache configured by the environment, or None if disabled
+    """
+    global _CACHE  # pylint: disable=global-statement
+
+    if os.getenv(SOLUTION_CACHE_ENABLED_ENV, "true").lower() in ("false", "0", "no"):
+        return None
+
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            path: str = os.getenv(SOLUTION_CACHE_PATH_ENV)
+            max_entries: int = int(os.getenv(SOLUTION_CACHE_MAX_ENTRIES_ENV, str(DEFAULT_MAX_ENTRIES)))
+            ttl_seconds: float = float(os.getenv(SOLUTION_CACHE_TTL_ENV, str(DEFAULT_TTL_SECONDS)))
+            try:
+                _CACHE = SolutionCache(os.path.expanduser(path) if path else None, max_entries, ttl_seconds)
+            except (OSError, sqlite3.Error) as error:
+                logging.warning("Could not open solution cache at %s, keeping it in memory only: %s", path, error)
+                _CACHE = SolutionCache(None, max_entries, ttl_seconds)
+        return _CACHE
@@ -0,0 +1,48 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from dataclasses import dataclass
+
+
+@dataclass
+class SolverConfig:
+    """
+    Settings of a NeuroSanSolver.
+
+    Counts left as None default to 2 * winning_vote_count - 1.
+    """
+
+    winning_vote_count: int = 2
+    candidate_count: int = None
+    number_of_votes: int = None
+    solution_candidate_count: int = None
+    # If True, request only as many votes as are needed to reach winning_vote_count,
+    # and more only when votes split. Otherwise request number_of_votes up front.
+    adaptive_voting: bool = False
+    # Maximum number of agent calls in flight across the whole decomposition. None for no limit.
+    max_concurrent_calls: int = None
+
+    def __post_init__(self):
+        if self.winning_vote_count is None:
+            self.winning_vote_count = 2
+
+        default_count: int = (2 * self.winning_vote_count) - 1
+        if self.candidate_count is None:
+            self.candidate_count = default_count
+        if self.number_of_votes is None:
+            self.number_of_votes = default_count
+        if self.solution_candidate_count is None:
+            self.solution_candidate_count = default_count
@@ -28,6 +28,9 @@ from langchain_openai import OpenAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from neuro_san.interfaces.coded_tool import CodedTool
 
+from coded_tools.tools.vector_store_registry import get_vector_store_registry
+from coded_tools.tools.vector_store_registry import make_registry_key
+
 PDF_FILE_URL = "https://www.replicon.com/wp-content/uploads/2016/06/RFP-Template_Replicon.pdf"
 
 
@@ -93,10 +96,20 @@ class Rag(CodedTool):
         Asynchronously loads web documents from given URLs, split them into
         chunks, and build an in-memory vector store using OpenAI embeddings.
 
-        :param urls: List of URLs to fetch and embed
+        The vector store is shared with other invocations and sessions,
+        so the PDF is only downloaded and embedded once per process.
+
+        :param url: URL of the PDF to fetch and embed
         :return: In-memory vector store containing the embedded document chunks
         """
+        key: str = make_registry_key(tool=type(self).__name__, url=url)
+        return await get_vector_store_registry().get_or_build(key, lambda: self._build_vector_store(url))
 
+    async def _build_vector_store(self, url: str) -> InMemoryVectorStore:
+        """
+        :param url: URL of the PDF to fetch and embed
+        :return: In-memory vector store containing the embedded document chunks
+        """
         loader = PyPDFLoader(file_path=url)
         docs: List[Document] = await loader.aload()
 
@@ -22,6 +22,7 @@ from abc import ABC
 from abc import abstractmethod
 from dataclasses import dataclass
 from typing import Any
+from typing import AsyncIterator
 from typing import Literal
 from typing import Optional
 
@@ -31,15 +32,38 @@ from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
 from langchain_core.vectorstores.base import VectorStoreRetriever
 from langchain_openai import OpenAIEmbeddings
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 from sqlalchemy.exc import ProgrammingError
 
+from coded_tools.tools.embedding_cache import CachedEmbeddings
+from coded_tools.tools.embedding_cache import get_embedding_cache
+from coded_tools.tools.hybrid_retriever import HybridRetriever
+from coded_tools.tools.hybrid_retriever import RetrievalIndexes
+from coded_tools.tools.hybrid_retriever import RetrievalSettings
+from coded_tools.tools.hybrid_retriever import get_retrieval_indexes
+from coded_tools.tools.hybrid_retriever import refresh_retrieval_indexes
+from coded_tools.tools.ingestion_pipeline import IngestionPipeline
+from coded_tools.tools.ingestion_pipeline import IngestionSettings
+from coded_tools.tools.mmap_vector_store import DEFAULT_DTYPE
+from coded_tools.tools.mmap_vector_store import SUPPORTED_DTYPES
+from coded_tools.tools.mmap_vector_store import MmapVectorStore
+from coded_tools.tools.source_manifest import SourceManifest
+from coded_tools.tools.vector_store_registry import get_vector_store_registry
+from coded_tools.tools.vector_store_registry import make_registry_key
+
 # Invalid file path character pattern
 INVALID_PATH_PATTERN = r"[<>:\"|?*\x00-\x1F]"
 DEFAULT_TABLE_NAME = "vectorstore"
 EMBEDDINGS_MODEL = "text-embedding-3-small"
 VECTOR_SIZE = 1536
 
+# Vector store file formats: JSON dump of an InMemoryVectorStore, or memory-mapped binary matrix
+JSON_VECTOR_STORE_EXTENSION = ".json"
+BINARY_VECTOR_STORE_EXTENSION = ".npy"
+
+# Directory for the source manifests of postgres vector stores
+SOURCE_MANIFEST_DIR_ENV = "RAG_SOURCE_MANIFEST_DIR"
+DEFAULT_SOURCE_MANIFEST_DIR = os.path.join(os.path.expanduser("~"), ".cache", "neuro-san-studio", "rag_sources")
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,6 +85,18 @@ class PostgresConfig:
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
 
+@dataclass
+class VectorStoreOptions:
+    """How a RAG tool reuses and stores its vector store."""
+
+    # Refresh an existing vector store with changed sources instead of using it as-is if True
+    incremental_update: bool = False
+    # Share the built in-memory vector store with other invocations in this process if True
+    share_vector_store: bool = True
+    # Storage type of the vectors in the binary vector store format
+    vector_store_dtype: str = DEFAULT_DTYPE
+
+
 class BaseRag(ABC):
     """
     Abstract Base Class for different types of RAG implementations.
@@ -70,8 +106,24 @@ class BaseRag(ABC):
         # Save the generated vector store as a JSON file if True
         self.save_vector_store: bool = False
         self.abs_vector_store_path: Optional[str] = None
+        # Incremental updates, sharing and storage type, see configure_vector_store()
+        self.vector_store_options: VectorStoreOptions = VectorStoreOptions()
+        # Chunking and embedding settings, see configure_ingestion()
+        self.ingestion: IngestionSettings = IngestionSettings()
+        # Sources that failed to load in the current run. Their chunks are kept rather than treated as removed.
+        self.unavailable_sources: set[str] = set()
+        # Retrieval settings, see configure_retrieval()
+        self.retrieval: RetrievalSettings = RetrievalSettings()
         self.embeddings: Embeddings = OpenAIEmbeddings(model=EMBEDDINGS_MODEL, dimensions=VECTOR_SIZE)
 
+        # Serve unchanged chunks from the on-disk embedding cache instead of re-embedding them.
+        # Both the in-memory and postgres paths embed through self.embeddings.
+        embedding_cache = get_embedding_cache()
+        if embedding_cache is not None:
+            self.embeddings = CachedEmbeddings(
+                self.embeddings, model=EMBEDDINGS_MODEL, dimensions=VECTOR_SIZE, cache=embedding_cache
+            )
+
     @abstractmethod
     async def load_documents(self, loader_args: Any) -> list[Document]:
         """
@@ -83,7 +135,10 @@ class BaseRag(ABC):
         """
         Validate the vector store file path and set it as an absolute path.
 
-        :param vector_store_path: Relative or absolute path to the vector store JSON file.
+        :param vector_store_path: Relative or absolute path to the vector store file.
+            A ".json" path stores a JSON dump of an InMemoryVectorStore at that path. A "<name>.npy"
+            path is never written itself: it stores a memory-mapped "<name>.<generation>.npy" matrix
+            and a "<name>.meta.jsonl" sidecar that names the current generation.
         :raises ValueError: If the path contains invalid characters or has an incorrect file extension.
         """
         if not vector_store_path:
@@ -95,9 +150,9 @@ class BaseRag(ABC):
             raise ValueError(f"Invalid vector_store_path: '{vector_store_path}'")
 
         # Check file extension
-        if not vector_store_path.endswith(".json"):
-            logger.error("vector_store_path must be a .json file, got: '%s'\n", vector_store_path)
-            raise ValueError(f"vector_store_path must be a .json file, got: '{vector_store_path}'")
+        if not vector_store_path.endswith((JSON_VECTOR_STORE_EXTENSION, BINARY_VECTOR_STORE_EXTENSION)):
+            logger.error("vector_store_path must be a .json or .npy file, got: '%s'\n", vector_store_path)
+            raise ValueError(f"vector_store_path must be a .json or .npy file, got: '{vector_store_path}'")
 
         if os.path.isabs(vector_store_path):
             # It's already an absolute path — use it directly
@@ -135,20 +190,190 @@ class BaseRag(ABC):
         if vector_store_type == "postgres" and postgres_config is None:
             raise ValueError("postgres_config is required when vector_store_type is 'postgres'\n")
 
+        # Reuse an in-memory vector store already built by another invocation or session.
+        # Incremental updates always go back to the sources, so they bypass the registry.
+        options: VectorStoreOptions = self.vector_store_options
+        if vector_store_type == "in_memory" and options.share_vector_store and not options.incremental_update:
+            key: str = make_registry_key(
+                tool=type(self).__name__,
+                loader_args=loader_args,
+                embeddings_model=EMBEDDINGS_MODEL,
+                vector_size=VECTOR_SIZE,
+                chunk_size=self.ingestion.chunk_size,
+                chunk_overlap=self.ingestion.chunk_overlap,
+                vector_store_path=self.abs_vector_store_path,
+                save_vector_store=self.save_vector_store,
+                vector_store_dtype=options.vector_store_dtype,
+            )
+            return await get_vector_store_registry().get_or_build(
+                key, lambda: self._generate_vector_store(loader_args, postgres_config, vector_store_type)
+            )
+
+        return await self._generate_vector_store(loader_args, postgres_config, vector_store_type)
+
+    async def _generate_vector_store(
+        self,
+        loader_args: Any,
+        postgres_config: Optional[PostgresConfig],
+        vector_store_type: Literal["in_memory", "postgres"],
+    ) -> Optional[VectorStore]:
+        """
+        Load an existing vector store, or build a new one from the sources.
+
+        :param loader_args: Arguments specific to the document loader
+        :param postgres_config: PostgreSQL configuration (required for postgres vector store)
+        :param vector_store_type: Type of vector store to create
+        :return: Vector store containing the embedded document chunks
+        """
+        manifest_path: Optional[str] = self._get_source_manifest_path(postgres_config, vector_store_type)
+
         # Try to load existing vector store for in-memory vector store
         if vector_store_type == "in_memory":
             existing_store = await self._load_existing_vector_store()
             if existing_store:
-                return existing_store
+                if not self.vector_store_options.incremental_update:
+                    await self._prepare_retrieval_indexes(existing_store)
+                    return existing_store
+
+                manifest: Optional[SourceManifest] = SourceManifest.load(manifest_path) if manifest_path else None
+                if manifest is not None:
+                    if await self._update_vector_store(existing_store, loader_args, manifest):
+                        await self._save_vector_store(existing_store, vector_store_type, manifest, manifest_path)
+                    await self._prepare_retrieval_indexes(existing_store)
+                    return existing_store
+
+                logger.info("No source manifest found for %s. Rebuilding.\n", self.abs_vector_store_path)
 
         # Load and process documents
-        vectorstore = await self._create_new_vector_store(loader_args, postgres_config, vector_store_type)
+        manifest = SourceManifest()
+        vectorstore = await self._create_new_vector_store(loader_args, postgres_config, vector_store_type, manifest)
 
         # Save vector store if configured
-        await self._save_vector_store(vectorstore, vector_store_type)
+        await self._save_vector_store(vectorstore, vector_store_type, manifest, manifest_path)
+        await self._prepare_retrieval_indexes(vectorstore)
 
         return vectorstore
 
+    def _get_source_manifest_path(
+        self, postgres_config: Optional[PostgresConfig], vector_store_type: Literal["in_memory", "postgres"]
+    ) -> Optional[str]:
+        """
+        :return: Path of the source manifest that tracks what is indexed in the vector store,
+                 or None if the vector store is not persisted
+        """
+        if vector_store_type == "postgres":
+            manifest_dir: str = os.getenv(SOURCE_MANIFEST_DIR_ENV) or DEFAULT_SOURCE_MANIFEST_DIR
+            table_name: str = postgres_config.table_name or DEFAULT_TABLE_NAME
+            file_name: str = f"{postgres_config.host}_{postgres_config.port}_{postgres_config.database}_{table_name}"
+            return os.path.join(manifest_dir, re.sub(INVALID_PATH_PATTERN, "_", file_name) + ".sources.json")
+
+        if not self.abs_vector_store_path:
+            return None
+
+        return os.path.splitext(self.abs_vector_store_path)[0] + ".sources.json"
+
+    def _get_bm25_index_path(self) -> Optional[str]:
+        """
+        :return: Path of the persisted BM25 index of an in-memory vector store, or None if it is not persisted
+        """
+        if not self.abs_vector_store_path:
+            return None
+
+        return os.path.splitext(self.abs_vector_store_path)[0] + ".bm25.json"
+
+    async def _prepare_retrieval_indexes(self, vectorstore: Optional[VectorStore]):
+        """
+        Build or load the keyword index of an in-process vector store and bring it up to date,
+        so that the first query does not pay for it. The index is saved next to the vector store.
+        """
+        if vectorstore is None or not self.retrieval.hybrid_search:
+            return
+
+        bm25_path: Optional[str] = self._get_bm25_index_path()
+        changed: bool = await asyncio.to_thread(refresh_retrieval_indexes, vectorstore, bm25_path)
+        if not (changed and self.save_vector_store and bm25_path):
+            return
+
+        indexes: Optional[RetrievalIndexes] = get_retrieval_indexes(vectorstore)
+        try:
+            await asyncio.to_thread(indexes.bm25.save, bm25_path)
+            logger.info("BM25 index saved to: %s\n", bm25_path)
+        except OSError as os_error:
+            logger.error("Failed to save BM25 index to %s: %s\n", bm25_path, os_error)
+
+    def configure_retrieval(self, args: dict[str, Any]):
+        """
+        Read the optional retrieval settings from the tool arguments.
+
+        :param args: Tool arguments, optionally containing "top_k", "score_threshold",
+            "keyword_score_threshold", "hybrid_search" and "ann_index"
+        """
+        self.retrieval = RetrievalSettings.from_args(args)
+
+    def configure_ingestion(self, args: dict[str, Any]):
+        """
+        Read the optional chunking and embedding settings from the tool arguments.
+
+        :param args: Tool arguments, optionally containing "chunk_size", "chunk_overlap",
+            "embedding_batch_size" and "embedding_concurrency"
+        """
+        self.ingestion = IngestionSettings.from_args(args)
+
+    def configure_vector_store(self, args: dict[str, Any]):
+        """
+        Read the optional vector store reuse and storage settings from the tool arguments.
+
+        :param args: Tool arguments, optionally containing "incremental_update", "share_vector_store"
+            and "vector_store_dtype"
+        """
+        self.vector_store_options = VectorStoreOptions(
+            incremental_update=bool(args.get("incremental_update", False)),
+            share_vector_store=bool(args.get("share_vector_store", True)),
+            vector_store_dtype=args.get("vector_store_dtype", DEFAULT_DTYPE),
+        )
+
+    async def alazy_load_documents(self, loader_args: Any) -> AsyncIterator[list[Document]]:
+        """
+        Load documents one source at a time, so that splitting and embedding can start
+        before everything is loaded. Subclasses whose loaders can stream should override this.
+
+        Each source (URL or file path) must be yielded exactly once, with all of its documents.
+        Sources that fail to load should be added to self.unavailable_sources so that an
+        incremental update does not delete their existing chunks.
+
+        :param loader_args: Arguments specific to the document loader
+        :return: Async iterator over the documents of each source
+        """
+        docs: list[Document] = await self.load_documents(loader_args)
+        for source_docs in SourceManifest.group_by_source(docs).values():
+            yield source_docs
+
+    async def _update_vector_store(self, vectorstore: VectorStore, loader_args: Any, manifest: SourceManifest) -> bool:
+        """
+        Bring a vector store up to date with its sources.
+        Only sources whose content changed are split and embedded,
+        and chunks of sources that changed or disappeared are deleted.
+
+        :param vectorstore: The vector store to update in place
+        :param loader_args: Arguments specific to the document loader
+        :param manifest: Source manifest of the vector store, updated in place
+        :return: True if the vector store was modified
+        """
+        pipeline = IngestionPipeline(
+            chunk_size=self.ingestion.chunk_size,
+            chunk_overlap=self.ingestion.chunk_overlap,
+            embedding_batch_size=self.ingestion.embedding_batch_size,
+            embedding_concurrency=self.ingestion.embedding_concurrency,
+        )
+        self.unavailable_sources = set()
+        return await pipeline.run(
+            vectorstore, self.alazy_load_documents(loader_args), manifest, keep_sources=self.unavailable_sources
+        )
+
+    def _use_binary_format(self) -> bool:
+        """Check whether the vector store is persisted in the memory-mapped binary format."""
+        return bool(self.abs_vector_store_path) and self.abs_vector_store_path.endswith(BINARY_VECTOR_STORE_EXTENSION)
+
     async def _load_existing_vector_store(self) -> Optional[VectorStore]:
         """Try to load existing vector store from file."""
 
@@ -156,52 +381,60 @@ class BaseRag(ABC):
             return None
 
         try:
-            vector_store: VectorStore = InMemoryVectorStore.load(
-                path=self.abs_vector_store_path, embedding=self.embeddings
-            )
+            vector_store: VectorStore
+            if self._use_binary_format():
+                vector_store = MmapVectorStore.load(path=self.abs_vector_store_path, embedding=self.embeddings)
+            else:
+                vector_store = InMemoryVectorStore.load(path=self.abs_vector_store_path, embedding=self.embeddings)
             logger.info("Loaded vector store from: %s\n", self.abs_vector_store_path)
             return vector_store
         except FileNotFoundError:
             logger.info("Vector store not found at: %s. Creating from source.\n", self.abs_vector_store_path)
             return None
+        except ValueError as value_error:
+            logger.warning(
+                "Vector store at %s is invalid. Creating from source. %s\n", self.abs_vector_store_path, value_error
+            )
+            return None
 
     async def _create_new_vector_store(
         self,
         loader_args: Any,
         postgres_config: Optional[PostgresConfig],
         vector_store_type: Literal["in_memory", "postgres"],
+        manifest: SourceManifest,
     ) -> Optional[VectorStore]:
         """Create a new vector store."""
 
         if vector_store_type == "in_memory":
-            return await self._create_in_memory_vector_store(loader_args)
+            return await self._create_in_memory_vector_store(loader_args, manifest)
 
-        return await self._create_postgres_vector_store(loader_args, postgres_config)
-
-    async def _process_documents(self, loader_args: Any) -> list[Document]:
-        """Load and split documents"""
-        # Load documents and build the vector store
-        docs: list[Document] = await self.load_documents(loader_args)
+        return await self._create_postgres_vector_store(loader_args, postgres_config, manifest)
 
-        # Split documents into smaller chunks for better embedding and retrieval
-        text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(chunk_size=100, chunk_overlap=50)
-
-        doc_chunks: list[Document] = text_splitter.split_documents(docs)
-        logger.info("Processed %d document chunks\n", len(doc_chunks))
-
-        return doc_chunks
-
-    async def _create_in_memory_vector_store(self, loader_args) -> VectorStore:
+    async def _create_in_memory_vector_store(self, loader_args: Any, manifest: SourceManifest) -> VectorStore:
         """Create an in-memory vector store."""
-        doc_chunks: list[Document] = await self._process_documents(loader_args)
-        logger.info("Creating in-memory vector store.")
-        return await InMemoryVectorStore.afrom_documents(
-            documents=doc_chunks,
-            embedding=self.embeddings,
-        )
+        vectorstore: VectorStore
+        if self._use_binary_format():
+            options: VectorStoreOptions = self.vector_store_options
+            if options.vector_store_dtype not in SUPPORTED_DTYPES:
+                logger.warning(
+                    "Received %s as 'vector_store_dtype'. Available types are %s\n",
+                    options.vector_store_dtype,
+                    SUPPORTED_DTYPES,
+                )
+                options.vector_store_dtype = DEFAULT_DTYPE
+
+            logger.info("Creating binary vector store.")
+            vectorstore = MmapVectorStore(embedding=self.embeddings, dtype=options.vector_store_dtype)
+        else:
+            logger.info("Creating in-memory vector store.")
+            vectorstore = InMemoryVectorStore(embedding=self.embeddings)
+
+        await self._update_vector_store(vectorstore, loader_args, manifest)
+        return vectorstore
 
     async def _create_postgres_vector_store(
-        self, loader_args: Any, postgres_config: PostgresConfig
+        self, loader_args: Any, postgres_config: PostgresConfig, manifest: SourceManifest
     ) -> Optional[VectorStore]:
         """Create a PostgreSQL vector store."""
 
@@ -236,27 +469,31 @@ class BaseRag(ABC):
                 vector_size=VECTOR_SIZE,
             )
 
-            doc_chunks: list[Document] = await self._process_documents(loader_args)
-
             logger.info("Creating postgres vector store from documents.")
             # Create vector store and load documents
-            return await PGVectorStore.afrom_documents(
-                documents=doc_chunks,
-                embedding=self.embeddings,
+            vectorstore = await PGVectorStore.create(
                 engine=pg_engine,
                 table_name=table_name,
+                embedding_service=self.embeddings,
             )
+            await self._update_vector_store(vectorstore, loader_args, manifest)
+            return vectorstore
 
         except ProgrammingError:
             # Table already exists. Create vector store from it.
             logger.info("Table %s already exists.\n", table_name)
             logger.info("Creating postgres vector store from existing table.\n")
-            return await PGVectorStore.create(
+            vectorstore = await PGVectorStore.create(
                 engine=pg_engine,
                 table_name=table_name,
                 embedding_service=self.embeddings,
             )
 
+            if self.vector_store_options.incremental_update:
+                await self._update_postgres_vector_store(vectorstore, loader_args, postgres_config)
+
+            return vectorstore
+
         except OSError as os_error:
             # Fail to create vector store due to connection error
             logger.error("Fail to create vector store due to connection error. %s\n", os_error)
@@ -274,9 +511,40 @@ class BaseRag(ABC):
             logger.error("Fail to create vector store due to invalid DB name. %s\n", invalid_catalog_error)
             return None
 
-    async def _save_vector_store(self, vectorstore: VectorStore, vector_store_type: Literal["in_memory", "postgres"]):
-        """Save vector store to file if configured."""
-        should_save: bool = self.save_vector_store and self.abs_vector_store_path and vector_store_type == "in_memory"
+    async def _update_postgres_vector_store(
+        self, vectorstore: VectorStore, loader_args: Any, postgres_config: PostgresConfig
+    ):
+        """
+        Bring an existing postgres table up to date with its sources, as recorded in its source manifest.
+        """
+        manifest_path: str = self._get_source_manifest_path(postgres_config, "postgres")
+        manifest: Optional[SourceManifest] = SourceManifest.load(manifest_path)
+        if manifest is None:
+            # Without a manifest there is no way to tell which rows belong to which source.
+            logger.warning(
+                "No source manifest found for table %s. Drop the table once to enable incremental updates.\n",
+                postgres_config.table_name or DEFAULT_TABLE_NAME,
+            )
+        elif await self._update_vector_store(vectorstore, loader_args, manifest):
+            manifest.save(manifest_path)
+
+    async def _save_vector_store(
+        self,
+        vectorstore: Optional[VectorStore],
+        vector_store_type: Literal["in_memory", "postgres"],
+        manifest: Optional[SourceManifest] = None,
+        manifest_path: Optional[str] = None,
+    ):
+        """Save vector store to file if configured, along with the manifest of its sources."""
+        if vectorstore is None:
+            return None
+
+        # Postgres persists the vectors itself, so only the manifest needs to be written
+        if vector_store_type == "postgres":
+            self._save_source_manifest(manifest, manifest_path)
+            return None
+
+        should_save: bool = self.save_vector_store and self.abs_vector_store_path
 
         if not should_save:
             return None
@@ -287,6 +555,21 @@ class BaseRag(ABC):
             logger.info("Vector store saved to: %s\n", self.abs_vector_store_path)
         except OSError as os_error:
             logger.error("Failed to save vector store to %s: %s\n", self.abs_vector_store_path, os_error)
+            return None
+
+        self._save_source_manifest(manifest, manifest_path)
+        return None
+
+    @staticmethod
+    def _save_source_manifest(manifest: Optional[SourceManifest], manifest_path: Optional[str]):
+        """Save the source manifest if there is anything to record."""
+        if manifest is None or not manifest.sources or not manifest_path:
+            return
+
+        try:
+            manifest.save(manifest_path)
+        except OSError as os_error:
+            logger.error("Failed to save source manifest to %s: %s\n", manifest_path, os_error)
 
     async def query_vectorstore(self, vectorstore: VectorStore, query: str) -> str:
         """
@@ -298,14 +581,42 @@ class BaseRag(ABC):
         :return: Concatenated text content of the retrieved documents
         """
         try:
-            # Create a retriever interface from the vector store
-            retriever: VectorStoreRetriever = vectorstore.as_retriever()
-
-            return await self.query_retriever(retriever, query)
+            return await self.query_retriever(self.get_retriever(vectorstore), query)
 
         except AttributeError:
             return "Failed to create vector store. Please check the log for more information.\n"
 
+    def get_retriever(self, vectorstore: VectorStore) -> Any:
+        """
+        :param vectorstore: The vector store to query
+        :return: A hybrid keyword and vector retriever for vector stores held in this process,
+            or the vector store's own retriever otherwise
+        """
+        indexes: Optional[RetrievalIndexes] = None
+        if self.retrieval.hybrid_search or self.retrieval.ann_index:
+            indexes = get_retrieval_indexes(vectorstore, self._get_bm25_index_path())
+
+        if indexes is not None:
+            return HybridRetriever(
+                vectorstore=vectorstore,
+                indexes=indexes,
+                k=self.retrieval.top_k,
+                score_threshold=self.retrieval.score_threshold,
+                keyword_score_threshold=self.retrieval.keyword_score_threshold,
+                keyword_search=self.retrieval.hybrid_search,
+                use_ann=self.retrieval.ann_index,
+            )
+
+        # Create a retriever interface from the vector store
+        search_kwargs: dict[str, Any] = {"k": self.retrieval.top_k}
+        if self.retrieval.score_threshold is not None:
+            search_kwargs["score_threshold"] = self.retrieval.score_threshold
+        retriever: VectorStoreRetriever = vectorstore.as_retriever(
+            search_type="similarity_score_threshold" if self.retrieval.score_threshold is not None else "similarity",
+            search_kwargs=search_kwargs,
+        )
+        return retriever
+
     @staticmethod
     async def query_retriever(retriever: Any, query: str) -> str:
         """
@@ -0,0 +1,210 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Persistent BM25 inverted index over the chunks of a RAG vector store"""
+
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import tempfile
+from collections import Counter
+from typing import Any
+from typing import Optional
+
+BM25_INDEX_VERSION = 1
+
+# Standard BM25 parameters: term frequency saturation and document length normalization
+DEFAULT_K1 = 1.5
+DEFAULT_B = 0.75
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+logger = logging.getLogger(__name__)
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    :param text: Text to tokenize
+    :return: Lower-cased word tokens
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class Bm25Index:
+    """
+    Inverted index that scores chunks with Okapi BM25.
+
+    A query only visits the postings of its own terms, so keyword search cost
+    depends on how many chunks contain those terms rather than on the size of
+    the whole store. Chunks are keyed by the same ids as in the vector store.
+    """
+
+    def __init__(self, k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        """
+        :param k1: Term frequency saturation
+        :param b: Strength of the document length normalization, between 0 and 1
+        """
+        self.k1: float = k1
+        self.b: float = b
+        # term -> {chunk id -> term frequency}
+        self.postings: dict[str, dict[str, int]] = {}
+        # chunk id -> number of tokens
+        self.lengths: dict[str, int] = {}
+        self._total_length: int = 0
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def add(self, texts: dict[str, str]):
+        """
+        Index chunks. Chunks that are already indexed are replaced.
+
+        :param texts: Dictionary of chunk id -> chunk text
+        """
+        self.remove([doc_id for doc_id in texts if doc_id in self.lengths])
+        for doc_id, text in texts.items():
+            tokens: list[str] = tokenize(text)
+            self.lengths[doc_id] = len(tokens)
+            self._total_length += len(tokens)
+            for term, count in Counter(tokens).items():
+                self.postings.setdefault(term, {})[doc_id] = count
+
+    def remove(self, ids: list[str]):
+        """
+        Drop chunks from the index.
+
+        :param ids: Ids of the chunks to drop
+        """
+        doomed: set[str] = {doc_id for doc_id in ids if doc_id in self.lengths}
+        if not doomed:
+            return
+
+        for doc_id in doomed:
+            self._total_length -= self.lengths.pop(doc_id)
+
+        # Chunk texts are not kept, so every posting list has to be checked
+        for term in list(self.postings):
+            postings: dict[str, int] = self.postings[term]
+            for doc_id in doomed.intersection(postings):
+                del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+
+    def sync(self, texts: dict[str, str]) -> bool:
+        """
+        Bring the index up to date with the chunks of a vector store.
+        Chunk ids are content-derived, so comparing ids is enough to find changes.
+
+        :param texts: Dictionary of chunk id -> chunk text of every chunk in the vector store
+        :return: True if the index changed
+        """
+        removed: list[str] = [doc_id for doc_id in self.lengths if doc_id not in texts]
+        added: dict[str, str] = {doc_id: text for doc_id, text in texts.items() if doc_id not in self.lengths}
+        self.remove(removed)
+        self.add(added)
+        return bool(removed or added)
+
+    def search(self, query: str, k: int) -> list[tuple[str, float]]:
+        """
+        :param query: Keyword query
+        :param k: Maximum number of results
+        :return: Up to k (chunk id, BM25 score) tuples, best first
+        """
+        if not self.lengths or k <= 0:
+            return []
+
+        count: int = len(self.lengths)
+        average_length: float = self._total_length / count or 1.0
+        scores: dict[str, float] = {}
+
+        for term in set(tokenize(query)):
+            postings: Optional[dict[str, int]] = self.postings.get(term)
+            if not postings:
+                continue
+            idf: float = math.log(1.0 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                norm: float = self.k1 * (1.0 - self.b + self.b * self.lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1.0) / (frequency + norm)
+
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+    @classmethod
+    def load(cls, path: str) -> Optional["Bm25Index"]:
+        """
+        :param path: Path to the index JSON file
+        :return: The index, or None if it does not exist or cannot be read
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as index_file:
+                content: dict[str, Any] = json.load(index_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as error:
+            logger.warning("Ignoring unreadable BM25 index %s: %s", path, error)
+            return None
+
+        if content.get("version") != BM25_INDEX_VERSION:
+            logger.warning("Ignoring BM25 index %s with unsupported version", path)
+            return None
+
+        index = cls(k1=content.get("k1", DEFAULT_K1), b=content.get("b", DEFAULT_B))
+        ids: list[str] = content["ids"]
+        index.lengths = dict(zip(ids, content["lengths"]))
+        index._total_length = sum(index.lengths.values())
+        # Postings are stored as flat [position, frequency, position, frequency, ...] lists
+        for term, flat in content["postings"].items():
+            index.postings[term] = {ids[flat[i]]: flat[i + 1] for i in range(0, len(flat), 2)}
+        return index
+
+    def save(self, path: str):
+        """
+        Atomically write the index to a JSON file.
+        Chunk ids are written once and referenced by position to keep the file compact.
+
+        :param path: Path to the index JSON file
+        """
+        ids: list[str] = list(self.lengths)
+        positions: dict[str, int] = {doc_id: position for position, doc_id in enumerate(ids)}
+        postings: dict[str, list[int]] = {
+            term: [value for doc_id, frequency in term_postings.items() for value in (positions[doc_id], frequency)]
+            for term, term_postings in self.postings.items()
+        }
+
+        directory: str = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as index_file:
+                json.dump(
+                    {
+                        "version": BM25_INDEX_VERSION,
+                        "k1": self.k1,
+                        "b": self.b,
+                        "ids": ids,
+                        "lengths": [self.lengths[doc_id] for doc_id in ids],
+                        "postings": postings,
+                    },
+                    index_file,
+                )
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
@@ -105,9 +105,18 @@ class ConfluenceRag(CodedTool, BaseRag):
         # Save the generated vector store as a JSON file if True
         self.save_vector_store = args.get("save_vector_store", False)
 
+        # Configure incremental updates, sharing and the storage type of a binary ".npy" vector store
+        self.configure_vector_store(args)
+
         # Configure the vector store path
         self.configure_vector_store_path(args.get("vector_store_path"))
 
+        # Configure chunking and embedding batches
+        self.configure_ingestion(args)
+
+        # Configure the number of results, score thresholds and hybrid keyword search
+        self.configure_retrieval(args)
+
         # Prepare the vector store
         vectorstore = await self.generate_vector_store(loader_args=loader_args)
 
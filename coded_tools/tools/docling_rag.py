@@ -47,8 +47,15 @@ class DoclingRag(CodedTool, BaseRag):
         :param args: Dictionary containing:
           "query": search string
           "urls": list of pdf files
-          "save_vector_store": save to JSON file if True
+          "save_vector_store": save to a JSON or binary file if True
           "vector_store_path": relative path to this file
+          "incremental_update": re-embed only changed sources of an existing vector store if True
+          "share_vector_store": reuse the vector store built by other invocations if True (default)
+          "vector_store_dtype": "float32" or "float16" storage for a binary ".npy" vector store
+          "chunk_size", "chunk_overlap": tokens per chunk and tokens shared by consecutive chunks
+          "embedding_batch_size", "embedding_concurrency": chunks per embedding call and calls in flight
+          "top_k", "score_threshold", "keyword_score_threshold": number of results and minimum scores
+          "hybrid_search", "ann_index": fuse BM25 keyword search with vector search, approximate vector search
 
         :param sly_data: A dictionary whose keys are defined by the agent
             hierarchy, but whose values are meant to be kept out of the
@@ -82,9 +89,18 @@ class DoclingRag(CodedTool, BaseRag):
         # Save the generated vector store as a JSON file if True
         self.save_vector_store = args.get("save_vector_store", False)
 
+        # Configure incremental updates, sharing and the storage type of a binary ".npy" vector store
+        self.configure_vector_store(args)
+
         # Configure the vector store path
         self.configure_vector_store_path(args.get("vector_store_path"))
 
+        # Configure chunking and embedding batches
+        self.configure_ingestion(args)
+
+        # Configure the number of results, score thresholds and hybrid keyword search
+        self.configure_retrieval(args)
+
         # For PostgreSQL vector store
         if vector_store_type == "postgres":
             postgres_config = PostgresConfig(
@@ -0,0 +1,303 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Content-addressed, on-disk cache for document embeddings used by the RAG tools"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Optional
+
+from langchain_core.embeddings import Embeddings
+
+# Environment variables that control the cache
+EMBEDDING_CACHE_PATH_ENV = "RAG_EMBEDDING_CACHE_PATH"
+EMBEDDING_CACHE_MAX_ENTRIES_ENV = "RAG_EMBEDDING_CACHE_MAX_ENTRIES"
+EMBEDDING_CACHE_ENABLED_ENV = "RAG_EMBEDDING_CACHE_ENABLED"
+
+DEFAULT_EMBEDDING_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "neuro-san-studio", "embeddings.db")
+DEFAULT_MAX_ENTRIES = 500_000
+
+# SQLite limits the number of host parameters in a single statement
+LOOKUP_BATCH_SIZE = 500
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Persistent key/vector store backed by SQLite.
+
+    Keys are content hashes, values are float32 vectors. Every lookup
+    refreshes the entry's access time so that eviction drops the least
+    recently used vectors once the cache grows past max_entries.
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        :param path: Path to the SQLite database file. Parent directories are created if needed.
+        :param max_entries: Maximum number of vectors to keep before evicting the least recently used ones
+        """
+        self.path: str = path
+        self.max_entries: int = max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.Lock()
+
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key TEXT PRIMARY KEY,"
+            " vector BLOB NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON embeddings(last_access)")
+        self._connection.commit()
+        # Kept up to date by put_many, so that writes do not count the table
+        self._count: int = self._count_entries()
+
+    def _count_entries(self) -> int:
+        """
+        :return: The number of entries in the database
+        """
+        return self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    @staticmethod
+    def make_key(model: str, dimensions: Optional[int], text: str) -> str:
+        """
+        :param model: Name of the embedding model
+        :param dimensions: Dimensions requested from the model
+        :param text: Text being embedded
+        :return: Hex digest that uniquely addresses the embedding of the text
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{model}\x00{dimensions}\x00".encode("utf-8"))
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """
+        Look up several keys at once.
+
+        :param keys: Keys to look up
+        :return: Dictionary of key -> vector for the keys that were found
+        """
+        found: dict[str, list[float]] = {}
+        unique_keys: list[str] = list(dict.fromkeys(keys))
+        now: float = time.time()
+
+        with self._lock:
+            for start in range(0, len(unique_keys), LOOKUP_BATCH_SIZE):
+                batch: list[str] = unique_keys[start : start + LOOKUP_BATCH_SIZE]
+                placeholders: str = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+
+                self._connection.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE key = ?", [(now, key) for key, _ in rows]
+                )
+            self._connection.commit()
+
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+
+        return found
+
+    def put_many(self, items: dict[str, list[float]]):
+        """
+        Store several vectors at once and evict old entries if over budget.
+
+        :param items: Dictionary of key -> vector to store
+        """
+        if not items:
+            return
+
+        now: float = time.time()
+        rows = [(key, array("f", vector).tobytes(), now) for key, vector in items.items()]
+
+        with self._lock:
+            existing: int = 0
+            keys: list[str] = list(items)
+            for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+                batch: list[str] = keys[start : start + LOOKUP_BATCH_SIZE]
+                placeholders: str = ",".join("?" * len(batch))
+                existing += self._connection.execute(
+                    f"SELECT COUNT(*) FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchone()[0]
+
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, last_access) VALUES (?, ?, ?)", rows
+            )
+            self._count += len(rows) - existing
+            self._evict()
+            self._connection.commit()
+
+    def _evict(self):
+        """
+        Drop the least recently used entries beyond max_entries.
+        Assumes the lock is held.
+        """
+        if self._count <= self.max_entries:
+            return
+
+        # Other processes may share the database, so count exactly before deleting anything
+        self._count = self._count_entries()
+        overflow: int = self._count - self.max_entries
+        if overflow <= 0:
+            return
+
+        self._connection.execute(
+            "DELETE FROM embeddings WHERE key IN (SELECT key FROM embeddings ORDER BY last_access ASC LIMIT ?)",
+            (overflow,),
+        )
+        self._count -= overflow
+        logger.info("Evicted %d entries from embedding cache %s", overflow, self.path)
+
+    def stats(self) -> dict[str, float]:
+        """
+        :return: Dictionary with hit/miss counters and the hit rate
+        """
+        total: int = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def close(self):
+        """
+        Close the underlying database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that serves document embeddings out of an EmbeddingCache
+    and only sends cache misses to the underlying embeddings model.
+
+    Query embeddings are passed straight through since they rarely repeat.
+    """
+
+    def __init__(self, embeddings: Embeddings, model: str, dimensions: Optional[int], cache: EmbeddingCache):
+        """
+        :param embeddings: The underlying embeddings model
+        :param model: Name of the embedding model, part of the cache key
+        :param dimensions: Dimensions of the embedding vectors, part of the cache key
+        :param cache: The cache to read from and write to
+        """
+        self.embeddings: Embeddings = embeddings
+        self.model: str = model
+        self.dimensions: Optional[int] = dimensions
+        self.cache: EmbeddingCache = cache
+
+    def _split_hits(self, texts: list[str]) -> tuple[list[str], dict[str, list[float]], list[str]]:
+        """
+        :param texts: Texts to embed
+        :return: A tuple of (keys for every text, cached vectors by key, texts that still need embedding)
+        """
+        keys: list[str] = [EmbeddingCache.make_key(self.model, self.dimensions, text) for text in texts]
+        cached: dict[str, list[float]] = self.cache.get_many(keys)
+
+        # Deduplicate the misses so identical chunks are only embedded once
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+
+        return keys, cached, list(missing.values())
+
+    def _merge(self, keys: list[str], cached: dict[str, list[float]], new_texts: list[str], new_vectors):
+        """
+        Store the new vectors and assemble the result in the original order.
+        """
+        new_items: dict[str, list[float]] = {
+            EmbeddingCache.make_key(self.model, self.dimensions, text): list(vector)
+            for text, vector in zip(new_texts, new_vectors)
+        }
+        self.cache.put_many(new_items)
+        cached.update(new_items)
+
+        logger.debug(
+            "Embedding cache: %d cached, %d embedded, %s",
+            len(keys) - len(new_texts),
+            len(new_texts),
+            self.cache.stats(),
+        )
+        return [cached[key] for key in keys]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents, reusing cached vectors where possible."""
+        keys, cached, missing = self._split_hits(texts)
+        new_vectors = self.embeddings.embed_documents(missing) if missing else []
+        return self._merge(keys, cached, missing, new_vectors)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Asynchronously embed documents, reusing cached vectors where possible."""
+        keys, cached, missing = await asyncio.to_thread(self._split_hits, texts)
+        new_vectors = await self.embeddings.aembed_documents(missing) if missing else []
+        return await asyncio.to_thread(self._merge, keys, cached, missing, new_vectors)
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query without caching."""
+        return self.embeddings.embed_query(text)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        """Asynchronously embed a query without caching."""
+        return await self.embeddings.aembed_query(text)
+
+
+# Process-wide caches, keyed by database path
+_CACHES: dict[str, EmbeddingCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Get the process-wide embedding cache as configured by the environment.
+
+    :return: The shared EmbeddingCache, or None if caching is disabled or the cache cannot be opened
+    """
+    if os.getenv(EMBEDDING_CACHE_ENABLED_ENV, "true").lower() in ("false", "0", "no"):
+        return None
+
+    path: str = os.getenv(EMBEDDING_CACHE_PATH_ENV) or DEFAULT_EMBEDDING_CACHE_PATH
+    max_entries: int = int(os.getenv(EMBEDDING_CACHE_MAX_ENTRIES_ENV, str(DEFAULT_MAX_ENTRIES)))
+
+    with _CACHES_LOCK:
+        cache: Optional[EmbeddingCache] = _CACHES.get(path)
+        if cache is None:
+            try:
+                cache = EmbeddingCache(path, max_entries=max_entries)
+            except (OSError, sqlite3.Error) as error:
+                logger.warning("Embedding cache disabled, could not open %s: %s", path, error)
+                return None
+            _CACHES[path] = cache
+        return cache
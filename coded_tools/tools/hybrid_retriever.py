@@ -0,0 +1,315 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Retriever that fuses BM25 keyword search with vector search over in-process vector stores"""
+
+import asyncio
+import threading
+import weakref
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Optional
+
+import numpy as np
+from langchain_core.callbacks import AsyncCallbackManagerForRetrieverRun
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores import VectorStore
+from pydantic import ConfigDict
+from pydantic import SkipValidation
+
+from coded_tools.tools.bm25_index import Bm25Index
+from coded_tools.tools.ivf_index import IvfIndex
+from coded_tools.tools.ivf_index import normalize
+from coded_tools.tools.mmap_vector_store import MmapVectorStore
+
+DEFAULT_K = 4
+# Candidates taken from each ranking before fusion, as a multiple of k
+FETCH_K_MULTIPLIER = 5
+# Reciprocal rank fusion constant; dampens the weight of the very top ranks
+DEFAULT_RRF_K = 60
+# Below this many vectors an exact scan is fast enough that an ANN index does not pay off
+DEFAULT_ANN_MIN_VECTORS = 20_000
+
+
+# Number of writes to each in-process vector store, see mark_vector_store_written()
+_VERSIONS: "weakref.WeakKeyDictionary[VectorStore, int]" = weakref.WeakKeyDictionary()
+_VERSIONS_LOCK = threading.Lock()
+
+
+def mark_vector_store_written(vectorstore: VectorStore):
+    """
+    Record that chunks were added to, removed from or replaced in a vector store,
+    so that its indexes are brought up to date before the next query.
+
+    :param vectorstore: A vector store
+    """
+    with _VERSIONS_LOCK:
+        _VERSIONS[vectorstore] = _VERSIONS.get(vectorstore, 0) + 1
+
+
+def get_store_version(vectorstore: VectorStore) -> Optional[int]:
+    """
+    :param vectorstore: A vector store
+    :return: Number of writes recorded for the store, or None if the store is not held in this process
+    """
+    if not isinstance(vectorstore, (MmapVectorStore, InMemoryVectorStore)):
+        return None
+    with _VERSIONS_LOCK:
+        return _VERSIONS.get(vectorstore, 0)
+
+
+def get_chunk_texts(vectorstore: VectorStore) -> Optional[dict[str, str]]:
+    """
+    :param vectorstore: A vector store
+    :return: Dictionary of chunk id -> chunk text, or None if the store is not held in this process
+    """
+    if isinstance(vectorstore, MmapVectorStore):
+        return dict(zip(vectorstore.ids, vectorstore.texts))
+    if isinstance(vectorstore, InMemoryVectorStore):
+        return {doc_id: entry["text"] for doc_id, entry in vectorstore.store.items()}
+    return None
+
+
+def get_chunk_vectors(vectorstore: VectorStore) -> Optional[tuple[list[str], np.ndarray]]:
+    """
+    :param vectorstore: A vector store
+    :return: Chunk ids and the matrix of their unit-length vectors, one row per id,
+        or None if the store is not held in this process
+    """
+    if isinstance(vectorstore, MmapVectorStore):
+        return list(vectorstore.ids), vectorstore.matrix
+    if isinstance(vectorstore, InMemoryVectorStore):
+        ids: list[str] = list(vectorstore.store)
+        return ids, normalize(np.asarray([vectorstore.store[doc_id]["vector"] for doc_id in ids]))
+    return None
+
+
+@dataclass
+class RetrievalSettings:
+    """Number of results, score thresholds and kinds of search of a RAG tool."""
+
+    top_k: int = DEFAULT_K
+    score_threshold: Optional[float] = None
+    keyword_score_threshold: Optional[float] = None
+    hybrid_search: bool = False
+    ann_index: bool = False
+
+    @classmethod
+    def from_args(cls, args: dict[str, Any]) -> "RetrievalSettings":
+        """
+        :param args: Tool arguments, optionally containing "top_k", "score_threshold",
+            "keyword_score_threshold", "hybrid_search" and "ann_index"
+        :return: The settings, with defaults for the arguments that are not given
+        """
+        score_threshold: Optional[Any] = args.get("score_threshold")
+        keyword_score_threshold: Optional[Any] = args.get("keyword_score_threshold")
+        return cls(
+            top_k=int(args.get("top_k", DEFAULT_K)),
+            score_threshold=float(score_threshold) if score_threshold is not None else None,
+            keyword_score_threshold=float(keyword_score_threshold) if keyword_score_threshold is not None else None,
+            hybrid_search=bool(args.get("hybrid_search", False)),
+            ann_index=bool(args.get("ann_index", False)),
+        )
+
+
+@dataclass
+class RetrievalIndexes:
+    """Search indexes kept alongside one in-process vector store."""
+
+    bm25: Bm25Index
+    size: int
+    version: int
+    ann: Optional[IvfIndex] = None
+    ann_ids: list[str] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+# Indexes live as long as their vector store, which may be shared across invocations
+_INDEXES: "weakref.WeakKeyDictionary[VectorStore, RetrievalIndexes]" = weakref.WeakKeyDictionary()
+_INDEXES_LOCK = threading.Lock()
+
+
+def _sync_indexes(
+    vectorstore: VectorStore, indexes: Optional[RetrievalIndexes], bm25_path: Optional[str]
+) -> tuple[RetrievalIndexes, bool]:
+    """
+    Bring the indexes of a vector store up to date with its chunks. Assumes _INDEXES_LOCK is held.
+
+    :return: A tuple of (the indexes, True if the BM25 index changed)
+    """
+    # Read the version first, so that a write during the sync leaves the indexes behind rather than ahead
+    version: int = get_store_version(vectorstore)
+    texts: dict[str, str] = get_chunk_texts(vectorstore)
+    if indexes is None:
+        bm25: Bm25Index = (Bm25Index.load(bm25_path) if bm25_path else None) or Bm25Index()
+        indexes = RetrievalIndexes(bm25=bm25, size=len(texts), version=version)
+        _INDEXES[vectorstore] = indexes
+
+    changed: bool = indexes.bm25.sync(texts)
+    if changed or indexes.version != version:
+        # Vector rows may have moved, so the ANN index is rebuilt on next use
+        indexes.ann = None
+        indexes.ann_ids = []
+    indexes.size = len(texts)
+    indexes.version = version
+    return indexes, changed
+
+
+def get_retrieval_indexes(vectorstore: VectorStore, bm25_path: Optional[str] = None) -> Optional[RetrievalIndexes]:
+    """
+    :param vectorstore: A vector store
+    :param bm25_path: Persisted BM25 index to start from, if the indexes are not built yet
+    :return: The indexes of the vector store, or None if the store is not held in this process
+    """
+    version: Optional[int] = get_store_version(vectorstore)
+    if version is None:
+        return None
+
+    with _INDEXES_LOCK:
+        indexes: Optional[RetrievalIndexes] = _INDEXES.get(vectorstore)
+        if indexes is None or indexes.version != version:
+            indexes, _ = _sync_indexes(vectorstore, indexes, bm25_path)
+        return indexes
+
+
+def refresh_retrieval_indexes(vectorstore: VectorStore, bm25_path: Optional[str] = None) -> bool:
+    """
+    Bring the indexes of a vector store up to date after its chunks were changed.
+
+    :param vectorstore: A vector store
+    :param bm25_path: Persisted BM25 index to start from, if the indexes are not built yet
+    :return: True if the BM25 index changed and should be saved again
+    """
+    if get_store_version(vectorstore) is None:
+        return False
+
+    with _INDEXES_LOCK:
+        _, changed = _sync_indexes(vectorstore, _INDEXES.get(vectorstore), bm25_path)
+        return changed
+
+
+def reciprocal_rank_fusion(rankings: list[list[str]], rrf_k: int = DEFAULT_RRF_K) -> list[str]:
+    """
+    :param rankings: Lists of chunk ids, each ordered best first
+    :param rrf_k: Fusion constant
+    :return: All chunk ids, ordered by their fused score
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking):
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (rrf_k + rank + 1)
+    return sorted(scores, key=scores.get, reverse=True)
+
+
+class HybridRetriever(BaseRetriever):
+    """
+    Retriever that combines BM25 keyword search with vector similarity search
+    using reciprocal rank fusion, so that chunks matching rare terms exactly
+    (names, codes, identifiers) are found even when their embeddings are not
+    the closest ones.
+
+    For large stores the vector search can go through an IVF approximate
+    nearest neighbour index instead of scanning every vector.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    vectorstore: VectorStore
+    # Shared with other retrievers of the same store, so it must not be copied by validation
+    indexes: SkipValidation[RetrievalIndexes]
+    k: int = DEFAULT_K
+    # Minimum cosine similarity of vector hits, and minimum BM25 score of keyword hits
+    score_threshold: Optional[float] = None
+    keyword_score_threshold: Optional[float] = None
+    keyword_search: bool = True
+    use_ann: bool = False
+    ann_min_vectors: int = DEFAULT_ANN_MIN_VECTORS
+    rrf_k: int = DEFAULT_RRF_K
+
+    @property
+    def fetch_k(self) -> int:
+        """
+        :return: Number of candidates taken from each ranking
+        """
+        return self.k * FETCH_K_MULTIPLIER if self.keyword_search else self.k
+
+    def _get_ann_index(self) -> Optional[IvfIndex]:
+        """
+        :return: The ANN index of the vector store, built on first use, or None if it is not worth it
+        """
+        if not self.use_ann or self.indexes.size < self.ann_min_vectors:
+            return None
+
+        with self.indexes.lock:
+            if self.indexes.ann is None:
+                ids, matrix = get_chunk_vectors(self.vectorstore)
+                self.indexes.ann = IvfIndex(matrix)
+                self.indexes.ann_ids = ids
+            return self.indexes.ann
+
+    def _vector_search(self, embedding: list[float], ann: Optional[IvfIndex]) -> list[tuple[Document, float]]:
+        """
+        :return: Up to fetch_k (document, cosine similarity) tuples, most similar first
+        """
+        if ann is None:
+            return self.vectorstore.similarity_search_with_score_by_vector(embedding, k=self.fetch_k)
+
+        hits: list[tuple[int, float]] = ann.search(np.asarray(embedding), self.fetch_k)
+        hit_ids: list[str] = [self.indexes.ann_ids[row] for row, _ in hits]
+        # get_by_ids() leaves out ids that are no longer in the store, so match documents by id, not position
+        docs: dict[str, Document] = {doc.id: doc for doc in self.vectorstore.get_by_ids(hit_ids)}
+        return [(docs[doc_id], score) for doc_id, (_, score) in zip(hit_ids, hits) if doc_id in docs]
+
+    def _fuse(self, query: str, vector_hits: list[tuple[Document, float]]) -> list[Document]:
+        """
+        Filter both rankings by their thresholds and fuse them.
+
+        :return: Up to k documents, best first
+        """
+        if self.score_threshold is not None:
+            vector_hits = [(doc, score) for doc, score in vector_hits if score >= self.score_threshold]
+        if not self.keyword_search:
+            return [doc for doc, _ in vector_hits[: self.k]]
+
+        keyword_hits: list[tuple[str, float]] = self.indexes.bm25.search(query, self.fetch_k)
+        if self.keyword_score_threshold is not None:
+            keyword_hits = [(doc_id, score) for doc_id, score in keyword_hits if score >= self.keyword_score_threshold]
+
+        found: dict[str, Document] = {doc.id: doc for doc, _ in vector_hits}
+        fused: list[str] = reciprocal_rank_fusion(
+            [[doc.id for doc, _ in vector_hits], [doc_id for doc_id, _ in keyword_hits]], self.rrf_k
+        )[: self.k]
+
+        missing: list[str] = [doc_id for doc_id in fused if doc_id not in found]
+        found.update({doc.id: doc for doc in self.vectorstore.get_by_ids(missing)})
+        return [found[doc_id] for doc_id in fused if doc_id in found]
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> list[Document]:
+        embedding: list[float] = self.vectorstore.embeddings.embed_query(query)
+        return self._fuse(query, self._vector_search(embedding, self._get_ann_index()))
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> list[Document]:
+        embedding: list[float] = await self.vectorstore.embeddings.aembed_query(query)
+        # Building the ANN index and scanning vectors is CPU-bound, so keep it off the event loop
+        ann: Optional[IvfIndex] = await asyncio.to_thread(self._get_ann_index)
+        vector_hits: list[tuple[Document, float]] = await asyncio.to_thread(self._vector_search, embedding, ann)
+        return self._fuse(query, vector_hits)
@@ -0,0 +1,351 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Streaming load -> split -> embed pipeline that feeds RAG vector stores"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+from typing import AsyncIterator
+from typing import Optional
+
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from openai import APITimeoutError
+from openai import RateLimitError
+
+from coded_tools.tools.hybrid_retriever import mark_vector_store_written
+from coded_tools.tools.source_manifest import SourceManifest
+
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_CHUNK_OVERLAP = 50
+DEFAULT_EMBEDDING_BATCH_SIZE = 256
+DEFAULT_EMBEDDING_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 5
+
+# Backoff between retries of a rate-limited embedding batch, in seconds
+BASE_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+
+# Sources with less text than this are split in a thread; starting worker processes is not worth it
+PROCESS_SPLIT_MIN_CHARACTERS = 200_000
+
+# Number of worker processes for splitting. Set to 0 to always split in a thread.
+SPLIT_WORKERS_ENV = "RAG_SPLIT_WORKERS"
+
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError)
+
+logger = logging.getLogger(__name__)
+
+_split_executor: Optional[ProcessPoolExecutor] = None
+_split_executor_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _get_text_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """
+    :return: A token-based text splitter, cached per process since loading the encoder is not free
+    """
+    return RecursiveCharacterTextSplitter.from_tiktoken_encoder(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+
+def split_documents(docs: list[Document], chunk_size: int, chunk_overlap: int) -> list[Document]:
+    """
+    Split documents into chunks. Module-level so that it can run in a worker process.
+
+    :param docs: Documents to split
+    :param chunk_size: Maximum number of tokens per chunk
+    :param chunk_overlap: Number of tokens shared by consecutive chunks
+    :return: The chunks, in document order
+    """
+    return _get_text_splitter(chunk_size, chunk_overlap).split_documents(docs)
+
+
+def _get_split_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    :return: The process-wide pool used for splitting large sources, or None if disabled
+    """
+    global _split_executor  # pylint: disable=global-statement
+
+    workers: int = int(os.getenv(SPLIT_WORKERS_ENV, str(min(4, os.cpu_count() or 1))))
+    if workers <= 0:
+        return None
+
+    with _split_executor_lock:
+        if _split_executor is None:
+            # Spawn rather than fork, since the server process runs threads
+            _split_executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return _split_executor
+
+
+def _reset_split_executor():
+    """
+    Drop a broken process pool so that the next large source gets a fresh one.
+    """
+    global _split_executor  # pylint: disable=global-statement
+
+    with _split_executor_lock:
+        if _split_executor is not None:
+            _split_executor.shutdown(wait=False, cancel_futures=True)
+        _split_executor = None
+
+
+@dataclass
+class IngestionSettings:
+    """Chunking and embedding settings of an ingestion pipeline."""
+
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP
+    embedding_batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE
+    embedding_concurrency: int = DEFAULT_EMBEDDING_CONCURRENCY
+
+    @classmethod
+    def from_args(cls, args: dict[str, Any]) -> "IngestionSettings":
+        """
+        :param args: Tool arguments, optionally containing "chunk_size", "chunk_overlap",
+            "embedding_batch_size" and "embedding_concurrency"
+        :return: The settings, with defaults for the arguments that are not given
+        """
+        return cls(
+            chunk_size=int(args.get("chunk_size", DEFAULT_CHUNK_SIZE)),
+            chunk_overlap=int(args.get("chunk_overlap", DEFAULT_CHUNK_OVERLAP)),
+            embedding_batch_size=int(args.get("embedding_batch_size", DEFAULT_EMBEDDING_BATCH_SIZE)),
+            embedding_concurrency=int(args.get("embedding_concurrency", DEFAULT_EMBEDDING_CONCURRENCY)),
+        )
+
+
+class IngestionPipeline:
+    """
+    Ingests documents into a vector store as they are loaded.
+
+    Loading, splitting and embedding overlap: while the loader fetches the next
+    source, earlier sources are split (in worker processes when large, since
+    token-based splitting is CPU-bound) and their chunks are embedded and added
+    to the vector store in batches, with a bounded number of batches in flight
+    and exponential backoff when the embeddings provider rate-limits.
+
+    Sources whose fingerprint matches the source manifest are skipped, so the
+    same pipeline builds new vector stores and incrementally updates existing ones.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+        embedding_batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        embedding_concurrency: int = DEFAULT_EMBEDDING_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ):
+        """
+        :param chunk_size: Maximum number of tokens per chunk
+        :param chunk_overlap: Number of tokens shared by consecutive chunks
+        :param embedding_batch_size: Number of chunks embedded and added per vector store call
+        :param embedding_concurrency: Maximum number of embedding batches in flight
+        :param max_retries: Number of retries of a rate-limited batch before giving up
+        """
+        self.chunk_size: int = chunk_size
+        self.chunk_overlap: int = chunk_overlap
+        self.embedding_batch_size: int = max(1, embedding_batch_size)
+        self.embedding_concurrency: int = max(1, embedding_concurrency)
+        self.max_retries: int = max_retries
+
+    def get_fingerprint(self, docs: list[Document]) -> str:
+        """
+        :param docs: All documents loaded from one source
+        :return: Fingerprint of the source. Changing the chunking changes the fingerprint too.
+        """
+        return SourceManifest.fingerprint(docs, salt=f"{self.chunk_size}:{self.chunk_overlap}")
+
+    async def run(
+        self,
+        vectorstore: VectorStore,
+        source_batches: AsyncIterator[list[Document]],
+        manifest: SourceManifest,
+        keep_sources: Optional[set[str]] = None,
+    ) -> bool:
+        """
+        Bring the vector store up to date with the sources.
+
+        :param vectorstore: Vector store to add chunks to and delete stale chunks from
+        :param source_batches: Async iterator yielding all documents of one source at a time
+        :param manifest: Source manifest of the vector store, updated in place
+        :param keep_sources: Sources that were not yielded but must not be treated as removed,
+            such as ones that failed to load. May be filled in while source_batches is iterated.
+        :return: True if the vector store was modified
+        """
+        embedding_slots = asyncio.Semaphore(self.embedding_concurrency)
+        # Bound how many loaded-but-not-yet-embedded sources are held in memory
+        source_slots = asyncio.Semaphore(2 * self.embedding_concurrency)
+        seen: set[str] = set()
+        tasks: list[asyncio.Task] = []
+
+        try:
+            async for docs in source_batches:
+                if not docs:
+                    continue
+
+                source: str = SourceManifest.get_source(docs[0])
+                if source in seen:
+                    logger.warning("Source %s was loaded more than once. Ignoring the repeat.", source)
+                    continue
+                seen.add(source)
+
+                fingerprint: str = self.get_fingerprint(docs)
+                if manifest.sources.get(source, {}).get("fingerprint") == fingerprint:
+                    continue
+
+                await source_slots.acquire()
+                tasks.append(
+                    asyncio.create_task(
+                        self._ingest_source(
+                            vectorstore, source, docs, fingerprint, manifest, embedding_slots, source_slots
+                        )
+                    )
+                )
+
+            chunk_counts: list[int] = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        removed: int = await self._remove_sources(vectorstore, manifest, seen | (keep_sources or set()))
+
+        logger.info(
+            "Ingested %d sources (%d chunks), skipped %d unchanged, removed %d\n",
+            len(tasks),
+            sum(chunk_counts),
+            len(seen) - len(tasks),
+            removed,
+        )
+        return bool(tasks or removed)
+
+    @staticmethod
+    async def _remove_sources(vectorstore: VectorStore, manifest: SourceManifest, kept: set[str]) -> int:
+        """
+        Delete the chunks of the sources of the manifest that are no longer there.
+
+        :param vectorstore: Vector store to delete stale chunks from
+        :param manifest: Source manifest of the vector store, updated in place
+        :param kept: Sources that were loaded or must be kept anyway
+        :return: Number of sources removed
+        """
+        removed: list[str] = [source for source in manifest.sources if source not in kept]
+        removed_ids: list[str] = [chunk_id for source in removed for chunk_id in manifest.chunk_ids(source)]
+        if removed_ids:
+            await vectorstore.adelete(ids=removed_ids)
+            mark_vector_store_written(vectorstore)
+        for source in removed:
+            manifest.remove_source(source)
+        return len(removed)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    async def _ingest_source(
+        self,
+        vectorstore: VectorStore,
+        source: str,
+        docs: list[Document],
+        fingerprint: str,
+        manifest: SourceManifest,
+        embedding_slots: asyncio.Semaphore,
+        source_slots: asyncio.Semaphore,
+    ) -> int:
+        """
+        Split one source, replace its chunks in the vector store and record it in the manifest.
+
+        :return: Number of chunks added
+        """
+        stale_ids: list[str] = manifest.chunk_ids(source)
+        ids: list[str] = []
+        try:
+            chunks: list[Document] = await self._split(docs)
+            ids = [SourceManifest.chunk_id(source, index, chunk.page_content) for index, chunk in enumerate(chunks)]
+
+            if stale_ids:
+                await vectorstore.adelete(ids=stale_ids)
+                mark_vector_store_written(vectorstore)
+
+            await asyncio.gather(
+                *(
+                    self._add_batch(
+                        vectorstore,
+                        chunks[start : start + self.embedding_batch_size],
+                        ids[start : start + self.embedding_batch_size],
+                        embedding_slots,
+                    )
+                    for start in range(0, len(chunks), self.embedding_batch_size)
+                )
+            )
+        except BaseException:
+            # Remember every id that may have been written, with no fingerprint, so the next run cleans them up
+            manifest.set_source(source, "", list(dict.fromkeys(stale_ids + ids)))
+            raise
+        finally:
+            source_slots.release()
+
+        manifest.set_source(source, fingerprint, ids)
+        return len(chunks)
+
+    async def _split(self, docs: list[Document]) -> list[Document]:
+        """
+        Split documents off the event loop, in a worker process if they are large.
+
+        :param docs: All documents loaded from one source
+        :return: The chunks, in document order
+        """
+        loop = asyncio.get_running_loop()
+        executor: Optional[ProcessPoolExecutor] = None
+        if sum(len(doc.page_content) for doc in docs) >= PROCESS_SPLIT_MIN_CHARACTERS:
+            executor = _get_split_executor()
+
+        if executor is not None:
+            try:
+                return await loop.run_in_executor(executor, split_documents, docs, self.chunk_size, self.chunk_overlap)
+            except BrokenProcessPool as error:
+                logger.warning("Split worker pool broke, splitting in a thread instead: %s", error)
+                _reset_split_executor()
+
+        return await asyncio.to_thread(split_documents, docs, self.chunk_size, self.chunk_overlap)
+
+    async def _add_batch(
+        self, vectorstore: VectorStore, chunks: list[Document], ids: list[str], embedding_slots: asyncio.Semaphore
+    ):
+        """
+        Embed and add one batch of chunks, backing off while the embeddings provider rate-limits.
+        """
+        async with embedding_slots:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    await vectorstore.aadd_documents(documents=chunks, ids=ids)
+                    mark_vector_store_written(vectorstore)
+                    return
+                except RETRYABLE_ERRORS as error:
+                    if attempt == self.max_retries:
+                        raise
+                    delay: float = min(MAX_BACKOFF_SECONDS, BASE_BACKOFF_SECONDS * 2**attempt)
+                    delay *= 0.5 + random.random() / 2
+                    logger.warning("Embedding batch failed (%s). Retrying in %.1f seconds.", error, delay)
+                    await asyncio.sleep(delay)
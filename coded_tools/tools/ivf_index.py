@@ -0,0 +1,134 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Inverted-file approximate nearest neighbour index over unit-length vectors"""
+
+import logging
+import math
+from typing import Optional
+
+import numpy as np
+
+DEFAULT_TRAINING_ITERATIONS = 8
+# Rows used to train the cluster centroids; more only slows training down
+MAX_TRAINING_ROWS = 20_000
+# Rows scored per matrix product, to bound temporary memory
+ASSIGN_BATCH_ROWS = 8_192
+
+logger = logging.getLogger(__name__)
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """
+    :param vectors: 2D array of vectors, one per row
+    :return: The vectors as float32, scaled to unit length
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms: np.ndarray = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return vectors / norms
+
+
+class IvfIndex:
+    """
+    Approximate nearest neighbour index that partitions vectors into clusters
+    with spherical k-means and, per query, only scores the vectors in the
+    nprobe clusters closest to the query.
+
+    With about sqrt(n) clusters a query scores roughly nprobe * sqrt(n)
+    vectors instead of all n, at the price of occasionally missing a
+    neighbour that sits in an unprobed cluster.
+    """
+
+    def __init__(self, matrix: np.ndarray, nlist: Optional[int] = None, nprobe: int = 8, seed: int = 0):
+        """
+        Train the clusters and assign every vector to one.
+
+        :param matrix: Unit-length vectors, one per row. May be a memory map; it is read, never copied whole.
+        :param nlist: Number of clusters. Defaults to sqrt of the number of vectors.
+        :param nprobe: Number of clusters scored per query
+        :param seed: Seed for picking the initial centroids
+        :raises ValueError: If the matrix has no rows
+        """
+        count: int = matrix.shape[0]
+        if not count:
+            raise ValueError("Cannot build an IVF index without vectors")
+
+        self.matrix: np.ndarray = matrix
+        self.nlist: int = max(1, min(count, nlist or int(math.sqrt(count))))
+        self.nprobe: int = max(1, min(self.nlist, nprobe))
+
+        rng = np.random.default_rng(seed)
+        training_rows: np.ndarray = np.sort(rng.choice(count, size=min(count, MAX_TRAINING_ROWS), replace=False))
+        training: np.ndarray = np.asarray(matrix[training_rows], dtype=np.float32)
+        self.centroids: np.ndarray = self._train(training, rng)
+
+        assignments: np.ndarray = self.assign(matrix)
+        order: np.ndarray = np.argsort(assignments, kind="stable")
+        boundaries: np.ndarray = np.searchsorted(assignments[order], np.arange(self.nlist + 1))
+        self.lists: list[np.ndarray] = [order[boundaries[i] : boundaries[i + 1]] for i in range(self.nlist)]
+
+        logger.info("Built IVF index over %d vectors with %d clusters", count, self.nlist)
+
+    def _train(self, training: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """
+        :param training: Sample of unit-length vectors
+        :param rng: Random generator
+        :return: Unit-length cluster centroids, one per row
+        """
+        centroids: np.ndarray = training[rng.choice(len(training), size=self.nlist, replace=False)]
+        for _ in range(DEFAULT_TRAINING_ITERATIONS):
+            labels: np.ndarray = np.argmax(training @ centroids.T, axis=1)
+            sums: np.ndarray = np.zeros_like(centroids)
+            np.add.at(sums, labels, training)
+            # Keep the previous centroid for clusters that lost all their members
+            empty: np.ndarray = ~np.any(sums, axis=1)
+            sums[empty] = centroids[empty]
+            centroids = normalize(sums)
+        return centroids
+
+    def assign(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        :param matrix: Unit-length vectors, one per row
+        :return: Index of the closest centroid for every row
+        """
+        labels: list[np.ndarray] = []
+        for start in range(0, matrix.shape[0], ASSIGN_BATCH_ROWS):
+            rows: np.ndarray = np.asarray(matrix[start : start + ASSIGN_BATCH_ROWS], dtype=np.float32)
+            labels.append(np.argmax(rows @ self.centroids.T, axis=1))
+        return np.concatenate(labels) if labels else np.empty(0, dtype=np.int64)
+
+    def search(self, query: np.ndarray, k: int) -> list[tuple[int, float]]:
+        """
+        :param query: Query vector; it does not need to be unit-length
+        :param k: Maximum number of results
+        :return: Up to k (row, cosine similarity) tuples, most similar first
+        """
+        if k <= 0:
+            return []
+
+        query = normalize(np.asarray([query]))[0]
+        probes: np.ndarray = np.argsort(-(self.centroids @ query))[: self.nprobe]
+        candidates: np.ndarray = np.concatenate([self.lists[probe] for probe in probes])
+        if candidates.size == 0:
+            return []
+
+        candidates.sort()
+        scores: np.ndarray = np.asarray(self.matrix[candidates], dtype=np.float32) @ query
+        k = min(k, len(candidates))
+        top: np.ndarray = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(candidates[position]), float(scores[position])) for position in top]
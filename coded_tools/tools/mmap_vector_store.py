@@ -0,0 +1,494 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Vector store persisted as a memory-mapped .npy matrix plus a JSON lines sidecar"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import uuid
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+from typing import TextIO
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+SUPPORTED_DTYPES = ("float32", "float16")
+DEFAULT_DTYPE = "float32"
+# Version of the sidecar layout: a header line naming the current matrix file, then one line per row
+SIDECAR_VERSION = 2
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """
+    :param vectors: 2D array of vectors, one per row
+    :return: The vectors scaled to unit length, so that a dot product is a cosine similarity
+    """
+    norms: np.ndarray = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return vectors / norms
+
+
+# The rows are spread over the matrix, the pending rows and the per-row lists, which share one lock
+# pylint: disable=too-many-instance-attributes
+class MmapVectorStore(VectorStore):
+    """
+    Vector store that keeps unit-length embeddings in a single float32 or float16
+    matrix and does vectorized cosine top-k over it.
+
+    On disk the matrix is a standard .npy file, which is memory-mapped on load,
+    so several server processes serving the same store share the OS page cache
+    instead of each parsing and holding their own copy. Ids, texts and metadata
+    live in a "<name>.meta.jsonl" sidecar, one line per row of the matrix, after
+    a header line naming the "<name>.<generation>.npy" file of the matrix.
+    The configured "<name>.npy" path itself is never written; tooling that reads
+    the matrix directly should follow the sidecar header to the current file.
+
+    Added rows are buffered and deleted rows only marked, so that ingesting many
+    batches does not copy the whole matrix each time. Both are applied at once
+    the next time the matrix is read, searched or dumped.
+    """
+
+    def __init__(self, embedding: Embeddings, dtype: str = DEFAULT_DTYPE):
+        """
+        :param embedding: Embeddings model used for queries and added texts
+        :param dtype: Storage type of the vectors, "float32" or "float16"
+        """
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"dtype must be one of {SUPPORTED_DTYPES}, got: '{dtype}'")
+
+        self.embedding: Embeddings = embedding
+        self.dtype: str = dtype
+        self._matrix: np.ndarray = np.empty((0, 0), dtype=dtype)
+        # Rows added since the matrix was last compacted, in order
+        self._pending_rows: list[np.ndarray] = []
+        # Rows of the matrix and the pending rows that were deleted since the last compaction
+        self._deleted: set[int] = set()
+        self._dimension: Optional[int] = None
+        self._ids: list[str] = []
+        self._texts: list[str] = []
+        self._metadatas: list[dict[str, Any]] = []
+        # id -> row of the entries that are not deleted
+        self._positions: dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self.embedding
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        :return: The unit-length vectors, one row per entry
+        """
+        with self._lock:
+            self._compact()
+            return self._matrix
+
+    @property
+    def ids(self) -> list[str]:
+        """
+        :return: The ids of the entries, in the order of the rows of the matrix
+        """
+        with self._lock:
+            self._compact()
+            return self._ids
+
+    @property
+    def texts(self) -> list[str]:
+        """
+        :return: The texts of the entries, in the order of the rows of the matrix
+        """
+        with self._lock:
+            self._compact()
+            return self._texts
+
+    def _compact(self):
+        """
+        Append the pending rows to the matrix and drop the deleted rows, copying the matrix once.
+        Called with the lock held.
+        """
+        if not self._pending_rows and not self._deleted:
+            return
+
+        # Appending copies a memory-mapped matrix into memory; it is written back out by dump().
+        matrix: np.ndarray = self._matrix
+        if self._pending_rows:
+            # An empty store has no dimension yet, so its matrix cannot be concatenated with rows
+            blocks: list[np.ndarray] = ([matrix] if len(matrix) else []) + self._pending_rows
+            matrix = np.concatenate(blocks)
+        if self._deleted:
+            keep: np.ndarray = np.ones(len(self._ids), dtype=bool)
+            keep[list(self._deleted)] = False
+            matrix = matrix[keep]
+            self._ids = [doc_id for doc_id, kept in zip(self._ids, keep) if kept]
+            self._texts = [text for text, kept in zip(self._texts, keep) if kept]
+            self._metadatas = [metadata for metadata, kept in zip(self._metadatas, keep) if kept]
+            self._positions = {doc_id: position for position, doc_id in enumerate(self._ids)}
+
+        self._matrix = matrix
+        self._pending_rows = []
+        self._deleted = set()
+
+    @staticmethod
+    def get_sidecar_path(path: str) -> str:
+        """
+        :param path: Path of the vector store
+        :return: Path to the metadata sidecar, which also names the current matrix file
+        """
+        return os.path.splitext(path)[0] + ".meta.jsonl"
+
+    @staticmethod
+    def _read_header(sidecar: TextIO, sidecar_path: str) -> dict[str, Any]:
+        """
+        :param sidecar: The sidecar, opened for reading
+        :param sidecar_path: Path of the sidecar, for error messages
+        :return: The header line of the sidecar
+        :raises ValueError: If the sidecar has no header, as written before matrix files were versioned
+        """
+        line: str = sidecar.readline()
+        header: dict[str, Any] = json.loads(line) if line else {}
+        if header.get("version") != SIDECAR_VERSION:
+            raise ValueError(f"{sidecar_path} is not a version {SIDECAR_VERSION} vector store sidecar")
+        return header
+
+    def _add_vectors(
+        self,
+        vectors: list[list[float]],
+        texts: list[str],
+        metadatas: Optional[list[dict[str, Any]]],
+        ids: Optional[list[str]],
+    ) -> list[str]:
+        """
+        Append embedded texts to the store. Existing entries with the same ids are replaced.
+
+        :return: Ids of the added texts
+        """
+        if ids and len(ids) != len(texts):
+            raise ValueError(f"ids must be the same length as texts. Got {len(ids)} ids and {len(texts)} texts.")
+        if not texts:
+            return []
+
+        ids = [doc_id or str(uuid.uuid4()) for doc_id in ids] if ids else [str(uuid.uuid4()) for _ in texts]
+        metadatas = metadatas or [{} for _ in texts]
+        rows: np.ndarray = _normalize(np.asarray(vectors, dtype=np.float32)).astype(self.dtype)
+
+        with self._lock:
+            self.delete([doc_id for doc_id in ids if doc_id in self._positions])
+            if not self._positions:
+                # Nothing left to keep, so the store starts over and may change dimension
+                self._clear()
+            elif rows.shape[1] != self._dimension:
+                raise ValueError(f"Expected vectors of dimension {self._dimension}, got {rows.shape[1]}")
+
+            self._dimension = rows.shape[1]
+            self._pending_rows.append(rows)
+            for doc_id in ids:
+                self._positions[doc_id] = len(self._ids)
+                self._ids.append(doc_id)
+            self._texts.extend(texts)
+            self._metadatas.extend(metadatas)
+
+        return ids
+
+    def _clear(self):
+        """
+        Drop every row, deleted or not. Called with the lock held.
+        """
+        self._matrix = np.empty((0, 0), dtype=self.dtype)
+        self._pending_rows = []
+        self._deleted = set()
+        self._dimension = None
+        self._ids = []
+        self._texts = []
+        self._metadatas = []
+        self._positions = {}
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[list[dict[str, Any]]] = None,
+        *,
+        ids: Optional[list[str]] = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        texts = list(texts)
+        vectors: list[list[float]] = self.embedding.embed_documents(texts) if texts else []
+        return self._add_vectors(vectors, texts, metadatas, ids)
+
+    async def aadd_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[list[dict[str, Any]]] = None,
+        *,
+        ids: Optional[list[str]] = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        texts = list(texts)
+        vectors: list[list[float]] = await self.embedding.aembed_documents(texts) if texts else []
+        return self._add_vectors(vectors, texts, metadatas, ids)
+
+    def delete(self, ids: Optional[Sequence[str]] = None, **kwargs: Any) -> Optional[bool]:
+        if not ids:
+            return None
+
+        with self._lock:
+            doomed: set[int] = {self._positions.pop(doc_id) for doc_id in set(ids) if doc_id in self._positions}
+            if not doomed:
+                return False
+            # The rows are dropped when the matrix is next compacted
+            self._deleted |= doomed
+        return True
+
+    async def adelete(self, ids: Optional[Sequence[str]] = None, **kwargs: Any) -> Optional[bool]:
+        return self.delete(ids, **kwargs)
+
+    def _document(self, position: int) -> Document:
+        """
+        :param position: Row of the matrix
+        :return: The document stored at that row
+        """
+        return Document(id=self._ids[position], page_content=self._texts[position], metadata=self._metadatas[position])
+
+    def get_by_ids(self, ids: Sequence[str], /) -> list[Document]:
+        with self._lock:
+            return [self._document(self._positions[doc_id]) for doc_id in ids if doc_id in self._positions]
+
+    def similarity_search_with_score_by_vector(
+        self, embedding: list[float], k: int = 4, **kwargs: Any
+    ) -> list[tuple[Document, float]]:
+        """
+        :param embedding: Query vector
+        :param k: Number of documents to return
+        :param kwargs: May contain "filter", a function that returns True for the documents to consider,
+            as for InMemoryVectorStore
+        :return: Up to k (document, cosine similarity) tuples, most similar first
+        """
+        with self._lock:
+            self._compact()
+            positions: np.ndarray = np.arange(len(self._ids))
+            doc_filter: Optional[Callable[[Document], bool]] = kwargs.get("filter")
+            if doc_filter is not None:
+                positions = np.asarray(
+                    [position for position in range(len(self._ids)) if doc_filter(self._document(position))],
+                    dtype=np.intp,
+                )
+
+            k = min(k, len(positions))
+            if k <= 0:
+                return []
+
+            query: np.ndarray = _normalize(np.asarray([embedding], dtype=np.float32))[0]
+            matrix: np.ndarray = self._matrix if doc_filter is None else self._matrix[positions]
+            scores: np.ndarray = matrix @ query.astype(self.dtype)
+
+            # Partial sort: only the top k rows need ordering
+            top: np.ndarray = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+
+            return [(self._document(int(positions[row])), float(scores[row])) for row in top]
+
+    # The signatures are those of InMemoryVectorStore; VectorStore only declares (*args, **kwargs).
+    # pylint: disable=arguments-differ
+    def similarity_search_with_score(self, query: str, k: int = 4, **kwargs: Any) -> list[tuple[Document, float]]:
+        return self.similarity_search_with_score_by_vector(self.embedding.embed_query(query), k, **kwargs)
+
+    async def asimilarity_search_with_score(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> list[tuple[Document, float]]:
+        embedding: list[float] = await self.embedding.aembed_query(query)
+        return self.similarity_search_with_score_by_vector(embedding, k, **kwargs)
+
+    # pylint: enable=arguments-differ
+    def similarity_search_by_vector(self, embedding: list[float], k: int = 4, **kwargs: Any) -> list[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k, **kwargs)]
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs: Any) -> list[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, **kwargs)]
+
+    async def asimilarity_search(self, query: str, k: int = 4, **kwargs: Any) -> list[Document]:
+        return [doc for doc, _ in await self.asimilarity_search_with_score(query, k, **kwargs)]
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        # Scores are already cosine similarities
+        return lambda score: score
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: list[str],
+        embedding: Embeddings,
+        metadatas: Optional[list[dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> "MmapVectorStore":
+        store = cls(embedding=embedding, dtype=kwargs.pop("dtype", DEFAULT_DTYPE))
+        store.add_texts(texts=texts, metadatas=metadatas, **kwargs)
+        return store
+
+    @classmethod
+    async def afrom_texts(
+        cls,
+        texts: list[str],
+        embedding: Embeddings,
+        metadatas: Optional[list[dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> "MmapVectorStore":
+        store = cls(embedding=embedding, dtype=kwargs.pop("dtype", DEFAULT_DTYPE))
+        await store.aadd_texts(texts=texts, metadatas=metadatas, **kwargs)
+        return store
+
+    @classmethod
+    def load(cls, path: str, embedding: Embeddings) -> "MmapVectorStore":
+        """
+        Load a vector store, memory-mapping its matrix read-only.
+
+        :param path: Path of the vector store
+        :param embedding: Embeddings model used for queries and added texts
+        :return: The loaded vector store
+        :raises FileNotFoundError: If the sidecar or the matrix it names does not exist
+        :raises ValueError: If the matrix, the sidecar and the embeddings model do not match
+        """
+        try:
+            return cls._load(path, embedding)
+        except FileNotFoundError:
+            # A concurrent dump may have replaced the matrix between reading the sidecar and opening the matrix
+            if not os.path.exists(cls.get_sidecar_path(path)):
+                raise
+            return cls._load(path, embedding)
+
+    @classmethod
+    def _load(cls, path: str, embedding: Embeddings) -> "MmapVectorStore":
+        """
+        Load the generation of the vector store that its sidecar names.
+        """
+        sidecar_path: str = cls.get_sidecar_path(path)
+        with open(sidecar_path, "r", encoding="utf-8") as sidecar:
+            header: dict[str, Any] = cls._read_header(sidecar, sidecar_path)
+            matrix_path: str = os.path.join(os.path.dirname(path), header["matrix"])
+            try:
+                matrix: np.ndarray = np.load(matrix_path, mmap_mode="r")
+            except ValueError:
+                # Empty files cannot be memory-mapped
+                matrix = np.load(matrix_path)
+
+            store = cls(embedding=embedding, dtype=str(matrix.dtype))
+            # pylint: disable=protected-access
+            for line in sidecar:
+                row: dict[str, Any] = json.loads(line)
+                store._ids.append(row["id"])
+                store._texts.append(row["text"])
+                store._metadatas.append(row.get("metadata", {}))
+
+        if len(store._ids) != matrix.shape[0]:
+            raise ValueError(
+                f"{matrix_path} has {matrix.shape[0]} vectors but its sidecar has {len(store._ids)} entries"
+            )
+        if store._ids:
+            expected: Optional[int] = getattr(embedding, "dimensions", None) or header.get("dimension")
+            if expected and matrix.shape[1] != expected:
+                raise ValueError(f"{matrix_path} has vectors of dimension {matrix.shape[1]}, expected {expected}")
+            store._dimension = matrix.shape[1]
+
+        store._matrix = matrix
+        store._positions = {doc_id: position for position, doc_id in enumerate(store._ids)}
+        return store
+
+    def dump(self, path: str):
+        """
+        Write the matrix under a new generation name, then replace the sidecar, which names that matrix.
+        Replacing the sidecar is the only step readers can observe, so they see either the old
+        or the new sidecar and matrix together, never one of each. The previous matrix is then removed.
+
+        :param path: Path of the vector store
+        """
+        with self._lock:
+            self._compact()
+            self._dump(path)
+
+    def _dump(self, path: str):
+        """
+        Write the compacted store. Called with the lock held.
+
+        :param path: Path of the vector store
+        """
+        directory: str = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        sidecar_path: str = self.get_sidecar_path(path)
+        previous_matrix_path: Optional[str] = self._get_matrix_path(path)
+        matrix_name: str = f"{os.path.basename(os.path.splitext(path)[0])}.{uuid.uuid4().hex}.npy"
+        matrix_path: str = os.path.join(directory, matrix_name)
+        header: dict[str, Any] = {
+            "version": SIDECAR_VERSION,
+            "matrix": matrix_name,
+            "dimension": int(self._matrix.shape[1]) if self._ids else None,
+        }
+
+        sidecar_descriptor, sidecar_temp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with open(matrix_path, "xb") as matrix_file:
+                np.save(matrix_file, np.ascontiguousarray(self._matrix, dtype=self.dtype))
+            with os.fdopen(sidecar_descriptor, "w", encoding="utf-8") as sidecar:
+                self._write_sidecar(sidecar, header)
+
+            os.replace(sidecar_temp, sidecar_path)
+        except BaseException:
+            if os.path.exists(matrix_path):
+                os.remove(matrix_path)
+            raise
+        finally:
+            if os.path.exists(sidecar_temp):
+                os.remove(sidecar_temp)
+
+        if previous_matrix_path and previous_matrix_path != matrix_path:
+            try:
+                os.remove(previous_matrix_path)
+            except OSError as os_error:
+                # Still memory-mapped on platforms that do not allow that, or already gone
+                logger.debug("Could not remove previous matrix %s: %s", previous_matrix_path, os_error)
+
+        logger.info("Dumped %d vectors to %s", len(self._ids), matrix_path)
+
+    def _write_sidecar(self, sidecar: TextIO, header: dict[str, Any]):
+        """
+        :param sidecar: File to write the header and the rows to
+        :param header: The header line, naming the matrix
+        """
+        sidecar.write(json.dumps(header) + "\n")
+        for doc_id, text, metadata in zip(self._ids, self._texts, self._metadatas):
+            sidecar.write(json.dumps({"id": doc_id, "text": text, "metadata": metadata}, default=str) + "\n")
+
+    @classmethod
+    def _get_matrix_path(cls, path: str) -> Optional[str]:
+        """
+        :param path: Path of the vector store
+        :return: Path of the matrix the current sidecar names, or None if there is no valid sidecar
+        """
+        sidecar_path: str = cls.get_sidecar_path(path)
+        try:
+            with open(sidecar_path, "r", encoding="utf-8") as sidecar:
+                return os.path.join(os.path.dirname(path), cls._read_header(sidecar, sidecar_path)["matrix"])
+        except (OSError, ValueError, KeyError):
+            return None
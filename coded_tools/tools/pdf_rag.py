@@ -19,6 +19,7 @@
 import logging
 import os
 from typing import Any
+from typing import AsyncIterator
 from typing import Dict
 from typing import List
 
@@ -46,8 +47,15 @@ class PdfRag(CodedTool, BaseRag):
         :param args: Dictionary containing:
           "query": search string
           "urls": list of pdf files
-          "save_vector_store": save to JSON file if True
+          "save_vector_store": save to a JSON or binary file if True
           "vector_store_path": relative path to this file
+          "incremental_update": re-embed only changed sources of an existing vector store if True
+          "share_vector_store": reuse the vector store built by other invocations if True (default)
+          "vector_store_dtype": "float32" or "float16" storage for a binary ".npy" vector store
+          "chunk_size", "chunk_overlap": tokens per chunk and tokens shared by consecutive chunks
+          "embedding_batch_size", "embedding_concurrency": chunks per embedding call and calls in flight
+          "top_k", "score_threshold", "keyword_score_threshold": number of results and minimum scores
+          "hybrid_search", "ann_index": fuse BM25 keyword search with vector search, approximate vector search
 
         :param sly_data: A dictionary whose keys are defined by the agent
             hierarchy, but whose values are meant to be kept out of the
@@ -81,9 +89,18 @@ class PdfRag(CodedTool, BaseRag):
         # Save the generated vector store as a JSON file if True
         self.save_vector_store = args.get("save_vector_store", False)
 
+        # Configure incremental updates, sharing and the storage type of a binary ".npy" vector store
+        self.configure_vector_store(args)
+
         # Configure the vector store path
         self.configure_vector_store_path(args.get("vector_store_path"))
 
+        # Configure chunking and embedding batches
+        self.configure_ingestion(args)
+
+        # Configure the number of results, score thresholds and hybrid keyword search
+        self.configure_retrieval(args)
+
         # For PostgreSQL vector store
         if vector_store_type == "postgres":
             postgres_config = PostgresConfig(
@@ -113,17 +130,33 @@ class PdfRag(CodedTool, BaseRag):
         :return: List of loaded PDF documents
         """
         docs: List[Document] = []
+        async for url_docs in self.alazy_load_documents(loader_args):
+            docs.extend(url_docs)
+
+        return docs
+
+    async def alazy_load_documents(self, loader_args: Dict[str, Any]) -> AsyncIterator[List[Document]]:
+        """
+        Load PDF documents one URL at a time, so earlier PDFs are split and embedded
+        while later ones are still downloading.
+
+        :param loader_args: Dictionary containing 'urls' (list of PDF file URLs)
+        :return: Async iterator over the pages of each PDF
+        """
         urls: List[str] = loader_args.get("urls", [])
 
         for url in urls:
             try:
                 loader = PyMuPDFLoader(file_path=url)
                 doc: List[Document] = await loader.aload()
-                docs.extend(doc)
                 logger.info("Successfully loaded PDF file from %s", url)
             except FileNotFoundError:
                 logger.error("File not found: %s", url)
+                self.unavailable_sources.add(url)
+                continue
             except ValueError as e:
                 logger.error("Invalid file path or unsupported input: %s – %s", url, e)
+                self.unavailable_sources.add(url)
+                continue
 
-        return docs
+            yield doc
@@ -0,0 +1,154 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Per-source fingerprints of the documents indexed in a RAG vector store"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import uuid
+from typing import Any
+from typing import Optional
+
+from langchain_core.documents import Document
+
+# Namespace for deterministic chunk ids
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c1f0e-3f55-4b8e-9a39-0c6c1d0f5a11")
+MANIFEST_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+class SourceManifest:
+    """
+    Records, for every source document (URL or file path) in a vector store,
+    a fingerprint of its content and the ids of the chunks it produced.
+
+    Comparing a stored fingerprint against that of freshly loaded documents tells
+    whether a source changed, so that only changed sources are re-split and
+    re-embedded, and the chunks of removed sources deleted.
+    """
+
+    def __init__(self, sources: Optional[dict[str, dict[str, Any]]] = None):
+        """
+        :param sources: Dictionary of source -> {"fingerprint": str, "ids": list of chunk ids}
+        """
+        self.sources: dict[str, dict[str, Any]] = sources or {}
+
+    @staticmethod
+    def get_source(doc: Document) -> str:
+        """
+        :param doc: A loaded document
+        :return: The source the document was loaded from
+        """
+        return str(doc.metadata.get("source", ""))
+
+    @staticmethod
+    def group_by_source(docs: list[Document]) -> dict[str, list[Document]]:
+        """
+        :param docs: Loaded documents. Loaders like PDF loaders return one document per page.
+        :return: Dictionary of source -> documents loaded from that source, in load order
+        """
+        grouped: dict[str, list[Document]] = {}
+        for doc in docs:
+            grouped.setdefault(SourceManifest.get_source(doc), []).append(doc)
+        return grouped
+
+    @staticmethod
+    def fingerprint(docs: list[Document], salt: str = "") -> str:
+        """
+        :param docs: All documents loaded from one source
+        :param salt: Settings that change how the documents are indexed, such as the chunking
+        :return: Content hash of the documents
+        """
+        digest = hashlib.sha256()
+        digest.update(salt.encode("utf-8"))
+        digest.update(b"\x00")
+        for doc in docs:
+            digest.update(doc.page_content.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    @staticmethod
+    def chunk_id(source: str, index: int, text: str) -> str:
+        """
+        :param source: Source the chunk came from
+        :param index: Position of the chunk within its source
+        :param text: Text of the chunk
+        :return: Deterministic UUID string for the chunk
+        """
+        return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{source}\x00{index}\x00{text}"))
+
+    def chunk_ids(self, source: str) -> list[str]:
+        """
+        :param source: A source in the manifest
+        :return: Ids of the chunks produced from the source
+        """
+        return list(self.sources.get(source, {}).get("ids", []))
+
+    def set_source(self, source: str, fingerprint: str, ids: list[str]):
+        """
+        Record the fingerprint and chunk ids of a source.
+        """
+        self.sources[source] = {"fingerprint": fingerprint, "ids": ids}
+
+    def remove_source(self, source: str):
+        """
+        Forget a source.
+        """
+        self.sources.pop(source, None)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["SourceManifest"]:
+        """
+        :param path: Path to the manifest JSON file
+        :return: The manifest, or None if it does not exist or cannot be read
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as manifest_file:
+                content: dict[str, Any] = json.load(manifest_file)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as error:
+            logger.warning("Ignoring unreadable source manifest %s: %s", path, error)
+            return None
+
+        if content.get("version") != MANIFEST_VERSION:
+            logger.warning("Ignoring source manifest %s with unsupported version", path)
+            return None
+
+        return cls(content.get("sources", {}))
+
+    def save(self, path: str):
+        """
+        Atomically write the manifest to a JSON file.
+
+        :param path: Path to the manifest JSON file
+        """
+        directory: str = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as manifest_file:
+                json.dump({"version": MANIFEST_VERSION, "sources": self.sources}, manifest_file)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
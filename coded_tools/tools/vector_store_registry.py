@@ -0,0 +1,237 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Process-wide registry that shares built vector stores across RAG tool invocations"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+
+from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores import VectorStore
+
+from coded_tools.tools.mmap_vector_store import MmapVectorStore
+
+# Environment variables that control eviction
+VECTOR_STORE_TTL_ENV = "RAG_VECTOR_STORE_TTL_SECONDS"
+VECTOR_STORE_MAX_BYTES_ENV = "RAG_VECTOR_STORE_MAX_BYTES"
+
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Rough per-float cost of a vector held as a Python list of floats
+PYTHON_FLOAT_BYTES = 32
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(vectorstore: VectorStore) -> int:
+    """
+    :param vectorstore: A vector store
+    :return: Approximate number of bytes of memory the vector store holds.
+        Stores kept outside the process, like postgres, count as 0.
+    """
+    if isinstance(vectorstore, MmapVectorStore):
+        return int(vectorstore.matrix.nbytes) + sum(len(text) for text in vectorstore.texts)
+
+    if isinstance(vectorstore, InMemoryVectorStore):
+        return sum(
+            len(entry["vector"]) * PYTHON_FLOAT_BYTES + len(entry["text"]) for entry in vectorstore.store.values()
+        )
+
+    return 0
+
+
+def make_registry_key(**parts: Any) -> str:
+    """
+    :param parts: Everything that determines the contents of a vector store,
+        such as the tool, the loader arguments and the embedding model
+    :return: Stable key for the registry. Hashed, so credentials in loader arguments are not kept around.
+    """
+    serialized: str = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class BuildAbandonedError(Exception):
+    """Raised to the callers waiting for a build when the caller that was building is cancelled."""
+
+
+@dataclass
+class RegistryEntry:
+    """A vector store held by the registry."""
+
+    vectorstore: VectorStore
+    size: int
+    last_used: float
+
+
+class VectorStoreRegistry:
+    """
+    Shares built vector stores across tool invocations and agent sessions.
+
+    Concurrent requests for the same key are single-flighted: the first caller
+    builds the vector store and everyone else waits for that build instead of
+    downloading, splitting and embedding the same sources again. Stores that
+    have not been used for ttl_seconds are dropped, and the least recently used
+    ones are dropped once the total estimated size exceeds max_bytes.
+
+    Coded tools may run on different event loops in different threads,
+    so in-flight builds are tracked with thread-safe futures.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        :param ttl_seconds: Idle time after which a vector store is dropped
+        :param max_bytes: Budget for the total estimated size of the held vector stores
+        """
+        self.ttl_seconds: float = ttl_seconds
+        self.max_bytes: int = max_bytes
+        self._entries: dict[str, RegistryEntry] = {}
+        self._building: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    async def get_or_build(
+        self, key: str, builder: Callable[[], Awaitable[Optional[VectorStore]]]
+    ) -> Optional[VectorStore]:
+        """
+        :param key: Key identifying the vector store, see make_registry_key()
+        :param builder: Coroutine function that builds the vector store if it is not held yet
+        :return: The shared vector store, or None if the build produced none
+        """
+        while True:
+            with self._lock:
+                self._evict_expired()
+                entry: Optional[RegistryEntry] = self._entries.get(key)
+                if entry is not None:
+                    entry.last_used = time.monotonic()
+                    logger.info("Reusing shared vector store %s", key[:12])
+                    return entry.vectorstore
+
+                in_flight: Optional[Future] = self._building.get(key)
+                if in_flight is None:
+                    self._building[key] = Future()
+
+            if in_flight is None:
+                return await self._build(key, builder)
+
+            logger.info("Waiting for in-flight build of vector store %s", key[:12])
+            try:
+                # Shielded, so that a waiter being cancelled does not cancel the build for everyone else
+                return await asyncio.shield(asyncio.wrap_future(in_flight))
+            except BuildAbandonedError:
+                # The caller that was building went away. One of the waiters takes over.
+                logger.info("Build of vector store %s was abandoned. Taking over.", key[:12])
+
+    async def _build(self, key: str, builder: Callable[[], Awaitable[Optional[VectorStore]]]) -> Optional[VectorStore]:
+        """
+        Run the builder and publish its result to every waiter.
+        """
+        future: Future = self._building[key]
+        try:
+            vectorstore: Optional[VectorStore] = await builder()
+        except Exception as error:
+            with self._lock:
+                self._building.pop(key, None)
+            future.set_exception(error)
+            raise
+        except BaseException:
+            # Cancelled: the build did not fail, so the waiters must not fail with it
+            with self._lock:
+                self._building.pop(key, None)
+            future.set_exception(BuildAbandonedError(key))
+            raise
+
+        with self._lock:
+            self._building.pop(key, None)
+            if vectorstore is not None:
+                self._entries[key] = RegistryEntry(vectorstore, estimate_size(vectorstore), time.monotonic())
+                self._evict_over_budget(key)
+        future.set_result(vectorstore)
+        return vectorstore
+
+    def invalidate(self, key: str):
+        """
+        Drop a vector store, so that the next request builds it again.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def _evict_expired(self):
+        """
+        Drop vector stores idle for longer than the TTL. Assumes the lock is held.
+        """
+        now: float = time.monotonic()
+        expired: list[str] = [key for key, entry in self._entries.items() if now - entry.last_used > self.ttl_seconds]
+        for key in expired:
+            del self._entries[key]
+        if expired:
+            logger.info("Evicted %d idle vector stores", len(expired))
+
+    def _evict_over_budget(self, kept_key: str):
+        """
+        Drop the least recently used vector stores until the total size fits the budget.
+        Assumes the lock is held.
+
+        :param kept_key: Key of the vector store just built, which is kept even if it alone exceeds the budget,
+            since dropping it would only make the next request build it again
+        """
+        total: int = sum(entry.size for entry in self._entries.values())
+        for key, entry in sorted(self._entries.items(), key=lambda item: item[1].last_used):
+            if total <= self.max_bytes:
+                break
+            if key == kept_key:
+                continue
+            total -= entry.size
+            del self._entries[key]
+            logger.info("Evicted vector store %s to stay within %d bytes", key[:12], self.max_bytes)
+
+        if total > self.max_bytes:
+            logger.warning(
+                "Vector store %s alone takes about %d bytes, more than the %d bytes budget set by %s",
+                kept_key[:12],
+                total,
+                self.max_bytes,
+                VECTOR_STORE_MAX_BYTES_ENV,
+            )
+
+
+_REGISTRY: Optional[VectorStoreRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_vector_store_registry() -> VectorStoreRegistry:
+    """
+    :return: The process-wide vector store registry, configured by the environment
+    """
+    global _REGISTRY  # pylint: disable=global-statement
+
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = VectorStoreRegistry(
+                ttl_seconds=float(os.getenv(VECTOR_STORE_TTL_ENV, str(DEFAULT_TTL_SECONDS))),
+                max_bytes=int(os.getenv(VECTOR_STORE_MAX_BYTES_ENV, str(DEFAULT_MAX_BYTES))),
+            )
+        return _REGISTRY
@@ -17,12 +17,12 @@
 import logging
 import os
 from typing import Any
+from typing import AsyncIterator
 
 from langchain_community.document_loaders import WebBaseLoader
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
 from neuro_san.interfaces.coded_tool import CodedTool
-from requests.exceptions import HTTPError
 
 from coded_tools.tools.base_rag import BaseRag
 from coded_tools.tools.base_rag import PostgresConfig
@@ -44,8 +44,15 @@ class WebpageRag(CodedTool, BaseRag):
         :param args: Dictionary containing:
           "query": search string
           "urls": list of urls
-          "save_vector_store": save to JSON file if True
+          "save_vector_store": save to a JSON or binary file if True
           "vector_store_path": relative path to this file
+          "incremental_update": re-embed only changed sources of an existing vector store if True
+          "share_vector_store": reuse the vector store built by other invocations if True (default)
+          "vector_store_dtype": "float32" or "float16" storage for a binary ".npy" vector store
+          "chunk_size", "chunk_overlap": tokens per chunk and tokens shared by consecutive chunks
+          "embedding_batch_size", "embedding_concurrency": chunks per embedding call and calls in flight
+          "top_k", "score_threshold", "keyword_score_threshold": number of results and minimum scores
+          "hybrid_search", "ann_index": fuse BM25 keyword search with vector search, approximate vector search
 
         :param sly_data: A dictionary whose keys are defined by the agent
             hierarchy, but whose values are meant to be kept out of the
@@ -79,9 +86,18 @@ class WebpageRag(CodedTool, BaseRag):
         # Save the generated vector store as a JSON file if True
         self.save_vector_store = args.get("save_vector_store", False)
 
+        # Configure incremental updates, sharing and the storage type of a binary ".npy" vector store
+        self.configure_vector_store(args)
+
         # Configure the vector store path
         self.configure_vector_store_path(args.get("vector_store_path"))
 
+        # Configure chunking and embedding batches
+        self.configure_ingestion(args)
+
+        # Configure the number of results, score thresholds and hybrid keyword search
+        self.configure_retrieval(args)
+
         # For PostgreSQL vector store
         if vector_store_type == "postgres":
             postgres_config = PostgresConfig(
@@ -111,18 +127,22 @@ class WebpageRag(CodedTool, BaseRag):
         :return: List of loaded documents
         """
         docs: list[Document] = []
+        async for url_docs in self.alazy_load_documents(loader_args):
+            docs.extend(url_docs)
+
+        return docs
+
+    async def alazy_load_documents(self, loader_args: dict[str, Any]) -> AsyncIterator[list[Document]]:
+        """
+        Load documents one URL at a time, so earlier pages are split and embedded
+        while later ones are still downloading.
+
+        :param loader_args: Dictionary containing 'urls' (list of file URLs)
+        :return: Async iterator over the document of each URL
+        """
         urls: list[str] = loader_args.get("urls", [])
 
         loader = WebBaseLoader(web_path=urls)
         async for doc in loader.alazy_load():
-            try:
-                docs.append(doc)
-                logger.info("Successfully loaded PDF file from %s", doc.metadata.get("source", "unknown source"))
-            except HTTPError as http_e:
-                logger.error("HTTP error occurred: %s", http_e)
-            except FileNotFoundError as fnf_e:
-                logger.error("File not found: %s", fnf_e)
-            except ValueError as val_e:
-                logger.error("Value error: %s", val_e)
-
-        return docs
+            logger.info("Successfully loaded webpage from %s", doc.metadata.get("source", "unknown source"))
+            yield [doc]
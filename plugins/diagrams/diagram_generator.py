@@ -0,0 +1,237 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Building the HTML diagrams of the agent networks in the registries, skipping those that are up to date.
+"""
+
+import contextlib
+import glob
+import hashlib
+import importlib.metadata
+import importlib.util
+import io
+import json
+import os
+import re
+import runpy
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+DIAGRAM_BUILDER_PACKAGE = "neuro-san-web-client"
+DIAGRAM_BUILDER_MODULE = "neuro_san_web_client.agents_diagram_builder"
+
+# Include statements of a HOCON file: include "file", include file("file") and include required(...)
+INCLUDE_PATTERN = re.compile(r'^\s*include\s+(?:required\(\s*)?(?:file\(\s*)?"([^"]+)"', re.MULTILINE)
+
+
+def build_diagram(file: str) -> Tuple[str, str]:
+    """
+    Run the diagram builder on one registry file inside a pool worker,
+    so the interpreter and its imports are paid for once per worker rather than once per file.
+    Returns the builder output and an error message, which is empty on success.
+    """
+    output = io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = [DIAGRAM_BUILDER_MODULE, "--input_file", file]
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            runpy.run_module(DIAGRAM_BUILDER_MODULE, run_name="__main__")
+    except SystemExit as exit_error:
+        if exit_error.code not in (None, 0):
+            return output.getvalue(), f"exited with status {exit_error.code}"
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return output.getvalue(), f"{type(error).__name__}: {error}"
+    finally:
+        sys.argv = saved_argv
+    return output.getvalue(), ""
+
+
+def get_builder_static_dir() -> Optional[str]:
+    """
+    :return: Directory the diagram builder writes its .html files to, or None if the builder is not installed.
+    """
+    spec = importlib.util.find_spec(DIAGRAM_BUILDER_MODULE.split(".", maxsplit=1)[0])
+    if spec is None or spec.origin is None:
+        return None
+    return os.path.join(os.path.dirname(spec.origin), "static")
+
+
+def get_builder_version() -> str:
+    """
+    :return: Installed version of the diagram builder, or an empty string if it is not installed.
+    """
+    try:
+        return importlib.metadata.version(DIAGRAM_BUILDER_PACKAGE)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+class DiagramGenerator:
+    """
+    Builds the .html diagram of every agent network in a registry directory, in parallel.
+
+    A network is skipped if its hash, which covers its content, the content of the files it includes
+    and the builder version, matches that of its last successful build and its .html file still exists.
+    Manifests and the fragments other registry files include are not networks, so they are never built.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        root_dir: str,
+        hash_file: str,
+        static_dir: Optional[str] = None,
+        builder_version: Optional[str] = None,
+        build: Callable[[str], Tuple[str, str]] = build_diagram,
+    ):
+        """
+        :param root_dir: Directory that contains the "registries" directory, and that include paths are relative to
+        :param hash_file: JSON file recording the hash of the last successful build of each network
+        :param static_dir: Directory the builder writes .html files to. None to find it from the installed builder.
+        :param builder_version: Version of the builder. None to read the installed one.
+        :param build: Function that builds the diagram of one registry file, as build_diagram() does.
+            It runs in worker processes, so it must be a module-level function.
+        """
+        self.root_dir: str = root_dir
+        self.hash_file: str = hash_file
+        self.static_dir: Optional[str] = static_dir if static_dir is not None else get_builder_static_dir()
+        self.builder_version: str = builder_version if builder_version is not None else get_builder_version()
+        self.build: Callable[[str], Tuple[str, str]] = build
+
+    def get_network_files(self) -> List[str]:
+        """
+        :return: Registry files that define agent networks, relative to the root directory
+        """
+        files: List[str] = sorted(
+            os.path.relpath(path, self.root_dir)
+            for path in glob.glob(os.path.join(self.root_dir, "registries", "**", "*.hocon"), recursive=True)
+        )
+        fragments: Set[str] = set()
+        for file in files:
+            fragments.update(self._get_includes(file))
+        return [file for file in files if not os.path.basename(file).startswith("manifest") and file not in fragments]
+
+    def _resolve(self, include: str, including_file: str) -> Optional[str]:
+        """
+        :param include: Path of an include statement
+        :param including_file: Registry file with the include statement, relative to the root directory
+        :return: Path of the included file relative to the root directory, or None if it does not exist
+        """
+        for base in (self.root_dir, os.path.join(self.root_dir, os.path.dirname(including_file))):
+            path: str = os.path.normpath(os.path.join(base, include))
+            if os.path.isfile(path):
+                return os.path.relpath(path, self.root_dir)
+        return None
+
+    def _get_includes(self, file: str) -> List[str]:
+        """
+        :param file: Registry file, relative to the root directory
+        :return: Files it includes that exist, relative to the root directory
+        """
+        with open(os.path.join(self.root_dir, file), "r", encoding="utf-8") as registry_file:
+            includes: List[str] = INCLUDE_PATTERN.findall(registry_file.read())
+        return [path for path in (self._resolve(include, file) for include in includes) if path is not None]
+
+    def get_hash(self, file: str) -> str:
+        """
+        :param file: Registry file, relative to the root directory
+        :return: Hash of the builder version and of the content of the file and of every file it includes
+        """
+        digest = hashlib.sha256(self.builder_version.encode("utf-8"))
+        seen: Set[str] = set()
+        pending: List[str] = [file]
+        while pending:
+            current: str = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            with open(os.path.join(self.root_dir, current), "rb") as registry_file:
+                digest.update(current.encode("utf-8") + b"\0" + registry_file.read() + b"\0")
+            pending.extend(self._get_includes(current))
+        return digest.hexdigest()
+
+    def get_diagram_path(self, file: str) -> Optional[str]:
+        """
+        :param file: Registry file, relative to the root directory
+        :return: Path of the .html file the builder writes for it, or None if the builder is not installed
+        """
+        if self.static_dir is None:
+            return None
+        return os.path.join(self.static_dir, os.path.splitext(os.path.basename(file))[0] + ".html")
+
+    def is_up_to_date(self, file: str, content_hash: str, built_hashes: Dict[str, str]) -> bool:
+        """
+        :param file: Registry file, relative to the root directory
+        :param content_hash: Current hash of the file, see get_hash()
+        :param built_hashes: Dictionary of registry file -> hash of its last successful build
+        :return: True if the diagram was built from the same content and its .html file is still there
+        """
+        if built_hashes.get(file) != content_hash:
+            return False
+        diagram_path: Optional[str] = self.get_diagram_path(file)
+        return diagram_path is None or os.path.isfile(diagram_path)
+
+    def _load_hashes(self) -> Dict[str, str]:
+        """
+        :return: Dictionary of registry file -> hash of its last successful build
+        """
+        try:
+            with open(self.hash_file, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def generate(self) -> Dict[str, str]:
+        """
+        Build the diagrams of the networks that changed since their last successful build.
+        A network that fails to build is reported and tried again next time.
+        :return: Dictionary of registry file -> error message, for the networks that failed to build
+        """
+        built_hashes: Dict[str, str] = self._load_hashes()
+        to_build: Dict[str, str] = {}
+        for file in self.get_network_files():
+            content_hash: str = self.get_hash(file)
+            if not self.is_up_to_date(file, content_hash, built_hashes):
+                to_build[file] = content_hash
+
+        print(f"Generating .html files for {len(to_build)} changed registry files")
+        errors: Dict[str, str] = {}
+        if not to_build:
+            return errors
+
+        with ProcessPoolExecutor(max_workers=min(len(to_build), os.cpu_count() or 1)) as executor:
+            paths: List[str] = [os.path.join(self.root_dir, file) for file in to_build]
+            for file, (output, error) in zip(to_build, executor.map(self.build, paths)):
+                if output:
+                    print(output)
+                if error:
+                    print(f"Failed to generate .html file for {file}: {error}", file=sys.stderr)
+                    errors[file] = error
+                    built_hashes.pop(file, None)
+                else:
+                    print(f"Generated .html file for: {file}")
+                    built_hashes[file] = to_build[file]
+
+        os.makedirs(os.path.dirname(self.hash_file) or ".", exist_ok=True)
+        with open(self.hash_file, "w", encoding="utf-8") as file:
+            json.dump(built_hashes, file, indent=2)
+        return errors
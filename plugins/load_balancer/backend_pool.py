@@ -0,0 +1,64 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Choice of the worker a load balancer forwards a connection to.
+"""
+
+import time
+from typing import List
+from typing import Tuple
+
+# Seconds a backend that refused a connection is skipped, e.g. while its worker restarts
+BACKEND_RETRY_SECONDS = 1.0
+
+
+class BackendPool:
+    """
+    The backends of a load balancer, with the number of connections open to each
+    and the ones that recently refused a connection.
+    Only used from the event loop of the load balancer, so it needs no lock.
+    """
+
+    def __init__(self, backends: List[Tuple[str, int]]):
+        """
+        :param backends: List of (host, port) of the workers
+        """
+        self.backends = backends
+        self.active_connections = [0] * len(backends)
+        self._down_until = [0.0] * len(backends)
+        self._next = 0
+
+    def candidates(self) -> List[int]:
+        """
+        :return: Backend indexes to try, least connections first, taking turns among equally loaded ones
+                and skipping the recently refused ones
+        """
+        now = time.monotonic()
+        count = len(self.backends)
+        # Rotate the starting point so that ties are broken round-robin
+        order = [(self._next + offset) % count for offset in range(count)]
+        self._next = (self._next + 1) % count
+        available = [index for index in order if self._down_until[index] <= now]
+        # If every backend looks down, try them all anyway rather than refusing the client
+        return sorted(available or order, key=lambda index: self.active_connections[index])
+
+    def mark_down(self, index: int):
+        """
+        Skip a backend for a while, after it refused a connection.
+
+        :param index: Index of the backend
+        """
+        self._down_until[index] = time.monotonic() + BACKEND_RETRY_SECONDS
@@ -0,0 +1,132 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Lightweight local TCP load balancer used by run.py to spread connections over several server workers.
+"""
+
+import asyncio
+import threading
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from plugins.load_balancer.backend_pool import BackendPool
+
+CONNECT_TIMEOUT_SECONDS = 5.0
+BUFFER_SIZE = 65536
+
+
+class TcpLoadBalancer:
+    """
+    Forwards each accepted connection to the backend with the fewest open connections,
+    taking turns among equally loaded ones. Works for HTTP and gRPC alike, since it
+    only copies bytes. Runs its own event loop in a daemon thread.
+
+    Requests are balanced per TCP connection, not per request. HTTP/1 clients, which open
+    connections as they need them, are spread over the workers. A gRPC channel sends all of its
+    calls over one HTTP/2 connection, so they all go to the same worker; only separate channels,
+    for instance separate clients, are spread.
+    """
+
+    def __init__(self, name: str, host: str, port: int, backends: List[Tuple[str, int]]):
+        """
+        :param name: Label used in messages
+        :param host: Host to listen on
+        :param port: Port to listen on
+        :param backends: List of (host, port) of the workers
+        """
+        self.name = name
+        self.host = host
+        self.port = port
+        self.pool = BackendPool(backends)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start listening in a background thread. Returns once the port is bound."""
+        bound = threading.Event()
+        errors: List[BaseException] = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._server = self._loop.run_until_complete(
+                    asyncio.start_server(self._handle_client, self.host, self.port)
+                )
+            except OSError as error:
+                errors.append(error)
+                bound.set()
+                return
+            bound.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name=f"{self.name}-balancer", daemon=True)
+        self._thread.start()
+        bound.wait()
+        if errors:
+            raise errors[0]
+        print(f"{self.name} load balancer listening on {self.host}:{self.port} for {self.pool.backends}")
+
+    def stop(self):
+        """Stop listening and stop the event loop."""
+        if self._loop is None:
+            return
+        if self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    async def _handle_client(self, client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter):
+        """Connect an accepted client to a backend and copy bytes both ways until both sides finish."""
+        for index in self.pool.candidates():
+            host, port = self.pool.backends[index]
+            try:
+                backend_reader, backend_writer = await asyncio.wait_for(
+                    asyncio.open_connection(host, port), CONNECT_TIMEOUT_SECONDS
+                )
+            except (OSError, asyncio.TimeoutError):
+                self.pool.mark_down(index)
+                continue
+
+            self.pool.active_connections[index] += 1
+            try:
+                await asyncio.gather(
+                    self._pipe(client_reader, backend_writer), self._pipe(backend_reader, client_writer)
+                )
+            finally:
+                self.pool.active_connections[index] -= 1
+                backend_writer.close()
+                client_writer.close()
+            return
+
+        client_writer.close()
+
+    @staticmethod
+    async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Copy bytes from reader to writer, then pass the end of stream on."""
+        try:
+            while True:
+                data = await reader.read(BUFFER_SIZE)
+                if not data:
+                    break
+                writer.write(data)
+                await writer.drain()
+            if writer.can_write_eof():
+                writer.write_eof()
+        except (ConnectionError, OSError, RuntimeError):
+            # The other side went away; closing both ends is left to the caller
+            writer.close()
@@ -0,0 +1,132 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Keeps the server workers behind the load balancers of run.py running.
+"""
+
+import os
+import signal
+import subprocess
+import threading
+import time
+from typing import Callable
+from typing import List
+from typing import Optional
+
+# A worker that stayed up this long starts over with a short restart delay after its next crash
+HEALTHY_UPTIME_SECONDS = 60.0
+MAX_RESTART_DELAY_SECONDS = 60.0
+POLL_INTERVAL_SECONDS = 0.5
+
+
+class WorkerSupervisor:
+    """
+    Starts the server workers and restarts the ones that exit. Consecutive crashes of a worker
+    back off exponentially up to a minute.
+
+    Workers are started and killed under the same lock, so a restart under way when the supervisor
+    is stopped either finishes before the workers are killed, or does not happen at all.
+    """
+
+    def __init__(self, count: int, start_worker: Callable[[int, bool], subprocess.Popen]):
+        """
+        :param count: Number of workers
+        :param start_worker: Function that starts the worker of the given index and returns its process.
+                    Its second argument is True for restarts, which keep the log of the worker.
+        """
+        self.start_worker = start_worker
+        self.processes: List[Optional[subprocess.Popen]] = [None] * count
+        self._started_at: List[float] = [0.0] * count
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """
+        Start the workers and supervise them in a background thread. Returns once every worker is started.
+        The workers are started by that thread too, so a signal handler calling stop() meanwhile
+        never waits on a lock held by the thread it interrupted.
+        """
+        started = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(started,), name="worker-supervisor", daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        """
+        Stop restarting workers and kill the running ones.
+        """
+        self._stopping.set()
+        with self._lock:
+            for index, process in enumerate(self.processes):
+                if process is not None and process.poll() is None:
+                    print(f"Stopping SERVER WORKER {index} (PID {process.pid})...")
+                    if os.name == "nt":
+                        process.terminate()
+                    else:
+                        os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+
+    def join(self):
+        """
+        Wait until the supervisor is stopped.
+        """
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self, started: threading.Event):
+        """
+        Start the workers, then restart the ones that exit until stopped.
+
+        :param started: Event set once the workers are started
+        """
+        try:
+            for index in range(len(self.processes)):
+                self._start(index, False)
+        finally:
+            started.set()
+
+        failures = [0] * len(self.processes)
+        restart_at: List[Optional[float]] = [None] * len(self.processes)
+        while not self._stopping.wait(POLL_INTERVAL_SECONDS):
+            now = time.monotonic()
+            for index, process in enumerate(self.processes):
+                if restart_at[index] is not None:
+                    if now >= restart_at[index]:
+                        restart_at[index] = None
+                        self._start(index, True)
+                    continue
+                if process is None or process.poll() is None:
+                    continue
+
+                if now - self._started_at[index] >= HEALTHY_UPTIME_SECONDS:
+                    failures[index] = 0
+                failures[index] += 1
+                delay = min(2.0 ** (failures[index] - 1), MAX_RESTART_DELAY_SECONDS)
+                print(f"NeuroSan worker {index} exited with code {process.returncode}. Restarting in {delay:.0f}s...")
+                restart_at[index] = now + delay
+
+    def _start(self, index: int, append: bool):
+        """
+        Start a worker, unless the supervisor is stopping.
+
+        :param index: Index of the worker
+        :param append: True for restarts
+        """
+        with self._lock:
+            if self._stopping.is_set():
+                return
+            self.processes[index] = self.start_worker(index, append)
+            self._started_at[index] = time.monotonic()
@@ -16,12 +16,13 @@
 import logging
 import os
 import signal
-import socket
 import subprocess
 import sys
-import time
 from typing import Optional
 
+from plugins.readiness.readiness_probe import ReadinessProbe
+from plugins.readiness.readiness_probe import is_port_open
+
 try:
     from opentelemetry import trace
     from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
@@ -294,26 +295,6 @@ class PhoenixPlugin:
         print(f"PHOENIX_PROJECT_NAME set to: {os.environ['PHOENIX_PROJECT_NAME']}")
         print(f"PHOENIX_OTEL_REGISTER set to: {os.environ['PHOENIX_OTEL_REGISTER']}\n")
 
-    @staticmethod
-    def is_port_open(host: str, port: int, timeout: float = 1.0) -> bool:
-        """Check if a port is open on a given host.
-
-        Args:
-            host: Host address to check
-            port: Port number to check
-            timeout: Connection timeout in seconds
-
-        Returns:
-            True if the port is open, False otherwise.
-        """
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            try:
-                sock.connect((host, port))
-                return True
-            except (ConnectionRefusedError, TimeoutError, OSError):
-                return False
-
     def start_process(self, command: list, log_file: str):
         """Start a subprocess and return the process object.
 
@@ -354,11 +335,14 @@ class PhoenixPlugin:
         print(f"Started Phoenix with PID {process.pid}")
         return process
 
-    def start_phoenix_server(self) -> None:
-        """Start Phoenix server (UI + OTLP HTTP collector) if enabled."""
-        if str(self.config.get("phoenix_autostart", "false")).lower() not in ("true", "1", "yes", "on"):
-            return
-        if str(self.config.get("phoenix_enabled", "false")).lower() not in ("true", "1", "yes", "on"):
+    def start_phoenix_server(self, wait: bool = True) -> None:
+        """Start Phoenix server (UI + OTLP HTTP collector) if enabled.
+
+        Args:
+            wait: True to wait until Phoenix accepts connections. With False the caller
+                can start other services meanwhile and call wait_until_ready() later.
+        """
+        if not self.is_autostart_enabled():
             return
 
         print("Starting Phoenix (AI observability)...")
@@ -366,7 +350,7 @@ class PhoenixPlugin:
         phoenix_port = self.config.get("phoenix_port", 6006)
 
         # If something is already listening on PHOENIX_PORT, assume Phoenix is running and skip autostart
-        if self.is_port_open(phoenix_host, phoenix_port):
+        if is_port_open(phoenix_host, phoenix_port):
             phoenix_url = f"http://{phoenix_host}:{phoenix_port}"
             print(f"Phoenix detected at {phoenix_url} — skipping autostart.")
         else:
@@ -378,19 +362,8 @@ class PhoenixPlugin:
                 self.phoenix_process = self.start_process(
                     [sys.executable, "-m", "phoenix.server.main", "serve"], "logs/phoenix.log"
                 )
-
-                # Wait for Phoenix to bind to port (with retry)
-                phoenix_ready = False
-                for _ in range(10):  # Try for up to 10 seconds
-                    time.sleep(1)
-                    if self.is_port_open(phoenix_host, phoenix_port):
-                        phoenix_ready = True
-                        break
-
-                if phoenix_ready:
-                    print("Phoenix started successfully.")
-                else:
-                    print("Failed to start Phoenix automatically. Check logs/phoenix.log")
+                if wait:
+                    self.wait_until_ready()
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 print(f"Failed to start Phoenix automatically: {exc}")
 
@@ -400,6 +373,35 @@ class PhoenixPlugin:
             os.environ["OTEL_EXPORTER_OTLP_TRACES_ENDPOINT"] = default_otlp
             print(f"OTEL_EXPORTER_OTLP_TRACES_ENDPOINT updated to: {default_otlp}")
 
+    def is_autostart_enabled(self) -> bool:
+        """Return True if Phoenix is enabled and should be started by the runner."""
+        if str(self.config.get("phoenix_autostart", "false")).lower() not in ("true", "1", "yes", "on"):
+            return False
+        return str(self.config.get("phoenix_enabled", "false")).lower() in ("true", "1", "yes", "on")
+
+    def wait_until_ready(self, timeout: float = 10.0) -> bool:
+        """Wait for a Phoenix process started by this plugin to bind to its port.
+
+        Polls with a short, growing interval, so a quick start is noticed at once.
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            True if Phoenix accepts connections, False otherwise.
+        """
+        probe = ReadinessProbe(
+            "Phoenix",
+            self.config.get("phoenix_host", "127.0.0.1"),
+            self.config.get("phoenix_port", 6006),
+            process=self.phoenix_process,
+        )
+        if probe.wait(timeout) is None:
+            print("Failed to start Phoenix automatically. Check logs/phoenix.log")
+            return False
+        print("Phoenix started successfully.")
+        return True
+
     def stop_phoenix_server(self) -> None:
         """Stop the Phoenix process if it's running."""
         if self.phoenix_process:
@@ -0,0 +1,119 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Waiting for the components run.py starts to become ready, without fixed sleeps.
+"""
+
+import socket
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+
+@dataclass
+class ReadinessProbe:
+    """
+    How to tell that a component is ready: its port accepts connections and, if given, its URL answers with 200.
+    If its process is given, waiting stops as soon as the process exits.
+    """
+
+    name: str
+    host: str
+    port: int
+    url: Optional[str] = None
+    process: Optional[subprocess.Popen] = None
+
+    def wait(self, timeout_seconds: float) -> Optional[float]:
+        """
+        Poll the component until it is ready. The poll interval starts short and backs off,
+        so fast starts are noticed at once.
+        :param timeout_seconds: Seconds after which to give up
+        :return: Seconds it took to become ready, or None if it exited or timed out.
+        """
+        start = time.monotonic()
+        deadline = start + timeout_seconds
+        delay = 0.05
+        while True:
+            if is_port_open(self.host, self.port, timeout=0.5) and (self.url is None or is_url_ready(self.url)):
+                return time.monotonic() - start
+            if self.process is not None and self.process.poll() is not None:
+                print(f"{self.name} exited with code {self.process.returncode} before becoming ready.")
+                return None
+            if time.monotonic() >= deadline:
+                print(f"{self.name} was not ready after {timeout_seconds} seconds.")
+                return None
+            time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+            delay = min(delay * 2, 1.0)
+
+
+def is_port_open(host: str, port: int, timeout: float = 1.0) -> bool:
+    """
+    Check if a port is open on a given host.
+    :return: True if the port is open, False otherwise.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect((host, port))
+            return True
+        except (ConnectionRefusedError, TimeoutError, OSError):
+            return False
+
+
+def is_url_ready(url: str) -> bool:
+    """
+    Check if an HTTP endpoint answers with status 200.
+    :return: True if it does, False otherwise.
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=2.0) as response:
+            return response.status == 200
+    except (urllib.error.URLError, OSError, ValueError):
+        return False
+
+
+def time_until(wait: Callable[[], bool]) -> Optional[float]:
+    """
+    :param wait: Function that waits for a component and returns whether it became ready
+    :return: Seconds it took to become ready, or None if it did not.
+    """
+    start = time.monotonic()
+    if wait():
+        return time.monotonic() - start
+    return None
+
+
+def wait_for_components(components: Dict[str, Callable[[], Optional[float]]], started_at: float):
+    """
+    Wait for all started components in parallel and report how long each took to become ready.
+    :param components: Dictionary of component name -> function that waits for it to be ready
+    :param started_at: Monotonic time at which startup began
+    """
+    if components:
+        with ThreadPoolExecutor(max_workers=len(components)) as executor:
+            futures = {name: executor.submit(wait) for name, wait in components.items()}
+            timings: Dict[str, Optional[float]] = {name: future.result() for name, future in futures.items()}
+
+        print("\nStartup timings:")
+        for name, seconds in timings.items():
+            print(f"  {name}: " + (f"ready in {seconds:.2f}s" if seconds is not None else "NOT READY"))
+    print(f"Startup took {time.monotonic() - started_at:.2f}s")
@@ -15,21 +15,30 @@
 # END COPYRIGHT
 
 import argparse
-import glob
 import os
 import signal
-import socket
 import subprocess
 import sys
 import threading
 import time
+from functools import partial
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Optional
 from typing import Tuple
 
 from dotenv import load_dotenv
+
+from plugins.diagrams.diagram_generator import DiagramGenerator
+from plugins.load_balancer.tcp_load_balancer import TcpLoadBalancer
+from plugins.load_balancer.worker_supervisor import WorkerSupervisor
 from plugins.log_bridge.process_log_bridge import ProcessLogBridge
 from plugins.phoenix.phoenix_plugin import PhoenixPlugin
+from plugins.readiness.readiness_probe import ReadinessProbe
+from plugins.readiness.readiness_probe import is_port_open
+from plugins.readiness.readiness_probe import time_until
+from plugins.readiness.readiness_probe import wait_for_components
 
 
 class NeuroSanRunner:
@@ -78,6 +87,8 @@ class NeuroSanRunner:
                 "MCP_SERVERS_INFO_FILE", os.path.join(self.root_dir, "mcp", "mcp_info.hocon")
             ),
             "logs_dir": self.logs_dir,
+            "startup_timeout_seconds": float(os.getenv("NEURO_SAN_STARTUP_TIMEOUT_SECONDS", "120")),
+            "workers": int(os.getenv("NEURO_SAN_WORKERS", "1")),
         }
 
         # Add Phoenix configuration defaults
@@ -100,6 +111,10 @@ class NeuroSanRunner:
         self.flask_webclient_process = None
         self.nsflow_process = None
 
+        # Server workers and the load balancers in front of them, with --workers N
+        self.load_balancers: list[TcpLoadBalancer] = []
+        self.worker_supervisor: Optional[WorkerSupervisor] = None
+
         # Initialize Phoenix manager
         self.phoenix_plugin = PhoenixPlugin(self.args)
 
@@ -153,6 +168,15 @@ class NeuroSanRunner:
             "--thinking-file", type=str, default=self.args["thinking_file"], help="Path to the agent thinking file"
         )
         parser.add_argument("--no-html", action="store_true", help="Don't generate html for network diagrams")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=self.args["workers"],
+            help="Number of Neuro SAN server processes. With more than one, they listen on the ports following "
+            "the server ports, behind a local load balancer on the server ports. Connections, not requests, "
+            "are balanced: HTTP/1 clients are spread over the workers, but the calls of one gRPC channel "
+            "all go to the same worker.",
+        )
         parser.add_argument(
             "--client-only", action="store_true", help="Run only the nsflow client without NeuroSan server"
         )
@@ -241,22 +265,12 @@ class NeuroSanRunner:
 
         print("\n" + "=" * 50 + "\n")
 
-    @staticmethod
-    def generate_html_files():
-        """Generate .html files for all registry files except manifest.hocon."""
-        for file in glob.glob("./registries/*"):
-            if os.path.basename(file) != "manifest.hocon":
-                print(f"Generating .html file for: {file}")
-                result = subprocess.run(
-                    [sys.executable, "-m", "neuro_san_web_client.agents_diagram_builder", "--input_file", file],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True,
-                    check=True,
-                )
-                print(result.stdout)
-                if result.stderr:
-                    print(result.stderr, file=sys.stderr)
+    def generate_html_files(self):
+        """
+        Generate .html files for all agent networks in the registries, in parallel.
+        Networks that are unchanged since the last successful build are skipped.
+        """
+        DiagramGenerator(self.root_dir, os.path.join(self.logs_dir, "html_diagram_hashes.json")).generate()
 
     @staticmethod
     def stream_output(pipe, log_file, prefix):
@@ -268,10 +282,10 @@ class NeuroSanRunner:
                 log.write(formatted_line + "\n")  # Write to log file
         pipe.close()
 
-    def start_process(self, command, process_name, log_file):
-        """Start a subprocess and capture logs."""
+    def start_process(self, command, process_name, log_file, append=False):
+        """Start a subprocess and capture logs. With append, the log file is kept rather than cleared."""
         # Initialize/clear the log file before starting
-        with open(log_file, "w", encoding="utf-8") as log:
+        with open(log_file, "a" if append else "w", encoding="utf-8") as log:
             log.write(f"Starting {process_name}...\n")
 
         # pylint: disable=consider-using-with
@@ -312,26 +326,64 @@ class NeuroSanRunner:
         return process
 
     def start_phoenix(self):
-        """Start Phoenix server (UI + OTLP HTTP collector) if enabled."""
-        self.phoenix_plugin.start_phoenix_server()
+        """Start Phoenix server (UI + OTLP HTTP collector) if enabled, without waiting for it."""
+        self.phoenix_plugin.start_phoenix_server(wait=False)
 
-    def start_neuro_san(self):
-        """Start the Neuro SAN server."""
-        print("Starting Neuro SAN server...")
-        command = [
+    @staticmethod
+    def get_server_command(grpc_port: int, http_port: int) -> list[str]:
+        """Return the command that starts a Neuro SAN server on the given ports."""
+        return [
             sys.executable,
             "-u",
             "-m",
             "servers.neuro_san.neuro_san_server_wrapper",
             "--port",
-            str(self.args["server_grpc_port"]),
+            str(grpc_port),
             "--http_port",
-            str(self.args["server_http_port"]),
+            str(http_port),
         ]
+
+    def start_neuro_san(self):
+        """Start the Neuro SAN server, or its workers and their load balancers with --workers N."""
+        if self.args["workers"] > 1:
+            self.start_neuro_san_workers()
+            return
+
+        print("Starting Neuro SAN server...")
+        command = self.get_server_command(self.args["server_grpc_port"], self.args["server_http_port"])
         self.server_process = self.start_process(command, "NeuroSan", "logs/server.log")
         print("NeuroSan server grpc started on port: ", self.args["server_grpc_port"])
         print("NeuroSan server http started on port: ", self.args["server_http_port"])
 
+    def get_worker_ports(self, index: int) -> Tuple[int, int]:
+        """Return the (grpc, http) ports of a server worker: the ones following the public server ports."""
+        return self.args["server_grpc_port"] + 1 + index, self.args["server_http_port"] + 1 + index
+
+    def start_neuro_san_workers(self):
+        """Start the server workers, the load balancers on the public server ports, and the worker supervisor."""
+        workers = self.args["workers"]
+        print(f"Starting {workers} Neuro SAN server workers...")
+        host = self.args["server_host"]
+        for public_port, port_index in ((self.args["server_grpc_port"], 0), (self.args["server_http_port"], 1)):
+            backends = [(host, self.get_worker_ports(index)[port_index]) for index in range(workers)]
+            balancer = TcpLoadBalancer(
+                "NeuroSan " + ("grpc" if port_index == 0 else "http"), host, public_port, backends
+            )
+            balancer.start()
+            self.load_balancers.append(balancer)
+
+        def start_worker(index: int, append: bool) -> subprocess.Popen:
+            # Restarts append to the log of the worker so the cause of the crash is kept
+            grpc_port, http_port = self.get_worker_ports(index)
+            process = self.start_process(
+                self.get_server_command(grpc_port, http_port), f"NeuroSan-{index}", f"logs/server_{index}.log", append
+            )
+            print(f"NeuroSan worker {index} started on grpc port {grpc_port} and http port {http_port}")
+            return process
+
+        self.worker_supervisor = WorkerSupervisor(workers, start_worker)
+        self.worker_supervisor.start()
+
     def start_nsflow(self):
         """Start nsflow client."""
         print("Starting nsflow client...")
@@ -376,6 +428,12 @@ class NeuroSanRunner:
         """Handle termination signals to cleanly exit."""
         print("\nTermination signal received. Stopping all processes...")
 
+        for balancer in self.load_balancers:
+            balancer.stop()
+
+        if self.worker_supervisor:
+            self.worker_supervisor.stop()
+
         if self.server_process:
             print(f"\nStopping SERVER (PID {self.server_process.pid})...")
             if self.is_windows:
@@ -402,41 +460,34 @@ class NeuroSanRunner:
 
         sys.exit(0)
 
-    def is_port_open(self, host: str, port: int, timeout=1.0) -> bool:
-        """
-        Check if a port is open on a given host.
-        :return: True if the port is open, False otherwise.
-        """
-        # Create a socket and set a timeout
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            try:
-                sock.connect((host, port))
-                return True
-            except (ConnectionRefusedError, TimeoutError, OSError):
-                return False
-
     def _check_port_conflicts(self) -> Tuple[list[str], list[int]]:
         """Check if any of the ports are in use."""
         port_conflicts = []
         conflicting_ports: list[int] = []
 
         if not self.args["server_only"] and self.args["nsflow_host"] == "localhost":
-            if self.is_port_open(self.args["nsflow_host"], self.args["nsflow_port"]):
+            if is_port_open(self.args["nsflow_host"], self.args["nsflow_port"]):
                 port_conflicts.append(f"NSFlow client port {self.args['nsflow_port']} is already in use.")
                 conflicting_ports.append(self.args["nsflow_port"])
 
         if not self.args["client_only"] and self.args["server_host"] == "localhost":
-            if self.is_port_open(self.args["server_host"], self.args["server_grpc_port"]):
+            if is_port_open(self.args["server_host"], self.args["server_grpc_port"]):
                 port_conflicts.append(f"Neuro-San server grpc port {self.args['server_grpc_port']} is already in use.")
                 conflicting_ports.append(self.args["server_grpc_port"])
 
-            if self.is_port_open(self.args["server_host"], self.args["server_http_port"]):
+            if is_port_open(self.args["server_host"], self.args["server_http_port"]):
                 port_conflicts.append(f"Neuro-San server http port {self.args['server_http_port']} is already in use.")
                 conflicting_ports.append(self.args["server_http_port"])
 
+            if self.args["workers"] > 1:
+                for index in range(self.args["workers"]):
+                    for port in self.get_worker_ports(index):
+                        if is_port_open(self.args["server_host"], port):
+                            port_conflicts.append(f"Neuro-San server worker {index} port {port} is already in use.")
+                            conflicting_ports.append(port)
+
         if self.args.get("use_flask_web_client"):
-            if self.is_port_open("localhost", self.args["neuro_san_web_client_port"]):
+            if is_port_open("localhost", self.args["neuro_san_web_client_port"]):
                 port_conflicts.append(
                     f"Flask web client port {self.args['neuro_san_web_client_port']} is already in use."
                 )
@@ -475,21 +526,77 @@ class NeuroSanRunner:
             except Exception as e:  # pylint: disable=broad-exception-caught
                 print(f"  Error handling port {port}: {e}")
 
+    def _resolve_port_conflicts(self):
+        """Offer to kill the processes using the ports of the components to start. Exit if refused."""
+        port_conflicts, conflicting_ports = self._check_port_conflicts()
+        if not port_conflicts:
+            return
+
+        print("\n" + "=" * 50)
+        for msg in port_conflicts:
+            print(msg)
+        print("=" * 50)
+
+        # Ask user if they want to kill the processes
+        response = input("\nDo you want to kill the processes using these ports? (yes/no): ").strip().lower()
+
+        if response in ["yes", "y"]:
+            self._kill_processes_on_ports(conflicting_ports)
+            print("\nProcesses killed. Continuing with startup...\n")
+        else:
+            print("\nExiting due to port conflicts.\n")
+            sys.exit(1)
+
+    def _start_server(self) -> Dict[str, Callable[[], Optional[float]]]:
+        """
+        Start the Neuro SAN server, or its workers.
+        :return: Dictionary of component name -> function that waits for it to be ready
+        """
+        self.start_neuro_san()
+        scheme = "https" if self.args["server_connection"] == "https" else "http"
+        host = self.args["server_host"]
+        timeout = self.args["startup_timeout_seconds"]
+        probes: list[ReadinessProbe] = []
+        if self.worker_supervisor:
+            for index, process in enumerate(self.worker_supervisor.processes):
+                port = self.get_worker_ports(index)[1]
+                list_url = f"{scheme}://{host}:{port}/api/v1/list"
+                probes.append(ReadinessProbe(f"Neuro-San worker {index}", host, port, list_url, process))
+        else:
+            port = self.args["server_http_port"]
+            list_url = f"{scheme}://{host}:{port}/api/v1/list"
+            probes.append(ReadinessProbe("Neuro-San server", host, port, list_url, self.server_process))
+        return {probe.name: partial(probe.wait, timeout) for probe in probes}
+
+    def _start_client(self) -> Dict[str, Callable[[], Optional[float]]]:
+        """
+        Start the Flask web client, or nsflow.
+        :return: Dictionary of component name -> function that waits for it to be ready
+        """
+        if self.args.get("use_flask_web_client", False):
+            if not self.args.get("no_html", False):
+                self.generate_html_files()
+            self.start_flask_web_client()
+            probe = ReadinessProbe(
+                "Flask web-client", "localhost", self.args["web_client_port"], process=self.flask_webclient_process
+            )
+        else:
+            self.start_nsflow()
+            probe = ReadinessProbe(
+                "nsflow client", self.args["nsflow_host"], self.args["nsflow_port"], process=self.nsflow_process
+            )
+        return {probe.name: partial(probe.wait, self.args["startup_timeout_seconds"])}
+
     def conditional_start_servers(self):
         """
         Start neuro-san, nsflow, and flask client based on conditions while running on localhost.
         Exit if any port is in use.
         """
-        client_only = self.args["client_only"]
-        server_only = self.args["server_only"]
-        use_flask = self.args.get("use_flask_web_client", False)
-        no_html = self.args.get("no_html", False)
-
-        if client_only and server_only:
+        if self.args["client_only"] and self.args["server_only"]:
             print("Cannot use --client-only and --server-only together.")
             sys.exit(1)
 
-        if use_flask:
+        if self.args.get("use_flask_web_client", False):
             # Check if flask web client is available
             try:
                 import neuro_san_web_client  # pylint: disable=unused-import,import-outside-toplevel  # noqa: F401
@@ -497,42 +604,24 @@ class NeuroSanRunner:
                 print("Flask web client is not available. Please install it with `pip install neuro-san-web-client`.")
                 sys.exit(1)
 
-        port_conflicts, conflicting_ports = self._check_port_conflicts()
-
         # Exit early if any conflict is found
-        if port_conflicts:
-            print("\n" + "=" * 50)
-            for msg in port_conflicts:
-                print(msg)
-            print("=" * 50)
-
-            # Ask user if they want to kill the processes
-            response = input("\nDo you want to kill the processes using these ports? (yes/no): ").strip().lower()
-
-            if response in ["yes", "y"]:
-                self._kill_processes_on_ports(conflicting_ports)
-                print("\nProcesses killed. Continuing with startup...\n")
-            else:
-                print("\nExiting due to port conflicts.\n")
-                sys.exit(1)
+        self._resolve_port_conflicts()
 
-        # Start services only if ports are free
-        # 1) Phoenix first so other services point OTLP to it
+        # Start services only if ports are free.
+        # Phoenix first so other services point OTLP to it. Nothing waits for another service
+        # to be ready: the clients only connect to the server when they get a request.
+        started_at = time.monotonic()
         self.start_phoenix()
-        if not server_only:
-            if use_flask:
-                if not no_html:
-                    self.generate_html_files()
-                self.start_flask_web_client()
-                print("Flask web-client is now running.")
-            else:
-                self.start_nsflow()
-                print("nsflow client is now running.")
+        components: Dict[str, Callable[[], Optional[float]]] = {}
+        if self.phoenix_plugin.phoenix_process is not None:
+            phoenix_timeout = min(self.args["startup_timeout_seconds"], 30.0)
+            components["Phoenix"] = partial(time_until, partial(self.phoenix_plugin.wait_until_ready, phoenix_timeout))
+        if not self.args["client_only"]:
+            components.update(self._start_server())
+        if not self.args["server_only"]:
+            components.update(self._start_client())
 
-        if not client_only:
-            self.start_neuro_san()
-            time.sleep(3)
-            print("Neuro-San server is now running.")
+        wait_for_components(components, started_at)
 
     def run(self):
         """Run the Neuro SAN server and a client."""
@@ -568,6 +657,8 @@ class NeuroSanRunner:
             self.server_process.wait()
         if self.flask_webclient_process:
             self.flask_webclient_process.wait()
+        if self.worker_supervisor:
+            self.worker_supervisor.join()
 
 
 if __name__ == "__main__":
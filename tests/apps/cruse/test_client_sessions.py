@@ -0,0 +1,110 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from apps.cruse.client_sessions import GUI_CONTEXT
+from apps.cruse.client_sessions import NEW_CHAT
+from apps.cruse.client_sessions import USER_INPUT
+from apps.cruse.client_sessions import ClientSession
+from apps.cruse.client_sessions import ClientSessions
+
+
+class TestClientSession(TestCase):
+    """
+    Unit tests for ClientSession.
+    """
+
+    def test_take_turn_returns_everything_queued(self):
+        """
+        Events queued while a turn ran are all handled in the next one, in order.
+        """
+        client = ClientSession("sid", "agent")
+        client.put(USER_INPUT, "hello")
+        client.put(GUI_CONTEXT, {"field": 1})
+        client.put(NEW_CHAT, "other")
+        self.assertEqual([(USER_INPUT, "hello"), (GUI_CONTEXT, {"field": 1}), (NEW_CHAT, "other")], client.take_turn())
+        self.assertTrue(client.inbox.empty())
+
+    def test_take_turn_waits_for_an_event(self):
+        """
+        A turn starts as soon as an event arrives, not before.
+        """
+        client = ClientSession("sid", "agent")
+        turns = []
+        worker = threading.Thread(target=lambda: turns.append(client.take_turn()))
+        worker.start()
+        worker.join(0.1)
+        self.assertTrue(worker.is_alive())
+
+        client.put(USER_INPUT, "hello")
+        worker.join(5.0)
+        self.assertEqual([[(USER_INPUT, "hello")]], turns)
+
+
+class TestClientSessions(TestCase):
+    """
+    Unit tests for ClientSessions.
+    """
+
+    def test_add_get_remove(self):
+        """
+        Sessions are found by sid until they are removed.
+        """
+        sessions = ClientSessions(60.0)
+        client = ClientSession("sid", "agent")
+        sessions.add(client)
+        self.assertIs(client, sessions.get("sid"))
+        self.assertEqual([client], sessions.all())
+        self.assertEqual(1, len(sessions))
+
+        self.assertIs(client, sessions.remove("sid"))
+        self.assertIsNone(sessions.get("sid"))
+        self.assertIsNone(sessions.remove("sid"))
+        self.assertEqual(0, len(sessions))
+
+    def test_idle_only_lists_unused_sessions_holding_an_agent(self):
+        """
+        Only sessions with an agent session, not in a turn and inactive for idle_seconds are idle.
+        """
+        sessions = ClientSessions(60.0)
+        with patch("apps.cruse.client_sessions.time.monotonic", return_value=1000.0):
+            idle = ClientSession("idle", "agent")
+            busy = ClientSession("busy", "agent")
+            without_agent = ClientSession("without_agent", "agent")
+            recent = ClientSession("recent", "agent")
+        recent.last_active = 1050.0
+        for client in (idle, busy, recent):
+            client.agent_session = object()
+        busy.busy = True
+        for client in (idle, busy, without_agent, recent):
+            sessions.add(client)
+
+        with patch("apps.cruse.client_sessions.time.monotonic", return_value=1065.0):
+            self.assertEqual([idle], sessions.idle())
+
+    def test_idle_disabled(self):
+        """
+        With idle_seconds 0, sessions are never released.
+        """
+        sessions = ClientSessions(0)
+        client = ClientSession("sid", "agent")
+        client.agent_session = object()
+        client.last_active = 0.0
+        sessions.add(client)
+        self.assertEqual([], sessions.idle())
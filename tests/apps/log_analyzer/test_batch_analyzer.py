@@ -0,0 +1,167 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import json
+import os
+import re
+import tempfile
+import threading
+from typing import List
+from unittest import TestCase
+
+from apps.log_analyzer.batch_analyzer import BatchLogAnalyzer
+
+LOG = """[SYSTEM]:
+You check arithmetic.
+[HUMAN]:
+What is 2+2?
+[AI]:
+4
+[AGENT]:
+{"completion_tokens": 1, "prompt_tokens": 10, "total_tokens": 11}
+[HUMAN]:
+What is 3+3?
+[AI]:
+6
+"""
+
+
+class FakeAnalysis:
+    """
+    Stands in for the analysis agent, failing on the inputs it is told to.
+    """
+
+    def __init__(self, failing: str = None):
+        """
+        :param failing: Text of the inputs to fail on
+        """
+        self.failing = failing
+        self.inputs: List[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, agent_input: str) -> str:
+        with self._lock:
+            self.inputs.append(agent_input)
+        if self.failing and self.failing in agent_input:
+            raise RuntimeError("analysis failed")
+        return "analysis of " + re.search(r"What is \S+", agent_input).group(0)
+
+    def count(self) -> int:
+        """
+        :return: The number of analyses asked for
+        """
+        with self._lock:
+            return len(self.inputs)
+
+
+class TestBatchLogAnalyzer(TestCase):
+    """
+    Unit tests for BatchLogAnalyzer, with a fake analysis in place of the agent.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.logs = os.path.join(self.directory.name, "logs")
+        os.makedirs(self.logs)
+        self.output = os.path.join(self.directory.name, "analysis.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_log(self, name: str, content: str = LOG):
+        """
+        Write a log file to the log directory.
+        """
+        with open(os.path.join(self.logs, name), "w", encoding="utf-8") as log_file:
+            log_file.write(content)
+
+    def read_records(self) -> List[dict]:
+        """
+        :return: The records of the output file
+        """
+        with open(self.output, "r", encoding="utf-8") as output_file:
+            return [json.loads(line) for line in output_file]
+
+    def run_batch(self, analysis: FakeAnalysis):
+        """
+        :return: The stats of a batch run over the log directory
+        """
+        return BatchLogAnalyzer(self.output, workers=2, analyze=analysis).run(self.logs)
+
+    def test_identical_entries_are_analyzed_once_with_a_result_each(self):
+        """
+        The same entries in two files are sent once, and each file still gets a result for each of its entries.
+        """
+        self.write_log("a.txt")
+        self.write_log("b.txt")
+        analysis = FakeAnalysis()
+        stats = self.run_batch(analysis)
+
+        self.assertEqual(2, analysis.count())
+        self.assertEqual(2, stats["entries_analyzed"])
+        self.assertEqual(2, stats["entries_duplicate"])
+        self.assertEqual(2, stats["files_analyzed"])
+        results = sorted((os.path.basename(record["file"]), record["entry_index"]) for record in self.read_records())
+        self.assertEqual([("a.txt", 0), ("a.txt", 1), ("b.txt", 0), ("b.txt", 1)], results)
+        self.assertEqual(
+            {"analysis of What is 2+2?", "analysis of What is 3+3?"},
+            {record["analysis"] for record in self.read_records()},
+        )
+
+    def test_resume_skips_finished_files(self):
+        """
+        A second run over the same output reads no finished file and analyzes nothing again.
+        """
+        self.write_log("a.txt")
+        self.run_batch(FakeAnalysis())
+
+        analysis = FakeAnalysis()
+        stats = self.run_batch(analysis)
+        self.assertEqual(0, analysis.count())
+        self.assertEqual(1, stats["files_skipped"])
+        self.assertEqual(2, len(self.read_records()))
+
+    def test_failed_entries_are_retried_by_the_next_run(self):
+        """
+        A file with a failed entry is left out of the checkpoint, and the next run only sends that entry again.
+        """
+        self.write_log("a.txt")
+        stats = self.run_batch(FakeAnalysis(failing="3+3"))
+        self.assertEqual(1, stats["entries_failed"])
+        self.assertEqual(0, stats["files_analyzed"])
+        with open(self.output + ".checkpoint", "r", encoding="utf-8") as checkpoint_file:
+            self.assertEqual("", checkpoint_file.read())
+
+        analysis = FakeAnalysis()
+        stats = self.run_batch(analysis)
+        self.assertEqual(1, analysis.count())
+        self.assertIn("3+3", analysis.inputs[0])
+        self.assertEqual(1, stats["entries_skipped"])
+        self.assertEqual(1, stats["files_analyzed"])
+
+    def test_changed_file_is_read_again(self):
+        """
+        A file that changed since it was checkpointed is read again, and only its new entries are analyzed.
+        """
+        self.write_log("a.txt")
+        self.run_batch(FakeAnalysis())
+
+        self.write_log("a.txt", LOG + "[HUMAN]:\nWhat is 4+4?\n[AI]:\n8\n")
+        analysis = FakeAnalysis()
+        stats = self.run_batch(analysis)
+        self.assertEqual(1, analysis.count())
+        self.assertEqual(2, stats["entries_skipped"])
+        self.assertEqual(1, stats["files_analyzed"])
@@ -0,0 +1,87 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import io
+import os
+from unittest import TestCase
+
+from apps.log_analyzer.log_analyzer import extract_conversation_entries
+from apps.log_analyzer.log_analyzer import extract_system_prompt
+from apps.log_analyzer.log_analyzer import iter_log_entries
+from apps.log_analyzer.log_analyzer import iter_log_file
+
+FIXTURE_LOG = os.path.join(
+    os.path.dirname(__file__), "..", "..", "fixtures", "experimental", "log_analyzer", "agent_thinking.txt"
+)
+
+SYSTEM_PROMPT = "You are the front man of a math network.\nAnswer briefly.\n[SYSTEM] Tools: calculator"
+
+ENTRIES = [
+    # Everything from [HUMAN] to [AI], plus the [AGENT] token accounting right after it
+    "[HUMAN]:\nWhat is 2+2?\n"
+    '[AGENT]:\nCalling calculator with {"expression": "2+2"}\n'
+    "[AI]:\n2+2 is 4.\n[note] checked twice\n"
+    '[AGENT]:\n{"completion_tokens": 5, "prompt_tokens": 40, "total_tokens": 45}',
+    # An [AGENT] section after [AI] that is not token accounting is left out
+    "[HUMAN]:\nAnd 3+3?\n[AI]:\n6.",
+    # Empty sections are dropped, and the entry at the end of the log is kept
+    "[HUMAN]:\nThanks!\n[AI]:\nYou are welcome.",
+]
+
+
+class TestLogAnalyzer(TestCase):
+    """
+    Unit tests for the parsing of agent thinking logs.
+    """
+
+    def test_entries_of_the_fixture_log(self):
+        """
+        Each entry runs from a [HUMAN] section to the [AI] section and the token accounting after it,
+        and comes with the system prompt of the log.
+        """
+        self.assertEqual([(SYSTEM_PROMPT, entry) for entry in ENTRIES], list(iter_log_file(FIXTURE_LOG)))
+
+    def test_whole_content_functions_agree(self):
+        """
+        The functions taking the whole log find the same system prompt and entries as the streaming pass.
+        """
+        with open(FIXTURE_LOG, "r", encoding="utf-8") as log_file:
+            content = log_file.read()
+        self.assertEqual(SYSTEM_PROMPT, extract_system_prompt(content))
+        self.assertEqual(ENTRIES, extract_conversation_entries(content))
+
+    def test_system_prompt_needs_its_own_line(self):
+        """
+        Only a line that is just "[SYSTEM]:" starts the system prompt, which ends at the next other section.
+        """
+        self.assertEqual("", extract_system_prompt("[SYSTEM]: inline\n[HUMAN]\nhi\n"))
+        self.assertEqual("prompt", extract_system_prompt("[SYSTEM] note\n[SYSTEM]:\nprompt\n[AI]\nhello\n"))
+
+    def test_entries_before_the_system_prompt(self):
+        """
+        Entries that end before the system prompt is read in full come without it, since the log is read once.
+        """
+        log = "[HUMAN]\nhi\n[AI]\nhello\n[SYSTEM]:\nlate prompt\n[HUMAN]\nbye\n[AI]\nbye\n"
+        self.assertEqual(
+            [("", "[HUMAN]:\nhi\n[AI]:\nhello"), ("late prompt", "[HUMAN]:\nbye\n[AI]:\nbye")],
+            list(iter_log_entries(io.StringIO(log))),
+        )
+
+    def test_human_without_answer(self):
+        """
+        A [HUMAN] section with nothing after it is not an entry.
+        """
+        self.assertEqual([], extract_conversation_entries("[HUMAN]\nhi\n"))
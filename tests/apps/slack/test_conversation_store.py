@@ -0,0 +1,104 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from apps.slack.conversation_store import ConversationStore
+
+
+def set_network(network: str):
+    """
+    :param network: The network to remember for a thread
+    :return: A change for ConversationStore.update
+    """
+
+    def change(record):
+        record.network = network
+
+    return change
+
+
+class TestConversationStore(TestCase):
+    """
+    Unit tests for ConversationStore.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.temp_dir.name, "threads.db")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_evicts_least_recently_used(self):
+        """
+        Past max_threads, the thread read longest ago leaves memory but is reloaded from the database.
+        """
+        store = ConversationStore(max_threads=2, path=self.path)
+        store.update("a", set_network("hello"))
+        store.update("b", set_network("music"))
+        store.get("a")
+        store.update("c", set_network("weather"))
+
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.get("b").network, "music")
+        self.assertEqual(len(store), 2)
+
+    def test_memory_only_store_forgets_evicted_threads(self):
+        """
+        Without a database, a thread evicted by the size budget is gone, but the last one is always kept.
+        """
+        store = ConversationStore(max_threads=0, max_bytes=1)
+        store.update("a", set_network("hello"))
+        store.update("b", set_network("music"))
+
+        self.assertIsNone(store.get("a"))
+        self.assertEqual(store.get("b").network, "music")
+        self.assertEqual(store.total_bytes, store.get("b").size)
+
+    def test_reads_keep_threads_alive_across_restarts(self):
+        """
+        A thread that is only read stays alive in the database, so a restarted bot does not expire it.
+        """
+        with patch("apps.slack.conversation_store.time.time", return_value=1000.0):
+            ConversationStore(ttl_seconds=100, path=self.path).update("a", set_network("hello"))
+        with patch("apps.slack.conversation_store.time.time", return_value=1080.0):
+            self.assertEqual(ConversationStore(ttl_seconds=100, path=self.path).get("a").network, "hello")
+
+        with patch("apps.slack.conversation_store.time.time", return_value=1160.0):
+            restarted = ConversationStore(ttl_seconds=100, path=self.path)
+            self.assertEqual(restarted.get("a").network, "hello")
+        with patch("apps.slack.conversation_store.time.time", return_value=1300.0):
+            self.assertIsNone(ConversationStore(ttl_seconds=100, path=self.path).get("a"))
+
+    def test_frequent_reads_do_not_write(self):
+        """
+        Reads close together write the access time once, not on every read.
+        """
+        store = ConversationStore(ttl_seconds=100, path=self.path)
+        with patch("apps.slack.conversation_store.time.time", return_value=1000.0):
+            store.update("a", set_network("hello"))
+        # pylint: disable=protected-access
+        with patch.object(store, "_connection", wraps=store._connection) as connection:
+            for now in (1001.0, 1002.0, 1011.0, 1012.0):
+                with patch("apps.slack.conversation_store.time.time", return_value=now):
+                    store.get("a")
+
+        updates = [call for call in connection.execute.call_args_list if call.args[0].startswith("UPDATE")]
+        self.assertEqual([call.args[1][0] for call in updates], [1011.0])
@@ -0,0 +1,98 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import threading
+from unittest import TestCase
+
+from apps.slack.message_queue import MessageQueue
+
+
+class TestMessageQueue(TestCase):
+    """
+    Unit tests for MessageQueue.
+    """
+
+    def test_turns_away_messages_past_the_limit(self):
+        """
+        Messages beyond max_queued are refused and never run.
+        """
+        queue = MessageQueue(max_workers=1, max_queued=1)
+        release = threading.Event()
+        refused = threading.Event()
+        self.assertTrue(queue.submit("a", release.wait))
+        self.assertFalse(queue.submit("b", refused.set))
+
+        release.set()
+        queue.shutdown()
+        self.assertFalse(refused.is_set())
+
+    def test_answers_a_thread_in_order(self):
+        """
+        Messages of one Slack thread run one after the other and in order, while other threads go ahead.
+        """
+        queue = MessageQueue(max_workers=4, max_queued=8)
+        answered = []
+        started = threading.Event()
+        release = threading.Event()
+        other_answered = threading.Event()
+
+        def first():
+            started.set()
+            release.wait()
+            answered.append("first")
+
+        def other():
+            answered.append("other")
+            other_answered.set()
+
+        queue.submit("thread", first)
+        started.wait()
+        queue.submit("thread", answered.append, "second")
+        queue.submit("other", other)
+        self.assertTrue(other_answered.wait(5))
+
+        release.set()
+        queue.shutdown()
+        self.assertEqual(answered, ["other", "first", "second"])
+
+    def test_a_busy_thread_holds_one_worker(self):
+        """
+        A burst of messages in one Slack thread is answered in order on one worker at a time,
+        so another thread is answered while the burst waits.
+        """
+        queue = MessageQueue(max_workers=2, max_queued=16)
+        answered = []
+        release = threading.Event()
+        other_answered = threading.Event()
+
+        def first():
+            release.wait()
+            answered.append(0)
+
+        def other():
+            answered.append("other")
+            other_answered.set()
+
+        queue.submit("thread", first)
+        for number in range(1, 10):
+            queue.submit("thread", answered.append, number)
+        queue.submit("other", other)
+        other_was_answered = other_answered.wait(5)
+
+        release.set()
+        queue.shutdown()
+        self.assertTrue(other_was_answered)
+        self.assertEqual(answered, ["other"] + list(range(10)))
@@ -0,0 +1,92 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from apps.slack.network_catalog import NetworkCatalog
+
+
+class TestNetworkCatalog(TestCase):
+    """
+    Unit tests for NetworkCatalog.
+    """
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.list_networks.return_value = ([{"agent_name": "hello"}], "v1")
+        self.catalog = NetworkCatalog(self.client)
+
+    def test_unchanged_catalog_is_kept(self):
+        """
+        A 304 reply keeps the networks already known, and the ETag is sent with the next request.
+        """
+        self.catalog.refresh()
+        self.client.list_networks.return_value = (None, "v1")
+        self.catalog.refresh()
+
+        self.client.list_networks.assert_called_with("v1")
+        self.assertEqual(self.catalog.get_networks(), [{"agent_name": "hello"}])
+        self.assertTrue(self.catalog.has_network("hello"))
+
+    def test_unknown_network_is_checked_against_a_stale_catalog_only(self):
+        """
+        Right after a refresh an unknown network is rejected from memory. Later it is checked against
+        the server, which also asks the background thread for a refresh.
+        """
+        self.client.test_connection.return_value = False
+        with patch("apps.slack.network_catalog.time.monotonic", return_value=100.0):
+            self.catalog.refresh()
+        self.client.list_networks.reset_mock()
+
+        with patch.object(self.catalog, "invalidate") as invalidate:
+            with patch("apps.slack.network_catalog.time.monotonic", return_value=101.0):
+                self.assertFalse(self.catalog.has_network("music"))
+            invalidate.assert_not_called()
+            self.client.test_connection.assert_not_called()
+            with patch("apps.slack.network_catalog.time.monotonic", return_value=200.0):
+                self.assertFalse(self.catalog.has_network("music"))
+            invalidate.assert_called_once()
+        self.client.test_connection.assert_called_once_with("music")
+        self.client.list_networks.assert_not_called()
+
+    def test_newly_added_network_is_found(self):
+        """
+        A network added to the server since the last refresh, or before the first one, is found.
+        """
+        self.client.test_connection.side_effect = lambda name: name in ("hello", "music")
+        with patch.object(self.catalog, "invalidate"):
+            self.assertTrue(self.catalog.has_network("hello"))
+            with patch("apps.slack.network_catalog.time.monotonic", return_value=100.0):
+                self.catalog.refresh()
+            with patch("apps.slack.network_catalog.time.monotonic", return_value=200.0):
+                self.assertTrue(self.catalog.has_network("music"))
+
+    def test_background_refresh_finds_new_network(self):
+        """
+        Once the background thread refreshed the catalog, a network added to the server is found from memory.
+        """
+        self.client.list_networks.return_value = ([{"agent_name": "hello"}, {"agent_name": "music"}], "v2")
+        self.client.test_connection.return_value = False
+        self.assertFalse(self.catalog.has_network("music"))
+
+        self.catalog.start()
+        deadline = time.monotonic() + 5
+        while not self.catalog.has_network("music") and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(self.catalog.has_network("music"))
@@ -0,0 +1,89 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("slack_bolt")
+
+# pylint: disable=wrong-import-position
+from apps.slack.conversation_manager import ConversationManager  # noqa: E402
+from apps.slack.dataclass.handler_settings import HandlerSettings  # noqa: E402
+from apps.slack.dataclass.message_context import MessageContext  # noqa: E402
+from apps.slack.dataclass.thread_context import ThreadContext  # noqa: E402
+from apps.slack.network_handler import NetworkHandler  # noqa: E402
+
+FINAL_MESSAGE = {
+    "response": {"chat_context": {"chat_histories": [{"messages": [{"type": "AI", "text": "The answer"}]}]}}
+}
+
+
+class TestNetworkHandler(TestCase):
+    """
+    Unit tests for NetworkHandler.
+    """
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.handler = NetworkHandler(ConversationManager(), self.client, HandlerSettings(update_interval=0))
+        self.slack = MagicMock()
+        self.say = MagicMock(return_value={"ts": "2.0"})
+        self.msg_ctx = MessageContext(ThreadContext("C1", "1.0", "1.0"), self.say, MagicMock(), self.slack)
+
+    def tearDown(self):
+        self.handler.queue.shutdown()
+
+    def test_replaces_partial_answer(self):
+        """
+        The final answer overwrites the partial one in place.
+        """
+        self.client.stream_chat.return_value = iter([{"response": {"text": "Thinking"}}, FINAL_MESSAGE])
+        self.handler.process_message(self.msg_ctx, "hello", "Hi")
+        self.handler.queue.shutdown()
+
+        self.say.assert_called_once()
+        self.slack.chat_update.assert_called_once_with(channel="C1", ts="2.0", text="The answer")
+        self.slack.chat_delete.assert_not_called()
+
+    def test_failed_update_reposts_the_answer(self):
+        """
+        If the partial answer cannot be overwritten, it is deleted and the answer posted anew.
+        """
+        self.client.stream_chat.return_value = iter([{"response": {"text": "Thinking"}}, FINAL_MESSAGE])
+        self.slack.chat_update.side_effect = RuntimeError("message_not_found")
+        self.handler.process_message(self.msg_ctx, "hello", "Hi")
+        self.handler.queue.shutdown()
+
+        self.slack.chat_delete.assert_called_once_with(channel="C1", ts="2.0")
+        self.assertEqual(self.say.call_args.kwargs["text"], "The answer")
+
+    def test_failed_stream_deletes_partial_answer(self):
+        """
+        If the stream breaks after a partial answer was posted, only the error is left in the thread.
+        """
+
+        def broken_stream(_network_name, _payload):
+            yield {"response": {"text": "Thinking"}}
+            raise ValueError("connection reset")
+
+        self.client.stream_chat.side_effect = broken_stream
+        self.handler.process_message(self.msg_ctx, "hello", "Hi")
+        self.handler.queue.shutdown()
+
+        self.slack.chat_delete.assert_called_once_with(channel="C1", ts="2.0")
+        self.assertEqual(self.say.call_args.kwargs["text"], "Error calling API: connection reset")
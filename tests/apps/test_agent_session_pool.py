@@ -0,0 +1,127 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from unittest import TestCase
+
+from apps.agent_session_pool import AgentSessionPool
+
+
+# pylint: disable=too-few-public-methods
+class FakeSession:
+    """
+    Agent session that only records whether it was closed.
+    """
+
+    def __init__(self, agent_name: str):
+        self.agent_name = agent_name
+        self.closed = False
+
+    def close(self):
+        """
+        Mark the session closed.
+        """
+        self.closed = True
+
+
+# pylint: disable=too-few-public-methods
+class FakeFactory:
+    """
+    AgentSessionFactory that hands out fake sessions and counts them.
+    """
+
+    def __init__(self):
+        self.created = []
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,unused-argument
+    def create_session(self, connection, agent_name, host, port, local_externals_direct, metadata):
+        """
+        :return: A new fake session
+        """
+        session = FakeSession(agent_name)
+        self.created.append(session)
+        return session
+
+
+class TestAgentSessionPool(TestCase):
+    """
+    Unit tests for AgentSessionPool.
+    """
+
+    def setUp(self):
+        self.pool = AgentSessionPool(max_idle_per_key=1)
+        self.pool.factory = FakeFactory()
+
+    def test_released_session_is_reused(self):
+        """
+        A released session serves the next caller for the same agent network, but not another network.
+        """
+        first = self.pool.acquire("hello_world")
+        processor = self.pool.get_processor(first)
+        self.pool.release(first)
+
+        second = self.pool.acquire("hello_world")
+        self.assertIs(first, second)
+        self.assertIs(processor, self.pool.get_processor(second))
+        self.assertFalse(second.closed)
+
+        other = self.pool.acquire("music_nerd")
+        self.assertIsNot(first, other)
+        self.assertEqual(2, len(self.pool.factory.created))
+
+    def test_sessions_beyond_the_idle_cap_are_closed(self):
+        """
+        Only max_idle_per_key released sessions are kept, and releasing one twice keeps it once.
+        """
+        first = self.pool.acquire("hello_world")
+        second = self.pool.acquire("hello_world")
+        self.assertIsNot(first, second)
+
+        self.pool.release(first)
+        self.pool.release(first)
+        self.pool.release(second)
+        self.assertFalse(first.closed)
+        self.assertTrue(second.closed)
+
+        self.assertIs(first, self.pool.acquire("hello_world"))
+        self.assertIsNot(first, self.pool.acquire("hello_world"))
+        self.assertEqual(3, len(self.pool.factory.created))
+
+    def test_discarded_session_is_not_reused(self):
+        """
+        A discarded session is closed and never handed out again, even if it was released before.
+        """
+        session = self.pool.acquire("hello_world")
+        self.pool.release(session)
+        self.pool.discard(session)
+        self.assertTrue(session.closed)
+
+        self.assertIsNot(session, self.pool.acquire("hello_world"))
+
+    def test_close_all_leaves_sessions_in_use_open(self):
+        """
+        close_all closes idle sessions at once, and sessions in use once they are released.
+        """
+        idle = self.pool.acquire("hello_world")
+        in_use = self.pool.acquire("music_nerd")
+        self.pool.release(idle)
+
+        self.pool.close_all()
+        self.assertTrue(idle.closed)
+        self.assertFalse(in_use.closed)
+
+        self.pool.release(in_use)
+        self.assertTrue(in_use.closed)
+        self.assertIsNot(idle, self.pool.acquire("hello_world"))
@@ -0,0 +1,121 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from unittest import TestCase
+
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+
+from apps.response_blocks import BlockStreamingProcessor
+from apps.response_blocks import ResponseBlockParser
+from apps.response_blocks import parse_blocks
+
+KINDS = ("say", "gui")
+
+
+class TestResponseBlockParser(TestCase):
+    """
+    Unit tests for ResponseBlockParser.
+    """
+
+    def test_block_is_returned_once_the_next_one_starts(self):
+        """
+        A block is complete when the line starting the next block is, and the last one when the response ends.
+        """
+        parser = ResponseBlockParser(KINDS)
+        self.assertEqual([], parser.feed("say: hello\nthere\n"))
+        self.assertEqual([], parser.feed("GUI: <div>"))
+        self.assertEqual([("say", "hello\nthere")], parser.feed("</div>\n"))
+        self.assertEqual([("gui", "<div></div>")], parser.close())
+
+    def test_labels_split_across_pieces(self):
+        """
+        Text can be cut anywhere, even inside the label of a block.
+        """
+        parser = ResponseBlockParser(KINDS)
+        blocks = []
+        for piece in ("sa", "y: one\ng", "ui", ": two\nsay:", " three"):
+            blocks += parser.feed(piece)
+        blocks += parser.close()
+        self.assertEqual([("say", "one"), ("gui", "two"), ("say", "three")], blocks)
+
+    def test_text_before_the_first_block_is_dropped(self):
+        """
+        Only labeled blocks are returned, and unknown labels are part of the content.
+        """
+        self.assertEqual(
+            [("say", "hello\nthought: not a block")],
+            parse_blocks("preamble\nsay: hello\nthought: not a block", KINDS),
+        )
+        self.assertEqual([], parse_blocks("no blocks at all", KINDS))
+
+    def test_close_starts_over(self):
+        """
+        After close, the parser handles the next response from scratch.
+        """
+        parser = ResponseBlockParser(KINDS)
+        parser.feed("say: first")
+        self.assertEqual([("say", "first")], parser.close())
+        self.assertEqual([], parser.close())
+        self.assertEqual([("gui", "second")], parser.feed("gui: second\n") + parser.close())
+
+
+class TestBlockStreamingProcessor(TestCase):
+    """
+    Unit tests for BlockStreamingProcessor.
+    """
+
+    def test_only_answers_of_the_front_man_are_parsed(self):
+        """
+        Answer messages are parsed one after the other, each starting on a line of its own,
+        and messages of other agents are left out.
+        """
+        blocks = []
+        processor = BlockStreamingProcessor(KINDS, lambda kind, content: blocks.append((kind, content)))
+        front_man = [{"tool": "front_man"}]
+        processor.process_message({"text": "say: one", "origin": front_man}, ChatMessageType.AGENT_FRAMEWORK)
+        processor.process_message(
+            {"text": "say: not an answer", "origin": front_man + [{"tool": "other"}]}, ChatMessageType.AGENT_FRAMEWORK
+        )
+        processor.process_message({"text": "say: not an answer", "origin": front_man}, ChatMessageType.HUMAN)
+        processor.process_message({"text": "gui: two", "origin": front_man}, ChatMessageType.AGENT_FRAMEWORK)
+        self.assertEqual([("say", "one")], blocks)
+
+        processor.flush()
+        self.assertEqual([("say", "one"), ("gui", "two")], blocks)
+        self.assertEqual(2, processor.block_count)
+
+    def test_maximal_turn_hands_each_block_over_once(self):
+        """
+        With the MAXIMAL chat filter the answer of the front man comes as an AI message and again as the final
+        AGENT_FRAMEWORK message; its blocks are handed over once.
+        """
+        blocks = []
+        processor = BlockStreamingProcessor(KINDS, lambda kind, content: blocks.append((kind, content)))
+        front_man = [{"tool": "front_man"}]
+        answer = "say: hello\ngui: <form/>"
+        messages = [
+            ({"text": "hi", "origin": front_man}, ChatMessageType.HUMAN),
+            ({"text": "say: from a tool", "origin": front_man + [{"tool": "helper"}]}, ChatMessageType.AI),
+            ({"text": "say: from a tool", "origin": front_man + [{"tool": "helper"}]}, ChatMessageType.AGENT),
+            ({"text": answer, "origin": front_man}, ChatMessageType.AI),
+            ({"text": answer, "origin": front_man}, ChatMessageType.AGENT_FRAMEWORK),
+        ]
+        for chat_message_dict, message_type in messages:
+            processor.process_message(chat_message_dict, message_type)
+        processor.flush()
+
+        self.assertEqual([("say", "hello"), ("gui", "<form/>")], blocks)
+        self.assertEqual(2, processor.block_count)
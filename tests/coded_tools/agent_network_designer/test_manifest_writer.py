@@ -0,0 +1,125 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+from coded_tools.agent_network_designer.manifest_writer import ManifestWriter
+from coded_tools.agent_network_designer.manifest_writer import write_atomically
+
+
+class TestManifestWriter(TestCase):
+    """
+    Unit tests for ManifestWriter.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.temp_dir.name, "generated", "manifest.hocon")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_concurrent_entries_are_all_kept(self):
+        """
+        Entries added from many threads and two writers all end up in the manifest exactly once.
+        """
+        writers = [ManifestWriter(self.path), ManifestWriter(self.path)]
+        names = [f"generated/network_{index}.hocon" for index in range(40)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda index: writers[index % 2].add_entries([names[index % 20]]), range(40)))
+            list(executor.map(lambda index: writers[index % 2].add_entries([names[index]]), range(20, 40)))
+
+        with open(self.path, "r", encoding="utf-8") as manifest_file:
+            content: dict[str, bool] = json.loads(manifest_file.read().replace(",\n}", "\n}"))
+        self.assertEqual(sorted(content), sorted(names))
+        self.assertTrue(writers[0].contains("generated/network_39.hocon"))
+        self.assertEqual([name for name in os.listdir(os.path.dirname(self.path)) if name.endswith(".tmp")], [])
+
+    def test_written_files_keep_usual_permissions(self):
+        """
+        A new file gets the permissions open() would give it, and a replaced file keeps its own.
+        """
+        path = os.path.join(self.temp_dir.name, "network.hocon")
+        umask = os.umask(0o022)
+        try:
+            write_atomically(path, "{}")
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o644)
+
+            os.chmod(path, 0o640)
+            write_atomically(path, "{ }")
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o640)
+        finally:
+            os.umask(umask)
+
+    def test_keeps_hocon_format(self):
+        """
+        A manifest without braces gets HOCON entries, and commented-out entries do not count.
+        """
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as manifest_file:
+            manifest_file.write('# "generated/old.hocon" = true\n"generated/kept.hocon" = true\n')
+
+        writer = ManifestWriter(self.path)
+        writer.add_entries(["generated/kept.hocon", "generated/old.hocon"])
+
+        with open(self.path, "r", encoding="utf-8") as manifest_file:
+            self.assertEqual(
+                manifest_file.read(),
+                '# "generated/old.hocon" = true\n"generated/kept.hocon" = true\n"generated/old.hocon" = true\n',
+            )
+
+    def test_failed_write_is_reported_to_every_caller(self):
+        """
+        When the write that commits several callers' entries fails, each of them gets the error,
+        and the entries are written by the next call.
+        """
+        writer = ManifestWriter(self.path)
+        with patch(
+            "coded_tools.agent_network_designer.manifest_writer.write_atomically", side_effect=OSError("disk full")
+        ):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(writer.add_entries, [f"generated/network_{index}.hocon"]) for index in range(8)
+                ]
+            for future in futures:
+                with self.assertRaises(OSError):
+                    future.result()
+        self.assertFalse(writer.contains("generated/network_0.hocon"))
+
+        writer.add_entries(["generated/network_0.hocon"])
+        self.assertTrue(writer.contains("generated/network_0.hocon"))
+
+    def test_unreadable_manifest_is_reported_to_every_caller(self):
+        """
+        An error other than OSError, such as a manifest that is not UTF-8, reaches every caller instead of
+        leaving those whose entries were in the failed batch waiting.
+        """
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as manifest_file:
+            manifest_file.write(b'{\n    "generated/\xff.hocon": true\n}\n')
+
+        writer = ManifestWriter(self.path)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(writer.add_entries, [f"generated/network_{index}.hocon"]) for index in range(8)]
+            for future in futures:
+                with self.assertRaises(UnicodeDecodeError):
+                    future.result(timeout=10)
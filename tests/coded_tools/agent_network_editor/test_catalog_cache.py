@@ -0,0 +1,75 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from coded_tools.agent_network_editor.catalog_cache import FileCache
+from coded_tools.agent_network_editor.catalog_cache import _manifest_paths
+
+
+class TestCatalogCache(TestCase):
+    """
+    Unit tests for the file-based catalog caches.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.manifest = os.path.join(self.temp_dir.name, "manifest.hocon")
+        self.write("manifest.hocon", '{"hello.hocon": true}')
+        self.write("hello.hocon", "{}")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name: str, text: str):
+        """
+        :param name: Name of the file in the temporary directory
+        :param text: Content of the file
+        """
+        with open(os.path.join(self.temp_dir.name, name), "w", encoding="utf-8") as file:
+            file.write(text)
+
+    def test_walks_again_only_when_manifest_changes(self):
+        """
+        The registry directory is walked once per version of the manifest.
+        """
+        with patch.dict(os.environ, {"AGENT_MANIFEST_FILE": self.manifest}), patch(
+            "coded_tools.agent_network_editor.catalog_cache.os.walk", wraps=os.walk
+        ) as walk:
+            paths = _manifest_paths()
+            self.write("music.hocon", "{}")
+            self.assertEqual(_manifest_paths(), paths)
+            self.assertEqual(walk.call_count, 1)
+
+            stat = os.stat(self.manifest)
+            os.utime(self.manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertIn(os.path.join(self.temp_dir.name, "music.hocon"), _manifest_paths())
+            self.assertEqual(walk.call_count, 2)
+
+    def test_reloads_when_a_network_changes(self):
+        """
+        A change to a network file reloads the cached value even if the manifest is unchanged.
+        """
+        loads = []
+        cache = FileCache(lambda: loads.append(1) or len(loads), _manifest_paths)
+        with patch.dict(os.environ, {"AGENT_MANIFEST_FILE": self.manifest}):
+            self.assertEqual(cache.get(), 1)
+            self.assertEqual(cache.get(), 1)
+            self.write("hello.hocon", '{"tools": []}')
+            self.assertEqual(cache.get(), 2)
@@ -0,0 +1,110 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from coded_tools.agent_network_editor.catalog_cache import MCP_TOOLS_CACHE
+from coded_tools.agent_network_editor.get_mcp_tool import GetMcpTool
+
+GOOD_SERVER = "http://localhost:8000/mcp"
+BROKEN_SERVER = "http://localhost:8001/mcp"
+SLOW_SERVER = "http://localhost:8002/mcp"
+INVALID_SERVER = "not a url"
+
+
+# MCP servers the fake adapter was asked to list the tools of
+CALLS: list[str] = []
+
+
+async def get_mcp_tools(mcp_server: str):
+    """
+    Stands in for LangChainMcpAdapter.get_mcp_tools, with one server of each kind.
+
+    :param mcp_server: URL of the MCP server
+    :return: The tools of the server
+    """
+    CALLS.append(mcp_server)
+    if mcp_server == BROKEN_SERVER:
+        raise OSError("connection refused")
+    if mcp_server == SLOW_SERVER:
+        await asyncio.sleep(10)
+    if mcp_server == INVALID_SERVER:
+        raise ValueError("invalid URL")
+    return [SimpleNamespace(name="add", description="Adds two numbers")]
+
+
+class TestGetMcpTool(TestCase):
+    """
+    Unit tests for GetMcpTool.
+    """
+
+    def setUp(self):
+        MCP_TOOLS_CACHE.clear()
+        CALLS.clear()
+        servers = [GOOD_SERVER, BROKEN_SERVER, SLOW_SERVER]
+        with patch("coded_tools.agent_network_editor.get_mcp_tool.get_mcp_servers", return_value=servers):
+            self.tool = GetMcpTool()
+        self.tool.timeout_seconds = 0.2
+
+    def tearDown(self):
+        MCP_TOOLS_CACHE.clear()
+
+    def invoke(self) -> dict:
+        """
+        :return: The result of the tool
+        """
+        adapter = SimpleNamespace(get_mcp_tools=get_mcp_tools)
+        with patch("coded_tools.agent_network_editor.get_mcp_tool.LangChainMcpAdapter", return_value=adapter):
+            return asyncio.run(self.tool.async_invoke({}, {}))
+
+    def test_reports_each_server(self):
+        """
+        Every server gets an entry: its tools, or the error that kept it from listing them.
+        """
+        result = self.invoke()
+
+        self.assertEqual(list(result), [GOOD_SERVER, BROKEN_SERVER, SLOW_SERVER])
+        self.assertEqual(result[GOOD_SERVER]["tools"], {"add": "Adds two numbers"})
+        self.assertFalse(result[GOOD_SERVER]["cached"])
+        self.assertIn("connection refused", result[BROKEN_SERVER]["error"])
+        self.assertNotIn("tools", result[BROKEN_SERVER])
+        self.assertIn("did not list its tools within 0.2 seconds", result[SLOW_SERVER]["error"])
+        self.assertLess(result[SLOW_SERVER]["seconds"], 5)
+
+    def test_reuses_listed_tools(self):
+        """
+        Tools a server listed are reused by the next call, while failed servers are asked again.
+        """
+        self.invoke()
+        result = self.invoke()
+
+        self.assertEqual(result[GOOD_SERVER], {"tools": {"add": "Adds two numbers"}, "seconds": 0.0, "cached": True})
+        self.assertEqual(CALLS.count(GOOD_SERVER), 1)
+        self.assertEqual(CALLS.count(BROKEN_SERVER), 2)
+
+    def test_unexpected_error_keeps_other_servers(self):
+        """
+        An error of any kind from one server becomes its error entry, and the other servers still report.
+        """
+        self.tool.mcp_servers = [GOOD_SERVER, INVALID_SERVER]
+
+        result = self.invoke()
+
+        self.assertEqual(result[GOOD_SERVER]["tools"], {"add": "Adds two numbers"})
+        self.assertIn("invalid URL", result[INVALID_SERVER]["error"])
@@ -0,0 +1,151 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import copy
+import random
+from typing import Any
+from unittest import TestCase
+
+from neuro_san.internals.validation.network.keyword_network_validator import KeywordNetworkValidator
+from neuro_san.internals.validation.network.structure_network_validator import StructureNetworkValidator
+from neuro_san.internals.validation.network.toolbox_network_validator import ToolboxNetworkValidator
+from neuro_san.internals.validation.network.url_network_validator import UrlNetworkValidator
+
+from coded_tools.agent_network_editor.incremental_validator import IncrementalNetworkValidator
+from coded_tools.agent_network_editor.incremental_validator import ValidationResult
+from coded_tools.agent_network_editor.incremental_validator import get_network_validator
+from coded_tools.agent_network_editor.incremental_validator import get_session_validator
+
+TOOLS: dict[str, Any] = {"search_tool": {}}
+EXTERNAL_AGENTS: list[str] = ["/math_guy"]
+MCP_SERVERS: list[str] = ["http://localhost:8000/mcp"]
+
+
+def validate_from_scratch(network_def: dict[str, Any]) -> list[str]:
+    """
+    :return: The errors the neuro-san validators find in the whole network
+    """
+    return (
+        StructureNetworkValidator().validate(network_def)
+        + KeywordNetworkValidator().validate(network_def)
+        + ToolboxNetworkValidator(TOOLS).validate(network_def)
+        + UrlNetworkValidator(EXTERNAL_AGENTS, MCP_SERVERS).validate(network_def)
+    )
+
+
+class TestIncrementalNetworkValidator(TestCase):
+    """
+    Unit tests for IncrementalNetworkValidator.
+    """
+
+    def sync(self, validator: IncrementalNetworkValidator, network_def: dict[str, Any]) -> ValidationResult:
+        """
+        :return: The result of syncing the validator with the network
+        """
+        return validator.sync(network_def, TOOLS, EXTERNAL_AGENTS, MCP_SERVERS)
+
+    def test_reports_errors_each_edit_adds_and_clears(self):
+        """
+        Each edit reports only the errors it caused or fixed.
+        """
+        network_def: dict[str, Any] = {"front": {"instructions": "lead", "tools": ["helper"]}}
+        validator = IncrementalNetworkValidator()
+        self.assertEqual(
+            self.sync(validator, network_def).new_errors,
+            ["Agent 'front' references non-existent agent(s) in tools: 'helper'"],
+        )
+
+        network_def["helper"] = {"instructions": ""}
+        result: ValidationResult = self.sync(validator, network_def)
+        self.assertEqual(result.new_errors, ["helper 'instructions' cannot be empty."])
+        self.assertEqual(result.cleared_errors, ["Agent 'front' references non-existent agent(s) in tools: 'helper'"])
+
+        network_def["helper"] = {"instructions": "help", "tools": ["front", "/unknown"]}
+        result = self.sync(validator, network_def)
+        self.assertEqual(
+            result.new_errors,
+            [
+                "Cyclical dependencies found in agents: ['front', 'helper']",
+                "No top agent found in network",
+                "Agent 'helper' has invalid URL or path in tools. "
+                "Invalid tool: '/unknown' urls: ['/math_guy', 'http://localhost:8000/mcp']",
+            ],
+        )
+        self.assertEqual(result.errors, validate_from_scratch(network_def))
+
+        network_def["helper"]["tools"] = ["search_tool", "/math_guy"]
+        network_def["search_tool"] = {}
+        result = self.sync(validator, network_def)
+        self.assertEqual(result.new_errors, [])
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.top_agents, {"front"})
+
+    def test_matches_validation_from_scratch(self):
+        """
+        After any sequence of edits, the errors are those of the neuro-san validators.
+        """
+        names: list[str] = ["a", "b", "c", "d", "search_tool", "missing_tool"]
+        for seed in range(50):
+            generator = random.Random(seed)
+            network_def: dict[str, Any] = {"a": {"instructions": "lead"}}
+            validator = IncrementalNetworkValidator()
+            for _ in range(30):
+                choice: float = generator.random()
+                name: str = generator.choice(names)
+                if choice < 0.3:
+                    network_def[name] = {} if name.endswith("_tool") else {"instructions": generator.choice(["", "x"])}
+                elif choice < 0.45 and len(network_def) > 1:
+                    network_def.pop(generator.choice(list(network_def)))
+                else:
+                    tools: list[str] = names + ["/math_guy", "/unknown", "http://localhost:9000"]
+                    generator.choice(list(network_def.values()))["tools"] = generator.sample(
+                        tools, generator.randint(0, 3)
+                    )
+                result: ValidationResult = self.sync(validator, network_def)
+                self.assertEqual(result.errors, validate_from_scratch(network_def), f"seed {seed}: {network_def}")
+
+    def test_validator_is_found_by_session_key(self):
+        """
+        A definition rebuilt from sly data on the next turn is reconciled with the same validator.
+        """
+        network_def: dict[str, Any] = {"front": {"instructions": "lead", "tools": ["helper"]}}
+        validator: IncrementalNetworkValidator = get_network_validator("test_session")
+        self.sync(validator, network_def)
+
+        rebuilt: dict[str, Any] = copy.deepcopy(network_def)
+        rebuilt["helper"] = {"instructions": "help"}
+        self.assertIs(get_network_validator("test_session"), validator)
+        result: ValidationResult = self.sync(get_network_validator("test_session"), rebuilt)
+        self.assertEqual(result.new_errors, [])
+        self.assertEqual(result.cleared_errors, ["Agent 'front' references non-existent agent(s) in tools: 'helper'"])
+        self.assertIsNot(get_network_validator("other_session"), validator)
+
+    def test_sessions_with_the_same_network_name_do_not_share_validators(self):
+        """
+        Two sessions editing networks of the same name each get their own errors and top agent.
+        """
+        first_sly_data: dict[str, Any] = {"agent_network_name": "customer_support_network"}
+        second_sly_data: dict[str, Any] = {"agent_network_name": "customer_support_network"}
+        first: IncrementalNetworkValidator = get_session_validator(first_sly_data)
+        second: IncrementalNetworkValidator = get_session_validator(second_sly_data)
+
+        self.assertIsNot(first, second)
+        self.assertIs(get_session_validator(first_sly_data), first)
+        self.sync(first, {"front": {"instructions": "lead"}})
+        result: ValidationResult = self.sync(second, {"desk": {"instructions": ""}})
+        self.assertEqual(result.top_agents, {"desk"})
+        self.assertEqual(result.new_errors, ["desk 'instructions' cannot be empty."])
+        self.assertEqual(self.sync(first, {"front": {"instructions": "lead"}}).top_agents, {"front"})
@@ -0,0 +1,94 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from coded_tools.experimental.kwik_agents.memory_store import MemoryStore
+from coded_tools.experimental.kwik_agents.recall_memory import RecallMemory
+
+
+class TestMemoryStore(TestCase):
+    """
+    Unit tests for MemoryStore.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.temp_dir.name, "TopicMemory.db")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_imports_legacy_file_and_appends(self):
+        """
+        A legacy JSON memory is split into facts, and new facts are appended without duplicates.
+        """
+        legacy_path = os.path.join(self.temp_dir.name, "TopicMemory.json")
+        with open(legacy_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"pets": "[2025-01-01 10:00:00] Bill has a dog named Max\n[2025-01-02 10:00:00] Max is a beagle"}, file
+            )
+
+        store = MemoryStore(self.path, compact_interval=2)
+        self.assertEqual(store.import_legacy_file(legacy_path), 2)
+        self.assertTrue(store.add_fact("family", "Bill has a sister named Ann"))
+        self.assertFalse(store.add_fact("pets", "  bill has a dog named MAX "))
+
+        reopened = MemoryStore(self.path)
+        self.assertEqual(reopened.topics(), ["family", "pets"])
+        self.assertEqual(
+            MemoryStore.format_facts(reopened.facts("pets")),
+            "[2025-01-01 10:00:00] Bill has a dog named Max\n[2025-01-02 10:00:00] Max is a beagle",
+        )
+        self.assertEqual(reopened.import_legacy_file(legacy_path), 0)
+
+    def test_recall_returns_relevant_facts(self):
+        """
+        With a query, recall returns the matching facts of the topic first, then matches from other topics.
+        """
+        store = MemoryStore(self.path)
+        store.add_fact("pets", "Bill has a dog named Max", "2025-01-01 10:00:00")
+        store.add_fact("pets", "Ann has a cat", "2025-01-01 10:01:00")
+        store.add_fact("family", "Max bit Bill's sister Ann", "2025-01-01 10:02:00")
+
+        recalled: str = RecallMemory.recall_from_store(store, "pets", "max")
+
+        self.assertEqual(
+            recalled,
+            "[2025-01-01 10:00:00] Bill has a dog named Max\n[2025-01-01 10:02:00] (family) Max bit Bill's sister Ann",
+        )
+        self.assertEqual(RecallMemory.recall_from_store(store, "pets", "parrot"), "NO RELATED MEMORIES!")
+
+        # Without FTS5 the same facts are found by BM25
+        full_text_results = store.search("max")
+        store.full_text = False
+        self.assertCountEqual(store.search("max"), full_text_results)
+
+    def test_full_text_index_covers_earlier_facts(self):
+        """
+        Facts stored before the full-text index existed are found once it is created.
+        """
+        store = MemoryStore(self.path)
+        store.add_fact("pets", "Bill has a dog named Max", "2025-01-01 10:00:00")
+        with store._connection:  # pylint: disable=protected-access
+            store._connection.execute("DROP TABLE facts_fts")  # pylint: disable=protected-access
+
+        reopened = MemoryStore(self.path)
+
+        self.assertEqual(reopened.search("max"), [("pets", "2025-01-01 10:00:00", "Bill has a dog named Max")])
@@ -0,0 +1,82 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+from typing import Any
+from unittest import TestCase
+
+from coded_tools.experimental.mdap_decomposer.call_scheduler import CALL_PRIORITY
+from coded_tools.experimental.mdap_decomposer.call_scheduler import CallScheduler
+from coded_tools.experimental.mdap_decomposer.call_scheduler import ScheduledAgentCaller
+from coded_tools.tools.agent_caller import AgentCaller
+
+
+class RecordingCaller(AgentCaller):
+    """
+    AgentCaller that records the order of its calls and how many overlap.
+    """
+
+    def __init__(self):
+        self.order: list[str] = []
+        self.running: int = 0
+        self.peak: int = 0
+
+    def get_name(self) -> str:
+        return "recording"
+
+    async def call_agent(self, tool_args: dict[str, Any], sly_data: dict[str, Any] = None) -> str:
+        self.order.append(tool_args["problem"])
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.001)
+        self.running -= 1
+        return tool_args["problem"]
+
+
+class TestCallScheduler(TestCase):
+    """
+    Unit tests for CallScheduler.
+    """
+
+    def test_bounds_calls_and_prefers_shallow_nodes(self):
+        """
+        No more than max_in_flight calls overlap, and queued shallow calls go before deep ones.
+        """
+        inner = RecordingCaller()
+        scheduler = CallScheduler(max_in_flight=2)
+        caller = ScheduledAgentCaller(inner, scheduler)
+
+        async def call(name: str, depth: int) -> str:
+            CALL_PRIORITY.set(depth)
+            return await caller.call_agent({"problem": name})
+
+        async def run_all():
+            return await asyncio.gather(*[call(f"deep{i}", 3) for i in range(4)], call("shallow", 0))
+
+        results = asyncio.run(run_all())
+
+        self.assertEqual(results[4], "shallow")
+        self.assertEqual(inner.peak, 2)
+        self.assertEqual(inner.order[:3], ["deep0", "deep1", "shallow"])
+        self.assertEqual(scheduler.stats()["agent_calls"], 5)
+        self.assertEqual(scheduler.in_flight, 0)
+
+    def test_rejects_empty_budget(self):
+        """
+        A budget of no calls at all is refused rather than left to block every call.
+        """
+        with self.assertRaises(ValueError):
+            CallScheduler(max_in_flight=0)
@@ -0,0 +1,83 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+from typing import Any
+from unittest import TestCase
+
+from coded_tools.experimental.mdap_decomposer.first_to_k_voter import FirstToKVoter
+from coded_tools.tools.agent_caller import AgentCaller
+
+
+class ScriptedVoter(AgentCaller):
+    """
+    AgentCaller that hands out scripted (delay, vote) answers in call order.
+    """
+
+    def __init__(self, script: list[tuple[float, str]]):
+        self.script = list(script)
+        self.started: int = 0
+        self.finished: int = 0
+        self.cancelled: int = 0
+
+    def get_name(self) -> str:
+        return "scripted"
+
+    async def call_agent(self, tool_args: dict[str, Any], sly_data: dict[str, Any] = None) -> str:
+        delay, vote = self.script[self.started]
+        self.started += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        self.finished += 1
+        return vote
+
+
+class TestFirstToKVoter(TestCase):
+    """
+    Unit tests for FirstToKVoter.
+    """
+
+    def vote(self, caller: ScriptedVoter, adaptive: bool) -> tuple[list[int], int]:
+        """
+        Run one round of voting over two candidates.
+        """
+        voter = FirstToKVoter("[test]", "test", "solutions", caller, 5, 2, adaptive=adaptive)
+        return asyncio.run(voter.vote("problem", ["a", "b"]))
+
+    def test_cancels_outstanding_votes(self):
+        """
+        Once a candidate has K votes the slower calls are cancelled.
+        """
+        caller = ScriptedVoter([(0.01, "2"), (0.02, "2"), (5.0, "1"), (5.0, "1"), (5.0, "1")])
+
+        votes, winner_idx = self.vote(caller, adaptive=False)
+
+        self.assertEqual((votes, winner_idx), ([0, 2], 1))
+        self.assertEqual((caller.started, caller.finished, caller.cancelled), (5, 2, 3))
+
+    def test_adaptive_votes_only_when_split(self):
+        """
+        Adaptive mode starts with K calls and adds calls only while votes split.
+        """
+        caller = ScriptedVoter([(0.0, "1"), (0.0, "2"), (0.0, "oops"), (0.0, "2"), (0.0, "1")])
+
+        votes, winner_idx = self.vote(caller, adaptive=True)
+
+        self.assertEqual((votes, winner_idx), ([1, 2], 1))
+        self.assertEqual(caller.started, 4)
@@ -0,0 +1,111 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from typing import Any
+from unittest import TestCase
+
+from coded_tools.experimental.mdap_decomposer.neuro_san_solver import NeuroSanSolver
+from coded_tools.experimental.mdap_decomposer.solution_cache import SolutionCache
+from coded_tools.experimental.mdap_decomposer.solver_config import SolverConfig
+from coded_tools.tools.agent_caller import AgentCaller
+
+
+class ScriptedAgentCaller(AgentCaller):
+    """
+    AgentCaller that answers from a function of the problem and counts its calls.
+    """
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls: int = 0
+
+    def get_name(self) -> str:
+        return "scripted"
+
+    async def call_agent(self, tool_args: dict[str, Any], sly_data: dict[str, Any] = None) -> str:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.answer(tool_args.get("problem"))
+
+
+class TestSolutionCache(TestCase):
+    """
+    Unit tests for SolutionCache and its use by NeuroSanSolver.
+    """
+
+    def setUp(self):
+        # "whole" splits into the same sub-problem twice; "part" is atomic
+        self.decomposer = ScriptedAgentCaller(
+            lambda problem: (
+                "P1=[part], P2=[  part ], C=[join]" if problem == "whole" else "P1=[None], P2=[None], C=[None]"
+            )
+        )
+        self.problem_solver = ScriptedAgentCaller(lambda problem: f"vote: answer to {problem}")
+        self.discriminator = ScriptedAgentCaller(lambda problem: "1")
+
+    def make_solver(self, cache: SolutionCache) -> NeuroSanSolver:
+        """
+        :return: A solver that uses the scripted agents and the given cache
+        """
+        solver = NeuroSanSolver(SolverConfig(winning_vote_count=2))
+        solver.set_callers(self.discriminator, self.decomposer, self.problem_solver, self.discriminator)
+        solver.set_solution_cache(cache, cache_scope={"tools": "scripted"})
+        return solver
+
+    def test_repeated_sub_problems_are_solved_once(self):
+        """
+        Identical siblings share one solve, and a later request reuses the whole tree.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "solutions.db")
+            cache = SolutionCache(path)
+
+            first = asyncio.run(self.make_solver(cache).solve("whole", depth=0, max_depth=2))
+            # 3 candidates for the single solve of "part" and 3 for the composition of "whole"
+            self.assertEqual(self.problem_solver.calls, 6)
+            self.assertEqual([child["path"] for child in first["children"]], ["0.0", "0.1"])
+            self.assertTrue(first["children"][1]["cached"])
+            self.assertNotIn("cached", first)
+            # The root itself started 3 decomposer, 3 solver and 2 x 3 discriminator calls
+            self.assertEqual(first["timing"]["agent_calls"], 12)
+
+            second = asyncio.run(
+                self.make_solver(SolutionCache(path)).solve("whole", depth=1, max_depth=3, path="0.1")
+            )
+            self.assertEqual(self.problem_solver.calls, 6)
+            self.assertTrue(second["cached"])
+            self.assertEqual(second["extracted_final"], first["extracted_final"])
+            self.assertEqual(
+                [(child["depth"], child["path"]) for child in second["children"]], [(2, "0.1.0"), (2, "0.1.1")]
+            )
+
+    def test_expired_solutions_are_solved_again(self):
+        """
+        Solutions older than the TTL are dropped, in memory and on disk.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "solutions.db")
+            cache = SolutionCache(path, ttl_seconds=3600.0)
+            cache.put("key", {"extracted_final": "answer"})
+            self.assertEqual(cache.get("key"), {"extracted_final": "answer"})
+
+            cache.ttl_seconds = 0.0
+            self.assertIsNone(cache.get("key"))
+            self.assertIsNone(SolutionCache(path).get("key"))
+            self.assertEqual(cache.stats()["misses"], 1)
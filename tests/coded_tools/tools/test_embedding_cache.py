@@ -0,0 +1,82 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from coded_tools.tools.embedding_cache import CachedEmbeddings
+from coded_tools.tools.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache(TestCase):
+    """
+    Unit tests for EmbeddingCache and CachedEmbeddings.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = EmbeddingCache(os.path.join(self.temp_dir, "embeddings.db"), max_entries=2)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_key_depends_on_model_and_dimensions(self):
+        """
+        The same text embedded with a different model or size must not share a cache entry.
+        """
+        key = EmbeddingCache.make_key("model-a", 8, "hello")
+        self.assertEqual(key, EmbeddingCache.make_key("model-a", 8, "hello"))
+        self.assertNotEqual(key, EmbeddingCache.make_key("model-b", 8, "hello"))
+        self.assertNotEqual(key, EmbeddingCache.make_key("model-a", 16, "hello"))
+
+    def test_evicts_least_recently_used(self):
+        """
+        Once over max_entries, the entry that was accessed least recently is dropped.
+        """
+        self.cache.put_many({"a": [1.0], "b": [2.0]})
+        self.cache.get_many(["a"])
+        self.cache.put_many({"c": [3.0]})
+
+        found = self.cache.get_many(["a", "b", "c"])
+        self.assertEqual(sorted(found), ["a", "c"])
+
+    def test_replacing_an_entry_does_not_count_twice(self):
+        """
+        Writing a key that is already cached replaces it without evicting anything.
+        """
+        self.cache.put_many({"a": [1.0], "b": [2.0]})
+        self.cache.put_many({"a": [1.5]})
+
+        self.assertEqual(self.cache.get_many(["a", "b"]), {"a": [1.5], "b": [2.0]})
+
+    def test_only_misses_are_embedded(self):
+        """
+        CachedEmbeddings sends only uncached texts to the underlying model and counts hits and misses.
+        """
+        embeddings = MagicMock()
+        embeddings.embed_documents.side_effect = lambda texts: [[float(len(text))] for text in texts]
+        cached = CachedEmbeddings(embeddings, model="model", dimensions=1, cache=self.cache)
+
+        self.assertEqual(cached.embed_documents(["ab", "abc"]), [[2.0], [3.0]])
+        self.assertEqual(cached.embed_documents(["ab", "abcd"]), [[2.0], [4.0]])
+
+        embeddings.embed_documents.assert_called_with(["abcd"])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 3)
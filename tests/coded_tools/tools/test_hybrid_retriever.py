@@ -0,0 +1,143 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from coded_tools.tools.bm25_index import Bm25Index
+from coded_tools.tools.hybrid_retriever import HybridRetriever
+from coded_tools.tools.hybrid_retriever import RetrievalSettings
+from coded_tools.tools.hybrid_retriever import get_retrieval_indexes
+from coded_tools.tools.hybrid_retriever import mark_vector_store_written
+from coded_tools.tools.ivf_index import IvfIndex
+from coded_tools.tools.ivf_index import normalize
+from coded_tools.tools.mmap_vector_store import MmapVectorStore
+
+TEXTS = {
+    "a": "the quarterly revenue report for the sales team",
+    "b": "error code XK-42 means the disk is full",
+    "c": "the team meets every monday to review revenue",
+}
+
+
+class TestHybridRetriever(TestCase):
+    """
+    Unit tests for the BM25 index, the IVF index and the hybrid retriever.
+    """
+
+    def test_bm25_ranks_rare_terms_and_persists(self):
+        """
+        Rare terms outrank common ones, and the index survives a save, load and sync.
+        """
+        index = Bm25Index()
+        index.add(TEXTS)
+        self.assertEqual(index.search("xk revenue", k=1)[0][0], "b")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.bm25.json")
+            index.save(path)
+            loaded = Bm25Index.load(path)
+
+        self.assertEqual(loaded.search("revenue", k=3), index.search("revenue", k=3))
+        self.assertTrue(loaded.sync({"a": TEXTS["a"]}))
+        self.assertEqual([doc_id for doc_id, _ in loaded.search("team revenue", k=3)], ["a"])
+        self.assertEqual(set(loaded.postings["team"]), {"a"})
+
+    def test_hybrid_finds_keyword_match(self):
+        """
+        A chunk with an exact keyword match is returned even though fake embeddings are random.
+        """
+        store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=16))
+        store.add_texts(list(TEXTS.values()), ids=list(TEXTS))
+        retriever = HybridRetriever(vectorstore=store, indexes=get_retrieval_indexes(store), k=1)
+
+        docs = asyncio.run(retriever.ainvoke("XK-42"))
+
+        self.assertEqual([doc.id for doc in docs], ["b"])
+
+    def test_ivf_finds_nearest_neighbour(self):
+        """
+        Probing every cluster gives the exact nearest neighbours.
+        """
+        matrix = normalize(np.random.default_rng(1).normal(size=(500, 8)))
+        index = IvfIndex(matrix, nprobe=1000)
+
+        hits = index.search(matrix[42] * 3.0, k=3)
+
+        self.assertEqual(hits[0][0], 42)
+        self.assertAlmostEqual(hits[0][1], 1.0, places=5)
+        self.assertEqual([row for row, _ in hits], list(np.argsort(-(matrix @ matrix[42]))[:3]))
+
+    def test_indexes_follow_replaced_chunks(self):
+        """
+        Replacing a chunk by another one brings the indexes up to date, though the number of chunks is the same.
+        """
+        store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=16))
+        store.add_texts([TEXTS["a"], TEXTS["c"]], ids=["a", "c"])
+        get_retrieval_indexes(store)
+
+        store.delete(["c"])
+        store.add_texts([TEXTS["b"]], ids=["b"])
+        mark_vector_store_written(store)
+        indexes = get_retrieval_indexes(store)
+
+        self.assertEqual([doc_id for doc_id, _ in indexes.bm25.search("XK-42", k=1)], ["b"])
+
+    def test_indexes_are_not_resynced_without_writes(self):
+        """
+        Queries against an unchanged store reuse its indexes without looking at its chunks again.
+        """
+        store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=16))
+        store.add_texts(list(TEXTS.values()), ids=list(TEXTS))
+        indexes = get_retrieval_indexes(store)
+        indexes.size = -1
+
+        self.assertIs(get_retrieval_indexes(store), indexes)
+        self.assertEqual(indexes.size, -1)
+
+    def test_hybrid_search_is_opt_in(self):
+        """
+        Tools keep the plain vector ranking unless they ask for hybrid search.
+        """
+        self.assertFalse(RetrievalSettings.from_args({}).hybrid_search)
+        self.assertTrue(RetrievalSettings.from_args({"hybrid_search": True}).hybrid_search)
+
+    def test_ann_hits_match_documents_by_id(self):
+        """
+        Ids the ANN index still has but the store dropped are left out without shifting the other scores.
+        """
+        store = MmapVectorStore(embedding=DeterministicFakeEmbedding(size=8))
+        vectors = normalize(np.random.default_rng(2).normal(size=(50, 8)))
+        store._add_vectors(  # pylint: disable=protected-access
+            vectors.tolist(), [f"text {i}" for i in range(50)], None, [f"id{i}" for i in range(50)]
+        )
+        retriever = HybridRetriever(
+            vectorstore=store, indexes=get_retrieval_indexes(store), k=5, use_ann=True, ann_min_vectors=0
+        )
+        ann = retriever._get_ann_index()  # pylint: disable=protected-access
+        store.delete(["id0"])
+
+        hits = retriever._vector_search(vectors[0].tolist(), ann)  # pylint: disable=protected-access
+
+        self.assertNotIn("id0", [doc.id for doc, _ in hits])
+        for doc, score in hits:
+            self.assertAlmostEqual(score, float(vectors[int(doc.id[2:])] @ vectors[0]), places=5)
@@ -0,0 +1,88 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+from unittest import TestCase
+from unittest.mock import patch
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from coded_tools.tools.ingestion_pipeline import IngestionPipeline
+from coded_tools.tools.source_manifest import SourceManifest
+
+
+def split_words(docs, chunk_size, chunk_overlap):  # pylint: disable=unused-argument
+    """
+    Stand-in for the token splitter so that tests do not need to download an encoder.
+    """
+    return [Document(page_content=word, metadata=doc.metadata) for doc in docs for word in doc.page_content.split()]
+
+
+async def source_batches(contents: dict[str, str]):
+    """
+    Yield one single-page source at a time.
+    """
+    for source, text in contents.items():
+        yield [Document(page_content=text, metadata={"source": source})]
+
+
+@patch("coded_tools.tools.ingestion_pipeline.split_documents", split_words)
+class TestIngestionPipeline(TestCase):
+    """
+    Unit tests for IngestionPipeline.
+    """
+
+    def setUp(self):
+        self.store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=8))
+        self.manifest = SourceManifest()
+        self.pipeline = IngestionPipeline(embedding_batch_size=2, embedding_concurrency=2)
+
+    def run_pipeline(self, contents: dict[str, str], keep_sources=None) -> bool:
+        """
+        Run the pipeline over the given sources.
+        """
+        return asyncio.run(self.pipeline.run(self.store, source_batches(contents), self.manifest, keep_sources))
+
+    def test_build_in_batches(self):
+        """
+        All chunks of all sources end up in the store and in the manifest.
+        """
+        self.assertTrue(self.run_pipeline({"a": "one two three", "b": "four five"}))
+
+        self.assertEqual(len(self.store.store), 5)
+        self.assertEqual(len(self.manifest.chunk_ids("a")), 3)
+        self.assertEqual(len(self.manifest.chunk_ids("b")), 2)
+
+    def test_incremental_update(self):
+        """
+        Unchanged sources are skipped, changed ones replaced and missing ones removed unless kept.
+        """
+        self.run_pipeline({"a": "one two three", "b": "four five", "c": "six"})
+        unchanged_ids = self.manifest.chunk_ids("a")
+
+        self.assertTrue(self.run_pipeline({"a": "one two three", "b": "four"}, keep_sources={"c"}))
+
+        self.assertEqual(self.manifest.chunk_ids("a"), unchanged_ids)
+        self.assertEqual(
+            sorted(doc["text"] for doc in self.store.store.values()), ["four", "one", "six", "three", "two"]
+        )
+        self.assertFalse(self.run_pipeline({"a": "one two three", "b": "four"}, keep_sources={"c"}))
+
+        self.run_pipeline({"a": "one two three", "b": "four"})
+        self.assertNotIn("c", self.manifest.sources)
+        self.assertEqual(len(self.store.store), 4)
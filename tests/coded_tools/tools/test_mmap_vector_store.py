@@ -0,0 +1,141 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+from langchain_core.embeddings import FakeEmbeddings
+
+from coded_tools.tools.mmap_vector_store import MmapVectorStore
+
+
+class DimensionedFakeEmbeddings(FakeEmbeddings):
+    """
+    Fake embeddings that declare their dimension, as OpenAIEmbeddings does.
+    """
+
+    dimensions: int
+
+
+class TestMmapVectorStore(TestCase):
+    """
+    Unit tests for MmapVectorStore.
+    """
+
+    def setUp(self):
+        self.store = MmapVectorStore(embedding=FakeEmbeddings(size=4), dtype="float16")
+        self.store._add_vectors(  # pylint: disable=protected-access
+            [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [1.0, 1.0, 0.0, 0.0]],
+            ["x", "y", "xy"],
+            [{"n": 1}, {"n": 2}, {"n": 3}],
+            ["a", "b", "c"],
+        )
+
+    def test_top_k_by_cosine(self):
+        """
+        Results come back most similar first and are limited to k.
+        """
+        results = self.store.similarity_search_with_score_by_vector([2.0, 0.1, 0.0, 0.0], k=2)
+
+        self.assertEqual([doc.id for doc, _ in results], ["a", "c"])
+        self.assertGreater(results[0][1], results[1][1])
+
+    def test_delete(self):
+        """
+        Deleted ids are no longer returned and remaining ids still resolve.
+        """
+        self.store.delete(["a"])
+
+        self.assertEqual(self.store.ids, ["b", "c"])
+        self.assertEqual([doc.page_content for doc in self.store.get_by_ids(["a", "c"])], ["xy"])
+
+    def test_dump_and_load_memory_maps(self):
+        """
+        A dumped store loads back as a read-only memory map with the same contents.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.npy")
+            self.store.dump(path)
+            loaded = MmapVectorStore.load(path, embedding=FakeEmbeddings(size=4))
+
+            self.assertIsInstance(loaded.matrix, np.memmap)
+            self.assertEqual(loaded.dtype, "float16")
+            self.assertEqual(loaded.ids, ["a", "b", "c"])
+            self.assertEqual(loaded.get_by_ids(["b"])[0].metadata, {"n": 2})
+            del loaded
+
+    def test_filter(self):
+        """
+        Only documents accepted by the filter are scored.
+        """
+        results = self.store.similarity_search_with_score_by_vector(
+            [2.0, 0.1, 0.0, 0.0], k=2, filter=lambda doc: doc.metadata["n"] > 1
+        )
+
+        self.assertEqual([doc.id for doc, _ in results], ["c", "b"])
+
+    def test_dump_replaces_previous_generation(self):
+        """
+        Dumping again switches the sidecar to a new matrix and removes the previous one.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.npy")
+            self.store.dump(path)
+            self.store.delete(["a"])
+            self.store.dump(path)
+
+            self.assertEqual(len([name for name in os.listdir(temp_dir) if name.endswith(".npy")]), 1)
+            loaded = MmapVectorStore.load(path, embedding=FakeEmbeddings(size=4))
+            self.assertEqual(loaded.ids, ["b", "c"])
+            del loaded
+
+    def test_load_checks_dimension(self):
+        """
+        A store whose vectors do not match the dimension of the embeddings model is rejected.
+        """
+        embedding = DimensionedFakeEmbeddings(size=8, dimensions=8)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.npy")
+            self.store.dump(path)
+
+            with self.assertRaises(ValueError):
+                MmapVectorStore.load(path, embedding=embedding)
+
+    def test_batches_are_compacted_once(self):
+        """
+        Many added and re-added batches copy the matrix once, when it is next searched.
+        """
+        store = MmapVectorStore(embedding=FakeEmbeddings(size=4))
+        # pylint: disable=protected-access
+        with patch("coded_tools.tools.mmap_vector_store.np.concatenate", wraps=np.concatenate) as concatenate:
+            for batch in range(50):
+                vector = [float(batch + 1), 1.0, 0.0, 0.0]
+                store._add_vectors([vector], [f"text {batch}"], None, [f"id {batch}"])
+            for batch in range(10):
+                vector = [0.0, 0.0, 1.0, float(batch)]
+                store._add_vectors([vector], [f"new text {batch}"], None, [f"id {batch}"])
+            self.assertEqual(concatenate.call_count, 0)
+
+            results = store.similarity_search_with_score_by_vector([0.0, 0.0, 1.0, 0.0], k=1)
+            self.assertEqual(concatenate.call_count, 1)
+
+        self.assertEqual([doc.page_content for doc, _ in results], ["new text 0"])
+        self.assertEqual(store.matrix.shape, (50, 4))
+        expected_ids = [f"id {batch}" for batch in range(10, 50)] + [f"id {batch}" for batch in range(10)]
+        self.assertEqual(store.ids, expected_ids)
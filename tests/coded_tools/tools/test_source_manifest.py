@@ -0,0 +1,61 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import os
+import tempfile
+from unittest import TestCase
+
+from langchain_core.documents import Document
+
+from coded_tools.tools.source_manifest import SourceManifest
+
+
+class TestSourceManifest(TestCase):
+    """
+    Unit tests for SourceManifest.
+    """
+
+    def test_fingerprint_groups_by_source(self):
+        """
+        Pages loaded from one source share a fingerprint that changes with their content.
+        """
+        docs = [
+            Document(page_content="page 1", metadata={"source": "a.pdf"}),
+            Document(page_content="page 2", metadata={"source": "a.pdf"}),
+            Document(page_content="other", metadata={"source": "b.pdf"}),
+        ]
+        grouped = SourceManifest.group_by_source(docs)
+
+        self.assertEqual(list(grouped), ["a.pdf", "b.pdf"])
+        self.assertNotEqual(
+            SourceManifest.fingerprint(grouped["a.pdf"]),
+            SourceManifest.fingerprint([Document(page_content="page 1", metadata={"source": "a.pdf"})]),
+        )
+
+    def test_save_and_load(self):
+        """
+        A saved manifest loads back unchanged.
+        """
+        manifest = SourceManifest()
+        manifest.set_source("a.pdf", "1", [SourceManifest.chunk_id("a.pdf", 0, "text")])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.sources.json")
+            manifest.save(path)
+            loaded = SourceManifest.load(path)
+
+        self.assertEqual(loaded.sources, manifest.sources)
+        self.assertIsNone(SourceManifest.load(os.path.join(temp_dir, "missing.json")))
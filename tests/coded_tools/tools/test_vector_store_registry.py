@@ -0,0 +1,100 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+from unittest import TestCase
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from coded_tools.tools.vector_store_registry import VectorStoreRegistry
+from coded_tools.tools.vector_store_registry import make_registry_key
+
+
+class TestVectorStoreRegistry(TestCase):
+    """
+    Unit tests for VectorStoreRegistry.
+    """
+
+    def setUp(self):
+        self.builds = 0
+
+    async def build(self) -> InMemoryVectorStore:
+        """
+        Slow builder that counts how often it runs.
+        """
+        self.builds += 1
+        await asyncio.sleep(0.01)
+        store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=8))
+        await store.aadd_texts(["some text"])
+        return store
+
+    def test_single_flight(self):
+        """
+        Concurrent requests for the same key share one build, other keys build separately.
+        """
+        registry = VectorStoreRegistry()
+        key = make_registry_key(tool="PdfRag", loader_args=["a.pdf"])
+
+        async def get_all():
+            return await asyncio.gather(
+                registry.get_or_build(key, self.build),
+                registry.get_or_build(key, self.build),
+                registry.get_or_build(make_registry_key(tool="PdfRag", loader_args=["b.pdf"]), self.build),
+            )
+
+        first, second, other = asyncio.run(get_all())
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(self.builds, 2)
+
+    def test_eviction(self):
+        """
+        Idle stores expire, and stores past the memory budget are dropped.
+        """
+        registry = VectorStoreRegistry(ttl_seconds=0.0)
+        asyncio.run(registry.get_or_build("key", self.build))
+        asyncio.run(registry.get_or_build("key", self.build))
+        self.assertEqual(self.builds, 2)
+
+        # The store just built is kept even if it alone exceeds the budget, older ones are dropped
+        registry = VectorStoreRegistry(max_bytes=0)
+        asyncio.run(registry.get_or_build("key", self.build))
+        asyncio.run(registry.get_or_build("key", self.build))
+        self.assertEqual(self.builds, 3)
+        asyncio.run(registry.get_or_build("other", self.build))
+        asyncio.run(registry.get_or_build("key", self.build))
+        self.assertEqual(self.builds, 5)
+
+    def test_cancelled_build_is_taken_over(self):
+        """
+        When the caller that is building is cancelled, a waiter builds instead of failing.
+        """
+        registry = VectorStoreRegistry()
+
+        async def cancel_leader():
+            leader = asyncio.create_task(registry.get_or_build("key", self.build))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(registry.get_or_build("key", self.build))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await waiter
+
+        store = asyncio.run(cancel_leader())
+
+        self.assertIsInstance(store, InMemoryVectorStore)
+        self.assertEqual(self.builds, 2)
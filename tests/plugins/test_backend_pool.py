@@ -0,0 +1,59 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from unittest import TestCase
+
+from plugins.load_balancer.backend_pool import BackendPool
+
+BACKENDS = [("localhost", 1), ("localhost", 2), ("localhost", 3)]
+
+
+class TestBackendPool(TestCase):
+    """
+    Unit tests for BackendPool.
+    """
+
+    def test_least_connections_first(self):
+        """
+        The backend with the fewest open connections is tried first.
+        """
+        pool = BackendPool(BACKENDS)
+        pool.active_connections[:] = [2, 0, 1]
+        self.assertEqual([1, 2, 0], pool.candidates())
+
+    def test_ties_take_turns(self):
+        """
+        Equally loaded backends are tried first in turn.
+        """
+        pool = BackendPool(BACKENDS)
+        self.assertEqual([0, 1, 2, 0], [pool.candidates()[0] for _ in range(4)])
+
+    def test_skips_backends_marked_down(self):
+        """
+        A backend that refused a connection is left out while others are available.
+        """
+        pool = BackendPool(BACKENDS)
+        pool.mark_down(0)
+        self.assertEqual([1, 2], sorted(pool.candidates()))
+
+    def test_tries_all_when_all_are_down(self):
+        """
+        Clients are not refused just because every backend refused a connection recently.
+        """
+        pool = BackendPool(BACKENDS)
+        for index in range(len(BACKENDS)):
+            pool.mark_down(index)
+        self.assertEqual([0, 1, 2], sorted(pool.candidates()))
@@ -0,0 +1,125 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import os
+import tempfile
+from typing import Tuple
+from unittest import TestCase
+
+from plugins.diagrams.diagram_generator import DiagramGenerator
+
+NETWORK = '{\n    include "registries/llm_config.hocon",\n    "tools": [{"name": "%s"}]\n}\n'
+
+
+def fake_build(file: str) -> Tuple[str, str]:
+    """
+    Stands in for build_diagram: writes the .html file to <root>/static and records the build in <root>/builds.log.
+    A registry file named broken.hocon fails to build.
+    """
+    root_dir = os.path.dirname(os.path.dirname(file))
+    name = os.path.splitext(os.path.basename(file))[0]
+    with open(os.path.join(root_dir, "builds.log"), "a", encoding="utf-8") as log:
+        log.write(name + "\n")
+    if name == "broken":
+        return "parse error", "exited with status 1"
+    with open(os.path.join(root_dir, "static", name + ".html"), "w", encoding="utf-8") as html:
+        html.write("<html/>")
+    return "", ""
+
+
+class TestDiagramGenerator(TestCase):
+    """
+    Unit tests for DiagramGenerator.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.root_dir = self.temp_dir.name
+        os.makedirs(os.path.join(self.root_dir, "registries"))
+        os.makedirs(os.path.join(self.root_dir, "static"))
+        self.write("llm_config.hocon", '"llm_config": {"model_name": "gpt-4o"}\n')
+        self.write("manifest.hocon", '{"hello.hocon": true}\n')
+        self.write("manifest_multiuser_overlay.hocon", '{"music.hocon": false}\n')
+        self.write("hello.hocon", NETWORK % "hello")
+        self.write("music.hocon", NETWORK % "music")
+        self.generator = DiagramGenerator(
+            self.root_dir,
+            os.path.join(self.root_dir, "logs", "html_diagram_hashes.json"),
+            static_dir=os.path.join(self.root_dir, "static"),
+            builder_version="1.0",
+            build=fake_build,
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name: str, content: str):
+        """
+        Write a registry file.
+        """
+        with open(os.path.join(self.root_dir, "registries", name), "w", encoding="utf-8") as registry_file:
+            registry_file.write(content)
+
+    def generate(self) -> Tuple[dict, list]:
+        """
+        :return: The errors of a run of the generator and the names of the files it built
+        """
+        log_path = os.path.join(self.root_dir, "builds.log")
+        if os.path.exists(log_path):
+            os.remove(log_path)
+        errors = self.generator.generate()
+        if not os.path.exists(log_path):
+            return errors, []
+        with open(log_path, "r", encoding="utf-8") as log:
+            return errors, sorted(log.read().split())
+
+    def test_builds_networks_only_and_skips_unchanged_ones(self):
+        """
+        Manifests and included fragments are not built, and a second run builds nothing.
+        """
+        self.assertEqual(self.generate(), ({}, ["hello", "music"]))
+        self.assertEqual(self.generate(), ({}, []))
+
+    def test_rebuilds_networks_whose_included_file_changed(self):
+        """
+        Changing a fragment rebuilds every network that includes it.
+        """
+        self.generate()
+        self.write("llm_config.hocon", '"llm_config": {"model_name": "gpt-4.1"}\n')
+
+        self.assertEqual(self.generate(), ({}, ["hello", "music"]))
+
+    def test_rebuilds_missing_html_file(self):
+        """
+        A network whose .html file is gone, for instance after the builder was reinstalled, is built again.
+        """
+        self.generate()
+        os.remove(os.path.join(self.root_dir, "static", "music.html"))
+
+        self.assertEqual(self.generate(), ({}, ["music"]))
+
+    def test_failed_build_is_reported_and_retried(self):
+        """
+        A network that fails to build is reported, does not keep the others from being recorded,
+        and is tried again on the next run.
+        """
+        self.write("broken.hocon", NETWORK % "broken")
+
+        errors, built = self.generate()
+        self.assertEqual(errors, {os.path.join("registries", "broken.hocon"): "exited with status 1"})
+        self.assertEqual(built, ["broken", "hello", "music"])
+
+        self.assertEqual(self.generate(), (errors, ["broken"]))
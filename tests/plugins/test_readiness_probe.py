@@ -0,0 +1,52 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import socket
+import subprocess
+import sys
+from unittest import TestCase
+
+from plugins.readiness.readiness_probe import ReadinessProbe
+
+
+class TestReadinessProbe(TestCase):
+    """
+    Unit tests for ReadinessProbe.
+    """
+
+    def test_ready_once_the_port_accepts_connections(self):
+        """
+        A component listening on its port is ready without waiting for the timeout.
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("localhost", 0))
+            server.listen()
+            probe = ReadinessProbe("test", "localhost", server.getsockname()[1])
+            seconds = probe.wait(10.0)
+        self.assertIsNotNone(seconds)
+        self.assertLess(seconds, 10.0)
+
+    def test_gives_up_once_the_process_exits(self):
+        """
+        Waiting stops as soon as the process of the component has exited.
+        """
+        with subprocess.Popen([sys.executable, "-c", "pass"]) as process:
+            process.wait()
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as unused:
+            # Bound but not listening, so nothing accepts connections on the port
+            unused.bind(("localhost", 0))
+            probe = ReadinessProbe("test", "localhost", unused.getsockname()[1], process=process)
+            self.assertIsNone(probe.wait(60.0))
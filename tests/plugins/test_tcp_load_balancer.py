@@ -0,0 +1,138 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import socket
+import threading
+import time
+from typing import Callable
+from typing import Tuple
+from unittest import TestCase
+
+from plugins.load_balancer.tcp_load_balancer import TcpLoadBalancer
+
+
+def free_port() -> int:
+    """
+    :return: A port nothing listens on
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def start_backend(handle: Callable[[socket.socket], None]) -> Tuple[socket.socket, int]:
+    """
+    :param handle: Function called with the first accepted connection, in a background thread
+    :return: The listening socket and its port
+    """
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("localhost", 0))
+    server.listen()
+
+    def serve():
+        connection, _ = server.accept()
+        with connection:
+            handle(connection)
+
+    threading.Thread(target=serve, daemon=True).start()
+    return server, server.getsockname()[1]
+
+
+def echo_until_end_of_stream(connection: socket.socket):
+    """
+    Read everything the client sends, then send it back and close.
+    """
+    received = b""
+    while data := connection.recv(1024):
+        received += data
+    connection.sendall(received)
+
+
+def read_until_end_of_stream(connection: socket.socket) -> bytes:
+    """
+    :return: Everything received until the other side closed
+    """
+    received = b""
+    while data := connection.recv(1024):
+        received += data
+    return received
+
+
+class TestTcpLoadBalancer(TestCase):
+    """
+    Unit tests for TcpLoadBalancer.
+    """
+
+    def setUp(self):
+        self.backend_server, backend_port = start_backend(echo_until_end_of_stream)
+        self.balancer = TcpLoadBalancer("test", "localhost", free_port(), [("localhost", backend_port)])
+        self.balancer.start()
+
+    def tearDown(self):
+        self.balancer.stop()
+        self.backend_server.close()
+
+    def wait_for_no_connections(self):
+        """
+        Fail unless the balancer counts no open connection within a few seconds.
+        """
+        deadline = time.monotonic() + 5.0
+        while any(self.balancer.pool.active_connections) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(any(self.balancer.pool.active_connections))
+
+    def test_end_of_stream_is_passed_on_both_ways(self):
+        """
+        The client closing its side reaches the backend, and the backend closing its side reaches the client,
+        after which the connection is no longer counted.
+        """
+        with socket.create_connection(("localhost", self.balancer.port), timeout=5.0) as client:
+            client.sendall(b"hello")
+            client.shutdown(socket.SHUT_WR)
+            self.assertEqual(b"hello", read_until_end_of_stream(client))
+        self.wait_for_no_connections()
+
+    def test_backend_going_away_closes_the_client(self):
+        """
+        A client whose backend closes the connection is disconnected rather than left hanging.
+        """
+        self.balancer.stop()
+        self.backend_server.close()
+        self.backend_server, backend_port = start_backend(lambda connection: None)
+        self.balancer = TcpLoadBalancer("test", "localhost", free_port(), [("localhost", backend_port)])
+        self.balancer.start()
+
+        with socket.create_connection(("localhost", self.balancer.port), timeout=5.0) as client:
+            self.assertEqual(b"", read_until_end_of_stream(client))
+        self.wait_for_no_connections()
+
+    def test_refused_backend_is_skipped(self):
+        """
+        A connection goes to the next backend when the first one refuses it.
+        """
+        self.balancer.stop()
+        backend_port = self.backend_server.getsockname()[1]
+        self.balancer = TcpLoadBalancer(
+            "test", "localhost", free_port(), [("localhost", free_port()), ("localhost", backend_port)]
+        )
+        self.balancer.start()
+
+        with socket.create_connection(("localhost", self.balancer.port), timeout=5.0) as client:
+            client.sendall(b"hello")
+            client.shutdown(socket.SHUT_WR)
+            self.assertEqual(b"hello", read_until_end_of_stream(client))
+        self.wait_for_no_connections()
+        self.assertEqual([1], self.balancer.pool.candidates())
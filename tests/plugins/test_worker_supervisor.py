@@ -0,0 +1,96 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import subprocess
+import sys
+import threading
+from typing import List
+from unittest import TestCase
+
+from plugins.load_balancer.worker_supervisor import WorkerSupervisor
+
+EXIT_AT_ONCE = [sys.executable, "-c", "pass"]
+RUN_FOR_A_MINUTE = [sys.executable, "-c", "import time; time.sleep(60)"]
+
+
+class TestWorkerSupervisor(TestCase):
+    """
+    Unit tests for WorkerSupervisor.
+    """
+
+    def setUp(self):
+        self.processes: List[subprocess.Popen] = []
+
+    def tearDown(self):
+        for process in self.processes:
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+
+    def start(self, command: List[str]) -> subprocess.Popen:
+        """
+        :return: A process of its own session, like the workers of run.py
+        """
+        # pylint: disable=consider-using-with
+        process = subprocess.Popen(command, start_new_session=True)
+        self.processes.append(process)
+        return process
+
+    def test_restarts_a_worker_that_exits(self):
+        """
+        A worker that exited is started again, keeping its log.
+        """
+        restarted = threading.Event()
+
+        def start_worker(_index: int, append: bool) -> subprocess.Popen:
+            if append:
+                restarted.set()
+                return self.start(RUN_FOR_A_MINUTE)
+            return self.start(EXIT_AT_ONCE)
+
+        supervisor = WorkerSupervisor(1, start_worker)
+        supervisor.start()
+        self.assertTrue(restarted.wait(10.0))
+        supervisor.stop()
+        supervisor.join()
+        self.assertIsNotNone(self.processes[-1].wait(5.0))
+
+    def test_stop_waits_for_a_restart_under_way(self):
+        """
+        A worker being restarted while the supervisor stops is killed with the others, not left running.
+        """
+        restarting = threading.Event()
+        finish_restart = threading.Event()
+
+        def start_worker(_index: int, append: bool) -> subprocess.Popen:
+            if append:
+                restarting.set()
+                finish_restart.wait(10.0)
+                return self.start(RUN_FOR_A_MINUTE)
+            return self.start(EXIT_AT_ONCE)
+
+        supervisor = WorkerSupervisor(1, start_worker)
+        supervisor.start()
+        self.assertTrue(restarting.wait(10.0))
+
+        stopper = threading.Thread(target=supervisor.stop)
+        stopper.start()
+        finish_restart.set()
+        stopper.join(10.0)
+        supervisor.join()
+
+        self.assertEqual(2, len(self.processes))
+        self.assertIsNotNone(self.processes[-1].wait(5.0))